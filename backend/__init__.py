@@ -1,12 +1,15 @@
 """LLM Council backend package."""
 
-# Backend package initialization - expose submodules
-from . import config
-from . import council
-from . import conversation_storage
-from . import requesty_client
-
-# Export main module for uv run backend.main
-from . import main
+import importlib
 
+# Backend package initialization - expose submodules.
+# Loaded on first attribute access: `import backend.db.pool` (CLI commands,
+# cron scripts) must not pay for the FastAPI app, every router and the
+# OpenAI SDK that `backend.main` and `backend.requesty_client` pull in.
 __all__ = ["config", "council", "conversation_storage", "requesty_client", "main"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
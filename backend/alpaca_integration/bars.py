@@ -0,0 +1,531 @@
+"""Multi-symbol Alpaca bar fetching with a shared, per-key rate limiter.
+
+Both market data ingestion paths (backend/storage/data_fetcher.py over
+REST, backend/storage/fetch_market_data.py over alpaca-py in worker
+threads) fetch bars through BarFetcher instead of one request per symbol:
+
+    - Symbols are split into chunks; each chunk is one multi-symbol
+      request (GET /v2/stocks/bars?symbols=SPY,QQQ,...), following
+      next_page_token until the chunk is complete
+    - Chunks run concurrently, at most `concurrency` at a time
+    - Every request (including each page) first takes a token from the
+      rate limiter of the API key it is sent with
+
+Rate limits:
+    Alpaca budgets data API requests per API key per minute (200 on the
+    free plan). get_rate_limiter(key_id) returns one limiter per key for
+    the whole process, so concurrent fetchers sharing a key share its
+    budget. The limiter is a token bucket (ALPACA_DATA_RATE_LIMIT requests
+    per minute, default 200) that also follows the X-RateLimit-Remaining /
+    X-RateLimit-Reset response headers, and a 429 pauses every caller of
+    that key until the reset time (or Retry-After) before the request is
+    retried.
+
+Usage:
+    fetcher = BarFetcher(RestBarsTransport(headers), get_rate_limiter(key_id))
+    result = await fetcher.fetch(symbols, "1Day", start=start, end=end)
+    for symbol, bars in result.bars.items():
+        ...                      # bars: [{"t", "o", "h", "l", "c", "v", ...}]
+    for symbol, error in result.errors.items():
+        ...                      # symbols whose chunk failed
+
+    latest = await fetcher.fetch_latest(symbols)   # newest minute bar each
+
+    await bulk_upsert("daily_bars", daily_bar_columns(result.bars), ["symbol", "date"])
+
+Environment Variables:
+    ALPACA_DATA_RATE_LIMIT: Requests per minute per API key (default: 200)
+    ALPACA_BARS_CHUNK_SIZE: Symbols per request (default: 100)
+    ALPACA_BARS_CONCURRENCY: Chunks in flight (default: 4)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from backend.http_pool import get_alpaca_client
+
+logger = logging.getLogger(__name__)
+
+DATA_BASE_URL = "https://data.alpaca.markets"
+
+RATE_LIMIT_PER_MINUTE = int(os.getenv("ALPACA_DATA_RATE_LIMIT", "200"))
+CHUNK_SIZE = int(os.getenv("ALPACA_BARS_CHUNK_SIZE", "100"))
+CONCURRENCY = int(os.getenv("ALPACA_BARS_CONCURRENCY", "4"))
+
+# Page size of multi-symbol requests (Alpaca's maximum); the limit counts
+# bars across all symbols of the request
+PAGE_LIMIT = 10000
+
+# Retries of one request after a 429, and the pause when the response
+# carries no reset time
+MAX_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_PAUSE = 5.0
+
+
+class RateLimitedError(Exception):
+    """A request was rejected with HTTP 429."""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__("Alpaca rate limit exceeded")
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """
+    Token bucket for one API key's request budget.
+
+    Tokens refill continuously at rate_per_minute / 60 per second up to
+    `burst`. The server's view of the budget (observe()) and 429 pauses
+    (pause()) override the local estimate.
+    """
+
+    def __init__(self, rate_per_minute: int = RATE_LIMIT_PER_MINUTE, burst: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0
+        self.burst = float(burst if burst is not None else max(1, rate_per_minute // 4))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait for a token (and for any pause to end)."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.paused_until - now
+                if wait <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    return
+                if wait <= 0:
+                    wait = (1 - self.tokens) / self.rate
+                self.throttled += 1
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds` (after a 429)."""
+        now = time.monotonic()
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = now
+
+    def observe(self, headers) -> None:
+        """
+        Align with the server's remaining budget.
+
+        Args:
+            headers: Response headers (X-RateLimit-Remaining / -Reset)
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+        self.tokens = min(self.tokens, float(remaining))
+        if remaining <= 0:
+            reset = _seconds_until_reset(headers)
+            if reset:
+                self.pause(reset)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate_per_minute": round(self.rate * 60),
+            "requests": self.requests,
+            "throttled": self.throttled,
+        }
+
+
+def _seconds_until_reset(headers) -> Optional[float]:
+    """Seconds until X-RateLimit-Reset (epoch seconds), or Retry-After."""
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is not None:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+    return None
+
+
+# One limiter per API key for the whole process
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(key_id: Optional[str]) -> RateLimiter:
+    """
+    Get the shared rate limiter of an API key.
+
+    Args:
+        key_id: Alpaca API key ID (None shares one anonymous budget)
+    """
+    key = key_id or ""
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = RateLimiter()
+    return limiter
+
+
+# ============================================================================
+# Transports
+# ============================================================================
+
+# Bars by symbol, next page token
+Page = Tuple[Dict[str, List[Dict[str, Any]]], Optional[str]]
+
+
+class RestBarsTransport:
+    """Multi-symbol bars over the data REST API (shared httpx client)."""
+
+    def __init__(self, headers: Dict[str, str], base_url: str = DATA_BASE_URL):
+        self.headers = headers
+        self.base_url = base_url
+
+    async def _get(self, path: str, params: Dict[str, Any], limiter: Optional[RateLimiter]):
+        response = await get_alpaca_client().get(
+            f"{self.base_url}{path}", params=params, headers=self.headers
+        )
+        if limiter is not None:
+            limiter.observe(response.headers)
+        if response.status_code == 429:
+            raise RateLimitedError(_seconds_until_reset(response.headers))
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_page(
+        self,
+        symbols: Sequence[str],
+        params: Dict[str, Any],
+        page_token: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+    ) -> Page:
+        """
+        Fetch one page of bars for `symbols`.
+
+        Returns:
+            (bars by symbol, next page token or None)
+
+        Raises:
+            RateLimitedError: On HTTP 429
+            httpx.HTTPStatusError: On other error responses
+        """
+        query = {**params, "symbols": ",".join(symbols)}
+        if page_token:
+            query["page_token"] = page_token
+        payload = await self._get("/v2/stocks/bars", query, limiter)
+        return payload.get("bars") or {}, payload.get("next_page_token")
+
+    async def fetch_latest(
+        self,
+        symbols: Sequence[str],
+        params: Dict[str, Any],
+        limiter: Optional[RateLimiter] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch the latest minute bar of each symbol (one request)."""
+        query = {**params, "symbols": ",".join(symbols)}
+        payload = await self._get("/v2/stocks/bars/latest", query, limiter)
+        return payload.get("bars") or {}
+
+
+class SdkBarsTransport:
+    """
+    Multi-symbol bars through alpaca-py's StockHistoricalDataClient.
+
+    The SDK client is synchronous (requests), so each call runs in a worker
+    thread (asyncio.to_thread) and never blocks the event loop; BarFetcher's
+    `concurrency` bounds how many threads are in flight. The SDK follows
+    page tokens itself, so one call returns the whole chunk (and takes one
+    rate limiter token however many pages it reads; keep chunks small).
+    Bars are converted to the REST shape (t, o, h, l, c, v) in the worker
+    thread too.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def fetch_page(
+        self,
+        symbols: Sequence[str],
+        params: Dict[str, Any],
+        page_token: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+    ) -> Page:
+        from alpaca.data.requests import StockBarsRequest
+        from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+
+        amount, unit = _parse_timeframe(params["timeframe"])
+        request = StockBarsRequest(
+            symbol_or_symbols=list(symbols),
+            timeframe=TimeFrame(amount, getattr(TimeFrameUnit, unit)),
+            start=params.get("start"),
+            end=params.get("end"),
+            adjustment=params.get("adjustment"),
+            feed=params.get("feed"),
+        )
+
+        def get_bars() -> Dict[str, List[Dict[str, Any]]]:
+            barset = self.client.get_stock_bars(request)
+            return {
+                symbol: [_sdk_bar(bar) for bar in bars]
+                for symbol, bars in barset.data.items()
+            }
+
+        return await _in_thread(get_bars), None
+
+    async def fetch_latest(
+        self,
+        symbols: Sequence[str],
+        params: Dict[str, Any],
+        limiter: Optional[RateLimiter] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        from alpaca.data.requests import StockLatestBarRequest
+
+        request = StockLatestBarRequest(symbol_or_symbols=list(symbols), feed=params.get("feed"))
+
+        def get_latest() -> Dict[str, Dict[str, Any]]:
+            bars = self.client.get_stock_latest_bar(request)
+            return {symbol: _sdk_bar(bar) for symbol, bar in bars.items()}
+
+        return await _in_thread(get_latest)
+
+
+async def _in_thread(call: Callable[[], Any]) -> Any:
+    """Run a blocking SDK call in a worker thread, mapping 429s to RateLimitedError."""
+    from alpaca.common.exceptions import APIError
+
+    try:
+        return await asyncio.to_thread(call)
+    except APIError as e:
+        if e.status_code == 429:
+            headers = e.response.headers if e.response is not None else {}
+            raise RateLimitedError(_seconds_until_reset(headers)) from e
+        raise
+
+
+_TIMEFRAME_UNITS = {"Min": "Minute", "Hour": "Hour", "Day": "Day", "Week": "Week", "Month": "Month"}
+
+
+def _parse_timeframe(timeframe: str) -> Tuple[int, str]:
+    """"15Min" -> (15, "Minute")"""
+    for suffix, unit in _TIMEFRAME_UNITS.items():
+        if timeframe.endswith(suffix):
+            return int(timeframe[: -len(suffix)] or 1), unit
+    raise ValueError(f"Unknown timeframe: {timeframe!r}")
+
+
+def _sdk_bar(bar) -> Dict[str, Any]:
+    """alpaca-py Bar -> REST bar dict."""
+    return {
+        "t": bar.timestamp.isoformat(),
+        "o": bar.open,
+        "h": bar.high,
+        "l": bar.low,
+        "c": bar.close,
+        "v": bar.volume,
+        "n": bar.trade_count,
+        "vw": bar.vwap,
+    }
+
+
+# ============================================================================
+# Fetcher
+# ============================================================================
+
+
+@dataclass
+class BarsResult:
+    """Bars by symbol plus the symbols whose chunk failed."""
+
+    bars: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    requests: int = 0
+
+
+def daily_bar_columns(bars_by_symbol: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Convert REST bars of many symbols into daily_bars columns for bulk_upsert.
+
+    Each column is built in one pass (numpy arrays for prices and volume),
+    and each distinct timestamp is parsed once across symbols.
+
+    Args:
+        bars_by_symbol: Dict mapping symbol -> bars (BarsResult.bars)
+
+    Returns:
+        Dict of column -> values (symbol, date, open, high, low, close,
+        volume); empty columns when there are no bars
+    """
+    import numpy as np
+
+    symbols: List[str] = []
+    bars: List[Dict[str, Any]] = []
+    for symbol, symbol_bars in bars_by_symbol.items():
+        symbols.extend([symbol] * len(symbol_bars))
+        bars.extend(symbol_bars)
+
+    dates: Dict[str, Any] = {}
+    for bar in bars:
+        day = bar["t"][:10]
+        if day not in dates:
+            dates[day] = datetime.strptime(day, "%Y-%m-%d").date()
+
+    def prices(key: str):
+        return np.fromiter((bar[key] for bar in bars), dtype=float, count=len(bars))
+
+    return {
+        "symbol": symbols,
+        "date": [dates[bar["t"][:10]] for bar in bars],
+        "open": prices("o"),
+        "high": prices("h"),
+        "low": prices("l"),
+        "close": prices("c"),
+        "volume": np.fromiter((bar["v"] for bar in bars), dtype="int64", count=len(bars)),
+    }
+
+
+class BarFetcher:
+    """Fetch bars for many symbols in chunked, paginated, rate-limited requests."""
+
+    def __init__(
+        self,
+        transport,
+        limiter: Optional[RateLimiter] = None,
+        chunk_size: int = CHUNK_SIZE,
+        concurrency: int = CONCURRENCY,
+    ):
+        """
+        Args:
+            transport: RestBarsTransport or SdkBarsTransport
+            limiter: Rate limiter of the transport's API key
+            chunk_size: Symbols per request
+            concurrency: Chunks in flight at once
+        """
+        self.transport = transport
+        self.limiter = limiter or RateLimiter()
+        self.chunk_size = max(1, chunk_size)
+        self.concurrency = max(1, concurrency)
+
+    async def fetch(
+        self,
+        symbols: Sequence[str],
+        timeframe: str = "1Day",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        adjustment: str = "raw",
+        feed: Optional[str] = None,
+    ) -> BarsResult:
+        """
+        Fetch bars for every symbol between start and end.
+
+        Args:
+            symbols: Ticker symbols (any number)
+            timeframe: "1Day", "1Hour", "1Min", ...
+            start, end: Time range (naive datetimes are UTC)
+            adjustment: "raw", "split", "dividend" or "all"
+            feed: Data feed ("iex", "sip"); None uses the account default
+
+        Returns:
+            BarsResult; bars are oldest first, and a symbol with no bars in
+            range has an empty list
+        """
+        params: Dict[str, Any] = {"timeframe": timeframe, "adjustment": adjustment, "limit": PAGE_LIMIT}
+        if start is not None:
+            params["start"] = _rfc3339(start)
+        if end is not None:
+            params["end"] = _rfc3339(end)
+        if feed:
+            params["feed"] = feed
+
+        async def fetch_chunk(chunk: List[str], result: BarsResult) -> None:
+            page_token = None
+            while True:
+                bars, page_token = await self._request(
+                    lambda: self.transport.fetch_page(chunk, params, page_token, self.limiter)
+                )
+                result.requests += 1
+                for symbol, symbol_bars in bars.items():
+                    result.bars.setdefault(symbol, []).extend(symbol_bars)
+                if not page_token:
+                    return
+
+        return await self._map_chunks(symbols, fetch_chunk)
+
+    async def fetch_latest(self, symbols: Sequence[str], feed: Optional[str] = None) -> BarsResult:
+        """
+        Fetch the latest minute bar of every symbol.
+
+        Returns:
+            BarsResult with at most one bar per symbol
+        """
+        params = {"feed": feed} if feed else {}
+
+        async def fetch_chunk(chunk: List[str], result: BarsResult) -> None:
+            bars = await self._request(lambda: self.transport.fetch_latest(chunk, params, self.limiter))
+            result.requests += 1
+            for symbol, bar in bars.items():
+                result.bars[symbol] = [bar]
+
+        return await self._map_chunks(symbols, fetch_chunk)
+
+    async def _map_chunks(
+        self,
+        symbols: Sequence[str],
+        fetch_chunk: Callable[[List[str], BarsResult], Awaitable[None]],
+    ) -> BarsResult:
+        """Run fetch_chunk over symbol chunks, `concurrency` at a time."""
+        symbols = list(dict.fromkeys(symbols))
+        chunks = [symbols[i:i + self.chunk_size] for i in range(0, len(symbols), self.chunk_size)]
+        result = BarsResult(bars={symbol: [] for symbol in symbols})
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(chunk: List[str]) -> None:
+            async with semaphore:
+                try:
+                    await fetch_chunk(chunk, result)
+                except Exception as e:
+                    logger.warning(f"Bars request failed for {len(chunk)} symbols ({chunk[0]}, ...): {e}")
+                    for symbol in chunk:
+                        result.errors[symbol] = str(e)
+                        result.bars.pop(symbol, None)
+
+        await asyncio.gather(*(run(chunk) for chunk in chunks))
+        return result
+
+    async def _request(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Take a rate limiter token and run `call`, retrying after 429s."""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self.limiter.acquire()
+            try:
+                return await call()
+            except RateLimitedError as e:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                # Pause everyone on this key, then retry
+                pause = e.retry_after if e.retry_after is not None else RATE_LIMIT_PAUSE
+                self.limiter.pause(pause)
+                logger.warning(f"Alpaca rate limit hit; pausing requests for {pause:.1f}s")
+
+
+def _rfc3339(value: datetime) -> str:
+    """Format a datetime for the data API (naive values are UTC)."""
+    if value.tzinfo is None:
+        return value.isoformat() + "Z"
+    return value.isoformat()
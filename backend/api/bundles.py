@@ -0,0 +1,54 @@
+"""Week bundle API endpoints."""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from backend.pipeline.week_bundle import BundleError, load_week_bundle
+
+logger = logging.getLogger(__name__)
+
+# Create router for week bundle endpoints
+router = APIRouter(prefix="/api/week-bundle", tags=["week-bundle"])
+
+
+@router.get("")
+async def get_week_bundle(
+    week_id: Optional[str] = Query(None, description="Week ID (defaults to current week)"),
+    version: Optional[int] = Query(None, description="Bundle version (defaults to latest)"),
+):
+    """
+    Get the frozen week bundle in a single read.
+
+    The bundle is written once at weekly-pipeline completion and contains
+    everything the dashboard needs for the week.
+
+    Returns:
+        Dict containing:
+            - week_id, version, schema_version, created_at, execution_mode
+            - market_snapshot: Frozen market snapshot
+            - digest: Knowledge-graph digest
+            - pm_pitches, peer_reviews, label_to_model
+            - chairman_decision
+            - execution_result
+
+    Raises:
+        HTTPException: 404 if no bundle exists for the week
+        HTTPException: 500 if the bundle cannot be loaded or decoded
+    """
+    try:
+        bundle = await load_week_bundle(week_id, version)
+    except BundleError as e:
+        logger.error(f"Invalid week bundle for {week_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in get_week_bundle endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if bundle is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No week bundle available - run the weekly pipeline first",
+        )
+    return bundle
@@ -0,0 +1,81 @@
+"""Cache observability API endpoints."""
+
+import logging
+from typing import Dict, Any, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from backend.cache.stats import cache_stats, collect_cluster_stats, merge_snapshots
+
+logger = logging.getLogger(__name__)
+
+# Create router for cache endpoints
+router = APIRouter(prefix="/api/cache", tags=["cache"])
+
+
+# ============================================================================
+# Response Models
+# ============================================================================
+
+
+class CacheStatsResponse(BaseModel):
+    """Response model for cache statistics."""
+
+    scope: str = Field(description="'cluster' (all workers) or 'local' (this worker)")
+    workers: int = Field(description="Number of worker snapshots merged")
+    families: Dict[str, Dict[str, Any]] = Field(
+        description="Stats per key family (category:subcategory)"
+    )
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+
+@router.get("/stats")
+async def get_cache_stats(
+    scope: Optional[str] = Query(
+        "cluster", description="'cluster' merges all workers, 'local' is this worker only"
+    )
+) -> CacheStatsResponse:
+    """
+    Get cache hit/miss counters and latency/size histograms per key family.
+
+    Returns:
+        Dict containing:
+            - scope: "cluster" or "local"
+            - workers: Number of worker snapshots merged
+            - families: Per family hits, misses, errors, sets, hit_rate and
+              deserialize_ms / serialize_ms / payload_bytes /
+              compression_ratio histograms
+
+    Raises:
+        HTTPException: 400 if scope is not "cluster" or "local"
+        HTTPException: 500 if there's an error collecting stats
+
+    Example Response:
+        {
+            "scope": "cluster",
+            "workers": 4,
+            "families": {
+                "market:metrics": {
+                    "hits": 1520, "misses": 12, "errors": 0, "sets": 12,
+                    "hit_rate": 0.9922,
+                    "deserialize_ms": {"p50": 0.5, "p95": 1.0, ...},
+                    ...
+                }
+            }
+        }
+    """
+    if scope not in ("cluster", "local"):
+        raise HTTPException(status_code=400, detail="scope must be 'cluster' or 'local'")
+
+    try:
+        if scope == "local":
+            return {"scope": "local", **merge_snapshots([cache_stats.snapshot()])}
+        return await collect_cluster_stats()
+    except Exception as e:
+        logger.error(f"Error in get_cache_stats endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -254,6 +254,7 @@ async def synthesize_council(
 
             # Get PM pitches from request, pipeline state, or database
             pm_pitches_raw = request.pm_pitches_raw
+            pitch_ids = None
 
             if not pm_pitches_raw:
                 logger.info("No pitches in request, checking pipeline state...")
@@ -261,6 +262,7 @@ async def synthesize_council(
                 # Try pipeline state
                 if pipeline_state.pm_pitches_raw:
                     pm_pitches_raw = pipeline_state.pm_pitches_raw
+                    pitch_ids = pipeline_state.pm_pitch_ids
                     logger.info(f"Using {len(pm_pitches_raw)} pitches from pipeline state")
                 else:
                     # Try loading from database
@@ -276,6 +278,7 @@ async def synthesize_council(
                         if pitches:
                             pm_pitches_raw = pitches
                             pipeline_state.pm_pitches_raw = pitches
+                            pipeline_state.pm_pitch_ids = None
                             logger.info(f"Loaded {len(pitches)} pitches from database")
                         else:
                             logger.error("No pitches found in database")
@@ -295,6 +298,7 @@ async def synthesize_council(
             # Run council synthesis
             await council_service.synthesize_council(
                 pm_pitches_raw=pm_pitches_raw,
+                pitch_ids=pitch_ids,
                 research_context=request.research_context,
                 pipeline_state=pipeline_state,
                 week_id=request.week_id,
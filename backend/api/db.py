@@ -0,0 +1,99 @@
+"""Database observability API endpoints."""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from backend.db.event_writer import get_event_writer
+from backend.db.metrics import db_stats
+from backend.db.pool import check_pool_health
+
+logger = logging.getLogger(__name__)
+
+# Create router for database endpoints
+router = APIRouter(prefix="/api/db", tags=["database"])
+
+
+# ============================================================================
+# Response Models
+# ============================================================================
+
+
+class DBMetricsResponse(BaseModel):
+    """Response model for database metrics."""
+
+    pool: Dict[str, Any] = Field(description="Pool health, size and summary counters")
+    slow_query_ms: float = Field(description="Slow-query threshold (DB_SLOW_QUERY_MS)")
+    acquire_wait_ms: Dict[str, Any] = Field(description="Pool acquire wait histogram")
+    pools: Dict[str, Dict[str, Any]] = Field(
+        description="Acquire counters per named pool (primary, read, batch)"
+    )
+    statements: Dict[str, Dict[str, Any]] = Field(
+        description="Stats per normalized statement, by total latency"
+    )
+    scopes: Dict[str, Dict[str, Any]] = Field(
+        description="Pool usage per API route or pipeline stage"
+    )
+    slow_queries: List[Dict[str, Any]] = Field(description="Recent slow queries, newest first")
+    event_writer: Optional[Dict[str, Any]] = Field(
+        None, description="Execution event writer queue counters (None if not running)"
+    )
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+
+@router.get("/metrics")
+async def get_db_metrics(
+    top: Optional[int] = Query(
+        50, ge=1, description="Number of statements to return (by total latency)"
+    )
+) -> DBMetricsResponse:
+    """
+    Get connection pool and query metrics for this worker.
+
+    Returns:
+        Dict containing:
+            - pool: check_pool_health() result (status, size, free, metrics)
+            - slow_query_ms: Slow-query threshold
+            - acquire_wait_ms: Histogram of pool acquire wait
+            - pools: acquires, timeouts, in_use and acquire wait per named pool
+            - statements: calls, errors, rows and latency_ms per statement
+            - scopes: acquires, in_use, max_in_use, queries, query_ms and
+              acquire_wait_ms per route/stage
+            - slow_queries: Recent queries above the threshold
+            - event_writer: queued/written/spilled/replayed execution events
+
+    Raises:
+        HTTPException: 500 if there's an error collecting metrics
+
+    Example Response:
+        {
+            "pool": {"status": "healthy", "pool_size": 12, "free_connections": 9, ...},
+            "scopes": {
+                "GET /api/market/metrics": {"acquires": 310, "max_in_use": 4, ...},
+                "stage:research": {"acquires": 12, "max_in_use": 1, ...}
+            },
+            ...
+        }
+    """
+    try:
+        snapshot = db_stats.snapshot(top=top)
+        writer = get_event_writer()
+        return {
+            "pool": await check_pool_health(),
+            "slow_query_ms": snapshot["slow_query_ms"],
+            "acquire_wait_ms": snapshot["acquire_wait_ms"],
+            "pools": snapshot["pools"],
+            "statements": snapshot["statements"],
+            "scopes": snapshot["scopes"],
+            "slow_queries": snapshot["slow_queries"],
+            "event_writer": writer.stats() if writer else None,
+        }
+    except Exception as e:
+        logger.error(f"Error in get_db_metrics endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,110 @@
+"""Server push of database change events (Server-Sent Events)."""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from backend.db.change_feed import FEED_TABLES, broadcaster, get_change_feed
+
+logger = logging.getLogger(__name__)
+
+# Create router for push endpoints
+router = APIRouter(prefix="/api/events", tags=["events"])
+
+# Comment line sent when idle so proxies keep the connection open
+HEARTBEAT_SECONDS = 15.0
+
+
+def _parse_tables(tables: Optional[str]) -> Set[str]:
+    """Comma-separated table filter (empty = all feed tables)."""
+    if not tables:
+        return set(FEED_TABLES)
+    return {t.strip() for t in tables.split(",") if t.strip()}
+
+
+async def change_events(
+    request: Request,
+    tables: Set[str],
+    heartbeat: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    SSE frames for change messages on `tables` until the client disconnects.
+
+    Yields:
+        "data: {...}" frames, and ": keepalive" comments when idle
+    """
+    queue = broadcaster.subscribe()
+    try:
+        yield f"data: {json.dumps({'type': 'connected', 'tables': sorted(tables)})}\n\n"
+        while not await request.is_disconnected():
+            try:
+                message: Dict[str, Any] = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message["table"] in tables:
+                yield f"data: {json.dumps({'type': 'change', **message})}\n\n"
+    finally:
+        broadcaster.unsubscribe(queue)
+
+
+@router.get("/stream")
+async def stream_changes(request: Request, tables: Optional[str] = None) -> StreamingResponse:
+    """
+    Stream database change events to the client (Server-Sent Events).
+
+    Replaces polling: clients refetch a view only when a change event for
+    its table arrives. Events come from the PostgreSQL change feed
+    (backend/db/change_feed.py), so writes from any worker, script or cron
+    job are included.
+
+    Args:
+        tables: Comma-separated tables to receive (default: all of
+                research_reports, pm_pitches, peer_reviews,
+                chairman_decisions, execution_events)
+
+    Returns:
+        StreamingResponse with Server-Sent Events. Each event has format:
+            data: {"type": "change", "table": "pm_pitches", "op": "INSERT",
+                   "week_id": "2024-01-10", "research_date": ..., "account": ...,
+                   "at": "<ISO 8601>"}
+
+        The first event is {"type": "connected", "tables": [...]}; idle
+        periods carry ": keepalive" comments every 15 seconds.
+
+    Example (browser):
+        const source = new EventSource('/api/events/stream?tables=pm_pitches');
+        source.onmessage = (e) => { if (JSON.parse(e.data).type === 'change') reload(); };
+    """
+    return StreamingResponse(
+        change_events(request, _parse_tables(tables)),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.get("/status")
+async def change_feed_status() -> Dict[str, Any]:
+    """
+    Change feed health for this worker.
+
+    Returns:
+        Dict with listener state, notifications received, connected push
+        clients, and messages published/dropped
+    """
+    listener = get_change_feed()
+    return {
+        "listening": bool(listener and listener.running),
+        "received": listener.received if listener else 0,
+        "clients": broadcaster.clients,
+        "published": broadcaster.published,
+        "dropped": broadcaster.dropped,
+    }
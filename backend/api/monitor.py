@@ -1,9 +1,10 @@
-"""Monitoring API endpoints for positions and accounts."""
+"""Monitoring API endpoints for positions, accounts and execution history."""
 
 import logging
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -175,6 +176,18 @@ class LeaderboardEntry(BaseModel):
     win_rate: float = Field(description="Percentage of profitable weeks (e.g., 0.6667 = 66.67%)")
     weeks_traded: int = Field(description="Number of weeks with positions")
     profitable_weeks: int = Field(description="Number of weeks with positive returns")
+    refreshed_at: Optional[str] = Field(
+        None, description="When the materialized leaderboard was last refreshed (ISO 8601)"
+    )
+
+
+class ExecutionEventPage(BaseModel):
+    """Response model for a page of execution events (keyset pagination)."""
+
+    items: List[Dict[str, Any]] = Field(description="Execution events, newest first")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as ?cursor= for the next page (null on the last page)"
+    )
 
 
 # ============================================================================
@@ -358,7 +371,7 @@ async def get_leaderboard(weeks: Optional[int] = None) -> List[LeaderboardEntry]
                None = all time (default)
                4 = last 4 weeks
                8 = last 8 weeks
-               Custom values are supported but use non-optimized queries.
+               Any period calculated by calculate_performance.py is supported.
 
     Returns:
         List of leaderboard entries, each containing:
@@ -370,6 +383,7 @@ async def get_leaderboard(weeks: Optional[int] = None) -> List[LeaderboardEntry]
             - win_rate: Percentage of profitable weeks (e.g., 0.6667 = 66.67%)
             - weeks_traded: Number of weeks with positions
             - profitable_weeks: Number of weeks with positive returns
+            - refreshed_at: Freshness of the materialized leaderboard (ISO 8601)
 
         Falls back to MOCK_LEADERBOARD if live data unavailable or on error.
 
@@ -400,7 +414,7 @@ async def get_leaderboard(weeks: Optional[int] = None) -> List[LeaderboardEntry]
     Notes:
         - All 6 accounts are included: COUNCIL, CHATGPT, GEMINI, CLAUDE, GROQ, DEEPSEEK
         - Accounts are ranked by total_return (descending)
-        - Uses optimized database views for common time periods (all-time, 4w, 8w)
+        - Reads the mv_leaderboard materialized view (index scan for any period)
         - Performance metrics are calculated by backend/storage/calculate_performance.py
         - Returns mock data to avoid breaking frontend if database unavailable
     """
@@ -423,6 +437,9 @@ async def get_leaderboard(weeks: Optional[int] = None) -> List[LeaderboardEntry]
                     "win_rate": float(entry.get("win_rate", 0)),
                     "weeks_traded": int(entry.get("weeks_traded", 0)),
                     "profitable_weeks": int(entry.get("profitable_weeks", 0)),
+                    "refreshed_at": (
+                        entry["refreshed_at"].isoformat() if entry.get("refreshed_at") else None
+                    ),
                 }
             )
 
@@ -439,3 +456,77 @@ async def get_leaderboard(weeks: Optional[int] = None) -> List[LeaderboardEntry]
         )
         logger.warning("Falling back to mock leaderboard data")
         return MOCK_LEADERBOARD
+
+
+@router.get("/executions")
+async def get_execution_events(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    account: Optional[str] = None,
+    event_type: Optional[str] = None,
+    week_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> ExecutionEventPage:
+    """
+    Get execution events, newest first, with keyset pagination.
+
+    Args:
+        limit: Page size (default: 50, max: 500)
+        cursor: `next_cursor` from the previous response (omit for the first page)
+        account, event_type, week_id: Optional filters
+        since: Only events at or after this time (prunes monthly partitions)
+
+    Returns:
+        Dict with "items" and "next_cursor"
+
+    Raises:
+        HTTPException: 400 if cursor is invalid
+    """
+    from backend.db.execution_db import get_execution_page
+
+    try:
+        return await get_execution_page(
+            limit=limit,
+            cursor=cursor,
+            event_type=event_type,
+            account=account,
+            week_id=week_id,
+            since=since,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting execution events: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/executions/export")
+async def export_execution_events(
+    format: str = "ndjson",
+    account: Optional[str] = None,
+    event_type: Optional[str] = None,
+    week_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+):
+    """
+    Export execution events as a streamed NDJSON or CSV download.
+
+    Rows are read through a server-side cursor and flushed in chunks, so
+    memory use is constant regardless of history size.
+
+    Args:
+        format: "ndjson" (default) or "csv" (event_data as JSON text)
+        account, event_type, week_id, since: Optional filters
+
+    Raises:
+        HTTPException: 400 if format is not supported
+    """
+    from backend.db.execution_db import EVENT_COLUMNS, stream_execution_events
+    from backend.utils.exports import EXPORT_FORMATS, export_response
+
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {list(EXPORT_FORMATS)}")
+    rows = stream_execution_events(
+        event_type=event_type, account=account, week_id=week_id, since=since
+    )
+    return export_response(rows, format, EVENT_COLUMNS, "execution_events")
@@ -9,6 +9,8 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
 from backend.services.pitch_service import PitchService
+from backend.utils.exports import EXPORT_FORMATS, export_response
+from backend.db.pitch_db import PITCH_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +112,15 @@ class PitchStatusResponse(BaseModel):
     )
 
 
+class PitchHistoryPage(BaseModel):
+    """Response model for a page of pitch history (keyset pagination)."""
+
+    items: List[Dict[str, Any]] = Field(description="Pitch rows, newest first")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Pass as ?cursor= for the next page (null on the last page)"
+    )
+
+
 class ApprovePitchResponse(BaseModel):
     """Response model for pitch approval."""
 
@@ -242,6 +253,63 @@ async def get_current_pitches(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/history")
+async def get_pitch_history(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    week_id: Optional[str] = None,
+    model: Optional[str] = None,
+    account: Optional[str] = None,
+) -> PitchHistoryPage:
+    """
+    List saved PM pitches, newest first, with keyset pagination.
+
+    Args:
+        limit: Page size (default: 50, max: 500)
+        cursor: `next_cursor` from the previous response (omit for the first page)
+        week_id, model, account: Optional filters
+
+    Returns:
+        Dict with "items" (pitch rows including pitch_data) and "next_cursor"
+
+    Raises:
+        HTTPException: 400 if cursor is invalid
+    """
+    try:
+        return await pitch_service.get_pitch_history(
+            limit=limit, cursor=cursor, week_id=week_id, model=model, account=account
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in get_pitch_history endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/export")
+async def export_pitches(
+    format: str = "ndjson",
+    week_id: Optional[str] = None,
+    model: Optional[str] = None,
+    account: Optional[str] = None,
+):
+    """
+    Export pitch history as a streamed NDJSON or CSV download (server-side
+    cursor; constant memory).
+
+    Args:
+        format: "ndjson" (default) or "csv" (pitch_data as JSON text)
+        week_id, model, account: Optional filters
+
+    Raises:
+        HTTPException: 400 if format is not supported
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {list(EXPORT_FORMATS)}")
+    rows = pitch_service.stream_pitches(week_id=week_id, model=model, account=account)
+    return export_response(rows, format, PITCH_COLUMNS, "pm_pitches")
+
+
 @router.post("/generate")
 async def generate_pitches(
     background_tasks: BackgroundTasks,
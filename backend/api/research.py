@@ -9,6 +9,8 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
 from backend.services.research_service import ResearchService
+from backend.utils.exports import EXPORT_FORMATS, export_response
+from backend.db.research_db import REPORT_EXPORT_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -201,6 +203,15 @@ class ResearchHistoryResponse(BaseModel):
     )
 
 
+class ResearchReportPage(BaseModel):
+    """Response model for a page of research reports (keyset pagination)."""
+
+    items: List[Dict[str, Any]] = Field(description="Report metadata, newest first")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Pass as ?cursor= for the next page (null on the last page)"
+    )
+
+
 class VerifyResearchResponse(BaseModel):
     """Response model for verify research."""
 
@@ -420,7 +431,10 @@ async def get_latest_research() -> LatestResearchResponse:
             - status: Report status ('complete', 'error', etc.)
             - error_message: Error message if any
             - created_at: Creation timestamp (ISO format)
-        Returns empty dict if no research found or error occurs.
+        Returns empty dict if no research found.
+
+    Raises:
+        HTTPException: 500 if the research could not be read
 
     Database Tables:
         - research_reports: Contains research report data
@@ -440,7 +454,11 @@ async def get_latest_research() -> LatestResearchResponse:
     """
     try:
         result = await research_service.get_latest_research()
+        if result is None:
+            raise HTTPException(status_code=500, detail="Failed to load latest research")
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_latest_research endpoint: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -661,6 +679,68 @@ async def get_research_history(days: int = 90) -> ResearchHistoryResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/reports")
+async def list_research_reports(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    provider: Optional[str] = None,
+    status: Optional[str] = None,
+    week_id: Optional[str] = None,
+) -> ResearchReportPage:
+    """
+    List research reports, newest first, with keyset pagination.
+
+    Args:
+        limit: Page size (default: 50, max: 500)
+        cursor: `next_cursor` from the previous response (omit for the first page)
+        provider: Filter by research provider (optional)
+        status: Filter by report status (optional)
+        week_id: Filter by week identifier (optional)
+
+    Returns:
+        Dict with "items" (report metadata without bodies; fetch a body via
+        /report/{report_id}) and "next_cursor"
+
+    Raises:
+        HTTPException: 400 if cursor is invalid
+    """
+    try:
+        return await research_service.get_research_page(
+            limit=limit, cursor=cursor, provider=provider, status=status, week_id=week_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in list_research_reports endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/export")
+async def export_research_reports(
+    format: str = "ndjson",
+    provider: Optional[str] = None,
+    status: Optional[str] = None,
+    week_id: Optional[str] = None,
+):
+    """
+    Export full research reports as a streamed NDJSON or CSV download.
+
+    Rows are read through a server-side cursor and written as they arrive,
+    so memory use does not grow with the number of reports.
+
+    Args:
+        format: "ndjson" (default) or "csv" (structured_json as JSON text)
+        provider, status, week_id: Optional filters
+
+    Raises:
+        HTTPException: 400 if format is not supported
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {list(EXPORT_FORMATS)}")
+    rows = research_service.stream_research_reports(provider=provider, status=status, week_id=week_id)
+    return export_response(rows, format, REPORT_EXPORT_COLUMNS, "research_reports")
+
+
 @router.get("/{job_id}")
 async def get_research_results(job_id: str) -> CurrentResearchResponse:
     """
@@ -844,6 +924,9 @@ async def get_latest_graphs() -> LatestGraphsResponse:
             - weekly_graph: Weekly knowledge graph from structured_json
         Returns empty dict if no research or no graph available.
 
+    Raises:
+        HTTPException: 500 if the research could not be read
+
     Database Tables:
         - research_reports: Contains research report data with structured_json
 
@@ -859,7 +942,11 @@ async def get_latest_graphs() -> LatestGraphsResponse:
     """
     try:
         result = await research_service.get_latest_graphs()
+        if result is None:
+            raise HTTPException(status_code=500, detail="Failed to load latest graphs")
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_latest_graphs endpoint: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -884,6 +971,9 @@ async def get_latest_data_package() -> LatestDataPackageResponse:
             - market_metrics: Latest 7-day returns and correlation matrix
             - current_prices: Latest OHLCV data for tracked symbols
 
+    Raises:
+        HTTPException: 500 if any part of the package could not be read
+
     Database Tables:
         - research_reports: Research data
         - rolling_7day_log_returns: Market metrics
@@ -900,7 +990,11 @@ async def get_latest_data_package() -> LatestDataPackageResponse:
     """
     try:
         result = await research_service.get_latest_data_package()
+        if result is None:
+            raise HTTPException(status_code=500, detail="Failed to load latest data package")
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_latest_data_package endpoint: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -8,12 +8,14 @@ Key Modules:
     - keys: Cache key builders for different data types
     - serializer: JSON/msgpack serialization utilities
     - decorator: @cached decorator for automatic caching
-    - invalidation: Cache invalidation helpers
+    - invalidation: Cross-worker invalidation events over Redis pub/sub
+    - warming: Proactive cache warming after data jobs and pipeline stages
+    - stats: Per-key-family hit/miss, latency and size statistics
 
 Example:
     from backend.cache.keys import research_report_key
     from backend.cache.decorator import cached
-    from backend.redis_client import get_redis_client
+    from backend.redis_client import get_redis_pool
 
     # Use decorator for automatic caching
     @cached(
@@ -23,9 +25,9 @@ Example:
     def get_report(report_id: str):
         return fetch_from_db(report_id)
 
-    # Or use Redis client directly
-    redis = get_redis_client()
-    redis.set(key, json.dumps(data), ttl=3600)
+    # Or use the async Redis pool directly
+    redis = get_redis_pool()
+    await redis.setex(key, 3600, json.dumps(data))
 """
 
 __version__ = "1.0.0"
@@ -52,6 +54,19 @@ from .decorator import (
     invalidate_cache,
 )
 
+# Re-export cache warming entry points
+from .warming import (
+    warm_cache,
+    warm_after_update,
+    get_key_dependencies,
+)
+
+# Re-export cross-worker invalidation entry points
+from .invalidation import (
+    publish_change,
+    subscribe,
+)
+
 __all__ = [
     # Key builders
     "research_report_key",
@@ -69,4 +84,11 @@ __all__ = [
     "cached",
     "cache_key_from_args",
     "invalidate_cache",
+    # Cache warming
+    "warm_cache",
+    "warm_after_update",
+    "get_key_dependencies",
+    # Cross-worker invalidation
+    "publish_change",
+    "subscribe",
 ]
@@ -12,7 +12,8 @@ Features:
     - Multiple serialization formats (JSON, msgpack)
     - Automatic compression for large payloads
     - Graceful error handling (fallback to function if Redis fails)
-    - Detailed logging for cache hits/misses
+    - Per-key-family hit/miss/latency/size stats (see backend/cache/stats.py);
+      per-request HIT/MISS/SET lines are logged at DEBUG
 
 Usage:
     from backend.cache.decorator import cached
@@ -63,11 +64,19 @@ import functools
 import inspect
 import logging
 import base64
-from typing import Any, Callable, Optional, Union
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 import asyncio
 
-from backend.redis_client import get_redis_client, get_redis_pool
+from backend.redis_client import get_redis_client, get_redis_pool, in_event_loop
 from backend.cache.serializer import serialize, deserialize
+from backend.cache.stats import cache_stats
+
+# gzip streams start with this magic number
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Sync cached functions already warned about running inside the event loop
+_warned_sync_in_loop: set = set()
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +88,7 @@ def cached(
     format: str = "json",
     compress: bool = False,
     compression_threshold: int = 1024,
+    cache_none: bool = True,
 ):
     """
     Decorator for automatic Redis caching of function results.
@@ -96,9 +106,15 @@ def cached(
         format: Serialization format ("json" or "msgpack")
         compress: Whether to compress cached data
         compression_threshold: Compress if size exceeds this (bytes)
+        cache_none: Whether a None result is stored. Set to False for
+                    functions that return None to signal an error, so a
+                    transient failure is not served from cache until TTL.
 
     Returns:
-        Decorated function that uses caching
+        Decorated function that uses caching. The wrapper also exposes:
+            - cache_key(*args, **kwargs): the key a call would use
+            - refresh(*args, **kwargs): call the original function and
+              overwrite the cached value (used by cache warming)
 
     Raises:
         ValueError: If neither key nor key_builder is provided, or both are provided
@@ -144,7 +160,11 @@ def cached(
         - If Redis is unavailable, the decorator falls back to calling the function
         - Cache errors are logged but don't break the application
         - Both sync and async functions are supported automatically
+        - Sync functions use the blocking sync client and are meant for
+          scripts; called inside a running event loop they bypass the cache
         - The decorator preserves function signatures and docstrings
+        - refresh() is awaitable for async functions and a plain call for
+          sync functions
     """
     # Validate arguments
     if key is None and key_builder is None:
@@ -158,6 +178,10 @@ def cached(
         # Check if function is async
         is_async = asyncio.iscoroutinefunction(func)
 
+        def cache_key_for(*args, **kwargs) -> str:
+            """Return the cache key used for a call with these arguments."""
+            return _build_cache_key(key, key_builder, args, kwargs)
+
         if is_async:
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
@@ -173,7 +197,22 @@ def cached(
                     compress=compress,
                     compression_threshold=compression_threshold,
                     is_async=True,
+                    cache_none=cache_none,
                 )
+
+            async def refresh(*args, **kwargs) -> Any:
+                """Recompute the result and overwrite the cached value."""
+                cache_key = cache_key_for(*args, **kwargs)
+                result = await func(*args, **kwargs)
+                if result is not None or cache_none:
+                    await _store_result(
+                        cache_key, result, ttl, format, compress,
+                        compression_threshold, func.__name__,
+                    )
+                return result
+
+            async_wrapper.cache_key = cache_key_for
+            async_wrapper.refresh = refresh
             return async_wrapper
         else:
             @functools.wraps(func)
@@ -189,12 +228,186 @@ def cached(
                     format=format,
                     compress=compress,
                     compression_threshold=compression_threshold,
+                    cache_none=cache_none,
                 )
+
+            def refresh_sync(*args, **kwargs) -> Any:
+                """Recompute the result and overwrite the cached value."""
+                cache_key = cache_key_for(*args, **kwargs)
+                result = func(*args, **kwargs)
+                if result is not None or cache_none:
+                    _store_result_sync(
+                        cache_key, result, ttl, format, compress,
+                        compression_threshold, func.__name__,
+                    )
+                return result
+
+            sync_wrapper.cache_key = cache_key_for
+            sync_wrapper.refresh = refresh_sync
             return sync_wrapper
 
     return decorator
 
 
+def _build_cache_key(
+    key: Optional[str],
+    key_builder: Optional[Callable],
+    args: tuple,
+    kwargs: dict,
+) -> str:
+    """Resolve the cache key from a static key or a key builder."""
+    if key is not None:
+        return key
+    return key_builder(*args, **kwargs)
+
+
+def _encode_for_storage(
+    cache_key: str,
+    result: Any,
+    format: str,
+    compress: bool,
+    compression_threshold: int,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Serialize a result into the string form stored in Redis.
+
+    msgpack and compressed payloads are bytes, so they are base64 encoded
+    (both clients use decode_responses=True).
+
+    Returns:
+        Tuple of (serialized value, record_set() measurements: serialize
+        time, stored size and compression ratio). Callers record the set
+        only once Redis has accepted it.
+    """
+    start = time.perf_counter()
+    serialized = serialize(
+        result,
+        format=format,
+        compress=compress,
+        compression_threshold=compression_threshold
+    )
+
+    compression_ratio = None
+    if isinstance(serialized, bytes):
+        if serialized[:2] == GZIP_MAGIC and len(serialized) > 4:
+            # gzip trailer holds the uncompressed size (mod 2**32)
+            raw_size = int.from_bytes(serialized[-4:], "little")
+            compression_ratio = raw_size / len(serialized)
+        serialized = base64.b64encode(serialized).decode("ascii")
+
+    return serialized, {
+        "serialize_ms": (time.perf_counter() - start) * 1000,
+        "payload_bytes": len(serialized),
+        "compression_ratio": compression_ratio,
+    }
+
+
+def _decode_cached(
+    cache_key: str,
+    cached_value: Any,
+    format: str,
+    compress: bool,
+) -> Any:
+    """
+    Decode a value read from Redis and record the hit.
+
+    Raises:
+        Exception: Any deserialization error (caller falls back to the function)
+    """
+    start = time.perf_counter()
+    payload_bytes = len(cached_value)
+
+    # If format is msgpack or compressed, decode from base64
+    if format == "msgpack" or compress:
+        cached_value = base64.b64decode(cached_value)
+
+    result = deserialize(
+        cached_value,
+        format=format,
+        compressed=compress
+    )
+    cache_stats.record_hit(
+        cache_key,
+        deserialize_ms=(time.perf_counter() - start) * 1000,
+        payload_bytes=payload_bytes,
+    )
+    return result
+
+
+async def _store_result(
+    cache_key: str,
+    result: Any,
+    ttl: Optional[int],
+    format: str,
+    compress: bool,
+    compression_threshold: int,
+    func_name: str,
+) -> bool:
+    """
+    Store a computed result in Redis using the async pool.
+
+    Errors are logged and reported as False, never raised, so callers can
+    always return the freshly computed value.
+    """
+    try:
+        redis_pool = get_redis_pool()
+        serialized, measurements = _encode_for_storage(
+            cache_key, result, format, compress, compression_threshold
+        )
+
+        if ttl:
+            success = await redis_pool.setex(cache_key, ttl, serialized)
+        else:
+            success = await redis_pool.set(cache_key, serialized)
+
+        if success:
+            cache_stats.record_set(cache_key, **measurements)
+            logger.debug(f"Cache SET: {cache_key} (func={func_name}, ttl={ttl})")
+        else:
+            cache_stats.record_error(cache_key)
+            logger.warning(f"Failed to cache result for {cache_key}")
+        return bool(success)
+
+    except Exception as e:
+        # Log error but don't fail the request
+        cache_stats.record_error(cache_key)
+        logger.error(f"Failed to cache result for {cache_key}: {e}")
+        return False
+
+
+def _store_result_sync(
+    cache_key: str,
+    result: Any,
+    ttl: Optional[int],
+    format: str,
+    compress: bool,
+    compression_threshold: int,
+    func_name: str,
+) -> bool:
+    """Synchronous counterpart of _store_result using the sync client."""
+    try:
+        redis_client = get_redis_client()
+        serialized, measurements = _encode_for_storage(
+            cache_key, result, format, compress, compression_threshold
+        )
+
+        success = redis_client.set(cache_key, serialized, ttl=ttl)
+
+        if success:
+            cache_stats.record_set(cache_key, **measurements)
+            logger.debug(f"Cache SET: {cache_key} (func={func_name}, ttl={ttl})")
+        else:
+            cache_stats.record_error(cache_key)
+            logger.warning(f"Failed to cache result for {cache_key}")
+        return bool(success)
+
+    except Exception as e:
+        # Log error but don't fail the request
+        cache_stats.record_error(cache_key)
+        logger.error(f"Failed to cache result for {cache_key}: {e}")
+        return False
+
+
 def _cached_call_sync(
     func: Callable,
     args: tuple,
@@ -205,11 +418,14 @@ def _cached_call_sync(
     format: str,
     compress: bool,
     compression_threshold: int,
+    cache_none: bool = True,
 ) -> Any:
     """
     Internal function that implements the caching logic for sync functions.
 
-    This is the synchronous version of _cached_call.
+    This is the synchronous version of _cached_call. It uses the blocking
+    sync client, so when called on a thread running an event loop it skips
+    the cache and calls the function directly.
 
     Args:
         func: The original function to cache
@@ -221,22 +437,29 @@ def _cached_call_sync(
         format: Serialization format
         compress: Whether to compress
         compression_threshold: Compression threshold
+        cache_none: Whether a None result is stored
 
     Returns:
         The function result (from cache or freshly computed)
     """
     # Build cache key
     try:
-        if key is not None:
-            cache_key = key
-        else:
-            # Call key_builder with function arguments
-            cache_key = key_builder(*args, **kwargs)
+        cache_key = _build_cache_key(key, key_builder, args, kwargs)
     except Exception as e:
         logger.error(f"Failed to build cache key for {func.__name__}: {e}")
         # Fall back to calling function without caching
         return func(*args, **kwargs)
 
+    # The sync client would block the event loop - skip the cache there
+    if in_event_loop():
+        if func.__name__ not in _warned_sync_in_loop:
+            _warned_sync_in_loop.add(func.__name__)
+            logger.warning(
+                f"Sync @cached function {func.__name__} called inside the event "
+                "loop; bypassing Redis. Make it async to use the cache."
+            )
+        return func(*args, **kwargs)
+
     # Try to get from cache
     try:
         redis_client = get_redis_client()
@@ -245,18 +468,11 @@ def _cached_call_sync(
         if cached_value is not None:
             # Cache hit - deserialize and return
             try:
-                # If format is msgpack or compressed, decode from base64
-                if format == "msgpack" or compress:
-                    cached_value = base64.b64decode(cached_value)
-
-                result = deserialize(
-                    cached_value,
-                    format=format,
-                    compressed=compress
-                )
-                logger.info(f"Cache HIT: {cache_key} (func={func.__name__})")
+                result = _decode_cached(cache_key, cached_value, format, compress)
+                logger.debug(f"Cache HIT: {cache_key} (func={func.__name__})")
                 return result
             except Exception as e:
+                cache_stats.record_error(cache_key)
                 logger.error(
                     f"Failed to deserialize cached value for {cache_key}: {e}. "
                     "Falling back to function call."
@@ -264,6 +480,7 @@ def _cached_call_sync(
                 # Fall through to cache miss logic
 
     except Exception as e:
+        cache_stats.record_error(cache_key)
         logger.warning(
             f"Redis error for {cache_key}: {e}. "
             "Falling back to function call without caching."
@@ -271,7 +488,8 @@ def _cached_call_sync(
         # Fall through to cache miss logic
 
     # Cache miss - call the original function
-    logger.info(f"Cache MISS: {cache_key} (func={func.__name__})")
+    cache_stats.record_miss(cache_key)
+    logger.debug(f"Cache MISS: {cache_key} (func={func.__name__})")
 
     try:
         result = func(*args, **kwargs)
@@ -280,35 +498,12 @@ def _cached_call_sync(
         raise
 
     # Cache the result
-    try:
-        redis_client = get_redis_client()
-
-        # Serialize the result
-        serialized = serialize(
-            result,
-            format=format,
-            compress=compress,
-            compression_threshold=compression_threshold
+    if result is not None or cache_none:
+        _store_result_sync(
+            cache_key, result, ttl, format, compress,
+            compression_threshold, func.__name__,
         )
 
-        # Store in Redis (convert bytes to base64 string for storage)
-        if isinstance(serialized, bytes):
-            # For msgpack or compressed data, encode to base64
-            serialized = base64.b64encode(serialized).decode("ascii")
-
-        success = redis_client.set(cache_key, serialized, ttl=ttl)
-
-        if success:
-            logger.info(
-                f"Cache SET: {cache_key} (func={func.__name__}, ttl={ttl})"
-            )
-        else:
-            logger.warning(f"Failed to cache result for {cache_key}")
-
-    except Exception as e:
-        # Log error but don't fail the request
-        logger.error(f"Failed to cache result for {cache_key}: {e}")
-
     return result
 
 
@@ -323,6 +518,7 @@ async def _cached_call(
     compress: bool,
     compression_threshold: int,
     is_async: bool,
+    cache_none: bool = True,
 ) -> Any:
     """
     Internal function that implements the caching logic.
@@ -341,17 +537,14 @@ async def _cached_call(
         compress: Whether to compress
         compression_threshold: Compression threshold
         is_async: Whether the function is async
+        cache_none: Whether a None result is stored
 
     Returns:
         The function result (from cache or freshly computed)
     """
     # Build cache key
     try:
-        if key is not None:
-            cache_key = key
-        else:
-            # Call key_builder with function arguments
-            cache_key = key_builder(*args, **kwargs)
+        cache_key = _build_cache_key(key, key_builder, args, kwargs)
     except Exception as e:
         logger.error(f"Failed to build cache key for {func.__name__}: {e}")
         # Fall back to calling function without caching
@@ -368,18 +561,11 @@ async def _cached_call(
         if cached_value is not None:
             # Cache hit - deserialize and return
             try:
-                # If format is msgpack or compressed, decode from base64
-                if format == "msgpack" or compress:
-                    cached_value = base64.b64decode(cached_value)
-
-                result = deserialize(
-                    cached_value,
-                    format=format,
-                    compressed=compress
-                )
-                logger.info(f"Cache HIT: {cache_key} (func={func.__name__})")
+                result = _decode_cached(cache_key, cached_value, format, compress)
+                logger.debug(f"Cache HIT: {cache_key} (func={func.__name__})")
                 return result
             except Exception as e:
+                cache_stats.record_error(cache_key)
                 logger.error(
                     f"Failed to deserialize cached value for {cache_key}: {e}. "
                     "Falling back to function call."
@@ -387,6 +573,7 @@ async def _cached_call(
                 # Fall through to cache miss logic
 
     except Exception as e:
+        cache_stats.record_error(cache_key)
         logger.warning(
             f"Redis error for {cache_key}: {e}. "
             "Falling back to function call without caching."
@@ -394,7 +581,8 @@ async def _cached_call(
         # Fall through to cache miss logic
 
     # Cache miss - call the original function
-    logger.info(f"Cache MISS: {cache_key} (func={func.__name__})")
+    cache_stats.record_miss(cache_key)
+    logger.debug(f"Cache MISS: {cache_key} (func={func.__name__})")
 
     try:
         if is_async:
@@ -406,38 +594,12 @@ async def _cached_call(
         raise
 
     # Cache the result
-    try:
-        redis_pool = get_redis_pool()
-
-        # Serialize the result
-        serialized = serialize(
-            result,
-            format=format,
-            compress=compress,
-            compression_threshold=compression_threshold
+    if result is not None or cache_none:
+        await _store_result(
+            cache_key, result, ttl, format, compress,
+            compression_threshold, func.__name__,
         )
 
-        # Store in Redis (convert bytes to base64 string for storage)
-        if isinstance(serialized, bytes):
-            # For msgpack or compressed data, encode to base64
-            serialized = base64.b64encode(serialized).decode("ascii")
-
-        if ttl:
-            success = await redis_pool.setex(cache_key, ttl, serialized)
-        else:
-            success = await redis_pool.set(cache_key, serialized)
-
-        if success:
-            logger.info(
-                f"Cache SET: {cache_key} (func={func.__name__}, ttl={ttl})"
-            )
-        else:
-            logger.warning(f"Failed to cache result for {cache_key}")
-
-    except Exception as e:
-        # Log error but don't fail the request
-        logger.error(f"Failed to cache result for {cache_key}: {e}")
-
     return result
 
 
@@ -0,0 +1,383 @@
+"""Cross-worker cache invalidation over Redis pub/sub.
+
+Each uvicorn worker keeps in-process state (the pipeline_state object in
+backend/main.py, and any local L1 cache). When one worker writes to the
+database, the others must drop the entries derived from that write. Writers
+call publish_change() after committing; every worker runs an
+InvalidationListener that receives the event and dispatches it to the local
+handlers registered with subscribe().
+
+Event Flow:
+    writer (pitch_db.save_pitches)
+        -> publish_change(SOURCE_PM_PITCHES, week_id=...)
+        -> DEL shared Redis keys listed in the event
+        -> PUBLISH cache:invalidate {"source": "pm_pitches", ...}
+    other workers
+        -> InvalidationListener receives the message
+        -> handlers subscribed to "pm_pitches" (or "*") drop local entries
+
+Sources:
+    Table names (pm_pitches, peer_reviews, chairman_decisions,
+    research_reports, execution_events) for direct writes, and Stage.name
+    values (PMPitchStage, ...) for completed pipeline stages.
+
+    The PostgreSQL change feed (backend/db/change_feed.py) dispatches the
+    same events for every committed write to those tables, including writes
+    from scripts that never call publish_change().
+
+Usage:
+    from backend.cache.invalidation import publish_change, subscribe
+
+    # Writer side - never raises
+    await publish_change(SOURCE_PM_PITCHES, week_id=week_id)
+
+    # Reader side - drop local state when another worker writes
+    subscribe(SOURCE_PM_PITCHES, lambda event: local_cache.clear())
+
+Notes:
+    - A worker ignores the events it published itself; it already holds
+      the fresh data it just wrote.
+    - Publishing requires the async Redis pool. Without it (scripts, tests)
+      publish_change() is a no-op that returns False.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import socket
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pub/sub channel shared by all workers
+INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+
+# Identifies this process so it can skip its own events
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Source tables written by the db modules
+SOURCE_PM_PITCHES = "pm_pitches"
+SOURCE_PEER_REVIEWS = "peer_reviews"
+SOURCE_CHAIRMAN_DECISIONS = "chairman_decisions"
+SOURCE_RESEARCH_REPORTS = "research_reports"
+SOURCE_EXECUTION_EVENTS = "execution_events"
+
+# Subscribe to every source
+ALL_SOURCES = "*"
+
+
+@dataclass(frozen=True)
+class InvalidationEvent:
+    """A change notification published by a writer."""
+
+    source: str
+    week_id: Optional[str] = None
+    research_date: Optional[str] = None
+    keys: Tuple[str, ...] = ()
+    origin: str = WORKER_ID
+    published_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def to_json(self) -> str:
+        """Serialize the event for publishing."""
+        data = asdict(self)
+        data["keys"] = list(self.keys)
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "InvalidationEvent":
+        """
+        Parse a published event.
+
+        Raises:
+            ValueError: If the payload is not a valid event
+        """
+        try:
+            data = json.loads(payload)
+            return cls(
+                source=data["source"],
+                week_id=data.get("week_id"),
+                research_date=data.get("research_date"),
+                keys=tuple(data.get("keys") or ()),
+                origin=data.get("origin", ""),
+                published_at=data.get("published_at", ""),
+            )
+        except (TypeError, KeyError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid invalidation event: {e}") from e
+
+
+Handler = Callable[[InvalidationEvent], Any]
+
+# source -> handlers (sync or async)
+_handlers: Dict[str, List[Handler]] = {}
+
+
+# ============================================================================
+# Local Handlers
+# ============================================================================
+
+
+def subscribe(source: str, handler: Handler) -> None:
+    """
+    Register a local handler for change events from a source.
+
+    Args:
+        source: Table or stage name, or ALL_SOURCES for every event
+        handler: Callable (sync or async) receiving the InvalidationEvent
+    """
+    handlers = _handlers.setdefault(source, [])
+    if handler not in handlers:
+        handlers.append(handler)
+
+
+def unsubscribe(source: str, handler: Handler) -> None:
+    """Remove a handler registered with subscribe()."""
+    handlers = _handlers.get(source, [])
+    if handler in handlers:
+        handlers.remove(handler)
+
+
+async def dispatch(event: InvalidationEvent) -> int:
+    """
+    Run every local handler registered for the event's source.
+
+    Handler errors are logged and do not stop the remaining handlers.
+
+    Args:
+        event: Event to dispatch
+
+    Returns:
+        Number of handlers that ran successfully
+    """
+    handlers = _handlers.get(event.source, []) + _handlers.get(ALL_SOURCES, [])
+    succeeded = 0
+    for handler in handlers:
+        try:
+            result = handler(event)
+            if inspect.isawaitable(result):
+                await result
+            succeeded += 1
+        except Exception as e:
+            logger.error(f"Invalidation handler failed for {event.source}: {e}")
+    return succeeded
+
+
+# ============================================================================
+# Publishing
+# ============================================================================
+
+
+async def publish_change(
+    source: str,
+    *,
+    week_id: Optional[str] = None,
+    research_date: Optional[str] = None,
+    keys: Tuple[str, ...] = (),
+) -> bool:
+    """
+    Announce that a source was written so other workers drop local entries.
+
+    Shared Redis keys listed in `keys` are deleted before the event is
+    published, so a worker reacting to the event never re-reads them stale.
+    Safe to call from any writer - errors are logged, never raised.
+
+    Args:
+        source: Table or stage name that changed
+        week_id: Week identifier of the written data (optional)
+        research_date: Research date of the written data (optional)
+        keys: Shared Redis cache keys derived from the written data
+
+    Returns:
+        True if the event was published, False otherwise
+
+    Example:
+        await publish_change(SOURCE_CHAIRMAN_DECISIONS, research_date=research_date)
+    """
+    from backend.redis_client import get_redis_pool
+
+    try:
+        redis = get_redis_pool()
+    except RuntimeError:
+        logger.debug(f"Invalidation not published for {source}: Redis pool not initialized")
+        return False
+
+    event = InvalidationEvent(
+        source=source, week_id=week_id, research_date=research_date, keys=tuple(keys)
+    )
+
+    try:
+        if event.keys:
+            await redis.delete(*event.keys)
+        receivers = await redis.publish(INVALIDATION_CHANNEL, event.to_json())
+        logger.debug(f"Invalidation published: {source} ({receivers} receivers)")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to publish invalidation for {source}: {e}")
+        return False
+
+
+async def stage_completed(stage_name: str) -> None:
+    """
+    Pipeline hook: warm shared keys, then tell other workers the stage ran.
+
+    Passed as Pipeline(on_stage_complete=...) by the weekly pipeline.
+
+    Args:
+        stage_name: Stage.name of the stage that just completed
+    """
+    from backend.cache.warming import warm_after_stage
+
+    await warm_after_stage(stage_name)
+    await publish_change(stage_name)
+
+
+# ============================================================================
+# Listener
+# ============================================================================
+
+
+class InvalidationListener:
+    """
+    Background task that receives invalidation events for this worker.
+
+    Subscribes to INVALIDATION_CHANNEL on the async Redis pool and dispatches
+    every event published by another worker to the local handlers. The
+    subscription is re-established with backoff if the connection drops.
+
+    Example:
+        listener = InvalidationListener()
+        await listener.start()
+        ...
+        await listener.stop()
+    """
+
+    def __init__(self, channel: str = INVALIDATION_CHANNEL, poll_timeout: float = 1.0):
+        self.channel = channel
+        self.poll_timeout = poll_timeout
+        self.received = 0
+        self._task: Optional[asyncio.Task] = None
+        self._pubsub = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """
+        Subscribe and start the listener task.
+
+        Raises:
+            RuntimeError: If the async Redis pool is not initialized
+        """
+        if self.running:
+            return
+        await self._subscribe()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Invalidation listener subscribed to '{self.channel}'")
+
+    async def stop(self) -> None:
+        """Cancel the listener task and close the subscription."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_pubsub()
+
+    async def handle_message(self, data: Any) -> bool:
+        """
+        Parse and dispatch one pub/sub payload.
+
+        Args:
+            data: Message payload (str or bytes)
+
+        Returns:
+            True if the event was dispatched, False if ignored or invalid
+        """
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        try:
+            event = InvalidationEvent.from_json(data)
+        except ValueError as e:
+            logger.warning(str(e))
+            return False
+
+        if event.origin == WORKER_ID:
+            return False
+
+        self.received += 1
+        await dispatch(event)
+        return True
+
+    async def _subscribe(self) -> None:
+        from backend.redis_client import get_redis_pool
+
+        self._pubsub = get_redis_pool().pubsub()
+        await self._pubsub.subscribe(self.channel)
+
+    async def _close_pubsub(self) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing invalidation subscription: {e}")
+        self._pubsub = None
+
+    async def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.poll_timeout
+                )
+                if message and message.get("type") == "message":
+                    await self.handle_message(message["data"])
+                backoff = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Invalidation listener error: {e}; resubscribing in {backoff:.0f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+                try:
+                    await self._close_pubsub()
+                    await self._subscribe()
+                except Exception as resub_error:
+                    logger.error(f"Invalidation resubscribe failed: {resub_error}")
+
+
+# Global listener instance (one per worker)
+_listener: Optional[InvalidationListener] = None
+
+
+async def start_listener() -> InvalidationListener:
+    """
+    Start this worker's invalidation listener.
+
+    Returns:
+        The running InvalidationListener
+
+    Raises:
+        RuntimeError: If the async Redis pool is not initialized
+    """
+    global _listener
+    if _listener is None:
+        _listener = InvalidationListener()
+    await _listener.start()
+    return _listener
+
+
+async def stop_listener() -> None:
+    """Stop this worker's invalidation listener if it is running."""
+    global _listener
+    if _listener is not None:
+        await _listener.stop()
+        _listener = None
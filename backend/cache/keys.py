@@ -40,6 +40,7 @@ PREFIX_MARKET = "market"
 PREFIX_PITCHES = "pitches"
 PREFIX_GRAPHS = "graphs"
 PREFIX_DATA_PACKAGE = "data_package"
+PREFIX_BUNDLE = "bundle"
 
 
 # ============================================================================
@@ -412,6 +413,38 @@ def data_package_date_key(date: str) -> str:
     return f"{PREFIX_DATA_PACKAGE}:date:{date}"
 
 
+# ============================================================================
+# Week Bundle Keys
+# ============================================================================
+
+
+def week_bundle_key(week_id: str) -> str:
+    """
+    Build cache key for the frozen week bundle.
+
+    The week bundle is written once at weekly-pipeline completion and
+    contains the market snapshot, graph digest, pitches, chairman decision
+    and execution results for the week.
+
+    Args:
+        week_id: Week identifier (e.g., "2024-01-10")
+
+    Returns:
+        Cache key in format: "bundle:week:{week_id}"
+
+    Example:
+        >>> week_bundle_key("2024-01-10")
+        'bundle:week:2024-01-10'
+
+    Note:
+        Bundles are immutable; the key always holds the latest version and
+        is only replaced when the weekly pipeline is re-run.
+    """
+    if not week_id:
+        raise ValueError("week_id is required")
+    return f"{PREFIX_BUNDLE}:week:{week_id}"
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -573,6 +606,7 @@ def validate_key(key: str) -> bool:
         PREFIX_PITCHES,
         PREFIX_GRAPHS,
         PREFIX_DATA_PACKAGE,
+        PREFIX_BUNDLE,
     }
 
     if parts[0] not in valid_categories:
@@ -0,0 +1,351 @@
+"""Cache observability: per-key-family counters and histograms.
+
+The @cached decorator records every lookup here. Keys are grouped into
+families by backend/cache/keys.parse_key ("category:subcategory"), so
+"research:report:abc" and "research:report:def" aggregate together.
+
+Recorded Per Family:
+    - hits, misses, errors, sets
+    - deserialize_ms: time to decode a cached value (histogram)
+    - serialize_ms: time to encode a value before SET (histogram)
+    - payload_bytes: size of the value stored in Redis (histogram)
+    - compression_ratio: uncompressed / compressed size for gzip payloads
+
+Cluster View:
+    Stats are kept in-process (one set per uvicorn worker). Each worker
+    periodically writes a snapshot to Redis under cache:stats:worker:<id>
+    with a TTL; collect_cluster_stats() merges every live worker's snapshot.
+    Histograms use fixed buckets so snapshots merge by adding counts.
+
+Usage:
+    from backend.cache.stats import cache_stats, collect_cluster_stats
+
+    cache_stats.record_hit("market:metrics:latest", deserialize_ms=0.4, payload_bytes=5120)
+    snapshot = cache_stats.snapshot()
+
+    # All workers (used by /api/cache/stats and cli.py cache-stats)
+    stats = await collect_cluster_stats()
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+from backend.cache.keys import parse_key
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds (a final +Inf bucket is implicit)
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0)
+SIZE_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+RATIO_BUCKETS = (1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0)
+
+# Redis snapshot publishing
+STATS_KEY_PREFIX = "cache:stats:worker:"
+STATS_PUBLISH_INTERVAL = int(os.getenv("CACHE_STATS_PUBLISH_INTERVAL", "30"))
+STATS_SNAPSHOT_TTL = STATS_PUBLISH_INTERVAL * 4
+
+UNKNOWN_FAMILY = "unknown"
+
+
+@lru_cache(maxsize=1024)
+def family_for_key(key: str) -> str:
+    """
+    Get the key family used to aggregate stats.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        "category:subcategory", or "unknown" for keys that do not parse
+
+    Example:
+        >>> family_for_key("research:report:abc123")
+        'research:report'
+    """
+    if ":" not in key:
+        return UNKNOWN_FAMILY
+    parts = parse_key(key)
+    return f"{parts['category']}:{parts['subcategory']}"
+
+
+# ============================================================================
+# Histogram
+# ============================================================================
+
+
+class Histogram:
+    """Fixed-bucket histogram that can be merged across processes."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Add the counts of a to_dict() snapshot with the same buckets."""
+        for i, n in enumerate(data.get("counts", [])[: len(self.counts)]):
+            self.counts[i] += n
+        self.count += data.get("count", 0)
+        self.total += data.get("sum", 0.0)
+        self.max = max(self.max, data.get("max", 0.0))
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Upper bound of the bucket containing the p-th percentile (0-100)."""
+        if self.count == 0:
+            return None
+        target = self.count * p / 100.0
+        running = 0
+        for i, n in enumerate(self.counts):
+            running += n
+            if running >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "mean": round(self.total / self.count, 4) if self.count else None,
+            "max": round(self.max, 4),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+        }
+
+
+class FamilyStats:
+    """Counters and histograms for one key family."""
+
+    HISTOGRAMS = ("deserialize_ms", "serialize_ms", "payload_bytes", "compression_ratio")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.sets = 0
+        self.deserialize_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.serialize_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.payload_bytes = Histogram(SIZE_BUCKETS_BYTES)
+        self.compression_ratio = Histogram(RATIO_BUCKETS)
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        self.hits += data.get("hits", 0)
+        self.misses += data.get("misses", 0)
+        self.errors += data.get("errors", 0)
+        self.sets += data.get("sets", 0)
+        for name in self.HISTOGRAMS:
+            if name in data:
+                getattr(self, name).merge(data[name])
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        data = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "sets": self.sets,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+        for name in self.HISTOGRAMS:
+            data[name] = getattr(self, name).to_dict()
+        return data
+
+
+# ============================================================================
+# Recorder
+# ============================================================================
+
+
+class CacheStats:
+    """
+    Thread-safe per-family cache statistics for this process.
+
+    The sync decorator path may run in worker threads, so updates take a
+    lock. Recording never raises.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._families: Dict[str, FamilyStats] = {}
+        self.started_at = datetime.utcnow().isoformat()
+
+    def _family(self, key: str) -> FamilyStats:
+        family = family_for_key(key)
+        stats = self._families.get(family)
+        if stats is None:
+            stats = self._families[family] = FamilyStats()
+        return stats
+
+    def record_hit(self, key: str, deserialize_ms: float, payload_bytes: int) -> None:
+        with self._lock:
+            stats = self._family(key)
+            stats.hits += 1
+            stats.deserialize_ms.observe(deserialize_ms)
+            stats.payload_bytes.observe(payload_bytes)
+
+    def record_miss(self, key: str) -> None:
+        with self._lock:
+            self._family(key).misses += 1
+
+    def record_error(self, key: str) -> None:
+        with self._lock:
+            self._family(key).errors += 1
+
+    def record_set(
+        self,
+        key: str,
+        serialize_ms: float,
+        payload_bytes: int,
+        compression_ratio: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            stats = self._family(key)
+            stats.sets += 1
+            stats.serialize_ms.observe(serialize_ms)
+            stats.payload_bytes.observe(payload_bytes)
+            if compression_ratio is not None:
+                stats.compression_ratio.observe(compression_ratio)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable snapshot of this process's stats.
+
+        Returns:
+            Dict with started_at, pid and families (family -> stats dict)
+        """
+        with self._lock:
+            families = {name: s.to_dict() for name, s in sorted(self._families.items())}
+        return {"started_at": self.started_at, "pid": os.getpid(), "families": families}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._families.clear()
+            self.started_at = datetime.utcnow().isoformat()
+
+
+# Global recorder for this process
+cache_stats = CacheStats()
+
+
+def merge_snapshots(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-worker snapshots into one view.
+
+    Args:
+        snapshots: List of CacheStats.snapshot() dicts
+
+    Returns:
+        Dict with workers (count) and families (family -> merged stats)
+    """
+    merged: Dict[str, FamilyStats] = {}
+    for snapshot in snapshots:
+        for name, data in snapshot.get("families", {}).items():
+            merged.setdefault(name, FamilyStats()).merge(data)
+    return {
+        "workers": len(snapshots),
+        "families": {name: s.to_dict() for name, s in sorted(merged.items())},
+    }
+
+
+# ============================================================================
+# Cluster Snapshots (Redis)
+# ============================================================================
+
+
+async def publish_stats() -> bool:
+    """Write this worker's snapshot to Redis. Never raises."""
+    from backend.cache.invalidation import WORKER_ID
+    from backend.redis_client import get_redis_pool
+
+    try:
+        redis = get_redis_pool()
+        await redis.setex(
+            f"{STATS_KEY_PREFIX}{WORKER_ID}",
+            STATS_SNAPSHOT_TTL,
+            json.dumps(cache_stats.snapshot(), separators=(",", ":")),
+        )
+        return True
+    except Exception as e:
+        logger.debug(f"Cache stats not published: {e}")
+        return False
+
+
+async def collect_cluster_stats(include_local: bool = True) -> Dict[str, Any]:
+    """
+    Merge the stats of every live worker. Only reads; never publishes.
+
+    Args:
+        include_local: Merge this process's stats in memory (in place of its
+            possibly stale Redis snapshot). The API passes True; cli.py
+            passes False, since a short-lived CLI process has no stats of
+            its own and must not count as a worker.
+
+    Returns:
+        Dict with scope ("cluster" or "local"), workers and families.
+        Falls back to local stats when Redis is unavailable.
+    """
+    from backend.cache.invalidation import WORKER_ID
+    from backend.redis_client import get_redis_pool
+
+    local = cache_stats.snapshot()
+    try:
+        redis = get_redis_pool()
+        own_key = f"{STATS_KEY_PREFIX}{WORKER_ID}"
+        snapshots = [local] if include_local else []
+        async for key in redis.scan_iter(match=f"{STATS_KEY_PREFIX}*"):
+            if key == own_key:
+                continue
+            payload = await redis.get(key)
+            if payload:
+                snapshots.append(json.loads(payload))
+        return {"scope": "cluster", **merge_snapshots(snapshots)}
+    except Exception as e:
+        logger.warning(f"Cluster cache stats unavailable, using local stats: {e}")
+
+    return {"scope": "local", **merge_snapshots([local])}
+
+
+# Background publisher task
+_publisher_task: Optional[asyncio.Task] = None
+
+
+async def _publish_loop(interval: int) -> None:
+    while True:
+        await publish_stats()
+        await asyncio.sleep(interval)
+
+
+def start_stats_publisher(interval: int = STATS_PUBLISH_INTERVAL) -> None:
+    """Start publishing this worker's snapshot every `interval` seconds."""
+    global _publisher_task
+    if _publisher_task is None or _publisher_task.done():
+        _publisher_task = asyncio.create_task(_publish_loop(interval))
+
+
+async def stop_stats_publisher() -> None:
+    """Stop the publisher; the last snapshot expires after STATS_SNAPSHOT_TTL."""
+    global _publisher_task
+    if _publisher_task is not None:
+        _publisher_task.cancel()
+        try:
+            await _publisher_task
+        except asyncio.CancelledError:
+            pass
+        _publisher_task = None
@@ -0,0 +1,272 @@
+"""Proactive cache warming for dashboard read paths.
+
+This module knows which cache keys (see backend/cache/keys.py) are derived
+from which database tables and pipeline stages. When a producer finishes
+writing - the daily data job, calculate_metrics.py, or a pipeline stage -
+it calls warm_after_update() with the sources it touched, and every
+dependent key is recomputed and stored before the first dashboard request
+arrives.
+
+Dependency Map:
+    market:metrics:latest   <- rolling_7day_log_returns, correlation_matrix
+    market:prices:latest    <- daily_bars
+    research:latest         <- research_reports, ResearchStage
+    research:history:90     <- research_reports, ResearchStage
+    graphs:latest           <- research_reports, ResearchStage
+    data_package:latest     <- all of the above
+
+Warming Order:
+    Base keys are refreshed concurrently first. Composite keys (graphs,
+    data package) are refreshed afterwards so they are built from the
+    freshly warmed base keys instead of hitting the database again.
+
+Usage:
+    from backend.cache.warming import warm_cache, warm_after_update
+
+    # Warm every registered key (cli.py warm-cache, cron)
+    results = await warm_cache()
+
+    # Producer hook - never raises
+    await warm_after_update(TABLE_DAILY_BARS)
+
+Notes:
+    - Warming requires the database pool; it is skipped (not failed) when
+      the pool is not initialized, so an empty result is never cached.
+    - The async Redis pool is initialized on demand for scripts that do not
+      run inside the FastAPI app.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from backend.cache.keys import (
+    research_latest_key,
+    research_history_key,
+    market_metrics_key,
+    market_prices_key,
+    graphs_latest_key,
+    data_package_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Source tables
+TABLE_DAILY_BARS = "daily_bars"
+TABLE_DAILY_LOG_RETURNS = "daily_log_returns"
+TABLE_ROLLING_7DAY_LOG_RETURNS = "rolling_7day_log_returns"
+TABLE_CORRELATION_MATRIX = "correlation_matrix"
+TABLE_RESEARCH_REPORTS = "research_reports"
+
+# Source pipeline stages (Stage.name)
+STAGE_RESEARCH = "ResearchStage"
+
+METRICS_SOURCES = frozenset({TABLE_ROLLING_7DAY_LOG_RETURNS, TABLE_CORRELATION_MATRIX})
+PRICES_SOURCES = frozenset({TABLE_DAILY_BARS})
+RESEARCH_SOURCES = frozenset({TABLE_RESEARCH_REPORTS, STAGE_RESEARCH})
+
+
+@dataclass(frozen=True)
+class WarmTarget:
+    """A cache key together with the sources it is derived from."""
+
+    key: str
+    refresh: Callable[[], Awaitable[Any]]
+    sources: FrozenSet[str]
+    composite: bool = False
+
+
+# ============================================================================
+# Refresh Functions
+# ============================================================================
+# Imports are deferred so importing this module does not pull in the
+# service layer (and the pipeline stages it depends on).
+
+
+async def _refresh_market_metrics() -> Any:
+    from backend.db.market_db import fetch_market_metrics
+    return await fetch_market_metrics.refresh()
+
+
+async def _refresh_market_prices() -> Any:
+    from backend.db.market_db import fetch_current_prices
+    return await fetch_current_prices.refresh()
+
+
+async def _refresh_research_latest() -> Any:
+    from backend.db.research_db import get_latest_research
+    return await get_latest_research.refresh()
+
+
+async def _refresh_research_history() -> Any:
+    from backend.db.research_db import get_research_history
+    return await get_research_history.refresh(90)
+
+
+async def _refresh_graphs_latest() -> Any:
+    from backend.services.research_service import ResearchService
+    return await ResearchService.get_latest_graphs.refresh(ResearchService())
+
+
+async def _refresh_data_package() -> Any:
+    from backend.services.research_service import ResearchService
+    return await ResearchService.get_latest_data_package.refresh(ResearchService())
+
+
+WARM_TARGETS: List[WarmTarget] = [
+    WarmTarget(market_metrics_key(), _refresh_market_metrics, METRICS_SOURCES),
+    WarmTarget(market_prices_key(), _refresh_market_prices, PRICES_SOURCES),
+    WarmTarget(research_latest_key(), _refresh_research_latest, RESEARCH_SOURCES),
+    WarmTarget(research_history_key(90), _refresh_research_history, RESEARCH_SOURCES),
+    WarmTarget(
+        graphs_latest_key(), _refresh_graphs_latest, RESEARCH_SOURCES, composite=True
+    ),
+    WarmTarget(
+        data_package_key(),
+        _refresh_data_package,
+        METRICS_SOURCES | PRICES_SOURCES | RESEARCH_SOURCES,
+        composite=True,
+    ),
+]
+
+
+# ============================================================================
+# Dependency Lookup
+# ============================================================================
+
+
+def get_key_dependencies() -> Dict[str, FrozenSet[str]]:
+    """
+    Get the mapping of warmable cache keys to their source tables/stages.
+
+    Returns:
+        Dict keyed by cache key with the set of sources it depends on
+
+    Example:
+        >>> get_key_dependencies()["market:prices:latest"]
+        frozenset({'daily_bars'})
+    """
+    return {target.key: target.sources for target in WARM_TARGETS}
+
+
+def targets_for_sources(sources: Optional[Iterable[str]] = None) -> List[WarmTarget]:
+    """
+    Get the warm targets affected by a set of sources.
+
+    Args:
+        sources: Table or stage names that changed. None selects all targets.
+
+    Returns:
+        List of WarmTarget in registration order
+    """
+    if sources is None:
+        return list(WARM_TARGETS)
+    changed = set(sources)
+    return [target for target in WARM_TARGETS if target.sources & changed]
+
+
+# ============================================================================
+# Warming
+# ============================================================================
+
+
+async def _ensure_pools() -> bool:
+    """Make sure the database pool and async Redis pool are available."""
+    from backend.db.pool import get_pool
+    from backend.redis_client import get_redis_pool, init_redis_pool
+
+    try:
+        get_pool()
+    except RuntimeError:
+        logger.warning("Cache warming skipped: database pool not initialized")
+        return False
+
+    try:
+        get_redis_pool()
+    except RuntimeError:
+        try:
+            await init_redis_pool()
+        except Exception as e:
+            logger.warning(f"Cache warming skipped: Redis unavailable ({e})")
+            return False
+
+    return True
+
+
+async def _warm_target(target: WarmTarget) -> bool:
+    """Refresh one target, reporting success instead of raising."""
+    try:
+        result = await target.refresh()
+        if result is None:
+            logger.warning(f"Cache warm produced no data: {target.key}")
+            return False
+        logger.info(f"Cache WARM: {target.key}")
+        return True
+    except Exception as e:
+        logger.error(f"Cache warm failed for {target.key}: {e}")
+        return False
+
+
+async def warm_cache(sources: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+    """
+    Recompute and store every cache key that depends on the given sources.
+
+    Args:
+        sources: Table or stage names that changed. None warms every key.
+
+    Returns:
+        Dict mapping each warmed cache key to True (stored) or False (failed).
+        Empty dict if warming was skipped because a pool is unavailable.
+
+    Example:
+        results = await warm_cache([TABLE_DAILY_BARS])
+        # {'market:prices:latest': True, 'data_package:latest': True}
+    """
+    targets = targets_for_sources(sources)
+    if not targets:
+        return {}
+
+    if not await _ensure_pools():
+        return {}
+
+    base = [t for t in targets if not t.composite]
+    composite = [t for t in targets if t.composite]
+
+    results: Dict[str, bool] = {}
+    for group in (base, composite):
+        outcomes = await asyncio.gather(*(_warm_target(t) for t in group))
+        results.update({t.key: ok for t, ok in zip(group, outcomes)})
+
+    return results
+
+
+async def warm_after_update(*sources: str) -> Dict[str, bool]:
+    """
+    Producer hook: warm keys derived from the sources that were just written.
+
+    Safe to call from any producer - errors are logged, never raised.
+
+    Args:
+        *sources: Table or stage names that were just written
+
+    Returns:
+        Same as warm_cache()
+    """
+    try:
+        return await warm_cache(sources)
+    except Exception as e:
+        logger.error(f"Cache warming after update of {sources} failed: {e}")
+        return {}
+
+
+async def warm_after_stage(stage_name: str) -> None:
+    """
+    Pipeline hook: warm keys derived from a completed stage.
+
+    Passed as Pipeline(on_stage_complete=...) by the weekly pipeline.
+
+    Args:
+        stage_name: Stage.name of the stage that just completed
+    """
+    await warm_after_update(stage_name)
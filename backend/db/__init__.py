@@ -5,9 +5,11 @@ This module provides async connection pooling and database utilities.
 Main exports:
 - DatabaseConfig: Pool configuration
 - init_pool: Initialize connection pool (call on startup)
-- get_pool: Get the connection pool
-- close_pool: Close connection pool (call on shutdown)
-- check_pool_health: Health check for monitoring
+- init_pools: Initialize primary + read/batch pools (call on startup)
+- get_pool: Get the connection pool (optionally a named pool)
+- close_pool: Close connection pools (call on shutdown)
+- check_pool_health / check_all_pools_health: Health checks for monitoring
+- pool_name_for_intent: Map "read"/"write"/"batch" to a pool name
 
 For database queries, use the helper functions in backend/db_helpers.py:
 - fetch_one, fetch_all, fetch_val, execute, transaction
@@ -15,17 +17,26 @@ For database queries, use the helper functions in backend/db_helpers.py:
 For advanced queries, use query builders:
 - SelectQuery, build_upsert, build_batch_upsert, etc.
 
+For bulk loads (thousands of rows), use the COPY-based loader:
+- bulk_upsert
+
 ⚠️ Note: get_connection and DatabaseConnection are deprecated legacy utilities
 using psycopg2. They are no longer exported. Use the async pool instead.
 """
 
 from .pool import (
     DatabaseConfig,
+    POOL_PRIMARY,
+    POOL_READ,
+    POOL_BATCH,
     init_pool,
+    init_pools,
     get_pool,
+    pool_name_for_intent,
     close_pool,
     get_config,
     check_pool_health,
+    check_all_pools_health,
 )
 from .query_builders import (
     SelectQuery,
@@ -36,15 +47,22 @@ from .query_builders import (
     build_count_query,
     validate_identifier,
 )
+from .bulk_loader import bulk_upsert
 
 __all__ = [
     # Connection pool (main API)
     "DatabaseConfig",
+    "POOL_PRIMARY",
+    "POOL_READ",
+    "POOL_BATCH",
     "init_pool",
+    "init_pools",
     "get_pool",
+    "pool_name_for_intent",
     "close_pool",
     "get_config",
     "check_pool_health",
+    "check_all_pools_health",
     # Query builders (optional helpers)
     "SelectQuery",
     "build_upsert",
@@ -53,4 +71,6 @@ __all__ = [
     "build_date_range_query",
     "build_count_query",
     "validate_identifier",
+    # Bulk loading
+    "bulk_upsert",
 ]
@@ -0,0 +1,238 @@
+"""COPY-based bulk upserts for market data and metrics tables.
+
+Row-at-a-time INSERTs (or executemany with ON CONFLICT) cost one statement
+per row. For seeding 180 days x N symbols or a full correlation backfill,
+this module loads rows in three statements inside one transaction:
+
+    1. CREATE TEMP TABLE ... ON COMMIT DROP   (staging table, same column types)
+    2. COPY rows into the staging table       (asyncpg copy_records_to_table)
+    3. INSERT INTO target SELECT ... FROM staging ON CONFLICT DO UPDATE
+
+Columns are passed column-wise (a pandas DataFrame or a mapping of column
+name to list / NumPy array / pandas Series). Conversion to Python values is
+vectorized: NaN/NaT become NULL and NumPy scalars become native types
+without iterating rows in Python.
+
+Usage:
+    from backend.db.bulk_loader import bulk_upsert
+
+    rows = await bulk_upsert(
+        "daily_log_returns",
+        df[["symbol", "date", "log_return"]],
+        conflict_columns=["symbol", "date"],
+        touch_columns=["created_at"],
+    )
+
+Notes:
+    - Identifiers are validated with validate_identifier (no SQL injection)
+    - Duplicate conflict keys within one load keep the last row
+    - All three steps share one transaction: a failure leaves the table untouched
+    - Loads run on the batch pool (falls back to primary if not initialized)
+"""
+
+import logging
+from typing import Any, List, Optional, Sequence
+
+from backend.db.metrics import timed_acquire, track_query
+from backend.db.pool import POOL_BATCH, get_pool
+from backend.db.query_builders import validate_identifier
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# COLUMN CONVERSION
+# ============================================================================
+
+def _column_to_list(values: Any, length: Optional[int] = None) -> List[Any]:
+    """
+    Convert one column to a list of Python values accepted by asyncpg.
+
+    Args:
+        values: List, NumPy array, pandas Series/Index, or a scalar
+        length: Row count used to broadcast scalars
+
+    Returns:
+        List of native Python values (NaN/NaT -> None)
+    """
+    import numpy as np
+
+    if getattr(getattr(values, "dtype", None), "tz", None) is not None:
+        # tz-aware pandas column: keep the offset, NaT -> None
+        import pandas as pd
+
+        index = pd.DatetimeIndex(values)
+        out = index.to_pydatetime().astype(object)
+        out[index.isna()] = None
+        return out.tolist()
+
+    arr = np.asarray(values)
+    if arr.ndim == 0:
+        if length is None:
+            raise ValueError("Scalar column needs a row count to broadcast")
+        return [arr.item()] * length
+
+    kind = arr.dtype.kind
+    if kind == "M":
+        mask = np.isnat(arr)
+        out = arr.astype("datetime64[us]").astype(object)
+    elif kind == "f":
+        mask = np.isnan(arr)
+        if not mask.any():
+            return arr.tolist()
+        out = arr.astype(object)
+    elif kind == "O":
+        mask = arr != arr  # True only for NaN-like values
+        out = arr
+    else:
+        return arr.tolist()
+
+    if mask.any():
+        out = out.copy() if out is arr else out
+        out[mask] = None
+    return out.tolist()
+
+
+def _is_scalar(values: Any) -> bool:
+    """True for single values that are broadcast to every row."""
+    if isinstance(values, (str, bytes)):
+        return True
+    return getattr(values, "ndim", None) == 0 or not hasattr(values, "__len__")
+
+
+def columns_to_records(data: Any, columns: Sequence[str]) -> List[tuple]:
+    """
+    Convert column-wise data to records for COPY.
+
+    Args:
+        data: pandas DataFrame or mapping of column name -> array-like/scalar
+        columns: Column names, in COPY order
+
+    Returns:
+        List of row tuples
+
+    Raises:
+        KeyError: If a column is missing from data
+        ValueError: If columns have different lengths
+    """
+    lengths = {len(data[col]) for col in columns if not _is_scalar(data[col])}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    length = lengths.pop() if lengths else 1
+
+    column_lists = [_column_to_list(data[col], length) for col in columns]
+    return list(zip(*column_lists))
+
+
+# ============================================================================
+# BULK UPSERT
+# ============================================================================
+
+def _build_merge_query(
+    table: str,
+    staging: str,
+    columns: Sequence[str],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+    touch_columns: Sequence[str],
+) -> str:
+    """Build the INSERT ... SELECT ... ON CONFLICT merge from the staging table."""
+    cols = ", ".join(columns)
+    conflict = ", ".join(conflict_columns)
+
+    assignments = [f"{col} = EXCLUDED.{col}" for col in update_columns]
+    assignments += [f"{col} = NOW()" for col in touch_columns]
+    action = f"DO UPDATE SET {', '.join(assignments)}" if assignments else "DO NOTHING"
+
+    return (
+        f"INSERT INTO {table} ({cols}) "
+        f"SELECT DISTINCT ON ({conflict}) {cols} FROM {staging} "
+        f"ORDER BY {conflict}, ctid DESC "
+        f"ON CONFLICT ({conflict}) {action}"
+    )
+
+
+def _rowcount(status: str) -> int:
+    """Parse the row count from a command status ("INSERT 0 42" -> 42)."""
+    try:
+        return int(status.split()[-1])
+    except (AttributeError, IndexError, ValueError):
+        return 0
+
+
+async def bulk_upsert(
+    table: str,
+    data: Any,
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    touch_columns: Sequence[str] = (),
+    columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Upsert many rows with COPY into a staging table and one merge statement.
+
+    Args:
+        table: Target table name
+        data: pandas DataFrame or mapping of column name -> array-like/scalar
+              (scalars are broadcast, e.g. {"symbol": "SPY", ...})
+        conflict_columns: Unique key columns for ON CONFLICT
+        update_columns: Columns to overwrite on conflict (default: every
+                        loaded column not in conflict_columns)
+        touch_columns: Columns set to NOW() on conflict (e.g. created_at)
+        columns: Columns to load (default: all columns of data)
+
+    Returns:
+        Number of rows inserted or updated
+
+    Raises:
+        ValueError: If an identifier is invalid or columns are inconsistent
+        Exception: If the database operation fails (logged and raised)
+
+    Example:
+        await bulk_upsert(
+            "daily_bars",
+            {"symbol": "SPY", "date": dates, "open": o, "high": h,
+             "low": l, "close": c, "volume": v},
+            conflict_columns=["symbol", "date"],
+        )
+    """
+    columns = list(columns if columns is not None else data.keys())
+    conflict_columns = list(conflict_columns)
+    if update_columns is None:
+        update_columns = [col for col in columns if col not in conflict_columns]
+
+    for identifier in [table, *columns, *conflict_columns, *update_columns, *touch_columns]:
+        if not validate_identifier(identifier):
+            raise ValueError(f"Invalid SQL identifier: {identifier!r}")
+    missing = [col for col in conflict_columns if col not in columns]
+    if missing:
+        raise ValueError(f"Conflict columns not loaded: {missing}")
+
+    records = columns_to_records(data, columns)
+    if not records:
+        return 0
+
+    staging = f"_stage_{table}"[:63]
+    merge_query = _build_merge_query(
+        table, staging, columns, conflict_columns, update_columns, touch_columns
+    )
+
+    pool = get_pool(POOL_BATCH)
+    try:
+        async with timed_acquire(pool, POOL_BATCH) as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                    f"SELECT {', '.join(columns)} FROM {table} WITH NO DATA"
+                )
+                await conn.copy_records_to_table(staging, records=records, columns=columns)
+                with track_query(merge_query) as timer:
+                    status = await conn.execute(merge_query)
+                    timer.rows = _rowcount(status)
+    except Exception as e:
+        logger.error(f"Bulk upsert into {table} failed ({len(records)} rows): {e}")
+        raise
+
+    rows = _rowcount(status)
+    logger.debug(f"Bulk upserted {rows} rows into {table}")
+    return rows
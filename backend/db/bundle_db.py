@@ -0,0 +1,115 @@
+"""Week bundle database operations.
+
+A week bundle is the frozen context of one weekly pipeline run (market
+snapshot, graph digest, pitches, chairman decision, execution results),
+stored as a single gzip-compressed JSON blob. Rows are append-only: a re-run
+of the weekly pipeline inserts the next version for the week.
+
+ASYNC PATTERNS USED:
+    - BYTEA columns: Pass/receive bytes directly
+    - Version assigned in the INSERT (MAX(version) + 1) with RETURNING
+    - All functions are async and use await
+"""
+
+import logging
+from typing import Dict, Optional, Any
+
+from backend.db_helpers import fetch_one, execute_with_returning
+
+logger = logging.getLogger(__name__)
+
+
+async def save_week_bundle(
+    week_id: str,
+    payload: bytes,
+    checksum: str,
+    schema_version: int,
+) -> int:
+    """
+    Append a new bundle version for a week.
+
+    Args:
+        week_id: Week identifier (YYYY-MM-DD format)
+        payload: gzip-compressed JSON bundle
+        checksum: SHA-256 hex digest of payload
+        schema_version: Bundle layout version (see backend/pipeline/week_bundle.py)
+
+    Database Tables:
+        - week_bundles: week_id, version, schema_version, payload,
+          payload_size, checksum, created_at
+
+    Returns:
+        The version number assigned to the new bundle
+
+    Raises:
+        Exception: If database operation fails (logged and raised)
+    """
+    try:
+        row = await execute_with_returning(
+            """
+            INSERT INTO week_bundles
+            (week_id, version, schema_version, payload, payload_size, checksum, created_at)
+            SELECT $1, COALESCE(MAX(version), 0) + 1, $2, $3, $4, $5, NOW()
+            FROM week_bundles
+            WHERE week_id = $1
+            RETURNING version
+            """,
+            week_id,
+            schema_version,
+            payload,
+            len(payload),
+            checksum,
+        )
+        version = row["version"]
+        logger.info(
+            f"Saved week bundle {week_id} v{version} ({len(payload)} bytes)"
+        )
+        return version
+
+    except Exception as e:
+        logger.error(f"Error saving week bundle for {week_id}: {e}", exc_info=True)
+        raise
+
+
+async def load_week_bundle(
+    week_id: str,
+    version: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a stored bundle row.
+
+    Args:
+        week_id: Week identifier (YYYY-MM-DD format)
+        version: Specific version, or None for the latest
+
+    Returns:
+        Dict with week_id, version, schema_version, payload (bytes) and
+        checksum, or None if no bundle exists
+    """
+    try:
+        if version is None:
+            row = await fetch_one(
+                """
+                SELECT week_id, version, schema_version, payload, checksum
+                FROM week_bundles
+                WHERE week_id = $1
+                ORDER BY version DESC
+                LIMIT 1
+                """,
+                week_id,
+            )
+        else:
+            row = await fetch_one(
+                """
+                SELECT week_id, version, schema_version, payload, checksum
+                FROM week_bundles
+                WHERE week_id = $1 AND version = $2
+                """,
+                week_id,
+                version,
+            )
+        return dict(row) if row else None
+
+    except Exception as e:
+        logger.error(f"Error loading week bundle for {week_id}: {e}", exc_info=True)
+        raise
@@ -0,0 +1,349 @@
+"""PostgreSQL LISTEN/NOTIFY change feed.
+
+Triggers on the pipeline tables (see the CHANGE FEED section of
+postgres_schema.sql) call pg_notify() on CHANGE_CHANNEL whenever a row is
+inserted, updated or deleted. Each API worker holds ONE dedicated
+connection that LISTENs on the channel and fans every notification out to:
+
+    1. Cache invalidation: the shared Redis keys derived from the changed
+       rows are deleted and the event is dispatched to local handlers
+       (backend/cache/invalidation.py), exactly like a publish_change()
+       event from another worker
+    2. Server push: ChangeBroadcaster queues the event for every connected
+       client of GET /api/events/stream (Server-Sent Events)
+
+Unlike publish_change(), which only writers inside the API call, the
+trigger fires for every committed write, including cron jobs, CLI scripts
+and manual SQL. Notifications are delivered only after commit, and
+PostgreSQL collapses identical payloads within a transaction, so a batch
+insert of pitches for one week produces a single event.
+
+Payload (JSON, well below the 8000-byte NOTIFY limit):
+    {"table": "pm_pitches", "op": "INSERT", "week_id": "2024-01-10",
+     "research_date": "...", "account": null, "app": "<application_name>"}
+
+Notes:
+    - Writes made through this process's own pools (application_name ==
+      pool.APPLICATION_NAME) skip local cache handlers: the writer already
+      updated its state and called publish_change(). Clients are still
+      notified.
+    - The listener reconnects with backoff; events missed while it was
+      disconnected are not replayed, so caches fall back to their TTLs.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncpg
+
+from backend.cache.invalidation import (
+    InvalidationEvent,
+    SOURCE_CHAIRMAN_DECISIONS,
+    SOURCE_EXECUTION_EVENTS,
+    SOURCE_PEER_REVIEWS,
+    SOURCE_PM_PITCHES,
+    SOURCE_RESEARCH_REPORTS,
+    dispatch,
+)
+from backend.cache.keys import (
+    pitches_date_key,
+    pitches_latest_key,
+    pitches_week_key,
+    research_latest_key,
+    research_week_key,
+)
+from backend.db.pool import APPLICATION_NAME, POOL_PRIMARY, DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+# Must match the channel used by notify_table_change() in postgres_schema.sql
+CHANGE_CHANNEL = "table_changes"
+
+# Tables with a notify trigger
+FEED_TABLES = (
+    SOURCE_RESEARCH_REPORTS,
+    SOURCE_PM_PITCHES,
+    SOURCE_PEER_REVIEWS,
+    SOURCE_CHAIRMAN_DECISIONS,
+    SOURCE_EXECUTION_EVENTS,
+)
+
+
+def keys_for_change(table: str, week_id: Optional[str], research_date: Optional[str]) -> Tuple[str, ...]:
+    """Shared Redis keys derived from rows of `table` (same keys the writers delete)."""
+    keys: List[str] = []
+    if table == SOURCE_PM_PITCHES:
+        keys.append(pitches_latest_key())
+        if week_id:
+            keys.append(pitches_week_key(week_id))
+        if research_date:
+            keys.append(pitches_date_key(research_date))
+    elif table == SOURCE_RESEARCH_REPORTS:
+        keys.append(research_latest_key())
+        if week_id:
+            keys.append(research_week_key(week_id))
+    return tuple(keys)
+
+
+def parse_notification(payload: str) -> Tuple[InvalidationEvent, Dict[str, Any]]:
+    """
+    Parse a NOTIFY payload.
+
+    Returns:
+        (event for cache invalidation, message for push clients)
+
+    Raises:
+        ValueError: If the payload is not a change notification
+    """
+    try:
+        data = json.loads(payload)
+        table = data["table"]
+    except (TypeError, KeyError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid change notification: {e}") from e
+
+    week_id = data.get("week_id")
+    research_date = data.get("research_date")
+    event = InvalidationEvent(
+        source=table,
+        week_id=week_id,
+        research_date=research_date,
+        keys=keys_for_change(table, week_id, research_date),
+        origin=f"postgres:{data.get('app') or ''}",
+    )
+    message = {
+        "table": table,
+        "op": data.get("op"),
+        "week_id": week_id,
+        "research_date": research_date,
+        "account": data.get("account"),
+        "at": event.published_at,
+    }
+    return event, message
+
+
+# ============================================================================
+# Server Push
+# ============================================================================
+
+
+class ChangeBroadcaster:
+    """
+    Fans change messages out to connected push clients.
+
+    Each client gets a bounded queue; a client that stops reading loses its
+    oldest messages instead of growing memory without bound.
+    """
+
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self.published = 0
+        self.dropped = 0
+        self._clients: List[asyncio.Queue] = []
+
+    @property
+    def clients(self) -> int:
+        return len(self._clients)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a client and return its message queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue)
+        self._clients.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a client registered with subscribe()."""
+        if queue in self._clients:
+            self._clients.remove(queue)
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """Queue a message for every client (never blocks)."""
+        self.published += 1
+        for queue in self._clients:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(message)
+
+
+# Global broadcaster (one per worker)
+broadcaster = ChangeBroadcaster()
+
+
+# ============================================================================
+# Listener
+# ============================================================================
+
+
+class ChangeFeedListener:
+    """
+    Dedicated LISTEN connection dispatching change notifications.
+
+    The connection is opened outside the pools (a LISTEN connection must
+    stay checked out for its whole life) and re-established with backoff
+    if it drops. Notifications are queued by the asyncpg callback and
+    handled in order by a single task.
+
+    Example:
+        listener = ChangeFeedListener()
+        await listener.start()
+        ...
+        await listener.stop()
+    """
+
+    def __init__(
+        self,
+        channel: str = CHANGE_CHANNEL,
+        config: Optional[DatabaseConfig] = None,
+        broadcaster: ChangeBroadcaster = broadcaster,
+    ):
+        self.channel = channel
+        self.config = config or DatabaseConfig(POOL_PRIMARY)
+        self.broadcaster = broadcaster
+        self.received = 0
+        self._conn: Optional[asyncpg.Connection] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """
+        Connect, LISTEN and start the dispatch task.
+
+        Raises:
+            asyncpg.PostgresError, OSError: If the first connection fails
+        """
+        if self.running:
+            return
+        await self._connect()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Change feed listening on '{self.channel}'")
+
+    async def stop(self) -> None:
+        """Cancel the dispatch task and close the LISTEN connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close()
+
+    async def handle_notification(self, payload: str) -> bool:
+        """
+        Fan one notification out to cache invalidation and push clients.
+
+        Returns:
+            True if the payload was a valid change notification
+        """
+        try:
+            event, message = parse_notification(payload)
+        except ValueError as e:
+            logger.warning(str(e))
+            return False
+
+        self.received += 1
+        self.broadcaster.publish(message)
+
+        if event.origin == f"postgres:{APPLICATION_NAME}":
+            return True
+
+        if event.keys:
+            await _delete_shared_keys(event.keys)
+        await dispatch(event)
+        return True
+
+    def _on_notify(self, conn, pid: int, channel: str, payload: str) -> None:
+        self._queue.put_nowait(payload)
+
+    async def _connect(self) -> None:
+        self._conn = await asyncpg.connect(
+            dsn=self.config.get_dsn(),
+            server_settings={"application_name": f"{APPLICATION_NAME}:listen"[:63]},
+        )
+        await self._conn.add_listener(self.channel, self._on_notify)
+
+    async def _close(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            await self._conn.remove_listener(self.channel, self._on_notify)
+            await self._conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing change feed connection: {e}")
+        self._conn = None
+
+    async def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            try:
+                if self._conn is None or self._conn.is_closed():
+                    raise ConnectionError("change feed connection lost")
+                try:
+                    payload = await asyncio.wait_for(self._queue.get(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    continue
+                await self.handle_notification(payload)
+                backoff = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Change feed error: {e}; reconnecting in {backoff:.0f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+                try:
+                    await self._close()
+                    await self._connect()
+                except Exception as reconnect_error:
+                    logger.error(f"Change feed reconnect failed: {reconnect_error}")
+
+
+async def _delete_shared_keys(keys: Tuple[str, ...]) -> None:
+    """Delete shared Redis keys (no-op without the Redis pool)."""
+    from backend.redis_client import get_redis_pool
+
+    try:
+        await get_redis_pool().delete(*keys)
+    except RuntimeError:
+        logger.debug("Change feed: Redis pool not initialized, shared keys not deleted")
+    except Exception as e:
+        logger.error(f"Change feed failed to delete shared keys: {e}")
+
+
+# Global listener instance (one per worker)
+_listener: Optional[ChangeFeedListener] = None
+
+
+async def start_change_feed() -> ChangeFeedListener:
+    """
+    Start this worker's change feed listener.
+
+    Returns:
+        The running ChangeFeedListener
+
+    Raises:
+        asyncpg.PostgresError, OSError: If the database is unreachable
+    """
+    global _listener
+    if _listener is None:
+        _listener = ChangeFeedListener()
+    await _listener.start()
+    return _listener
+
+
+async def stop_change_feed() -> None:
+    """Stop this worker's change feed listener if it is running."""
+    global _listener
+    if _listener is not None:
+        await _listener.stop()
+        _listener = None
+
+
+def get_change_feed() -> Optional[ChangeFeedListener]:
+    """This worker's listener, or None if not started."""
+    return _listener
@@ -0,0 +1,125 @@
+"""Type codecs registered on every pool connection.
+
+asyncpg returns json/jsonb columns as strings and only accepts strings as
+parameters. init_connection() (passed as the pool's `init` hook) registers
+codecs so JSONB round-trips as Python objects:
+
+    await execute("INSERT INTO pm_pitches (..., pitch_data) VALUES (..., $4)", pitch)
+    row = await fetch_one("SELECT pitch_data FROM pm_pitches WHERE id = $1", pitch_id)
+    row["pitch_data"]["entry_policy"]   # already a dict
+
+Encoding/decoding uses orjson when installed (several times faster than
+the json module on large pitch and review payloads) and falls back to json.
+
+Numeric as float (analytic reads):
+    asyncpg decodes NUMERIC/DECIMAL columns to decimal.Decimal. Prices,
+    returns and correlations are only ever used as floats, so building a
+    Decimal per value and then calling float() on it is wasted work.
+    init_analytic_connection() also registers a numeric codec that decodes
+    straight to float (and encodes float/int/Decimal parameters). Pools
+    opt in with DB_<POOL>_NUMERIC_AS_FLOAT (on by default for the read
+    pool; see backend/db/pool.py).
+
+    The codec uses the text format, which binary COPY cannot use. Keep it
+    off for pools that load data with copy_records_to_table (the batch
+    pool, via bulk_loader). Queries that must return floats on any pool
+    cast in SQL instead (`close::float8`); see backend/db/columnar.py for
+    turning rows into columns.
+
+Notes:
+    - Do not pass json.dumps() output to a JSONB parameter: the codec would
+      store it as a JSON string literal
+    - Decimal values encode as floats, datetimes as ISO 8601 strings
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+# Try to import orjson (optional dependency)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    logger.debug("orjson not available - using json module for JSONB codecs")
+
+
+def _default(value: Any) -> Any:
+    """Encode types the JSON encoders do not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if HAS_ORJSON:
+    def json_dumps(value: Any) -> str:
+        """Encode a value for a json/jsonb parameter."""
+        return orjson.dumps(value, default=_default).decode()
+
+    json_loads = orjson.loads
+else:
+    def json_dumps(value: Any) -> str:
+        """Encode a value for a json/jsonb parameter."""
+        return json.dumps(value, default=_default)
+
+    json_loads = json.loads
+
+
+async def register_json_codecs(conn) -> None:
+    """Decode json/jsonb to Python objects and encode parameters from them."""
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename,
+            schema="pg_catalog",
+            encoder=json_dumps,
+            decoder=json_loads,
+            format="text",
+        )
+
+
+def encode_numeric(value: Any) -> str:
+    """Encode a float/int/Decimal parameter for a numeric column."""
+    return str(value)
+
+
+async def register_numeric_codecs(conn) -> None:
+    """Decode numeric to float instead of Decimal (NaN stays NaN)."""
+    await conn.set_type_codec(
+        "numeric",
+        schema="pg_catalog",
+        encoder=encode_numeric,
+        decoder=float,
+        format="text",
+    )
+
+
+async def init_connection(conn) -> None:
+    """
+    Pool `init` hook: runs once for each new connection.
+
+    Args:
+        conn: Newly opened asyncpg connection
+    """
+    await register_json_codecs(conn)
+
+
+async def init_analytic_connection(conn) -> None:
+    """
+    Pool `init` hook for pools with numeric_as_float: JSON codecs plus
+    numeric -> float.
+
+    Args:
+        conn: Newly opened asyncpg connection
+    """
+    await register_json_codecs(conn)
+    await register_numeric_codecs(conn)
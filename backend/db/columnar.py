@@ -0,0 +1,94 @@
+"""Row -> column conversion for analytic reads.
+
+asyncpg returns a list of Records. Analytic code (pandas, NumPy) wants
+columns; building a dict per row (`pd.DataFrame([dict(r) for r in rows])`)
+and converting values one field at a time dominates the cost of loading
+long histories. These helpers transpose rows in one pass (zip(*rows)
+runs in C) and build arrays per column.
+
+Numeric columns should already arrive as floats: cast in SQL
+(`close::float8`) or read through a pool with numeric_as_float (see
+backend/db/codecs.py). Decimal values still work, at the usual cost.
+
+Usage:
+    from backend.db_helpers import fetch_columns
+    from backend.db.columnar import columns_to_arrays
+
+    cols = await fetch_columns(
+        "SELECT symbol, date, close::float8 AS close FROM daily_bars", intent="batch"
+    )
+    arrays = columns_to_arrays(cols, float_columns=["close"])
+    df = columns_to_dataframe(cols)
+
+NumPy and pandas are imported on first use.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+def rows_to_columns(rows: Sequence[Any], columns: Sequence[str]) -> Dict[str, List[Any]]:
+    """
+    Transpose rows into {column: [values]}.
+
+    Args:
+        rows: asyncpg Records (or tuples) with values in `columns` order
+        columns: Column names, in select-list order
+
+    Returns:
+        Dict of column name -> list of values (empty lists if no rows)
+    """
+    if not rows:
+        return {name: [] for name in columns}
+    return {name: list(values) for name, values in zip(columns, zip(*rows))}
+
+
+def to_float_array(values: Sequence[Any]):
+    """
+    Convert a column to a float64 NumPy array (None -> NaN).
+
+    Returns:
+        numpy.ndarray of dtype float64
+    """
+    import numpy as np
+
+    if None not in values:
+        return np.asarray(values, dtype=np.float64)
+    return np.fromiter(
+        (np.nan if v is None else v for v in values), dtype=np.float64, count=len(values)
+    )
+
+
+def columns_to_arrays(
+    columns: Dict[str, List[Any]],
+    float_columns: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Convert columns to NumPy arrays.
+
+    Args:
+        columns: Output of rows_to_columns() / fetch_columns()
+        float_columns: Columns converted to float64 (None -> NaN); other
+                       columns become object or native-dtype arrays
+
+    Returns:
+        Dict of column name -> numpy.ndarray
+    """
+    import numpy as np
+
+    floats = set(float_columns or ())
+    return {
+        name: to_float_array(values) if name in floats else np.asarray(values)
+        for name, values in columns.items()
+    }
+
+
+def columns_to_dataframe(columns: Dict[str, List[Any]]):
+    """
+    Build a pandas DataFrame from columns (no per-row dicts).
+
+    Returns:
+        pandas.DataFrame with one column per key, in order
+    """
+    import pandas as pd
+
+    return pd.DataFrame(columns, columns=list(columns))
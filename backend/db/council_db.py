@@ -1,20 +1,128 @@
-"""Council database operations for peer reviews and chairman decisions."""
+"""Council database operations for peer reviews and chairman decisions.
+
+review_data and decision_data are JSONB: dicts are passed and returned as-is
+(the pool's JSONB codecs in backend/db/codecs.py encode and decode them).
+
+Each save runs in one transaction with set-based statements: one pitch-ID
+lookup for all models, one DELETE, and one executemany INSERT for all
+reviews. save_council_results writes reviews and the chairman decision
+atomically.
+"""
 
-import json
 import logging
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional
 
-from backend.db_helpers import fetch_one, execute
+import asyncpg
+
+from backend.db_helpers import transaction
+from backend.cache.invalidation import (
+    publish_change,
+    SOURCE_PEER_REVIEWS,
+    SOURCE_CHAIRMAN_DECISIONS,
+)
 
 logger = logging.getLogger(__name__)
 
 
+async def _write_peer_reviews(
+    conn: asyncpg.Connection,
+    week_id: str,
+    peer_reviews: List[Dict[str, Any]],
+    research_date: str,
+    pm_pitches: List[Dict[str, Any]],
+    label_to_model: Dict[str, str],
+    pitch_ids: Optional[Dict[str, str]] = None,
+) -> int:
+    """Replace the peer reviews for research_date on `conn`. Returns rows inserted."""
+    # Create mapping from model to pitch_id (one lookup for all models)
+    model_to_pitch_id: Dict[str, Any] = dict(pitch_ids or {})
+    models = sorted({
+        pitch["model"] for pitch in pm_pitches
+        if pitch.get("model") and pitch["model"] not in model_to_pitch_id
+    })
+    if models:
+        rows = await conn.fetch(
+            """
+            SELECT DISTINCT ON (model) model, id
+            FROM pm_pitches
+            WHERE model = ANY($1::text[]) AND research_date = $2
+            ORDER BY model, created_at DESC
+            """,
+            models, research_date
+        )
+        model_to_pitch_id.update((row["model"], row["id"]) for row in rows)
+
+    # Delete existing peer reviews for this research_date
+    await conn.execute(
+        "DELETE FROM peer_reviews WHERE research_date = $1",
+        research_date
+    )
+
+    records = []
+    for review in peer_reviews:
+        reviewer_model = review.get("reviewer_model", "unknown")
+        pitch_label = review.get("pitch_label", "")
+
+        # Map label (e.g., "Pitch A") back to model using label_to_model
+        reviewed_model = label_to_model.get(pitch_label)
+        if reviewed_model and reviewed_model in model_to_pitch_id:
+            records.append((
+                week_id,
+                model_to_pitch_id[reviewed_model],
+                reviewer_model,
+                pitch_label,
+                review,
+                research_date,
+            ))
+        else:
+            logger.warning(
+                f"Could not map pitch_label '{pitch_label}' to model for review"
+            )
+
+    # Insert peer reviews
+    if records:
+        await conn.executemany(
+            """
+            INSERT INTO peer_reviews
+            (week_id, pitch_id, reviewer_model, pitch_label, review_data, research_date, created_at)
+            VALUES ($1, $2::uuid, $3, $4, $5, $6, NOW())
+            """,
+            records
+        )
+    return len(records)
+
+
+async def _write_chairman_decision(
+    conn: asyncpg.Connection,
+    week_id: str,
+    chairman_decision: Dict[str, Any],
+    research_date: str,
+) -> None:
+    """Replace the chairman decision for research_date on `conn`."""
+    # Delete existing decision for this research_date
+    await conn.execute(
+        "DELETE FROM chairman_decisions WHERE research_date = $1",
+        research_date
+    )
+
+    # Insert new decision
+    await conn.execute(
+        """
+        INSERT INTO chairman_decisions
+        (week_id, decision_data, research_date, created_at)
+        VALUES ($1, $2, $3, NOW())
+        """,
+        week_id, chairman_decision, research_date
+    )
+
+
 async def save_peer_reviews(
     week_id: str,
     peer_reviews: List[Dict[str, Any]],
     research_date: str,
     pm_pitches: List[Dict[str, Any]],
     label_to_model: Dict[str, str],
+    pitch_ids: Optional[Dict[str, str]] = None,
 ) -> None:
     """
     Save peer reviews to database with pitch ID mapping.
@@ -23,7 +131,7 @@ async def save_peer_reviews(
     mapping from model names to pitch IDs by looking up the latest pitch for each
     model in the database. Maps pitch labels (e.g., "Pitch A") back to models
     using the provided label_to_model mapping. Deletes existing reviews for the
-    research_date before inserting new ones.
+    research_date before inserting new ones, all in one transaction.
 
     Args:
         week_id: Week identifier for the reviews
@@ -36,6 +144,8 @@ async def save_peer_reviews(
             Each should contain a "model" field.
         label_to_model: Mapping from pitch labels (e.g., "Pitch A") to model names.
             Used to identify which pitch each review is about.
+        pitch_ids: Model -> pitch ID as returned by save_pitches (optional;
+            models missing here are looked up in pm_pitches)
 
     Database Tables:
         - peer_reviews: Stores peer review data with columns:
@@ -54,63 +164,18 @@ async def save_peer_reviews(
             f"Saving {len(peer_reviews)} peer reviews to DB for research_date {research_date}"
         )
 
-        # Create mapping from model to pitch_id (look up pitch IDs from DB)
-        model_to_pitch_id = {}
-        for pitch in pm_pitches:
-            model = pitch.get("model")
-            if model:
-                row = await fetch_one(
-                    """
-                    SELECT id FROM pm_pitches
-                    WHERE model = $1 AND research_date = $2
-                    ORDER BY created_at DESC LIMIT 1
-                    """,
-                    model, research_date
-                )
-                if row:
-                    model_to_pitch_id[model] = row["id"]
-
-        # Delete existing peer reviews for this research_date
-        await execute(
-            "DELETE FROM peer_reviews WHERE research_date = $1",
-            research_date
-        )
-
-        # Insert peer reviews
-        for review in peer_reviews:
-            reviewer_model = review.get("reviewer_model", "unknown")
-            pitch_label = review.get("pitch_label", "")
-
-            # Map label (e.g., "Pitch A") back to model using label_to_model
-            reviewed_model = label_to_model.get(pitch_label)
-            if reviewed_model and reviewed_model in model_to_pitch_id:
-                pitch_id = model_to_pitch_id[reviewed_model]
-
-                logger.debug(
-                    f"Inserting peer review: week_id='{week_id}', "
-                    f"pitch_label='{pitch_label}', reviewer_model='{reviewer_model}'"
-                )
-
-                await execute(
-                    """
-                    INSERT INTO peer_reviews
-                    (week_id, pitch_id, reviewer_model, pitch_label, review_data, research_date, created_at)
-                    VALUES ($1, $2, $3, $4, $5, $6, NOW())
-                    """,
-                    week_id,
-                    pitch_id,
-                    reviewer_model,
-                    pitch_label,
-                    json.dumps(review),
-                    research_date
-                )
-            else:
-                logger.warning(
-                    f"Could not map pitch_label '{pitch_label}' to model for review"
-                )
+        async with transaction() as conn:
+            await _write_peer_reviews(
+                conn, week_id, peer_reviews, research_date,
+                pm_pitches, label_to_model, pitch_ids
+            )
 
         logger.info("Peer reviews saved to DB successfully")
 
+        await publish_change(
+            SOURCE_PEER_REVIEWS, week_id=week_id, research_date=research_date
+        )
+
     except Exception as e:
         logger.error(f"Error saving peer reviews to DB: {e}", exc_info=True)
         raise
@@ -125,7 +190,8 @@ async def save_chairman_decision(
     Save chairman decision to database.
 
     Saves the chairman's final decision to the chairman_decisions table. Deletes
-    any existing decision for the same research_date before inserting the new one.
+    any existing decision for the same research_date before inserting the new one,
+    in one transaction.
 
     Args:
         week_id: Week identifier for the decision
@@ -138,6 +204,8 @@ async def save_chairman_decision(
     Database Tables:
         - chairman_decisions: Stores chairman decision data with columns:
             week_id, decision_data, research_date, created_at
+            (selected_instrument and selected_direction are generated from
+            decision_data)
 
     Returns:
         None
@@ -150,24 +218,60 @@ async def save_chairman_decision(
             f"Saving chairman decision to DB for research_date {research_date}"
         )
 
-        # Delete existing decision for this research_date
-        await execute(
-            "DELETE FROM chairman_decisions WHERE research_date = $1",
-            research_date
+        async with transaction() as conn:
+            await _write_chairman_decision(conn, week_id, chairman_decision, research_date)
+
+        logger.info("Chairman decision saved to DB successfully")
+
+        await publish_change(
+            SOURCE_CHAIRMAN_DECISIONS, week_id=week_id, research_date=research_date
         )
 
-        # Insert new decision
-        await execute(
-            """
-            INSERT INTO chairman_decisions
-            (week_id, decision_data, research_date, created_at)
-            VALUES ($1, $2, $3, NOW())
-            """,
-            week_id, json.dumps(chairman_decision), research_date
+    except Exception as e:
+        logger.error(f"Error saving chairman decision to DB: {e}", exc_info=True)
+        raise
+
+
+async def save_council_results(
+    week_id: str,
+    peer_reviews: List[Dict[str, Any]],
+    chairman_decision: Dict[str, Any],
+    research_date: str,
+    pm_pitches: List[Dict[str, Any]],
+    label_to_model: Dict[str, str],
+    pitch_ids: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Save peer reviews and the chairman decision in one transaction.
+
+    Same arguments as save_peer_reviews and save_chairman_decision. Either
+    both are replaced for research_date or neither is.
+
+    Raises:
+        Exception: If database operation fails (logged and raised)
+    """
+    try:
+        logger.info(
+            f"Saving {len(peer_reviews)} peer reviews and chairman decision "
+            f"to DB for research_date {research_date}"
         )
 
-        logger.info("Chairman decision saved to DB successfully")
+        async with transaction() as conn:
+            await _write_peer_reviews(
+                conn, week_id, peer_reviews, research_date,
+                pm_pitches, label_to_model, pitch_ids
+            )
+            await _write_chairman_decision(conn, week_id, chairman_decision, research_date)
+
+        logger.info("Council results saved to DB successfully")
+
+        await publish_change(
+            SOURCE_PEER_REVIEWS, week_id=week_id, research_date=research_date
+        )
+        await publish_change(
+            SOURCE_CHAIRMAN_DECISIONS, week_id=week_id, research_date=research_date
+        )
 
     except Exception as e:
-        logger.error(f"Error saving chairman decision to DB: {e}", exc_info=True)
+        logger.error(f"Error saving council results to DB: {e}", exc_info=True)
         raise
@@ -0,0 +1,305 @@
+"""Write-behind writer for execution_events.
+
+Order placement must not wait on the audit log. When the writer is running,
+log_execution_event() assigns the event ID client-side, puts the event on
+a bounded in-memory queue and returns immediately; a background task
+writes queued events in batches with one set-based INSERT per batch.
+
+Durability:
+    - The queue is flushed every EVENT_FLUSH_INTERVAL seconds or as soon as
+      EVENT_BATCH_SIZE events are waiting, and drained on shutdown (stop())
+    - If a batch cannot be written (database down), it is appended to a
+      local NDJSON spill file instead of being dropped. A full queue also
+      spills rather than blocking the caller
+    - The spill file is replayed once the database accepts writes again.
+      Inserts use ON CONFLICT DO NOTHING on the client-generated IDs, so a
+      replay after a partial failure never duplicates events
+
+Events are visible in execution_events after the next flush (sub-second
+under normal operation), not when log_execution_event() returns.
+
+Configuration:
+    EVENT_QUEUE_SIZE: Max queued events before spilling (default: 10000)
+    EVENT_BATCH_SIZE: Max events per INSERT (default: 500)
+    EVENT_FLUSH_INTERVAL: Max seconds an event waits in the queue (default: 0.5)
+    EVENT_SPILL_PATH: Spill file (default: data/event_spill/execution_events.ndjson)
+
+Usage:
+    await start_event_writer()      # API startup / CLI, after init_pool()
+    ...
+    await stop_event_writer()       # flushes; call before close_pool()
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.db.codecs import json_dumps, json_loads
+from backend.db_helpers import execute
+
+logger = logging.getLogger(__name__)
+
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "10000"))
+EVENT_BATCH_SIZE = int(os.getenv("EVENT_BATCH_SIZE", "500"))
+EVENT_FLUSH_INTERVAL = float(os.getenv("EVENT_FLUSH_INTERVAL", "0.5"))
+EVENT_SPILL_PATH = os.getenv("EVENT_SPILL_PATH", "data/event_spill/execution_events.ndjson")
+
+# Seconds between replay attempts while the database is failing
+_RETRY_INTERVAL = 5.0
+
+_INSERT_EVENTS = """
+    INSERT INTO execution_events
+    (id, week_id, event_type, account, event_data, occurred_at, created_at)
+    SELECT e.id, e.week_id, e.event_type, e.account, e.event_data::jsonb, e.occurred_at, NOW()
+    FROM unnest($1::uuid[], $2::text[], $3::text[], $4::text[], $5::text[], $6::timestamptz[])
+         AS e(id, week_id, event_type, account, event_data, occurred_at)
+    ON CONFLICT DO NOTHING
+"""
+
+
+def make_event(
+    week_id: str,
+    event_type: str,
+    account: str,
+    event_data: Dict[str, Any],
+    occurred_at: datetime,
+) -> Dict[str, Any]:
+    """Queued event record with a client-generated ID."""
+    return {
+        "id": str(uuid.uuid4()),
+        "week_id": week_id,
+        "event_type": event_type,
+        "account": account,
+        "event_data": event_data,
+        "occurred_at": occurred_at,
+    }
+
+
+async def write_events(events: List[Dict[str, Any]]) -> None:
+    """
+    Insert events in one statement (idempotent on event ID).
+
+    Raises:
+        Exception: If the database write fails
+    """
+    await execute(
+        _INSERT_EVENTS,
+        [e["id"] for e in events],
+        [e["week_id"] for e in events],
+        [e["event_type"] for e in events],
+        [e["account"] for e in events],
+        [json_dumps(e["event_data"]) for e in events],
+        [e["occurred_at"] for e in events],
+    )
+
+
+class ExecutionEventWriter:
+    """
+    Bounded queue plus background batch flusher for execution events.
+
+    Example:
+        writer = ExecutionEventWriter()
+        await writer.start()
+        event_id = writer.enqueue(make_event(...))
+        await writer.stop()
+    """
+
+    def __init__(
+        self,
+        max_queue: int = EVENT_QUEUE_SIZE,
+        batch_size: int = EVENT_BATCH_SIZE,
+        flush_interval: float = EVENT_FLUSH_INTERVAL,
+        spill_path: str = EVENT_SPILL_PATH,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_path = Path(spill_path)
+        self.enqueued = 0
+        self.written = 0
+        self.spilled = 0
+        self.replayed = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._db_ok = True
+        self._next_replay = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize(),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "spill_pending": self._has_spill(),
+        }
+
+    def enqueue(self, event: Dict[str, Any]) -> str:
+        """
+        Queue an event without waiting (spills to disk if the queue is full).
+
+        Returns:
+            The event ID
+        """
+        self.enqueued += 1
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Execution event queue full, spilling event to disk")
+            self._spill([event])
+        return event["id"]
+
+    async def start(self) -> None:
+        """Start the background flusher (spilled events are replayed first)."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Execution event writer started (batch {self.batch_size}, every {self.flush_interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the flusher and write (or spill) everything still queued."""
+        if self._task is not None:
+            # Let an in-flight batch finish instead of cancelling it mid-write
+            self._stopping.set()
+            await self._task
+            self._task = None
+        while not self._queue.empty():
+            await self._flush(self._drain(self._queue.get_nowait()))
+        logger.info(f"Execution event writer stopped ({self.written} written, {self.spilled} spilled)")
+
+    def _drain(self, first: Dict[str, Any]) -> List[Dict[str, Any]]:
+        batch = [first]
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> bool:
+        try:
+            await write_events(batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} execution events, spilling to {self.spill_path}: {e}")
+            self._spill(batch)
+            self._db_ok = False
+            self._next_replay = asyncio.get_running_loop().time() + _RETRY_INTERVAL
+            return False
+        self.written += len(batch)
+        self._db_ok = True
+        return True
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            await self._maybe_replay()
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                continue
+            # Let concurrent callers add to the batch before writing
+            await asyncio.sleep(0)
+            await self._flush(self._drain(first))
+
+    # ------------------------------------------------------------------
+    # Spill file
+    # ------------------------------------------------------------------
+
+    def _spill(self, events: List[Dict[str, Any]]) -> None:
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json_dumps(event) + "\n")
+        self.spilled += len(events)
+
+    def _has_spill(self) -> bool:
+        return self.spill_path.exists() or self.spill_path.with_suffix(".replaying").exists()
+
+    async def _maybe_replay(self) -> None:
+        if not self._has_spill():
+            return
+        if not self._db_ok and asyncio.get_running_loop().time() < self._next_replay:
+            return
+        try:
+            await self.replay()
+        except Exception as e:
+            logger.error(f"Execution event replay failed: {e}", exc_info=True)
+            self._next_replay = asyncio.get_running_loop().time() + _RETRY_INTERVAL
+            self._db_ok = False
+
+    async def replay(self) -> int:
+        """
+        Write spilled events back to the database.
+
+        The spill file is renamed before reading so events spilled during
+        the replay go to a fresh file. Batches that still fail are spilled
+        again; the renamed file is removed only after that, so a crash
+        mid-replay replays it again (inserts are idempotent).
+
+        Returns:
+            Number of events replayed
+        """
+        if not self._has_spill():
+            return 0
+        replaying = self.spill_path.with_suffix(".replaying")
+        if not replaying.exists():
+            self.spill_path.rename(replaying)
+
+        events = []
+        with open(replaying, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    event = json_loads(line)
+                    event["occurred_at"] = datetime.fromisoformat(event["occurred_at"])
+                    events.append(event)
+
+        replayed = 0
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start:start + self.batch_size]
+            if not await self._flush(batch):
+                # Database still down: keep the rest for the next attempt
+                self._spill(events[start + self.batch_size:])
+                break
+            replayed += len(batch)
+        # Only now is every event either written or spilled again
+        replaying.unlink()
+
+        self.replayed += replayed
+        if replayed:
+            logger.info(f"Replayed {replayed} spilled execution events")
+        return replayed
+
+
+# Global writer (one per process)
+_writer: Optional[ExecutionEventWriter] = None
+
+
+def get_event_writer() -> Optional[ExecutionEventWriter]:
+    """The running writer, or None (events are then written inline)."""
+    if _writer is not None and _writer.running:
+        return _writer
+    return None
+
+
+async def start_event_writer() -> ExecutionEventWriter:
+    """Start the process-wide execution event writer."""
+    global _writer
+    if _writer is None:
+        _writer = ExecutionEventWriter()
+    await _writer.start()
+    return _writer
+
+
+async def stop_event_writer() -> None:
+    """Flush and stop the process-wide writer if it is running."""
+    global _writer
+    if _writer is not None:
+        await _writer.stop()
+        _writer = None
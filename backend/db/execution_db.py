@@ -14,10 +14,12 @@ ASYNC PATTERNS USED:
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 # Import async database helpers
-from backend.db_helpers import fetch_one, fetch_all, fetch_val, execute
+from backend.db_helpers import fetch_one, fetch_all, fetch_val, execute, stream_rows
+from backend.db.pagination import build_page, clamp_limit, keyset_condition
+from backend.db.event_writer import get_event_writer, make_event
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,11 @@ async def log_execution_event(
     Saves a trade execution event to the execution_events table for audit trail
     and analysis. Events are immutable once logged (event sourcing pattern).
 
+    When the write-behind writer is running (API server, CLI pipeline runs;
+    see backend/db/event_writer.py), the event is queued and this returns
+    immediately with a client-generated ID; the row is written with the
+    next batch. Otherwise it is inserted inline.
+
     Args:
         week_id: Week identifier (YYYY-MM-DD format)
         event_type: Type of event (e.g., 'order_placed', 'order_filled', 'order_failed',
@@ -51,7 +58,7 @@ async def log_execution_event(
         UUID of the created event record (as string)
 
     Raises:
-        Exception: If database operation fails (logged and raised)
+        Exception: If the inline database write fails (logged and raised)
 
     Example:
         event_id = await log_execution_event(
@@ -66,10 +73,17 @@ async def log_execution_event(
             }
         )
     """
-    try:
-        # Use NOW() if occurred_at not provided
-        occurred_at = occurred_at or datetime.utcnow()
+    # Use NOW() if occurred_at not provided
+    occurred_at = occurred_at or datetime.utcnow()
+
+    # Write-behind: queue and return without waiting on the database
+    writer = get_event_writer()
+    if writer is not None:
+        event_id = writer.enqueue(make_event(week_id, event_type, account, event_data, occurred_at))
+        logger.info(f"Queued execution event {event_type} for account {account} (week {week_id}): {event_id}")
+        return event_id
 
+    try:
         logger.info(
             f"Logging execution event: {event_type} for account {account} (week {week_id})"
         )
@@ -106,11 +120,44 @@ async def log_execution_event(
         raise
 
 
+EVENT_COLUMNS = ["id", "week_id", "event_type", "account", "event_data", "occurred_at", "created_at"]
+
+
+def _history_filters(
+    event_type: Optional[str] = None,
+    account: Optional[str] = None,
+    week_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> Tuple[List[str], List[Any]]:
+    """WHERE conditions and parameters ($1..$n) for the history filters."""
+    conditions = []
+    params: List[Any] = []
+
+    if event_type:
+        params.append(event_type)
+        conditions.append(f"event_type = ${len(params)}")
+
+    if account:
+        params.append(account)
+        conditions.append(f"account = ${len(params)}")
+
+    if week_id:
+        params.append(week_id)
+        conditions.append(f"week_id = ${len(params)}")
+
+    if since:
+        params.append(since)
+        conditions.append(f"occurred_at >= ${len(params)}")
+
+    return conditions, params
+
+
 async def get_execution_history(
     limit: Optional[int] = 100,
     event_type: Optional[str] = None,
     account: Optional[str] = None,
-    week_id: Optional[str] = None
+    week_id: Optional[str] = None,
+    since: Optional[datetime] = None
 ) -> List[Dict[str, Any]]:
     """
     Get execution event history with optional filters.
@@ -123,6 +170,9 @@ async def get_execution_history(
         event_type: Filter by event type (optional)
         account: Filter by account name (optional)
         week_id: Filter by week identifier (optional)
+        since: Only events at or after this time (optional). execution_events
+               is partitioned by month on occurred_at, so this bound lets
+               PostgreSQL skip older partitions.
 
     Returns:
         List of event dictionaries. Each dict contains:
@@ -147,24 +197,8 @@ async def get_execution_history(
     """
     try:
         # Build query with optional filters
-        conditions = []
-        params = []
-        param_num = 1
-
-        if event_type:
-            conditions.append(f"event_type = ${param_num}")
-            params.append(event_type)
-            param_num += 1
-
-        if account:
-            conditions.append(f"account = ${param_num}")
-            params.append(account)
-            param_num += 1
-
-        if week_id:
-            conditions.append(f"week_id = ${param_num}")
-            params.append(week_id)
-            param_num += 1
+        conditions, params = _history_filters(event_type, account, week_id, since)
+        param_num = len(params) + 1
 
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         limit_clause = f"LIMIT ${param_num}" if limit else ""
@@ -369,3 +403,89 @@ async def count_events_by_type(
     except Exception as e:
         logger.error(f"Error counting events by type: {e}", exc_info=True)
         return {}
+
+
+async def get_execution_page(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    event_type: Optional[str] = None,
+    account: Optional[str] = None,
+    week_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Get one page of execution events using keyset pagination.
+
+    Pages are ordered by (occurred_at, id) descending. Each page seeks past
+    the last row of the previous one, so deep pages cost the same as the
+    first and new events never shift rows between pages.
+
+    Args:
+        limit: Page size (default: 50, max: 500)
+        cursor: `next_cursor` from the previous page (None for the first page)
+        event_type, account, week_id, since: Same filters as get_execution_history()
+
+    Returns:
+        Dict containing:
+            - items: List of event dicts (same fields as get_execution_history)
+            - next_cursor: Token for the next page, None on the last page
+
+    Raises:
+        ValueError: If cursor is malformed
+
+    Example:
+        page = await get_execution_page(account="COUNCIL", limit=100)
+        while page["next_cursor"]:
+            page = await get_execution_page(account="COUNCIL", limit=100, cursor=page["next_cursor"])
+    """
+    limit = clamp_limit(limit)
+    conditions, params = _history_filters(event_type, account, week_id, since)
+    seek, seek_params = keyset_condition("occurred_at", "id", cursor, len(params) + 1)
+    if seek:
+        conditions.append(seek)
+        params.extend(seek_params)
+    params.append(limit + 1)
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT {", ".join(EVENT_COLUMNS)}
+        FROM execution_events
+        {where_clause}
+        ORDER BY occurred_at DESC, id DESC
+        LIMIT ${len(params)}
+    """
+
+    try:
+        rows = await fetch_all(query, *params)
+    except Exception as e:
+        logger.error(f"Error fetching execution events page: {e}", exc_info=True)
+        raise
+
+    return build_page(rows, limit, sort_key="occurred_at")
+
+
+def stream_execution_events(
+    event_type: Optional[str] = None,
+    account: Optional[str] = None,
+    week_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream all matching execution events (oldest first) through a
+    server-side cursor, for exports. Memory use is constant.
+
+    Args:
+        event_type, account, week_id, since: Same filters as get_execution_history()
+
+    Returns:
+        Async iterator of event dicts
+    """
+    conditions, params = _history_filters(event_type, account, week_id, since)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT {", ".join(EVENT_COLUMNS)}
+        FROM execution_events
+        {where_clause}
+        ORDER BY occurred_at, id
+    """
+    return stream_rows(query, *params)
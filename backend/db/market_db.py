@@ -10,17 +10,61 @@ ASYNC PATTERNS USED:
     - Uses $1, $2, $3 parameter placeholders (not %s)
     - Row access uses dict keys (not numeric indices)
     - Connection pool is automatic (no manual connection management)
+    - Dashboard reads are registered prepared statements, run by name
+      (backend/db/statements.py)
 """
 
 import logging
 from typing import Dict, List, Optional, Any
 
 # Import async database helpers - these automatically use the connection pool
-from backend.db_helpers import fetch_all, fetch_val
+from backend.db_helpers import fetch_prepared
+from backend.db.statements import register_statement
+from backend.cache.decorator import cached
+from backend.cache.keys import market_metrics_key, market_prices_key
 
 logger = logging.getLogger(__name__)
 
-
+# Latest values are maintained on write (latest_metrics/latest_prices
+# triggers), so these reads scan one row per symbol/pair regardless of
+# history size
+register_statement("market.latest_returns", """
+    SELECT symbol_1 AS symbol, value::float8 AS log_return_7d, date
+    FROM latest_metrics
+    WHERE metric = 'log_return_7d'
+        AND date = (SELECT MAX(date) FROM latest_metrics WHERE metric = 'log_return_7d')
+    ORDER BY value DESC
+""")
+# Correlations are stored as the upper triangle (symbol_1 <= symbol_2, a
+# CHECK constraint); the lower triangle is mirrored here so callers get the
+# full matrix
+register_statement("market.latest_correlations", """
+    WITH latest AS (
+        SELECT symbol_1, symbol_2, value::float8 AS correlation
+        FROM latest_metrics
+        WHERE metric = 'correlation'
+            AND date = (SELECT MAX(date) FROM latest_metrics WHERE metric = 'correlation')
+    )
+    SELECT symbol_1, symbol_2, correlation FROM latest
+    UNION ALL
+    SELECT symbol_2, symbol_1, correlation FROM latest WHERE symbol_1 < symbol_2
+    ORDER BY symbol_1, symbol_2
+""")
+register_statement("market.current_prices", """
+    SELECT symbol, date, open::float8 AS open, high::float8 AS high,
+           low::float8 AS low, close::float8 AS close, volume
+    FROM latest_prices
+    WHERE symbol IN ('SPY', 'QQQ', 'IWM', 'TLT', 'HYG', 'UUP', 'GLD', 'USO', 'VIXY', 'SH')
+        AND date IS NOT NULL
+    ORDER BY symbol
+""")
+
+
+@cached(
+    key=market_metrics_key(),
+    ttl=3600,  # Metrics change once per day; warmed by calculate_metrics.py
+    cache_none=False,
+)
 async def fetch_market_metrics() -> Optional[Dict[str, Any]]:
     """
     Fetch market metrics including 7-day returns and correlation matrix.
@@ -37,21 +81,18 @@ async def fetch_market_metrics() -> Optional[Dict[str, Any]]:
         Returns None if an error occurs.
 
     Database Tables:
-        - rolling_7day_log_returns: Contains 7-day rolling log returns by symbol/date
-        - correlation_matrix: Contains pairwise correlations by symbol/date
+        - latest_metrics: Latest 7-day log return per symbol and correlation
+          per pair, maintained by triggers on rolling_7day_log_returns and
+          correlation_matrix
     """
     try:
-        # ASYNC PATTERN: Use await with fetch_all helper
-        # - fetch_all automatically acquires connection from pool
+        # ASYNC PATTERN: Use await with fetch_prepared helper
+        # - fetch_prepared runs a registered statement by name on a pooled
+        #   connection where it is already prepared
         # - Returns list of dicts (empty list if no rows)
         # - Connection is automatically returned to pool after query
         # - No parameters needed for this query (no $1, $2 placeholders)
-        returns_rows = await fetch_all("""
-            SELECT symbol, log_return_7d
-            FROM rolling_7day_log_returns
-            WHERE date = (SELECT MAX(date) FROM rolling_7day_log_returns)
-            ORDER BY log_return_7d DESC
-        """)
+        returns_rows = await fetch_prepared("market.latest_returns")
 
         # ASYNC PATTERN: Row access uses dict keys (not row[0], row[1])
         # - asyncpg returns rows as dict-like objects
@@ -67,12 +108,7 @@ async def fetch_market_metrics() -> Optional[Dict[str, Any]]:
         ]
 
         # Get latest correlation matrix
-        corr_rows = await fetch_all("""
-            SELECT symbol_1, symbol_2, correlation
-            FROM correlation_matrix
-            WHERE date = (SELECT MAX(date) FROM correlation_matrix)
-            ORDER BY symbol_1, symbol_2
-        """)
+        corr_rows = await fetch_prepared("market.latest_correlations")
 
         # Build correlation matrix as nested dict
         correlation_matrix = {}
@@ -86,11 +122,7 @@ async def fetch_market_metrics() -> Optional[Dict[str, Any]]:
                 correlation_matrix[symbol1] = {}
             correlation_matrix[symbol1][symbol2] = float(corr)
 
-        # ASYNC PATTERN: Use await with fetch_val for single values
-        # - fetch_val returns a scalar value (not a dict or list)
-        # - Useful for COUNT, MAX, MIN, SUM, etc.
-        # - Returns None if query produces no rows
-        latest_date = await fetch_val("SELECT MAX(date) FROM rolling_7day_log_returns")
+        latest_date = returns_rows[0]["date"] if returns_rows else None
 
         return {
             "date": latest_date.isoformat() if latest_date else None,
@@ -104,6 +136,11 @@ async def fetch_market_metrics() -> Optional[Dict[str, Any]]:
         return None
 
 
+@cached(
+    key=market_prices_key(),
+    ttl=3600,  # Daily bars change once per day; warmed by the data fetchers
+    cache_none=False,
+)
 async def fetch_current_prices() -> Optional[Dict[str, Any]]:
     """
     Fetch current prices for all tracked instruments.
@@ -118,32 +155,15 @@ async def fetch_current_prices() -> Optional[Dict[str, Any]]:
         Returns None if an error occurs.
 
     Database Tables:
-        - daily_bars: Contains OHLCV data by symbol/date
+        - latest_prices: Latest daily bar per symbol, maintained by a
+          trigger on daily_bars
 
     Tracked Symbols:
         SPY, QQQ, IWM, TLT, HYG, UUP, GLD, USO, VIXY, SH
     """
     try:
         # Get latest daily bars for all instruments
-        rows = await fetch_all("""
-            WITH latest_dates AS (
-                SELECT symbol, MAX(date) as latest_date
-                FROM daily_bars
-                WHERE symbol IN ('SPY', 'QQQ', 'IWM', 'TLT', 'HYG', 'UUP', 'GLD', 'USO', 'VIXY', 'SH')
-                GROUP BY symbol
-            )
-            SELECT
-                db.symbol,
-                db.date,
-                db.open,
-                db.high,
-                db.low,
-                db.close,
-                db.volume
-            FROM daily_bars db
-            INNER JOIN latest_dates ld ON db.symbol = ld.symbol AND db.date = ld.latest_date
-            ORDER BY db.symbol
-        """)
+        rows = await fetch_prepared("market.current_prices")
 
         prices = []
         for row in rows:
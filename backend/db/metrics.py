@@ -0,0 +1,394 @@
+"""Database instrumentation: pool acquire wait, query latency, slow-query log.
+
+backend/db_helpers.py records every query here, and timed_acquire() wraps
+pool.acquire() to measure how long callers wait for a connection. Stats are
+attributed to a scope (the API route or pipeline stage that issued the
+query) so pool saturation can be traced to its source.
+
+Recorded:
+    - Pool: acquires, acquire timeouts, connections in use (current / peak),
+      acquire wait (histogram), in total and per named pool
+    - Per normalized statement: calls, errors, rows, latency (histogram)
+    - Per scope: acquires, in use (current / peak), acquire wait, queries,
+      total query time
+    - Slow queries above DB_SLOW_QUERY_MS (logged and kept in a ring buffer)
+
+Scopes:
+    The FastAPI middleware sets the scope to "<METHOD> <route path>" and
+    Pipeline.execute() sets "stage:<name>". Anything else is "unscoped".
+
+    with db_scope("stage:research"):
+        await fetch_all(...)
+
+Notes:
+    - Stats are per process; each uvicorn worker owns its own pool
+    - Exposed via check_pool_health() and GET /api/db/metrics
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from backend.cache.stats import Histogram, LATENCY_BUCKETS_MS
+
+logger = logging.getLogger(__name__)
+
+# Queries slower than this are logged and kept in the slow-query buffer
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+SLOW_QUERY_LOG_SIZE = int(os.getenv("DB_SLOW_QUERY_LOG_SIZE", "50"))
+
+# Database latencies run longer than cache lookups
+DB_LATENCY_BUCKETS_MS = LATENCY_BUCKETS_MS + (250.0, 500.0, 1000.0, 2500.0, 5000.0)
+
+UNSCOPED = "unscoped"
+DEFAULT_POOL = "primary"
+MAX_STATEMENT_LENGTH = 200
+
+_scope: contextvars.ContextVar[str] = contextvars.ContextVar("db_scope", default=UNSCOPED)
+
+
+@contextmanager
+def db_scope(label: str) -> Iterator[None]:
+    """
+    Attribute database activity in this block to a scope.
+
+    Args:
+        label: Scope name (e.g. "GET /api/market/metrics", "stage:research")
+    """
+    token = _scope.set(label)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def current_scope() -> str:
+    """Get the scope of the running task."""
+    return _scope.get()
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(query: str) -> str:
+    """
+    Normalize a query for aggregation.
+
+    Collapses whitespace and replaces string and numeric literals with "?",
+    so statements differing only in inlined values aggregate together.
+
+    Example:
+        >>> normalize_statement("SELECT *\\n  FROM t WHERE id = 42")
+        'SELECT * FROM t WHERE id = ?'
+    """
+    statement = _WHITESPACE_RE.sub(" ", query).strip()
+    statement = _STRING_RE.sub("?", statement)
+    statement = _NUMBER_RE.sub("?", statement)
+    if len(statement) > MAX_STATEMENT_LENGTH:
+        statement = statement[: MAX_STATEMENT_LENGTH - 3] + "..."
+    return statement
+
+
+# ============================================================================
+# Stats
+# ============================================================================
+
+
+class StatementStats:
+    """Counters and latency histogram for one normalized statement."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.latency_ms = Histogram(DB_LATENCY_BUCKETS_MS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "latency_ms": self.latency_ms.to_dict(),
+        }
+
+
+class PoolStats:
+    """Acquire counters for one named pool (primary, read, batch)."""
+
+    def __init__(self):
+        self.acquires = 0
+        self.acquire_timeouts = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.acquire_wait_ms = Histogram(DB_LATENCY_BUCKETS_MS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "acquires": self.acquires,
+            "acquire_timeouts": self.acquire_timeouts,
+            "in_use": self.in_use,
+            "max_in_use": self.max_in_use,
+            "acquire_wait_ms": self.acquire_wait_ms.to_dict(),
+        }
+
+
+class ScopeStats:
+    """Pool usage and query time for one scope (route or stage)."""
+
+    def __init__(self):
+        self.acquires = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.queries = 0
+        self.query_ms = 0.0
+        self.acquire_wait_ms = Histogram(DB_LATENCY_BUCKETS_MS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "acquires": self.acquires,
+            "in_use": self.in_use,
+            "max_in_use": self.max_in_use,
+            "queries": self.queries,
+            "query_ms": round(self.query_ms, 3),
+            "acquire_wait_ms": self.acquire_wait_ms.to_dict(),
+        }
+
+
+class DBStats:
+    """
+    Thread-safe database stats for this process.
+
+    Recording never raises.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = datetime.utcnow().isoformat()
+            self.acquires = 0
+            self.acquire_timeouts = 0
+            self.in_use = 0
+            self.max_in_use = 0
+            self.acquire_wait_ms = Histogram(DB_LATENCY_BUCKETS_MS)
+            self._statements: Dict[str, StatementStats] = {}
+            self._scopes: Dict[str, ScopeStats] = {}
+            self._pools: Dict[str, PoolStats] = {}
+            self._slow_queries: deque = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+
+    def _scope(self, scope: str) -> ScopeStats:
+        stats = self._scopes.get(scope)
+        if stats is None:
+            stats = self._scopes[scope] = ScopeStats()
+        return stats
+
+    def _pool(self, pool: str) -> PoolStats:
+        stats = self._pools.get(pool)
+        if stats is None:
+            stats = self._pools[pool] = PoolStats()
+        return stats
+
+    def record_acquire(
+        self, wait_ms: float, scope: Optional[str] = None, pool: str = DEFAULT_POOL
+    ) -> None:
+        with self._lock:
+            self.acquires += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self.acquire_wait_ms.observe(wait_ms)
+            pool_stats = self._pool(pool)
+            pool_stats.acquires += 1
+            pool_stats.in_use += 1
+            pool_stats.max_in_use = max(pool_stats.max_in_use, pool_stats.in_use)
+            pool_stats.acquire_wait_ms.observe(wait_ms)
+            stats = self._scope(scope or current_scope())
+            stats.acquires += 1
+            stats.in_use += 1
+            stats.max_in_use = max(stats.max_in_use, stats.in_use)
+            stats.acquire_wait_ms.observe(wait_ms)
+
+    def record_release(self, scope: Optional[str] = None, pool: str = DEFAULT_POOL) -> None:
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+            pool_stats = self._pool(pool)
+            pool_stats.in_use = max(0, pool_stats.in_use - 1)
+            stats = self._scope(scope or current_scope())
+            stats.in_use = max(0, stats.in_use - 1)
+
+    def record_acquire_timeout(self, pool: str = DEFAULT_POOL) -> None:
+        with self._lock:
+            self.acquire_timeouts += 1
+            self._pool(pool).acquire_timeouts += 1
+
+    def record_query(
+        self,
+        query: str,
+        elapsed_ms: float,
+        rows: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        scope: Optional[str] = None,
+    ) -> None:
+        statement = normalize_statement(query)
+        scope = scope or current_scope()
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None:
+                stats = self._statements[statement] = StatementStats()
+            stats.calls += 1
+            stats.latency_ms.observe(elapsed_ms)
+            if rows:
+                stats.rows += rows
+            if error is not None:
+                stats.errors += 1
+            scope_stats = self._scope(scope)
+            scope_stats.queries += 1
+            scope_stats.query_ms += elapsed_ms
+
+            slow = elapsed_ms >= SLOW_QUERY_MS
+            if slow:
+                self._slow_queries.append({
+                    "statement": statement,
+                    "elapsed_ms": round(elapsed_ms, 3),
+                    "rows": rows,
+                    "scope": scope,
+                    "error": str(error) if error is not None else None,
+                    "at": datetime.utcnow().isoformat(),
+                })
+
+        if slow:
+            logger.warning(
+                f"Slow query ({elapsed_ms:.1f}ms, scope={scope}, rows={rows}): {statement}"
+            )
+
+    def summary(self, pool: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Pool-level counters (used by check_pool_health).
+
+        Args:
+            pool: Restrict acquire counters to one named pool (query
+                  counters are always process-wide)
+        """
+        with self._lock:
+            source = self if pool is None else self._pools.get(pool) or PoolStats()
+            return {
+                "acquires": source.acquires,
+                "acquire_timeouts": source.acquire_timeouts,
+                "in_use": source.in_use,
+                "max_in_use": source.max_in_use,
+                "acquire_wait_ms_p95": source.acquire_wait_ms.percentile(95),
+                "queries": sum(s.calls for s in self._statements.values()),
+                "query_errors": sum(s.errors for s in self._statements.values()),
+                "slow_queries": len(self._slow_queries),
+            }
+
+    def snapshot(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable snapshot of this process's stats.
+
+        Args:
+            top: Only include the `top` statements by total latency
+
+        Returns:
+            Dict with summary, acquire_wait_ms, pools, statements, scopes
+            and slow_queries (newest first)
+        """
+        summary = self.summary()
+        with self._lock:
+            statements = sorted(
+                self._statements.items(),
+                key=lambda item: item[1].latency_ms.total,
+                reverse=True,
+            )
+            if top is not None:
+                statements = statements[:top]
+            return {
+                "started_at": self.started_at,
+                "pid": os.getpid(),
+                "slow_query_ms": SLOW_QUERY_MS,
+                "summary": summary,
+                "acquire_wait_ms": self.acquire_wait_ms.to_dict(),
+                "pools": {name: p.to_dict() for name, p in sorted(self._pools.items())},
+                "statements": {name: s.to_dict() for name, s in statements},
+                "scopes": {name: s.to_dict() for name, s in sorted(self._scopes.items())},
+                "slow_queries": list(reversed(self._slow_queries)),
+            }
+
+
+# Global recorder for this process
+db_stats = DBStats()
+
+
+# ============================================================================
+# Instrumentation Helpers
+# ============================================================================
+
+
+@asynccontextmanager
+async def timed_acquire(pool, name: str = DEFAULT_POOL) -> AsyncIterator[Any]:
+    """
+    Acquire a connection from `pool`, recording wait time and usage.
+
+    Drop-in replacement for `async with pool.acquire() as conn`.
+
+    Args:
+        pool: asyncpg pool
+        name: Pool name the stats are recorded under
+    """
+    scope = current_scope()
+    start = time.perf_counter()
+    acquired = False
+    try:
+        async with pool.acquire() as conn:
+            acquired = True
+            db_stats.record_acquire((time.perf_counter() - start) * 1000, scope, name)
+            try:
+                yield conn
+            finally:
+                db_stats.record_release(scope, name)
+    except asyncio.TimeoutError:
+        if not acquired:
+            db_stats.record_acquire_timeout(name)
+        raise
+
+
+class QueryTimer:
+    """Result holder for track_query(); set .rows before the block exits."""
+
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows: Optional[int] = None
+
+
+@contextmanager
+def track_query(query: str) -> Iterator[QueryTimer]:
+    """
+    Time a query and record it (including failures).
+
+    Example:
+        with track_query(query) as timer:
+            rows = await conn.fetch(query, *args)
+            timer.rows = len(rows)
+    """
+    timer = QueryTimer()
+    start = time.perf_counter()
+    try:
+        yield timer
+    except BaseException as e:
+        db_stats.record_query(query, (time.perf_counter() - start) * 1000, timer.rows, error=e)
+        raise
+    db_stats.record_query(query, (time.perf_counter() - start) * 1000, timer.rows)
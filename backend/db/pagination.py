@@ -0,0 +1,105 @@
+"""Keyset (seek) pagination for history queries.
+
+OFFSET pagination makes PostgreSQL read and discard every skipped row, so
+page N costs O(N * page size) and rows shift between pages as new events
+arrive. Keyset pagination instead remembers the sort key of the last row
+served and seeks past it with an index:
+
+    WHERE (occurred_at, id) < ($1, $2) ORDER BY occurred_at DESC, id DESC
+
+Every page is one index range scan regardless of depth, and concurrent
+inserts at the head never shift or duplicate rows on later pages.
+
+Cursors are opaque URL-safe tokens encoding (sort value, id) of the last
+row on the previous page. Clients pass `next_cursor` back unchanged.
+
+Usage:
+    where, params = keyset_condition("occurred_at", "id", cursor, param_num=1)
+    rows = await fetch_all(f"... {where} ORDER BY occurred_at DESC, id DESC LIMIT {limit + 1}", *params)
+    return build_page(rows, limit, sort_key="occurred_at")
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Page size bounded to [1, MAX_PAGE_SIZE] (None = DEFAULT_PAGE_SIZE)."""
+    if not limit:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def encode_cursor(sort_value: datetime, row_id: Any) -> str:
+    """Opaque token for the row (sort_value, row_id)."""
+    payload = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[datetime, str]:
+    """
+    Decode a token produced by encode_cursor().
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), str(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid pagination cursor: {token!r}") from e
+
+
+def keyset_condition(
+    sort_column: str,
+    id_column: str,
+    cursor: Optional[str],
+    param_num: int,
+    id_type: str = "uuid",
+) -> Tuple[Optional[str], List[Any]]:
+    """
+    Seek predicate for a descending (sort_column, id_column) order.
+
+    Args:
+        sort_column: Timestamp column the page is ordered by
+        id_column: Unique tie-breaker column
+        cursor: Token from the previous page (None for the first page)
+        param_num: Number of the first placeholder to use
+        id_type: PostgreSQL type of id_column
+
+    Returns:
+        (condition, params); condition is None for the first page
+    """
+    if not cursor:
+        return None, []
+    sort_value, row_id = decode_cursor(cursor)
+    condition = f"({sort_column}, {id_column}) < (${param_num}, ${param_num + 1}::{id_type})"
+    return condition, [sort_value, row_id]
+
+
+def build_page(
+    rows: List[Dict[str, Any]],
+    limit: int,
+    sort_key: str,
+    id_key: str = "id",
+) -> Dict[str, Any]:
+    """
+    Page response from rows fetched with LIMIT limit + 1.
+
+    The extra row only signals that another page exists; it is not returned.
+
+    Returns:
+        Dict with "items" and "next_cursor" (None on the last page)
+    """
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(last[sort_key], last[id_key])
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,273 @@
+"""Monthly range partitions for append-only history tables.
+
+execution_events (by occurred_at) and hourly_snapshots (by timestamp) are
+declared PARTITION BY RANGE in postgres_schema.sql, with one partition per
+calendar month plus a DEFAULT partition as a safety net. Queries that bound
+the partition key (e.g. "last 30 days") only touch the matching months, and
+old months can be archived and dropped without a long DELETE.
+
+Maintenance (idempotent, run by the daily data job and on API startup):
+    - ensure_partitions(): create partitions for the current month and
+      PARTITION_MONTHS_AHEAD months ahead. Rows that already landed in the
+      DEFAULT partition for a month are moved into the new partition.
+    - apply_retention(): partitions older than the table's retention are
+      exported to gzip-compressed CSV (PARTITION_ARCHIVE_DIR) and dropped.
+
+Configuration:
+    PARTITION_MONTHS_AHEAD: Months created ahead of time (default: 3)
+    EXECUTION_EVENTS_RETENTION_MONTHS: Months kept online (default: 0 = forever)
+    HOURLY_SNAPSHOTS_RETENTION_MONTHS: Months kept online (default: 0 = forever)
+    PARTITION_ARCHIVE_DIR: Archive directory (default: data/partition_archive;
+                           empty = drop without archiving)
+
+Converting existing unpartitioned tables: backend/storage/migrate_partitions.py
+"""
+
+import gzip
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from backend.db.metrics import timed_acquire
+from backend.db.pool import POOL_BATCH, get_pool
+
+logger = logging.getLogger(__name__)
+
+# Partitioned table -> partition key column
+PARTITIONED_TABLES: Dict[str, str] = {
+    "execution_events": "occurred_at",
+    "hourly_snapshots": "timestamp",
+}
+
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+PARTITION_ARCHIVE_DIR = os.getenv("PARTITION_ARCHIVE_DIR", "data/partition_archive")
+
+
+def retention_months(table: str) -> int:
+    """Months of `table` kept online (0 = keep forever)."""
+    return int(os.getenv(f"{table.upper()}_RETENTION_MONTHS", "0"))
+
+
+# ============================================================================
+# NAMING AND BOUNDS
+# ============================================================================
+
+def month_start(value: date) -> date:
+    """First day of the month containing `value`."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """First day of the month `months` after `value`'s month."""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Partition table name, e.g. execution_events_y2024m01."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def parse_partition_month(table: str, name: str) -> Optional[date]:
+    """Month of a partition created by partition_name() (None for others)."""
+    prefix = f"{table}_y"
+    if not name.startswith(prefix):
+        return None
+    try:
+        year, month = name[len(prefix):].split("m")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        return None
+
+
+def _check_table(table: str) -> str:
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"Not a partitioned table: {table!r} (expected one of {sorted(PARTITIONED_TABLES)})")
+    return PARTITIONED_TABLES[table]
+
+
+# ============================================================================
+# PARTITION MANAGEMENT
+# ============================================================================
+
+async def is_partitioned(conn, table: str) -> bool:
+    """True if `table` is a partitioned (parent) table."""
+    return bool(await conn.fetchval(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass($1))",
+        table,
+    ))
+
+
+async def list_partitions(conn, table: str) -> List[Tuple[str, Optional[date]]]:
+    """Partitions of `table` as (name, month); month is None for DEFAULT."""
+    rows = await conn.fetch(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass($1)
+        ORDER BY c.relname
+        """,
+        table,
+    )
+    return [(row["relname"], parse_partition_month(table, row["relname"])) for row in rows]
+
+
+async def create_month_partition(conn, table: str, month: date) -> bool:
+    """
+    Create the partition of `table` for `month` if it does not exist.
+
+    Rows for that month already sitting in the DEFAULT partition are moved
+    into the new partition in the same transaction (PostgreSQL refuses to
+    create a partition whose range overlaps rows in DEFAULT).
+
+    Returns:
+        True if a partition was created
+    """
+    column = _check_table(table)
+    name = partition_name(table, month)
+    lower, upper = month_start(month), add_months(month, 1)
+
+    if await conn.fetchval("SELECT to_regclass($1) IS NOT NULL", name):
+        return False
+
+    default = f"{table}_default"
+    async with conn.transaction():
+        has_default = await conn.fetchval("SELECT to_regclass($1) IS NOT NULL", default)
+        stranded = has_default and await conn.fetchval(
+            f'SELECT EXISTS (SELECT 1 FROM {default} WHERE "{column}" >= $1 AND "{column}" < $2)',
+            lower, upper,
+        )
+        bounds = f"FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        if not stranded:
+            await conn.execute(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}")
+        else:
+            await conn.execute(
+                f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            moved = await conn.execute(
+                f'WITH moved AS (DELETE FROM {default} WHERE "{column}" >= $1 AND "{column}" < $2 RETURNING *) '
+                f"INSERT INTO {name} SELECT * FROM moved",
+                lower, upper,
+            )
+            await conn.execute(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES {bounds}")
+            logger.warning(f"Moved rows from {default} into new partition {name}: {moved}")
+
+    logger.info(f"Created partition {name} for [{lower}, {upper})")
+    return True
+
+
+async def ensure_partitions(
+    tables: Optional[List[str]] = None,
+    months_ahead: Optional[int] = None,
+    start: Optional[date] = None,
+) -> List[str]:
+    """
+    Create monthly partitions from `start` (default: this month) through
+    `months_ahead` months ahead. Tables that are not partitioned yet
+    (migration not run) are skipped.
+
+    Returns:
+        Names of the partitions created
+    """
+    months_ahead = PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    first = month_start(start or datetime.utcnow().date())
+    last = add_months(month_start(datetime.utcnow().date()), months_ahead)
+
+    created = []
+    pool = get_pool(POOL_BATCH)
+    async with timed_acquire(pool, POOL_BATCH) as conn:
+        for table in tables or list(PARTITIONED_TABLES):
+            _check_table(table)
+            if not await is_partitioned(conn, table):
+                logger.info(f"{table} is not partitioned, skipping (run migrate_partitions.py)")
+                continue
+            month = first
+            while month <= last:
+                if await create_month_partition(conn, table, month):
+                    created.append(partition_name(table, month))
+                month = add_months(month, 1)
+    return created
+
+
+# ============================================================================
+# RETENTION
+# ============================================================================
+
+async def archive_partition(conn, name: str, archive_dir: str) -> Path:
+    """Export a partition to <archive_dir>/<name>.csv.gz (with header)."""
+    directory = Path(archive_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.csv.gz"
+
+    with gzip.open(path, "wb") as out:
+        async def write(chunk: bytes) -> None:
+            out.write(chunk)
+
+        await conn.copy_from_table(name, output=write, format="csv", header=True)
+    return path
+
+
+async def apply_retention(
+    tables: Optional[List[str]] = None,
+    archive_dir: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Dict[str, List[str]]:
+    """
+    Archive and drop partitions older than each table's retention.
+
+    A partition is dropped once its whole month is older than
+    <TABLE>_RETENTION_MONTHS months before the current month. Tables with
+    retention 0 are kept forever.
+
+    Args:
+        tables: Tables to process (default: all partitioned tables)
+        archive_dir: Archive directory (default: PARTITION_ARCHIVE_DIR;
+                     "" drops without archiving)
+        today: Reference date (default: today, UTC)
+
+    Returns:
+        Dict of table -> dropped partition names
+    """
+    archive_dir = PARTITION_ARCHIVE_DIR if archive_dir is None else archive_dir
+    current = month_start(today or datetime.utcnow().date())
+
+    dropped: Dict[str, List[str]] = {}
+    pool = get_pool(POOL_BATCH)
+    async with timed_acquire(pool, POOL_BATCH) as conn:
+        for table in tables or list(PARTITIONED_TABLES):
+            _check_table(table)
+            months = retention_months(table)
+            if months <= 0 or not await is_partitioned(conn, table):
+                continue
+            cutoff = add_months(current, -months)
+
+            for name, month in await list_partitions(conn, table):
+                if month is None or month >= cutoff:
+                    continue
+                if archive_dir:
+                    path = await archive_partition(conn, name, archive_dir)
+                    logger.info(f"Archived {name} to {path}")
+                async with conn.transaction():
+                    await conn.execute(f"ALTER TABLE {table} DETACH PARTITION {name}")
+                    await conn.execute(f"DROP TABLE {name}")
+                dropped.setdefault(table, []).append(name)
+                logger.info(f"Dropped partition {name} (retention {months} months)")
+    return dropped
+
+
+async def maintain_partitions() -> Dict[str, List[str]]:
+    """
+    Create upcoming partitions and apply retention (daily job).
+
+    Returns:
+        Dict with "created" and "dropped" partition names
+    """
+    created = await ensure_partitions()
+    dropped = await apply_retention()
+    return {
+        "created": created,
+        "dropped": [name for names in dropped.values() for name in names],
+    }
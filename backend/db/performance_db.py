@@ -9,29 +9,77 @@ ASYNC PATTERNS USED:
     - All functions are async and use await
     - Parameter placeholders use $1, $2, $3 (not %s)
     - Row access uses dict keys (not numeric indices)
-    - Uses views for common queries (v_leaderboard_all_time, v_leaderboard_4w, v_leaderboard_8w)
+    - Leaderboard reads use the mv_leaderboard materialized view (one index
+      scan per lookback period); refresh_leaderboard() refreshes it
+      CONCURRENTLY after calculate_performance.py writes new metrics
+    - Leaderboard reads are registered prepared statements, run by name
+      (backend/db/statements.py)
 """
 
 import logging
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
 
 # Import async database helpers
-from backend.db_helpers import fetch_one, fetch_all, fetch_val
+from backend.db_helpers import fetch_one, fetch_all, fetch_prepared, fetch_val, execute
+from backend.db.statements import register_statement
 
 logger = logging.getLogger(__name__)
 
 
+LEADERBOARD_VIEW = "mv_leaderboard"
+
+register_statement("leaderboard.by_lookback", f"""
+    SELECT
+        rank,
+        account,
+        total_return,
+        sharpe_ratio,
+        max_drawdown,
+        volatility,
+        win_rate,
+        weeks_traded,
+        profitable_weeks,
+        calculated_at,
+        refreshed_at
+    FROM {LEADERBOARD_VIEW}
+    WHERE lookback_key = $1::int
+    ORDER BY rank
+""")
+register_statement("leaderboard.council_vs_individuals", f"""
+    SELECT
+        strategy_type,
+        account,
+        total_return,
+        sharpe_ratio,
+        max_drawdown,
+        win_rate,
+        weeks_traded,
+        refreshed_at
+    FROM {LEADERBOARD_VIEW}
+    WHERE lookback_key = $1::int
+    ORDER BY strategy_order, total_return DESC
+""")
+
+
+def _lookback_key(weeks_filter: Optional[int]) -> int:
+    """mv_leaderboard key for a lookback period (0 = all time)."""
+    return weeks_filter or 0
+
+
 async def get_leaderboard(weeks_filter: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Get performance leaderboard ranked by total return.
 
     Retrieves performance metrics for all accounts, ranked by total return.
-    Uses pre-built views for common time periods (all-time, 4w, 8w) for optimal performance.
+    Reads the mv_leaderboard materialized view, which holds every lookback
+    period pre-ranked; each call is an index scan on (lookback_key, rank)
+    regardless of how much history account_performance holds.
 
     Args:
         weeks_filter: Number of weeks to look back (None = all time, 4 = last 4 weeks, 8 = last 8 weeks)
-                     Only None, 4, and 8 have optimized views. Other values query the table directly.
+                     Any lookback calculated by calculate_performance.py is available.
 
     Returns:
         List of performance dictionaries, each containing:
@@ -45,13 +93,12 @@ async def get_leaderboard(weeks_filter: Optional[int] = None) -> List[Dict[str,
             - weeks_traded: Number of weeks with positions
             - profitable_weeks: Number of weeks with positive returns
             - calculated_at: Timestamp when metrics were last calculated
+            - refreshed_at: Timestamp when the materialized view was refreshed
         Returns empty list if no performance data exists.
 
     Database Tables/Views:
-        - v_leaderboard_all_time: Pre-ranked view for all-time performance
-        - v_leaderboard_4w: Pre-ranked view for 4-week performance
-        - v_leaderboard_8w: Pre-ranked view for 8-week performance
-        - account_performance: Base table for custom lookback periods
+        - mv_leaderboard: Materialized, pre-ranked view of account_performance
+          (refreshed by refresh_leaderboard)
 
     Example:
         # Get all-time leaderboard
@@ -65,88 +112,9 @@ async def get_leaderboard(weeks_filter: Optional[int] = None) -> List[Dict[str,
             print(f"#{entry['rank']} {entry['account']}: {entry['total_return']:.2%}")
     """
     try:
-        # Use optimized views for common time periods
-        if weeks_filter is None:
-            # All-time performance
-            query = """
-                SELECT
-                    rank,
-                    account,
-                    total_return,
-                    sharpe_ratio,
-                    max_drawdown,
-                    volatility,
-                    win_rate,
-                    weeks_traded,
-                    profitable_weeks,
-                    calculated_at
-                FROM v_leaderboard_all_time
-                ORDER BY rank
-            """
-            rows = await fetch_all(query)
-            logger.info(f"Retrieved all-time leaderboard: {len(rows)} accounts")
-
-        elif weeks_filter == 4:
-            # 4-week performance
-            query = """
-                SELECT
-                    rank,
-                    account,
-                    total_return,
-                    sharpe_ratio,
-                    max_drawdown,
-                    volatility,
-                    win_rate,
-                    weeks_traded,
-                    profitable_weeks,
-                    calculated_at
-                FROM v_leaderboard_4w
-                ORDER BY rank
-            """
-            rows = await fetch_all(query)
-            logger.info(f"Retrieved 4-week leaderboard: {len(rows)} accounts")
-
-        elif weeks_filter == 8:
-            # 8-week performance
-            query = """
-                SELECT
-                    rank,
-                    account,
-                    total_return,
-                    sharpe_ratio,
-                    max_drawdown,
-                    volatility,
-                    win_rate,
-                    weeks_traded,
-                    profitable_weeks,
-                    calculated_at
-                FROM v_leaderboard_8w
-                ORDER BY rank
-            """
-            rows = await fetch_all(query)
-            logger.info(f"Retrieved 8-week leaderboard: {len(rows)} accounts")
-
-        else:
-            # Custom lookback period - query table directly and calculate rank
-            # ASYNC PATTERN: Use $1 parameter placeholder (not %s)
-            query = """
-                SELECT
-                    ROW_NUMBER() OVER (ORDER BY total_return DESC) AS rank,
-                    account,
-                    total_return,
-                    sharpe_ratio,
-                    max_drawdown,
-                    volatility,
-                    win_rate,
-                    weeks_traded,
-                    profitable_weeks,
-                    calculated_at
-                FROM account_performance
-                WHERE weeks_lookback = $1
-                ORDER BY total_return DESC
-            """
-            rows = await fetch_all(query, weeks_filter)
-            logger.info(f"Retrieved {weeks_filter}-week leaderboard: {len(rows)} accounts")
+        rows = await fetch_prepared("leaderboard.by_lookback", _lookback_key(weeks_filter))
+        period = f"{weeks_filter}-week" if weeks_filter else "all-time"
+        logger.info(f"Retrieved {period} leaderboard: {len(rows)} accounts")
 
         return rows
 
@@ -155,6 +123,44 @@ async def get_leaderboard(weeks_filter: Optional[int] = None) -> List[Dict[str,
         raise
 
 
+async def refresh_leaderboard() -> Optional[datetime]:
+    """
+    Refresh the materialized leaderboard after account_performance changes.
+
+    Uses REFRESH MATERIALIZED VIEW CONCURRENTLY (readers keep seeing the
+    previous snapshot until the refresh commits). The first refresh of a
+    view that was never populated cannot be concurrent and runs plainly.
+    Runs on the batch pool.
+
+    Returns:
+        refreshed_at of the new snapshot (None if account_performance is empty)
+
+    Raises:
+        Exception: If the refresh fails (logged and raised)
+    """
+    try:
+        populated = await fetch_val(
+            "SELECT relispopulated FROM pg_class WHERE oid = $1::regclass",
+            LEADERBOARD_VIEW,
+            intent="batch",
+        )
+        concurrently = "CONCURRENTLY " if populated else ""
+        await execute(
+            f"REFRESH MATERIALIZED VIEW {concurrently}{LEADERBOARD_VIEW}",
+            intent="batch",
+        )
+        refreshed_at = await fetch_val(
+            f"SELECT MAX(refreshed_at) FROM {LEADERBOARD_VIEW}",
+            intent="batch",
+        )
+        logger.info(f"Refreshed {LEADERBOARD_VIEW} ({concurrently or 'initial '}refresh) at {refreshed_at}")
+        return refreshed_at
+
+    except Exception as e:
+        logger.error(f"Error refreshing {LEADERBOARD_VIEW}: {e}", exc_info=True)
+        raise
+
+
 async def get_account_performance(
     account: str,
     weeks_filter: Optional[int] = None
@@ -438,10 +444,12 @@ async def get_council_vs_individuals(weeks_filter: Optional[int] = None) -> Dict
             - individuals: List of performance dicts for individual PM accounts
             - baseline: Performance dict for BASELINE account
             - council_vs_best_individual: Comparison metrics
+            - refreshed_at: When the materialized leaderboard was refreshed
         Returns empty structure if no data available.
 
     Database Views:
-        - v_council_vs_individuals: Comparison view
+        - mv_leaderboard: Materialized view (strategy_type/strategy_order columns
+          replace the v_council_vs_individuals view for every lookback period)
 
     Example:
         comparison = await get_council_vs_individuals()
@@ -449,52 +457,16 @@ async def get_council_vs_individuals(weeks_filter: Optional[int] = None) -> Dict
         print(f"Best Individual: {comparison['individuals'][0]['total_return']:.2%}")
     """
     try:
-        if weeks_filter is None:
-            # Use the optimized view for all-time comparison
-            query = """
-                SELECT
-                    strategy_type,
-                    account,
-                    total_return,
-                    sharpe_ratio,
-                    max_drawdown,
-                    win_rate,
-                    weeks_traded
-                FROM v_council_vs_individuals
-            """
-            rows = await fetch_all(query)
-        else:
-            # Query table directly with weeks filter
-            query = """
-                SELECT
-                    CASE
-                        WHEN account = 'COUNCIL' THEN 'Council'
-                        WHEN account = 'BASELINE' THEN 'Baseline'
-                        ELSE 'Individual PM'
-                    END AS strategy_type,
-                    account,
-                    total_return,
-                    sharpe_ratio,
-                    max_drawdown,
-                    win_rate,
-                    weeks_traded
-                FROM account_performance
-                WHERE weeks_lookback = $1
-                ORDER BY
-                    CASE
-                        WHEN account = 'COUNCIL' THEN 1
-                        WHEN account = 'BASELINE' THEN 3
-                        ELSE 2
-                    END,
-                    total_return DESC
-            """
-            rows = await fetch_all(query, weeks_filter)
+        rows = await fetch_prepared(
+            "leaderboard.council_vs_individuals", _lookback_key(weeks_filter)
+        )
 
         # Organize results by strategy type
         result = {
             "council": None,
             "individuals": [],
-            "baseline": None
+            "baseline": None,
+            "refreshed_at": rows[0]["refreshed_at"] if rows else None,
         }
 
         for row in rows:
@@ -5,29 +5,69 @@ ASYNC PATTERNS USED:
     See backend/db/ASYNC_PATTERNS.md for complete documentation.
 
     Key patterns:
-    - JSONB columns: Pass dicts directly (no Json() wrapper needed)
+    - JSONB columns: Pass dicts directly; rows come back decoded (the pool's
+      JSONB codecs in backend/db/codecs.py do both, no json.dumps/json.loads)
+    - Batched writes: save_pitches runs one set-based DELETE and one
+      INSERT ... SELECT FROM unnest() ... RETURNING in a single transaction
+    - Generated columns (horizon, risk_profile, entry_policy, exit_policy)
+      are derived from pitch_data by PostgreSQL for server-side filtering
     - Complete async chain: API → Service → DB → Pool
     - All functions are async and use await
     - Parameter placeholders use $1, $2, $3 (not %s)
     - Row access uses dict keys (not numeric indices)
+    - load_pitches runs registered prepared statements by name
+      (backend/db/statements.py)
 """
 
-import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 # Import async database helpers
-from backend.db_helpers import fetch_one, fetch_all, fetch_val, execute
+from backend.db.codecs import json_dumps
+from backend.db_helpers import fetch_one, fetch_all, fetch_prepared, stream_rows, transaction
+from backend.db.statements import RETURNS_VALUE, register_statement
+from backend.db.pagination import build_page, clamp_limit, keyset_condition
+from backend.cache.invalidation import publish_change, SOURCE_PM_PITCHES
+from backend.cache.keys import pitches_week_key, pitches_date_key, pitches_latest_key
 
 logger = logging.getLogger(__name__)
 
 
+_INSERT_PITCHES = """
+    INSERT INTO pm_pitches
+    (week_id, model, account, pitch_data, instrument, direction, conviction, research_date, created_at)
+    SELECT $1, p.model, p.account, p.pitch_data::jsonb, p.instrument, p.direction, p.conviction, $8, NOW()
+    FROM unnest($2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::numeric[])
+         AS p(model, account, pitch_data, instrument, direction, conviction)
+    RETURNING id, model
+"""
+
+register_statement(
+    "pitches.by_week",
+    "SELECT pitch_data, created_at, research_date FROM pm_pitches WHERE week_id = $1::text ORDER BY model",
+)
+register_statement(
+    "pitches.by_research_date",
+    "SELECT pitch_data, created_at, research_date FROM pm_pitches WHERE research_date = $1::timestamptz ORDER BY model",
+)
+register_statement(
+    "pitches.latest_research_date",
+    "SELECT MAX(research_date) FROM pm_pitches WHERE research_date IS NOT NULL",
+    returns=RETURNS_VALUE,
+)
+register_statement(
+    "pitches.latest_week",
+    "SELECT MAX(week_id) FROM pm_pitches",
+    returns=RETURNS_VALUE,
+)
+
+
 async def save_pitches(
     week_id: str,
     pitches_raw: List[Dict[str, Any]],
     research_date: Optional[str] = None
-) -> None:
+) -> Dict[str, str]:
     """
     Save raw PM pitches to database.
 
@@ -35,6 +75,10 @@ async def save_pitches(
     already exists for the same model and research_date (or week_id), it will
     be deleted and replaced with the new pitch data.
 
+    All pitches are written in one transaction with two statements: a
+    set-based DELETE of the models being replaced and a single INSERT over
+    unnest()ed column arrays. Either every pitch is saved or none is.
+
     Args:
         week_id: Week identifier for the pitches
         pitches_raw: List of pitch dictionaries containing:
@@ -51,63 +95,82 @@ async def save_pitches(
         - pm_pitches: Stores PM pitch data with columns:
             week_id, model, account, pitch_data, instrument, direction,
             conviction, research_date, created_at
+            (horizon, risk_profile, entry_policy and exit_policy are
+            generated from pitch_data)
 
     Returns:
-        None
+        Dict mapping model name to the new pitch ID (pass to
+        save_peer_reviews as pitch_ids to skip the ID lookup)
 
     Raises:
-        Exception: If database operation fails (logged but not raised)
+        Exception: If database operation fails (logged and raised)
     """
     try:
         logger.info(
             f"Saving {len(pitches_raw)} pitches to DB for week {week_id}"
         )
 
+        # One row per model (a later pitch for the same model replaces it,
+        # as the previous delete-then-insert loop did)
+        by_model: Dict[str, Dict[str, Any]] = {}
         for pitch in pitches_raw:
-            model = pitch.get("model", "unknown")
-            account = pitch.get("model_info", {}).get("account", "UNKNOWN")
-
             # Ensure timestamp exists
             if "timestamp" not in pitch:
                 pitch["timestamp"] = datetime.utcnow().isoformat()
+            by_model[pitch.get("model", "unknown")] = pitch
 
-            # Delete existing pitch for this model/research_date to allow re-runs
+        if not by_model:
+            return {}
+
+        models = list(by_model)
+        pitches = list(by_model.values())
+
+        # ASYNC PATTERN: Set-based writes in one transaction
+        # - DELETE ... = ANY($n) replaces every model in one statement
+        # - INSERT ... SELECT FROM unnest() inserts all pitches in one
+        #   statement; payloads travel as JSON text and are cast to JSONB
+        # - RETURNING gives the new IDs without a follow-up SELECT
+        async with transaction() as conn:
             # Match by research_date and model to avoid deleting pitches from other research dates
             if research_date:
-                await execute(
-                    "DELETE FROM pm_pitches WHERE research_date = $1 AND model = $2",
-                    research_date, model
+                await conn.execute(
+                    "DELETE FROM pm_pitches WHERE research_date = $1 AND model = ANY($2::text[])",
+                    research_date, models
                 )
             else:
                 # Fallback to week_id if research_date not provided
-                await execute(
-                    "DELETE FROM pm_pitches WHERE week_id = $1 AND model = $2",
-                    week_id, model
+                await conn.execute(
+                    "DELETE FROM pm_pitches WHERE week_id = $1 AND model = ANY($2::text[])",
+                    week_id, models
                 )
 
-            # ASYNC PATTERN: Execute INSERT with await
-            # - execute() automatically uses connection pool
-            # - Parameters use $1, $2, $3 placeholders (not %s)
-            # - JSONB column (pitch_data): json.dumps() for text storage
-            #   (In pure JSONB columns, you can pass dict directly without json.dumps)
-            # - All operations are async and non-blocking
-            await execute(
-                """
-                INSERT INTO pm_pitches
-                (week_id, model, account, pitch_data, instrument, direction, conviction, research_date, created_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
-                """,
+            rows = await conn.fetch(
+                _INSERT_PITCHES,
                 week_id,
-                model,
-                account,
-                json.dumps(pitch),  # TEXT column, so we use json.dumps()
-                pitch.get("selected_instrument") or pitch.get("instrument"),
-                pitch.get("direction"),
-                float(pitch.get("conviction", 0)),
+                models,
+                [p.get("model_info", {}).get("account", "UNKNOWN") for p in pitches],
+                [json_dumps(p) for p in pitches],
+                [p.get("selected_instrument") or p.get("instrument") for p in pitches],
+                [p.get("direction") for p in pitches],
+                [float(p.get("conviction", 0)) for p in pitches],
                 research_date
             )
 
-        logger.info("Pitches saved to DB successfully")
+        pitch_ids = {row["model"]: str(row["id"]) for row in rows}
+        logger.info(f"Saved {len(pitch_ids)} pitches to DB successfully")
+
+        # Tell other workers to drop their local copies of these pitches
+        keys = [pitches_week_key(week_id), pitches_latest_key()]
+        if research_date:
+            keys.append(pitches_date_key(research_date))
+        await publish_change(
+            SOURCE_PM_PITCHES,
+            week_id=week_id,
+            research_date=research_date,
+            keys=tuple(keys),
+        )
+
+        return pitch_ids
 
     except Exception as e:
         logger.error(f"Error saving pitches to DB: {e}", exc_info=True)
@@ -157,30 +220,20 @@ async def load_pitches(
             """
             rows = await fetch_all(query, research_date, research_date, research_date)
         elif week_id:
-            query = "SELECT pitch_data, created_at, research_date FROM pm_pitches WHERE week_id = $1 ORDER BY model"
-            rows = await fetch_all(query, week_id)
+            rows = await fetch_prepared("pitches.by_week", week_id)
         else:
             # Get latest by research_date if available, else by week_id
             # Prefer using research_date as it's more valid
-            latest_date = await fetch_val(
-                "SELECT MAX(research_date) FROM pm_pitches WHERE research_date IS NOT NULL"
-            )
+            latest_date = await fetch_prepared("pitches.latest_research_date")
 
             if latest_date:
-                query = """
-                    SELECT pitch_data, created_at, research_date
-                    FROM pm_pitches
-                    WHERE research_date = $1
-                    ORDER BY model
-                """
-                rows = await fetch_all(query, latest_date)
+                rows = await fetch_prepared("pitches.by_research_date", latest_date)
             else:
                 # Fallback to week_id
-                latest_week = await fetch_val("SELECT MAX(week_id) FROM pm_pitches")
+                latest_week = await fetch_prepared("pitches.latest_week")
                 if not latest_week:
                     return []
-                query = "SELECT pitch_data, created_at, research_date FROM pm_pitches WHERE week_id = $1 ORDER BY model"
-                rows = await fetch_all(query, latest_week)
+                rows = await fetch_prepared("pitches.by_week", latest_week)
 
         if not rows:
             return []
@@ -218,8 +271,9 @@ async def find_pitch_by_id(pitch_id: int) -> Optional[Dict[str, Any]]:
             - conviction: Conviction score
             - research_date: Research date
             - created_at: Creation timestamp
-            - entry_policy: Entry policy JSON (parsed if present)
-            - exit_policy: Exit policy JSON (parsed if present)
+            - horizon, risk_profile: Generated from pitch_data
+            - entry_policy: Entry policy dict (generated from pitch_data)
+            - exit_policy: Exit policy dict (generated from pitch_data)
         Returns None if pitch not found or error occurs.
 
     Database Tables:
@@ -234,22 +288,107 @@ async def find_pitch_by_id(pitch_id: int) -> Optional[Dict[str, Any]]:
         if not pitch_dict:
             return None
 
-        # Parse JSON fields if they exist
-        if pitch_dict.get('entry_policy'):
-            try:
-                pitch_dict['entry_policy'] = json.loads(pitch_dict['entry_policy'])
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        if pitch_dict.get('exit_policy'):
-            try:
-                pitch_dict['exit_policy'] = json.loads(pitch_dict['exit_policy'])
-            except (json.JSONDecodeError, TypeError):
-                pass
-
         logger.info(f"Found pitch {pitch_id} in database")
         return pitch_dict
 
     except Exception as e:
         logger.error(f"Error fetching pitch {pitch_id}: {e}", exc_info=True)
         return None
+
+
+PITCH_COLUMNS = [
+    "id", "week_id", "model", "account", "instrument", "direction",
+    "conviction", "research_date", "created_at", "pitch_data",
+]
+
+
+def _pitch_filters(
+    week_id: Optional[str] = None,
+    model: Optional[str] = None,
+    account: Optional[str] = None,
+) -> Tuple[List[str], List[Any]]:
+    """WHERE conditions and parameters ($1..$n) for pitch history."""
+    conditions = []
+    params: List[Any] = []
+    for column, value in (("week_id", week_id), ("model", model), ("account", account)):
+        if value:
+            params.append(value)
+            conditions.append(f"{column} = ${len(params)}")
+    return conditions, params
+
+
+async def get_pitch_page(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    week_id: Optional[str] = None,
+    model: Optional[str] = None,
+    account: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Get one page of pitch history (newest first) using keyset pagination.
+
+    Args:
+        limit: Page size (default: 50, max: 500)
+        cursor: `next_cursor` from the previous page (None for the first page)
+        week_id: Filter by week identifier (optional)
+        model: Filter by PM model (optional)
+        account: Filter by account (optional)
+
+    Returns:
+        Dict containing:
+            - items: Pitch row dicts (PITCH_COLUMNS; pitch_data decoded)
+            - next_cursor: Token for the next page, None on the last page
+
+    Raises:
+        ValueError: If cursor is malformed
+
+    Database Tables:
+        - pm_pitches: Contains PM pitch data
+    """
+    limit = clamp_limit(limit)
+    conditions, params = _pitch_filters(week_id, model, account)
+    seek, seek_params = keyset_condition("created_at", "id", cursor, len(params) + 1)
+    if seek:
+        conditions.append(seek)
+        params.extend(seek_params)
+    params.append(limit + 1)
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT {", ".join(PITCH_COLUMNS)}
+        FROM pm_pitches
+        {where_clause}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ${len(params)}
+    """
+
+    try:
+        rows = await fetch_all(query, *params)
+    except Exception as e:
+        logger.error(f"Error fetching pitch page: {e}", exc_info=True)
+        raise
+
+    return build_page(rows, limit, sort_key="created_at")
+
+
+def stream_pitches(
+    week_id: Optional[str] = None,
+    model: Optional[str] = None,
+    account: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream pitch history (oldest first) through a server-side cursor, for
+    exports. Memory use is constant.
+
+    Returns:
+        Async iterator of pitch row dicts (PITCH_COLUMNS)
+    """
+    conditions, params = _pitch_filters(week_id, model, account)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT {", ".join(PITCH_COLUMNS)}
+        FROM pm_pitches
+        {where_clause}
+        ORDER BY created_at, id
+    """
+    return stream_rows(query, *params)
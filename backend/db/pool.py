@@ -9,6 +9,21 @@ Architecture:
     - Async/await based using asyncpg for non-blocking I/O
     - Automatic connection reuse and lifecycle management
     - Configurable pool size and timeouts
+    - Named pools isolate workloads (see Named Pools below)
+    - Every connection registers JSON/JSONB codecs on open (backend/db/codecs.py),
+      so JSONB columns read and write as Python dicts/lists
+    - Every connection prepares the registered hot statements on open
+      (backend/db/statements.py)
+
+Named Pools:
+    primary: Writes and reads that must see them (always initialized)
+    read:    Dashboard/API reads; optionally pointed at a replica
+    batch:   Heavy jobs (metrics backfills, bulk loads, leaderboard refresh)
+             with its own small size and long timeout
+
+    A named pool that is not initialized falls back to primary, so scripts
+    that only call init_pool() keep working. db_helpers routes on intent:
+    reads -> read pool, writes -> primary, intent="batch" -> batch pool.
 
 Usage:
     # In FastAPI startup event
@@ -38,19 +53,79 @@ Environment Variables:
         DB_COMMAND_TIMEOUT: Query timeout in seconds (default: 60)
         DB_MAX_QUERIES: Queries per connection before recycling (default: 50000)
         DB_MAX_INACTIVE_CONNECTION_LIFETIME: Max idle time in seconds (default: 300)
+
+    Named pools (same settings with a DB_READ_ / DB_BATCH_ prefix):
+        DATABASE_READ_URL: Replica DSN for the read pool (default: primary)
+        DB_READ_MIN_POOL_SIZE / DB_READ_MAX_POOL_SIZE (default: 2 / 20)
+        DB_READ_COMMAND_TIMEOUT (default: 30)
+        DB_BATCH_MIN_POOL_SIZE / DB_BATCH_MAX_POOL_SIZE (default: 1 / 5)
+        DB_BATCH_COMMAND_TIMEOUT (default: 600)
+        DB_NUMERIC_AS_FLOAT / DB_READ_NUMERIC_AS_FLOAT / DB_BATCH_NUMERIC_AS_FLOAT:
+            Decode NUMERIC columns to float instead of Decimal (default: read
+            pool only; the batch pool runs binary COPY, see backend/db/codecs.py)
+        DB_PGBOUNCER / DB_READ_PGBOUNCER / DB_BATCH_PGBOUNCER: The pool
+            connects through a transaction-pooling proxy; disables prepared
+            statements and the statement cache (default: false)
+        DB_POOLS: Pools created by init_pools() (default: primary,read,batch)
+        DB_APPLICATION_NAME: application_name prefix; host and pid are
+                             appended (default: llm_trading)
+
+Lazy warm-up:
+    init_pool(lazy=True) / init_pools(lazy=True) open one connection per
+    pool (enough to verify the DSN) and return; a background task then
+    opens connections up to min_size for the first burst of traffic. The
+    pool's floor is one connection, so connections above it close after
+    max_inactive_connection_lifetime when idle and the pool is sized by
+    demand. The API server and CLI use this so a restart does not wait on
+    10+ connection handshakes before serving.
 """
 
+import asyncio
 import os
 import logging
-from typing import Optional
+import socket
+from functools import partial
+from typing import Dict, Optional, Sequence
 import asyncpg
 from dotenv import load_dotenv
 
+from backend.db.codecs import init_analytic_connection, init_connection
+from backend.db.statements import StatementConnection, prepare_connection
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+# Pool names
+POOL_PRIMARY = "primary"
+POOL_READ = "read"
+POOL_BATCH = "batch"
+POOL_NAMES = (POOL_PRIMARY, POOL_READ, POOL_BATCH)
+
+# Query intents (db_helpers) -> pool
+INTENT_READ = "read"
+INTENT_WRITE = "write"
+INTENT_BATCH = "batch"
+INTENT_POOLS = {
+    INTENT_READ: POOL_READ,
+    INTENT_WRITE: POOL_PRIMARY,
+    INTENT_BATCH: POOL_BATCH,
+}
+
+# Tags this process's connections (pg_stat_activity, change feed origin)
+APPLICATION_NAME = f"{os.getenv('DB_APPLICATION_NAME', 'llm_trading')}:{socket.gethostname()}:{os.getpid()}"[:56]
+
+# Env var prefix and (min_size, max_size, command_timeout, numeric_as_float)
+# defaults per pool
+_POOL_ENV_PREFIX = {POOL_PRIMARY: "DB_", POOL_READ: "DB_READ_", POOL_BATCH: "DB_BATCH_"}
+_POOL_DEFAULTS = {
+    POOL_PRIMARY: ("10", "50", "60.0", "false"),
+    POOL_READ: ("2", "20", "30.0", "true"),
+    POOL_BATCH: ("1", "5", "600.0", "false"),
+}
+
+
 class DatabaseConfig:
     """Configuration for PostgreSQL connection pool.
 
@@ -58,10 +133,23 @@ class DatabaseConfig:
     Supports both DATABASE_URL connection string and individual parameters.
     """
 
-    def __init__(self):
-        """Initialize database configuration from environment variables."""
-        # Connection parameters
+    def __init__(self, pool_name: str = POOL_PRIMARY):
+        """
+        Initialize database configuration from environment variables.
+
+        Args:
+            pool_name: "primary", "read" or "batch" (selects env prefix/defaults)
+        """
+        if pool_name not in _POOL_ENV_PREFIX:
+            raise ValueError(f"Unknown pool: {pool_name!r} (expected one of {POOL_NAMES})")
+        self.pool_name = pool_name
+        prefix = _POOL_ENV_PREFIX[pool_name]
+        min_size, max_size, command_timeout, numeric_as_float = _POOL_DEFAULTS[pool_name]
+
+        # Connection parameters (the read pool may point at a replica)
         self.database_url = os.getenv("DATABASE_URL")
+        if pool_name == POOL_READ and os.getenv("DATABASE_READ_URL"):
+            self.database_url = os.getenv("DATABASE_READ_URL")
 
         # Individual connection components (used if DATABASE_URL not provided)
         self.database_name = os.getenv("DATABASE_NAME", "llm_trading")
@@ -71,12 +159,22 @@ class DatabaseConfig:
         self.database_password = os.getenv("DATABASE_PASSWORD")
 
         # Pool configuration
-        self.min_pool_size = int(os.getenv("DB_MIN_POOL_SIZE", "10"))
-        self.max_pool_size = int(os.getenv("DB_MAX_POOL_SIZE", "50"))
-        self.command_timeout = float(os.getenv("DB_COMMAND_TIMEOUT", "60.0"))
-        self.max_queries = int(os.getenv("DB_MAX_QUERIES", "50000"))
+        self.min_pool_size = int(os.getenv(f"{prefix}MIN_POOL_SIZE", min_size))
+        self.max_pool_size = int(os.getenv(f"{prefix}MAX_POOL_SIZE", max_size))
+        self.command_timeout = float(os.getenv(f"{prefix}COMMAND_TIMEOUT", command_timeout))
+        self.numeric_as_float = (
+            os.getenv(f"{prefix}NUMERIC_AS_FLOAT", numeric_as_float).lower() in ("1", "true", "yes")
+        )
+        self.pgbouncer = (
+            os.getenv(f"{prefix}PGBOUNCER", os.getenv("DB_PGBOUNCER", "false")).lower()
+            in ("1", "true", "yes")
+        )
+        self.max_queries = int(os.getenv(f"{prefix}MAX_QUERIES", os.getenv("DB_MAX_QUERIES", "50000")))
         self.max_inactive_connection_lifetime = float(
-            os.getenv("DB_MAX_INACTIVE_CONNECTION_LIFETIME", "300.0")
+            os.getenv(
+                f"{prefix}MAX_INACTIVE_CONNECTION_LIFETIME",
+                os.getenv("DB_MAX_INACTIVE_CONNECTION_LIFETIME", "300.0"),
+            )
         )
 
     def get_dsn(self) -> str:
@@ -110,6 +208,7 @@ class DatabaseConfig:
         """String representation (safe - no password)."""
         return (
             f"DatabaseConfig("
+            f"pool={self.pool_name}, "
             f"host={self.database_host}, "
             f"port={self.database_port}, "
             f"database={self.database_name}, "
@@ -118,23 +217,100 @@ class DatabaseConfig:
         )
 
 
-# Global connection pool singleton
+# Global connection pool singleton (primary)
 _pool: Optional[asyncpg.Pool] = None
 _config: Optional[DatabaseConfig] = None
 
+# Secondary named pools ("read", "batch"); unset names fall back to _pool
+_named_pools: Dict[str, asyncpg.Pool] = {}
+_named_configs: Dict[str, DatabaseConfig] = {}
 
-async def init_pool() -> asyncpg.Pool:
+# Background warm-up tasks of lazily initialized pools (by pool name)
+_warmup_tasks: Dict[str, asyncio.Task] = {}
+
+
+async def _warm_pool(pool: asyncpg.Pool, config: DatabaseConfig) -> int:
     """
-    Initialize the global async connection pool.
+    Open connections until the pool holds min_pool_size of them.
+
+    Connections are acquired concurrently (so each one is new) and then
+    released back to the pool as idle connections.
+
+    Returns:
+        Number of connections opened
+    """
+    missing = config.min_pool_size - pool.get_size()
+    if missing <= 0:
+        return 0
+    results = await asyncio.gather(
+        *(pool.acquire() for _ in range(missing)), return_exceptions=True
+    )
+    opened = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning(f"Pool '{config.pool_name}' warm-up connection failed: {result}")
+            continue
+        await pool.release(result)
+        opened += 1
+    logger.info(f"Pool '{config.pool_name}' warmed up to {pool.get_size()} connections")
+    return opened
+
+
+async def _create_pool(config: DatabaseConfig, lazy: bool = False) -> asyncpg.Pool:
+    """
+    Create a pool from `config` and test it with one round trip.
+
+    With lazy=True the pool starts with one connection and is filled to
+    min_pool_size in the background.
+    """
+    pool = await asyncpg.create_pool(
+        dsn=config.get_dsn(),
+        min_size=min(1, config.min_pool_size) if lazy else config.min_pool_size,
+        max_size=config.max_pool_size,
+        command_timeout=config.command_timeout,
+        max_queries=config.max_queries,
+        max_inactive_connection_lifetime=config.max_inactive_connection_lifetime,
+        init=partial(
+            prepare_connection,
+            init=init_analytic_connection if config.numeric_as_float else init_connection,
+            pgbouncer=config.pgbouncer,
+        ),
+        connection_class=StatementConnection,
+        statement_cache_size=0 if config.pgbouncer else 100,
+        server_settings={"application_name": APPLICATION_NAME},
+    )
+
+    # Test the connection
+    async with pool.acquire() as conn:
+        version = await conn.fetchval("SELECT version()")
+        logger.info(f"✓ Database pool '{config.pool_name}' initialized successfully")
+        logger.info(f"  PostgreSQL version: {version.split(',')[0]}")
+        logger.info(f"  Pool size: {config.min_pool_size}-{config.max_pool_size} connections")
+
+    if lazy and config.min_pool_size > 1:
+        _warmup_tasks[config.pool_name] = asyncio.create_task(_warm_pool(pool, config))
+
+    return pool
+
+
+async def init_pool(name: str = POOL_PRIMARY, lazy: bool = False) -> asyncpg.Pool:
+    """
+    Initialize a global async connection pool.
 
     Should be called once during FastAPI startup event. Creates a connection
     pool that will be reused throughout the application lifetime.
 
+    Args:
+        name: Pool to initialize ("primary", "read" or "batch")
+        lazy: Open one connection now and the rest of min_size in the
+              background (see Lazy warm-up)
+
     Returns:
         asyncpg.Pool: The initialized connection pool
 
     Raises:
         asyncpg.PostgresError: If pool initialization fails
+        ValueError: If name is not a known pool
 
     Example:
         @app.on_event("startup")
@@ -149,6 +325,20 @@ async def init_pool() -> asyncpg.Pool:
     """
     global _pool, _config
 
+    if name != POOL_PRIMARY:
+        if name in _named_pools:
+            logger.info(f"Connection pool '{name}' already initialized, returning existing pool")
+            return _named_pools[name]
+        config = DatabaseConfig(name)
+        logger.info(f"Initializing connection pool with config: {config}")
+        try:
+            _named_pools[name] = await _create_pool(config, lazy=lazy)
+            _named_configs[name] = config
+            return _named_pools[name]
+        except Exception as e:
+            logger.error(f"✗ Failed to initialize database pool '{name}': {e}", exc_info=True)
+            raise
+
     if _pool is not None:
         logger.info("Connection pool already initialized, returning existing pool")
         return _pool
@@ -158,23 +348,7 @@ async def init_pool() -> asyncpg.Pool:
     logger.info(f"Initializing connection pool with config: {_config}")
 
     try:
-        # Create the connection pool
-        _pool = await asyncpg.create_pool(
-            dsn=_config.get_dsn(),
-            min_size=_config.min_pool_size,
-            max_size=_config.max_pool_size,
-            command_timeout=_config.command_timeout,
-            max_queries=_config.max_queries,
-            max_inactive_connection_lifetime=_config.max_inactive_connection_lifetime,
-        )
-
-        # Test the connection
-        async with _pool.acquire() as conn:
-            version = await conn.fetchval("SELECT version()")
-            logger.info(f"✓ Database pool initialized successfully")
-            logger.info(f"  PostgreSQL version: {version.split(',')[0]}")
-            logger.info(f"  Pool size: {_config.min_pool_size}-{_config.max_pool_size} connections")
-
+        _pool = await _create_pool(_config, lazy=lazy)
         return _pool
 
     except Exception as e:
@@ -184,12 +358,47 @@ async def init_pool() -> asyncpg.Pool:
         raise
 
 
-def get_pool() -> asyncpg.Pool:
+async def init_pools(
+    names: Optional[Sequence[str]] = None, lazy: bool = False
+) -> Dict[str, asyncpg.Pool]:
     """
-    Get the global async connection pool.
+    Initialize the primary pool and the configured named pools.
+
+    The primary pool must come up (its errors are raised). A failing read or
+    batch pool is logged and left uninitialized, so its traffic falls back to
+    the primary pool instead of taking the application down.
+
+    Args:
+        names: Pools to initialize (default: DB_POOLS, "primary,read,batch")
+        lazy: Warm each pool up in the background (see init_pool)
 
     Returns:
-        asyncpg.Pool: The global connection pool
+        Dict of pool name -> pool for the pools that initialized
+    """
+    if names is None:
+        names = [n.strip() for n in os.getenv("DB_POOLS", ",".join(POOL_NAMES)).split(",") if n.strip()]
+
+    pools = {POOL_PRIMARY: await init_pool(POOL_PRIMARY, lazy=lazy)}
+    for name in names:
+        if name == POOL_PRIMARY:
+            continue
+        try:
+            pools[name] = await init_pool(name, lazy=lazy)
+        except Exception as e:
+            logger.warning(f"Pool '{name}' unavailable, routing its queries to primary: {e}")
+    return pools
+
+
+def get_pool(name: str = POOL_PRIMARY) -> asyncpg.Pool:
+    """
+    Get a global async connection pool.
+
+    Args:
+        name: Pool name ("primary", "read" or "batch"). Named pools that were
+              not initialized fall back to the primary pool.
+
+    Returns:
+        asyncpg.Pool: The requested connection pool
 
     Raises:
         RuntimeError: If pool has not been initialized (call init_pool() first)
@@ -206,6 +415,10 @@ def get_pool() -> asyncpg.Pool:
         - Use the 'async with pool.acquire()' pattern for connection management
         - Connections are automatically returned to the pool after use
     """
+    if name != POOL_PRIMARY:
+        pool = _named_pools.get(name)
+        if pool is not None:
+            return pool
     if _pool is None:
         raise RuntimeError(
             "Database pool not initialized. Call init_pool() in FastAPI startup event."
@@ -213,9 +426,30 @@ def get_pool() -> asyncpg.Pool:
     return _pool
 
 
+def pool_name_for_intent(intent: str) -> str:
+    """
+    Map a query intent to the pool that serves it.
+
+    Args:
+        intent: "read", "write" or "batch"
+
+    Returns:
+        Pool name ("read" -> read, "write" -> primary, "batch" -> batch)
+
+    Raises:
+        ValueError: If intent is unknown
+    """
+    try:
+        return INTENT_POOLS[intent]
+    except KeyError:
+        raise ValueError(
+            f"Unknown query intent: {intent!r} (expected one of {sorted(INTENT_POOLS)})"
+        ) from None
+
+
 async def close_pool() -> None:
     """
-    Close the global connection pool and release all connections.
+    Close all connection pools and release all connections.
 
     Should be called once during FastAPI shutdown event. Gracefully closes
     all active connections and cleans up resources.
@@ -233,6 +467,19 @@ async def close_pool() -> None:
     """
     global _pool, _config
 
+    for task in _warmup_tasks.values():
+        task.cancel()
+    _warmup_tasks.clear()
+
+    for name, pool in list(_named_pools.items()):
+        try:
+            await pool.close()
+            logger.info(f"✓ Database pool '{name}' closed successfully")
+        except Exception as e:
+            logger.error(f"Error closing database pool '{name}': {e}", exc_info=True)
+    _named_pools.clear()
+    _named_configs.clear()
+
     if _pool is None:
         logger.info("Connection pool already closed or not initialized")
         return
@@ -250,9 +497,12 @@ async def close_pool() -> None:
         _config = None
 
 
-def get_config() -> Optional[DatabaseConfig]:
+def get_config(name: str = POOL_PRIMARY) -> Optional[DatabaseConfig]:
     """
-    Get the current database configuration.
+    Get the configuration of a pool.
+
+    Args:
+        name: Pool name (default: primary)
 
     Returns:
         DatabaseConfig or None: The configuration if pool is initialized
@@ -261,18 +511,25 @@ def get_config() -> Optional[DatabaseConfig]:
         - Useful for debugging and monitoring
         - Returns None if pool not yet initialized
     """
+    if name != POOL_PRIMARY:
+        return _named_configs.get(name)
     return _config
 
 
-async def check_pool_health() -> dict:
+async def check_pool_health(name: str = POOL_PRIMARY) -> dict:
     """
-    Check the health and status of the connection pool.
+    Check the health and status of a connection pool.
+
+    Args:
+        name: Pool name (default: primary)
 
     Returns:
         dict: Pool health status including:
             - status: "healthy", "degraded", or "unavailable"
             - pool_size: Current number of connections
             - free_connections: Number of available connections
+            - metrics: Acquire/query counters from backend/db/metrics.py
+              (acquires, in_use, max_in_use, acquire_wait_ms_p95, queries, ...)
             - error: Error message if unhealthy
 
     Example:
@@ -284,7 +541,14 @@ async def check_pool_health() -> dict:
         - Used by health check endpoints
         - Safe to call frequently (lightweight operation)
     """
-    if _pool is None:
+    from backend.db.metrics import db_stats
+
+    if name == POOL_PRIMARY:
+        pool, config = _pool, _config
+    else:
+        pool, config = _named_pools.get(name), _named_configs.get(name)
+
+    if pool is None:
         return {
             "status": "unavailable",
             "error": "Pool not initialized"
@@ -292,22 +556,46 @@ async def check_pool_health() -> dict:
 
     try:
         # Test pool connectivity
-        async with _pool.acquire() as conn:
+        async with pool.acquire() as conn:
             await conn.fetchval("SELECT 1")
 
         # Get pool statistics
         return {
             "status": "healthy",
-            "pool_size": _pool.get_size(),
-            "free_connections": _pool.get_idle_size(),
-            "min_size": _config.min_pool_size if _config else None,
-            "max_size": _config.max_pool_size if _config else None,
+            "pool_size": pool.get_size(),
+            "free_connections": pool.get_idle_size(),
+            "min_size": config.min_pool_size if config else None,
+            "max_size": config.max_pool_size if config else None,
+            "metrics": db_stats.summary(name),
         }
 
     except Exception as e:
-        logger.error(f"Pool health check failed: {e}", exc_info=True)
+        logger.error(f"Pool '{name}' health check failed: {e}", exc_info=True)
         return {
             "status": "degraded",
             "error": str(e),
-            "pool_size": _pool.get_size() if _pool else 0,
+            "pool_size": pool.get_size() if pool else 0,
+            "metrics": db_stats.summary(name),
         }
+
+
+async def check_all_pools_health() -> Dict[str, dict]:
+    """
+    Check every named pool.
+
+    Returns:
+        Dict of pool name -> health. Pools that were not initialized report
+        status "fallback" with routes_to="primary" while the primary pool
+        is up (their queries are served by primary).
+    """
+    health = {POOL_PRIMARY: await check_pool_health(POOL_PRIMARY)}
+    for name in POOL_NAMES:
+        if name == POOL_PRIMARY:
+            continue
+        if name in _named_pools:
+            health[name] = await check_pool_health(name)
+        elif _pool is not None:
+            health[name] = {"status": "fallback", "routes_to": POOL_PRIMARY}
+        else:
+            health[name] = {"status": "unavailable", "error": "Pool not initialized"}
+    return health
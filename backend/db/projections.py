@@ -0,0 +1,454 @@
+"""Projections over the execution_events event store, with snapshots.
+
+execution_events is append-only; derived state (open positions, weekly
+P&L, conviction history) is a fold over it. ProjectionEngine reads events
+in batches in stream order and applies them to a set of projections,
+persisting a snapshot of every projection's state to projection_snapshots
+as it goes. A rebuild starts from the latest snapshot and only replays the
+events written after it.
+
+Stream order:
+    Events are consumed by (created_at, id). created_at is set by the
+    server at insert time, so events inserted late (e.g. replayed from the
+    event writer's spill file with an old occurred_at) still sort after
+    the snapshot that preceded them. Events newer than SETTLE_SECONDS are
+    left for the next run so a transaction that commits late cannot slip
+    behind the stream position.
+
+Projections:
+    - positions: net submitted quantity and cost basis per account/symbol
+    - weekly_pnl: orders, notional and realized P&L per week/account, plus
+      open lots for mark-to-market (WeeklyPnLProjection.pnl(prices))
+    - conviction: per-account timeline of (direction, conviction) from the
+      pipeline's order events
+
+execution_events has no fill events yet, so positions are built from
+order_placed (submitted orders). Prices come from the fill price when an
+event carries one, otherwise the limit price.
+
+Configuration:
+    PROJECTION_BATCH_SIZE: Events per read (default: 5000)
+    PROJECTION_SNAPSHOT_EVERY: Events between snapshots (default: 50000)
+
+Usage:
+    engine = ProjectionEngine()
+    await engine.run()                  # resume from the latest snapshot
+    await engine.run(rebuild=True)      # full replay from the first event
+    engine["positions"].positions
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from backend.db.pool import INTENT_BATCH
+from backend.db_helpers import execute, fetch_all, fetch_one
+
+logger = logging.getLogger(__name__)
+
+PROJECTION_BATCH_SIZE = int(os.getenv("PROJECTION_BATCH_SIZE", "5000"))
+PROJECTION_SNAPSHOT_EVERY = int(os.getenv("PROJECTION_SNAPSHOT_EVERY", "50000"))
+
+# Snapshots kept per engine run (older ones are deleted)
+SNAPSHOT_KEEP = 3
+
+# Events younger than this are not consumed yet (see module notes)
+SETTLE_SECONDS = 2.0
+
+ORDER_EVENT = "order_placed"
+
+# Event data keys holding an execution price, in order of preference
+PRICE_KEYS = ("filled_avg_price", "fill_price", "limit_price")
+
+# Stream position: (created_at, id) of the last applied event
+Position = Tuple[datetime, str]
+
+
+# ============================================================================
+# Projections
+# ============================================================================
+
+
+def _signed_qty(data: Mapping[str, Any]) -> float:
+    """Order quantity signed by side (buy > 0, sell < 0)."""
+    qty = float(data.get("qty") or 0)
+    return -qty if str(data.get("side", "")).lower() == "sell" else qty
+
+
+def _price(data: Mapping[str, Any]) -> Optional[float]:
+    for key in PRICE_KEYS:
+        if data.get(key) is not None:
+            return float(data[key])
+    return None
+
+
+def _apply_trade(lots: Dict[str, Dict[str, float]], symbol: str, qty: float, price: Optional[float]) -> float:
+    """
+    Apply a signed trade to a book of open lots (average cost).
+
+    Returns:
+        Realized P&L of the part of the trade that reduced the position
+        (0 when no price is known)
+    """
+    lot = lots.setdefault(symbol, {"qty": 0.0, "cost": 0.0})
+    held = lot["qty"]
+    realized = 0.0
+
+    if held and (held > 0) != (qty > 0):
+        closed = min(abs(qty), abs(held)) * (1 if held > 0 else -1)
+        avg_cost = lot["cost"] / held
+        if price is not None:
+            realized = closed * (price - avg_cost)
+        lot["qty"] = held - closed
+        lot["cost"] -= closed * avg_cost
+        qty += closed
+
+    if qty:
+        lot["qty"] += qty
+        lot["cost"] += qty * (price or 0.0)
+
+    if abs(lot["qty"]) < 1e-9:
+        del lots[symbol]
+    return realized
+
+
+class Projection:
+    """
+    Base class: a fold over execution events with JSON-serializable state.
+
+    Subclasses set `name` (snapshot key), bump `version` whenever the state
+    layout or apply() semantics change (older snapshots are then ignored),
+    and implement reset(), apply(), state() and load().
+    """
+
+    name = "projection"
+    version = 1
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    def apply(self, event: Mapping[str, Any]) -> None:
+        raise NotImplementedError
+
+    def state(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def load(self, state: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class PositionsProjection(Projection):
+    """Open positions per account: {account: {symbol: {"qty", "cost"}}}."""
+
+    name = "positions"
+
+    def reset(self) -> None:
+        self.positions: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    def apply(self, event: Mapping[str, Any]) -> None:
+        if event["event_type"] != ORDER_EVENT:
+            return
+        data = event["event_data"]
+        if not data.get("symbol"):
+            return
+        lots = self.positions.setdefault(event["account"], {})
+        _apply_trade(lots, data["symbol"], _signed_qty(data), _price(data))
+
+    def state(self) -> Dict[str, Any]:
+        return {"positions": self.positions}
+
+    def load(self, state: Dict[str, Any]) -> None:
+        self.positions = state["positions"]
+
+
+class WeeklyPnLProjection(Projection):
+    """
+    Per week and account: order count, traded notional, realized P&L and
+    the week's open lots.
+
+    Example:
+        engine["weekly_pnl"].pnl({"SPY": 512.3})["2025-01-15"]["CHATGPT"]
+    """
+
+    name = "weekly_pnl"
+
+    def reset(self) -> None:
+        self.weeks: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def apply(self, event: Mapping[str, Any]) -> None:
+        if event["event_type"] != ORDER_EVENT:
+            return
+        data = event["event_data"]
+        if not data.get("symbol"):
+            return
+        week = self.weeks.setdefault(event["week_id"], {})
+        book = week.setdefault(
+            event["account"],
+            {"orders": 0, "notional": 0.0, "realized_pnl": 0.0, "unpriced": 0, "lots": {}},
+        )
+        qty = _signed_qty(data)
+        price = _price(data)
+        book["orders"] += 1
+        if price is None:
+            book["unpriced"] += 1
+        else:
+            book["notional"] += abs(qty) * price
+        book["realized_pnl"] += _apply_trade(book["lots"], data["symbol"], qty, price)
+
+    def pnl(self, prices: Mapping[str, float]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Realized plus unrealized P&L per week/account, marking open lots at
+        `prices` (symbols without a price are left out of unrealized).
+        """
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for week_id, accounts in self.weeks.items():
+            for account, book in accounts.items():
+                unrealized = sum(
+                    lot["qty"] * prices[symbol] - lot["cost"]
+                    for symbol, lot in book["lots"].items()
+                    if symbol in prices
+                )
+                result.setdefault(week_id, {})[account] = {
+                    "realized_pnl": book["realized_pnl"],
+                    "unrealized_pnl": unrealized,
+                    "total_pnl": book["realized_pnl"] + unrealized,
+                    "notional": book["notional"],
+                    "orders": book["orders"],
+                    "unpriced_orders": book["unpriced"],
+                }
+        return result
+
+    def state(self) -> Dict[str, Any]:
+        return {"weeks": self.weeks}
+
+    def load(self, state: Dict[str, Any]) -> None:
+        self.weeks = state["weeks"]
+
+
+class ConvictionTimelineProjection(Projection):
+    """Per-account list of {at, week_id, symbol, direction, conviction}."""
+
+    name = "conviction"
+
+    def reset(self) -> None:
+        self.timeline: Dict[str, List[Dict[str, Any]]] = {}
+
+    def apply(self, event: Mapping[str, Any]) -> None:
+        data = event["event_data"]
+        if data.get("conviction") is None:
+            return
+        self.timeline.setdefault(event["account"], []).append({
+            "at": event["occurred_at"].isoformat(),
+            "week_id": event["week_id"],
+            "symbol": data.get("symbol"),
+            "direction": data.get("direction"),
+            "conviction": data["conviction"],
+        })
+
+    def state(self) -> Dict[str, Any]:
+        return {"timeline": self.timeline}
+
+    def load(self, state: Dict[str, Any]) -> None:
+        self.timeline = state["timeline"]
+
+
+def default_projections() -> List[Projection]:
+    """Fresh instances of the built-in projections."""
+    return [PositionsProjection(), WeeklyPnLProjection(), ConvictionTimelineProjection()]
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+_EVENTS_QUERY = """
+    SELECT id::text AS id, week_id, event_type, account, event_data, occurred_at, created_at
+    FROM execution_events
+    WHERE created_at < NOW() - make_interval(secs => $1)
+      {after}
+    ORDER BY created_at, id
+    LIMIT {limit}
+"""
+
+
+class ProjectionEngine:
+    """
+    Applies execution events to projections in batches and snapshots them.
+
+    Snapshots hold every projection's state and version plus the stream
+    position, so one snapshot restores the whole engine. A snapshot that
+    lacks a projection (or has an older version) is ignored and the engine
+    replays from the first event.
+
+    Example:
+        engine = ProjectionEngine()
+        applied = await engine.run()
+        positions = engine["positions"].positions
+    """
+
+    def __init__(
+        self,
+        projections: Optional[Iterable[Projection]] = None,
+        batch_size: int = PROJECTION_BATCH_SIZE,
+        snapshot_every: int = PROJECTION_SNAPSHOT_EVERY,
+    ):
+        self.projections = {p.name: p for p in (projections or default_projections())}
+        self.batch_size = batch_size
+        self.snapshot_every = snapshot_every
+        self.position: Optional[Position] = None
+        self.events_applied = 0
+
+    def __getitem__(self, name: str) -> Projection:
+        return self.projections[name]
+
+    def reset(self) -> None:
+        """Clear every projection and the stream position."""
+        for projection in self.projections.values():
+            projection.reset()
+        self.position = None
+        self.events_applied = 0
+
+    def apply(self, events: Iterable[Mapping[str, Any]]) -> int:
+        """Apply events (in stream order) to every projection."""
+        count = 0
+        for event in events:
+            for projection in self.projections.values():
+                projection.apply(event)
+            self.position = (event["created_at"], event["id"])
+            count += 1
+        self.events_applied += count
+        return count
+
+    async def restore(self) -> bool:
+        """
+        Load the latest snapshot.
+
+        Returns:
+            True if a usable snapshot was loaded
+        """
+        row = await fetch_one(
+            """
+            SELECT position_at, position_id::text AS position_id, events_applied, state
+            FROM projection_snapshots
+            ORDER BY id DESC
+            LIMIT 1
+            """,
+            intent=INTENT_BATCH,
+        )
+        if row is None:
+            return False
+
+        state = row["state"]
+        for name, projection in self.projections.items():
+            saved = state.get(name)
+            if saved is None or saved["version"] != projection.version:
+                logger.info(f"Projection snapshot has no current '{name}' state, replaying all events")
+                return False
+
+        for name, projection in self.projections.items():
+            projection.load(state[name]["state"])
+        self.position = (row["position_at"], row["position_id"])
+        self.events_applied = row["events_applied"]
+        return True
+
+    async def snapshot(self) -> None:
+        """Persist all projection states at the current stream position."""
+        if self.position is None:
+            return
+        state = {
+            name: {"version": p.version, "state": p.state()}
+            for name, p in self.projections.items()
+        }
+        await execute(
+            """
+            INSERT INTO projection_snapshots (position_at, position_id, events_applied, state)
+            VALUES ($1, $2::uuid, $3, $4)
+            """,
+            self.position[0],
+            self.position[1],
+            self.events_applied,
+            state,
+            intent=INTENT_BATCH,
+        )
+        await execute(
+            """
+            DELETE FROM projection_snapshots
+            WHERE id NOT IN (SELECT id FROM projection_snapshots ORDER BY id DESC LIMIT $1)
+            """,
+            SNAPSHOT_KEEP,
+            intent=INTENT_BATCH,
+        )
+
+    async def fetch_batch(self) -> List[Dict[str, Any]]:
+        """Next batch of events after the current stream position."""
+        args: List[Any] = [SETTLE_SECONDS]
+        after = ""
+        if self.position is not None:
+            after = "AND (created_at, id) > ($2, $3::uuid)"
+            args.extend(self.position)
+        query = _EVENTS_QUERY.format(after=after, limit=int(self.batch_size))
+        return await fetch_all(query, *args, intent=INTENT_BATCH)
+
+    async def catch_up(self) -> int:
+        """
+        Apply every settled event after the current position.
+
+        Snapshots are written every `snapshot_every` events and once at the
+        end if anything was applied.
+
+        Returns:
+            Number of events applied
+        """
+        applied = 0
+        since_snapshot = 0
+        while True:
+            batch = await self.fetch_batch()
+            if not batch:
+                break
+            count = self.apply(batch)
+            applied += count
+            since_snapshot += count
+            if since_snapshot >= self.snapshot_every:
+                await self.snapshot()
+                since_snapshot = 0
+            if count < self.batch_size:
+                break
+        if since_snapshot:
+            await self.snapshot()
+        return applied
+
+    async def run(self, rebuild: bool = False) -> int:
+        """
+        Bring all projections up to date.
+
+        Args:
+            rebuild: Ignore snapshots and replay from the first event
+
+        Returns:
+            Number of events applied
+
+        Raises:
+            Exception: If a database read or snapshot write fails (logged and raised)
+        """
+        start = time.perf_counter()
+        try:
+            if rebuild or self.position is None:
+                self.reset()
+                if not rebuild:
+                    await self.restore()
+            applied = await self.catch_up()
+        except Exception as e:
+            logger.error(f"Projection run failed: {e}", exc_info=True)
+            raise
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Projections applied {applied} events in {elapsed:.2f}s "
+            f"({self.events_applied} total, position {self.position})"
+        )
+        return applied
@@ -1,15 +1,21 @@
 """Research database operations."""
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from backend.db_helpers import fetch_one, fetch_all
+from backend.db_helpers import fetch_one, fetch_all, stream_rows
+from backend.db.pagination import build_page, clamp_limit, keyset_condition
 from backend.cache.decorator import cached
-from backend.cache.keys import research_history_key
+from backend.cache.keys import research_history_key, research_latest_key
 
 logger = logging.getLogger(__name__)
 
 
+@cached(
+    key=research_latest_key(),
+    ttl=3600,  # Warmed by ResearchStage when a new report is saved
+    cache_none=False,
+)
 async def get_latest_research() -> Optional[Dict[str, Any]]:
     """
     Get the latest complete research report from database.
@@ -28,7 +34,8 @@ async def get_latest_research() -> Optional[Dict[str, Any]]:
             - status: Report status
             - error_message: Error message if any
             - created_at: Creation timestamp (ISO format)
-        Returns empty dict if no research found or error occurs.
+        Returns empty dict if no research found, None if an error occurs
+        (None is not cached).
 
     Database Tables:
         - research_reports: Contains research report data
@@ -63,7 +70,7 @@ async def get_latest_research() -> Optional[Dict[str, Any]]:
 
     except Exception as e:
         logger.error(f"Error fetching latest research: {e}")
-        return {}
+        return None
 
 
 async def get_research_by_id(report_id: str) -> Optional[Dict[str, Any]]:
@@ -206,3 +213,108 @@ async def get_research_history(days: int = 90) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error fetching research history: {e}")
         return {"history": {}, "days": days, "error": str(e)}
+
+
+# Listing columns: report bodies are fetched per report or streamed by exports
+REPORT_LIST_COLUMNS = ["id", "week_id", "provider", "model", "status", "error_message", "created_at"]
+REPORT_EXPORT_COLUMNS = REPORT_LIST_COLUMNS[:5] + ["natural_language", "structured_json"] + REPORT_LIST_COLUMNS[5:]
+
+
+def _report_filters(
+    provider: Optional[str] = None,
+    status: Optional[str] = None,
+    week_id: Optional[str] = None,
+) -> Tuple[List[str], List[Any]]:
+    """WHERE conditions and parameters ($1..$n) for report listings."""
+    conditions = []
+    params: List[Any] = []
+    for column, value in (("provider", provider), ("status", status), ("week_id", week_id)):
+        if value:
+            params.append(value)
+            conditions.append(f"{column} = ${len(params)}")
+    return conditions, params
+
+
+async def get_research_page(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    provider: Optional[str] = None,
+    status: Optional[str] = None,
+    week_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Get one page of research reports (newest first) using keyset pagination.
+
+    Unlike get_research_history(), which aggregates every report ID of the
+    last N days into arrays, each page is a bounded index range scan on
+    (created_at, id).
+
+    Args:
+        limit: Page size (default: 50, max: 500)
+        cursor: `next_cursor` from the previous page (None for the first page)
+        provider: Filter by research provider (optional)
+        status: Filter by report status (optional)
+        week_id: Filter by week identifier (optional)
+
+    Returns:
+        Dict containing:
+            - items: Report metadata dicts (id, week_id, provider, model,
+              status, error_message, created_at); bodies via get_research_by_id
+            - next_cursor: Token for the next page, None on the last page
+
+    Raises:
+        ValueError: If cursor is malformed
+
+    Database Tables:
+        - research_reports: Contains research report data
+    """
+    limit = clamp_limit(limit)
+    conditions, params = _report_filters(provider, status, week_id)
+    seek, seek_params = keyset_condition("created_at", "id", cursor, len(params) + 1)
+    if seek:
+        conditions.append(seek)
+        params.extend(seek_params)
+    params.append(limit + 1)
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    try:
+        rows = await fetch_all(
+            f"""
+            SELECT {", ".join(REPORT_LIST_COLUMNS)}
+            FROM research_reports
+            {where_clause}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ${len(params)}
+        """,
+            *params,
+        )
+    except Exception as e:
+        logger.error(f"Error fetching research page: {e}")
+        raise
+
+    return build_page(rows, limit, sort_key="created_at")
+
+
+def stream_research_reports(
+    provider: Optional[str] = None,
+    status: Optional[str] = None,
+    week_id: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream full research reports (oldest first) through a server-side
+    cursor, for exports. Memory use is constant.
+
+    Returns:
+        Async iterator of report dicts (REPORT_EXPORT_COLUMNS)
+    """
+    conditions, params = _report_filters(provider, status, week_id)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return stream_rows(
+        f"""
+        SELECT {", ".join(REPORT_EXPORT_COLUMNS)}
+        FROM research_reports
+        {where_clause}
+        ORDER BY created_at, id
+    """,
+        *params,
+    )
@@ -0,0 +1,206 @@
+"""Registry of named prepared statements for hot queries.
+
+Dashboard reads (latest metrics, current prices, pitches, leaderboard)
+run the same few statements over and over. Registering them here gives
+each one a name and a fixed parameter signature; every pool connection
+prepares them once when it opens (the pool `init` hook), and callers run
+them by name through db_helpers.fetch_prepared(). No statement is parsed
+or planned on the request path, and latency is recorded per statement
+name (backend/db/metrics.py, e.g. "prepared:market.current_prices").
+
+Usage:
+    from backend.db.statements import register_statement
+    from backend.db_helpers import fetch_prepared
+
+    register_statement(
+        "leaderboard.by_lookback",
+        "SELECT * FROM mv_leaderboard WHERE lookback_key = $1::int ORDER BY rank",
+    )
+    rows = await fetch_prepared("leaderboard.by_lookback", 4)
+
+Statements:
+    - Names are "<area>.<query>"; registering a name twice with different
+      SQL is an error (same SQL is a no-op, so module reloads are safe)
+    - Cast every parameter in SQL ($1::int, $1::text) so its type does not
+      depend on the first call
+    - `returns` fixes the result shape: "all" (list of dicts), "one"
+      (dict or None) or "value" (first column of the first row)
+    - Register at module import. Statements registered after a connection
+      opened are prepared on that connection the first time they run
+
+pgbouncer mode (DB_PGBOUNCER=true, per pool with DB_READ_/DB_BATCH_):
+    Transaction-pooling proxies move a client between server connections,
+    so statements prepared on one are missing on the next. In this mode
+    nothing is prepared on init, the pool's implicit statement cache is
+    disabled (statement_cache_size=0) and fetch_prepared() sends the SQL
+    as an unnamed statement. Names, signatures and per-statement timing
+    are unchanged.
+
+Notes:
+    - A statement that fails to prepare on init (e.g. its table is not
+      migrated yet) is logged and skipped; it is prepared on first use
+    - A prepared statement invalidated by a schema change is re-prepared
+      once and the call retried
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+RETURNS_ALL = "all"
+RETURNS_ONE = "one"
+RETURNS_VALUE = "value"
+_RETURNS = (RETURNS_ALL, RETURNS_ONE, RETURNS_VALUE)
+
+
+@dataclass(frozen=True)
+class Statement:
+    """A named SQL statement with a fixed result shape and default intent."""
+
+    name: str
+    sql: str
+    returns: str = RETURNS_ALL
+    intent: str = "read"
+
+    @property
+    def label(self) -> str:
+        """Name the statement's latency is recorded under."""
+        return f"prepared:{self.name}"
+
+
+# Global registry (name -> statement)
+STATEMENTS: Dict[str, Statement] = {}
+
+
+def register_statement(
+    name: str, sql: str, returns: str = RETURNS_ALL, intent: str = "read"
+) -> Statement:
+    """
+    Register a named statement.
+
+    Args:
+        name: Unique "<area>.<query>" name
+        sql: SQL with typed placeholders ($1::int, ...)
+        returns: "all", "one" or "value"
+        intent: Default pool routing ("read", "write" or "batch")
+
+    Returns:
+        The registered Statement
+
+    Raises:
+        ValueError: If returns is unknown or the name is taken by other SQL
+    """
+    if returns not in _RETURNS:
+        raise ValueError(f"Unknown result shape: {returns!r} (expected one of {_RETURNS})")
+    statement = Statement(name, sql, returns, intent)
+    existing = STATEMENTS.get(name)
+    if existing is not None and existing != statement:
+        raise ValueError(f"Statement {name!r} is already registered with different SQL")
+    STATEMENTS[name] = statement
+    return statement
+
+
+def get_statement(name: str) -> Statement:
+    """
+    Look up a registered statement.
+
+    Raises:
+        KeyError: If no statement is registered under `name`
+    """
+    try:
+        return STATEMENTS[name]
+    except KeyError:
+        raise KeyError(f"Unknown prepared statement: {name!r}") from None
+
+
+class StatementConnection(asyncpg.Connection):
+    """
+    asyncpg connection that holds the registry's prepared statements.
+
+    `prepared` maps statement name -> PreparedStatement, or is None when
+    the pool runs in pgbouncer mode (statements are never prepared).
+    """
+
+    __slots__ = ("prepared",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: Optional[Dict[str, asyncpg.prepared_stmt.PreparedStatement]] = {}
+
+
+async def prepare_statements(conn) -> int:
+    """
+    Prepare every registered statement on `conn`.
+
+    Returns:
+        Number of statements prepared
+    """
+    prepared = 0
+    for statement in list(STATEMENTS.values()):
+        try:
+            conn.prepared[statement.name] = await conn.prepare(statement.sql)
+            prepared += 1
+        except asyncpg.PostgresError as e:
+            logger.warning(f"Could not prepare statement {statement.name!r}: {e}")
+    return prepared
+
+
+async def prepare_connection(conn, init=None, pgbouncer: bool = False) -> None:
+    """
+    Pool `init` hook: register codecs, then prepare the registry.
+
+    Codecs go first: a prepared statement keeps the codecs that were
+    registered when it was prepared.
+
+    Args:
+        conn: Newly opened asyncpg connection (a StatementConnection)
+        init: Codec hook to run first (backend/db/codecs.py)
+        pgbouncer: Skip preparing (see pgbouncer mode)
+    """
+    if init is not None:
+        await init(conn)
+    if not isinstance(getattr(conn, "prepared", None), dict):
+        return
+    if pgbouncer:
+        conn.prepared = None
+    else:
+        await prepare_statements(conn)
+
+
+async def run_statement(conn, statement: Statement, args: tuple) -> Any:
+    """
+    Run `statement` on `conn`, preparing it first if this connection has not.
+
+    Connections without a prepared-statement slot (pgbouncer mode, plain
+    asyncpg connections) run the SQL directly.
+
+    Returns:
+        asyncpg Records (all), a Record or None (one), or a value
+    """
+    prepared: Optional[Dict[str, Any]] = getattr(conn, "prepared", None)
+    if not isinstance(prepared, dict):
+        if statement.returns == RETURNS_ONE:
+            return await conn.fetchrow(statement.sql, *args)
+        if statement.returns == RETURNS_VALUE:
+            return await conn.fetchval(statement.sql, *args)
+        return await conn.fetch(statement.sql, *args)
+
+    for attempt in (1, 2):
+        stmt = prepared.get(statement.name)
+        if stmt is None:
+            stmt = prepared[statement.name] = await conn.prepare(statement.sql)
+        try:
+            if statement.returns == RETURNS_ONE:
+                return await stmt.fetchrow(*args)
+            if statement.returns == RETURNS_VALUE:
+                return await stmt.fetchval(*args)
+            return await stmt.fetch(*args)
+        except asyncpg.InvalidCachedStatementError:
+            # Schema changed under the plan; re-prepare once
+            prepared.pop(statement.name, None)
+            if attempt == 2:
+                raise
@@ -10,6 +10,11 @@ Architecture:
     - Results are returned as dicts (similar to RealDictCursor behavior)
     - Transactions are supported via async context manager
     - Proper error handling and resource cleanup
+    - Every query is timed and counted (backend/db/metrics.py): acquire wait,
+      latency by normalized statement, rows, slow-query log
+    - Queries are routed to a named pool by intent (backend/db/pool.py):
+      fetch_* default to intent="read" (read pool), writes and transactions
+      to intent="write" (primary), and intent="batch" selects the batch pool
 
 Usage Examples:
     # Fetch single row
@@ -30,6 +35,9 @@ Usage Examples:
         [("Error occurred", "ERROR"), ("Info message", "INFO")]
     )
 
+    # Registered hot statements, by name (backend/db/statements.py)
+    rows = await fetch_prepared("leaderboard.by_lookback", 4)
+
     # Transactions
     async with transaction() as conn:
         await conn.execute("UPDATE accounts SET balance = balance - $1 WHERE id = $2", 100, 1)
@@ -40,6 +48,9 @@ Notes:
     - All database operations automatically return connections to the pool
     - Query timeout is configured at pool level (default: 60s)
     - For complex queries, consider using the pool directly for fine-grained control
+    - The read pool may point at a replica (DATABASE_READ_URL) and lag behind
+      the primary. Pass intent="write" to a fetch that must see a write made
+      moments earlier (read-your-writes)
 """
 
 import logging
@@ -47,22 +58,33 @@ from typing import Any, Dict, List, Optional, AsyncIterator
 from contextlib import asynccontextmanager
 import asyncpg
 
-from backend.db.pool import get_pool
+from backend.db.pool import INTENT_READ, INTENT_WRITE, get_pool, pool_name_for_intent
+from backend.db.metrics import timed_acquire, track_query
+from backend.db.statements import RETURNS_ALL, RETURNS_ONE, get_statement, run_statement
 
 logger = logging.getLogger(__name__)
 
 
+def _status_rowcount(status: str) -> Optional[int]:
+    """Parse the affected row count from a command status ("UPDATE 3" -> 3)."""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return None
+
+
 # ============================================================================
 # FETCH OPERATIONS (SELECT)
 # ============================================================================
 
-async def fetch_one(query: str, *args) -> Optional[Dict[str, Any]]:
+async def fetch_one(query: str, *args, intent: str = INTENT_READ) -> Optional[Dict[str, Any]]:
     """
     Fetch a single row from the database.
 
     Args:
         query: SQL query with $1, $2, ... placeholders
         *args: Query parameters
+        intent: Pool routing ("read", "write" or "batch"; see module notes)
 
     Returns:
         Dict with column names as keys, or None if no row found
@@ -77,11 +99,14 @@ async def fetch_one(query: str, *args) -> Optional[Dict[str, Any]]:
         - Automatically converts asyncpg.Record to dict
         - Connection is automatically returned to pool after query
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
     try:
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(query, *args)
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(query) as timer:
+                row = await conn.fetchrow(query, *args)
+                timer.rows = 1 if row else 0
             return dict(row) if row else None
 
     except Exception as e:
@@ -91,13 +116,14 @@ async def fetch_one(query: str, *args) -> Optional[Dict[str, Any]]:
         raise
 
 
-async def fetch_all(query: str, *args) -> List[Dict[str, Any]]:
+async def fetch_all(query: str, *args, intent: str = INTENT_READ) -> List[Dict[str, Any]]:
     """
     Fetch all rows from the database.
 
     Args:
         query: SQL query with $1, $2, ... placeholders
         *args: Query parameters
+        intent: Pool routing ("read", "write" or "batch"; see module notes)
 
     Returns:
         List of dicts with column names as keys (empty list if no rows)
@@ -115,11 +141,14 @@ async def fetch_all(query: str, *args) -> List[Dict[str, Any]]:
         - All rows are loaded into memory (use with caution for large result sets)
         - Connection is automatically returned to pool after query
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
     try:
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(query, *args)
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(query) as timer:
+                rows = await conn.fetch(query, *args)
+                timer.rows = len(rows)
             return [dict(row) for row in rows]
 
     except Exception as e:
@@ -129,13 +158,59 @@ async def fetch_all(query: str, *args) -> List[Dict[str, Any]]:
         raise
 
 
-async def fetch_val(query: str, *args) -> Any:
+async def fetch_columns(query: str, *args, intent: str = INTENT_READ) -> Dict[str, List[Any]]:
+    """
+    Fetch all rows column-wise (for pandas/NumPy consumers).
+
+    Skips the per-row dict of fetch_all(): rows are transposed in one pass
+    (backend/db/columnar.py). Cast numeric columns in SQL (`close::float8`)
+    so values arrive as floats rather than Decimal.
+
+    Args:
+        query: SQL query with $1, $2, ... placeholders
+        *args: Query parameters
+        intent: Pool routing ("read", "write" or "batch"; see module notes)
+
+    Returns:
+        Dict of column name -> list of values, in select-list order
+        (empty dict if no rows)
+
+    Example:
+        cols = await fetch_columns(
+            "SELECT date, close::float8 AS close FROM daily_bars WHERE symbol = $1",
+            "SPY", intent="batch",
+        )
+        closes = columns_to_arrays(cols, float_columns=["close"])["close"]
+    """
+    from backend.db.columnar import rows_to_columns
+
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
+
+    try:
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(query) as timer:
+                rows = await conn.fetch(query, *args)
+                timer.rows = len(rows)
+            if not rows:
+                return {}
+            return rows_to_columns(rows, list(rows[0].keys()))
+
+    except Exception as e:
+        logger.error(f"Error in fetch_columns: {e}", exc_info=True)
+        logger.error(f"Query: {query}")
+        logger.error(f"Args: {args}")
+        raise
+
+
+async def fetch_val(query: str, *args, intent: str = INTENT_READ) -> Any:
     """
     Fetch a single value from the database.
 
     Args:
         query: SQL query with $1, $2, ... placeholders (should return single column)
         *args: Query parameters
+        intent: Pool routing ("read", "write" or "batch"; see module notes)
 
     Returns:
         The value from the first column of the first row, or None if no row
@@ -151,11 +226,13 @@ async def fetch_val(query: str, *args) -> Any:
         - Returns None if query produces no rows
         - Only returns the first column value (other columns are ignored)
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
     try:
-        async with pool.acquire() as conn:
-            return await conn.fetchval(query, *args)
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(query):
+                return await conn.fetchval(query, *args)
 
     except Exception as e:
         logger.error(f"Error in fetch_val: {e}", exc_info=True)
@@ -164,17 +241,65 @@ async def fetch_val(query: str, *args) -> Any:
         raise
 
 
+async def fetch_prepared(name: str, *args, intent: Optional[str] = None) -> Any:
+    """
+    Run a registered statement by name.
+
+    The statement is prepared on every pool connection when it opens, so
+    no parsing or planning happens here (see backend/db/statements.py).
+
+    Args:
+        name: Registered statement name (e.g. "market.current_prices")
+        *args: Statement parameters
+        intent: Pool routing (default: the statement's own intent)
+
+    Returns:
+        By the statement's `returns`: list of dicts ("all"), dict or None
+        ("one"), or the first column of the first row ("value")
+
+    Raises:
+        KeyError: If no statement is registered under `name`
+
+    Example:
+        leaderboard = await fetch_prepared("leaderboard.by_lookback", 0)
+
+    Notes:
+        - Latency is recorded under "prepared:<name>" in the query stats
+    """
+    statement = get_statement(name)
+    pool_name = pool_name_for_intent(intent or statement.intent)
+    pool = get_pool(pool_name)
+
+    try:
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(statement.label) as timer:
+                result = await run_statement(conn, statement, args)
+                if statement.returns == RETURNS_ALL:
+                    timer.rows = len(result)
+                    return [dict(row) for row in result]
+                if statement.returns == RETURNS_ONE:
+                    timer.rows = 1 if result else 0
+                    return dict(result) if result else None
+                return result
+
+    except Exception as e:
+        logger.error(f"Error in fetch_prepared ({name}): {e}", exc_info=True)
+        logger.error(f"Args: {args}")
+        raise
+
+
 # ============================================================================
 # EXECUTE OPERATIONS (INSERT/UPDATE/DELETE)
 # ============================================================================
 
-async def execute(query: str, *args) -> str:
+async def execute(query: str, *args, intent: str = INTENT_WRITE) -> str:
     """
     Execute a query that modifies data (INSERT/UPDATE/DELETE).
 
     Args:
         query: SQL query with $1, $2, ... placeholders
         *args: Query parameters
+        intent: Pool routing ("write" or "batch"; see module notes)
 
     Returns:
         Status string from database (e.g., "INSERT 0 1", "UPDATE 5", "DELETE 2")
@@ -202,11 +327,15 @@ async def execute(query: str, *args) -> str:
         - Connection is automatically returned to pool after query
         - Query runs in autocommit mode (no explicit transaction)
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
     try:
-        async with pool.acquire() as conn:
-            return await conn.execute(query, *args)
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(query) as timer:
+                status = await conn.execute(query, *args)
+                timer.rows = _status_rowcount(status)
+            return status
 
     except Exception as e:
         logger.error(f"Error in execute: {e}", exc_info=True)
@@ -215,13 +344,16 @@ async def execute(query: str, *args) -> str:
         raise
 
 
-async def execute_many(query: str, args_list: List[tuple]) -> None:
+async def execute_many(
+    query: str, args_list: List[tuple], *, intent: str = INTENT_WRITE
+) -> None:
     """
     Execute a query multiple times with different parameters (batch operation).
 
     Args:
         query: SQL query with $1, $2, ... placeholders
         args_list: List of tuples, each containing parameters for one execution
+        intent: Pool routing ("write" or "batch"; see module notes)
 
     Returns:
         None
@@ -249,11 +381,14 @@ async def execute_many(query: str, args_list: List[tuple]) -> None:
         - Ideal for bulk inserts/updates
         - For very large batches (>1000 rows), consider using COPY instead
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
     try:
-        async with pool.acquire() as conn:
-            await conn.executemany(query, args_list)
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(query) as timer:
+                await conn.executemany(query, args_list)
+                timer.rows = len(args_list)
 
     except Exception as e:
         logger.error(f"Error in execute_many: {e}", exc_info=True)
@@ -267,10 +402,13 @@ async def execute_many(query: str, args_list: List[tuple]) -> None:
 # ============================================================================
 
 @asynccontextmanager
-async def transaction() -> AsyncIterator[asyncpg.Connection]:
+async def transaction(intent: str = INTENT_WRITE) -> AsyncIterator[asyncpg.Connection]:
     """
     Async context manager for database transactions.
 
+    Args:
+        intent: Pool routing ("write" or "batch"; see module notes)
+
     Yields:
         asyncpg.Connection: Database connection with active transaction
 
@@ -299,9 +437,10 @@ async def transaction() -> AsyncIterator[asyncpg.Connection]:
         - Nested transactions are supported (savepoints)
         - Connection is automatically returned to pool after transaction
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
-    async with pool.acquire() as conn:
+    async with timed_acquire(pool, pool_name) as conn:
         async with conn.transaction():
             try:
                 yield conn
@@ -311,17 +450,72 @@ async def transaction() -> AsyncIterator[asyncpg.Connection]:
                 raise
 
 
+# ============================================================================
+# STREAMING
+# ============================================================================
+
+async def stream_rows(
+    query: str,
+    *args,
+    intent: str = INTENT_READ,
+    prefetch: int = 500,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over a query's rows through a server-side cursor.
+
+    Rows are fetched from PostgreSQL `prefetch` at a time, so memory stays
+    constant however large the result set is (exports, full-history scans).
+
+    Args:
+        query: SQL query with $1, $2, ... placeholders
+        *args: Query parameters
+        intent: Pool routing ("read", "write" or "batch"; see module notes)
+        prefetch: Rows fetched per round trip
+
+    Yields:
+        One dict per row
+
+    Example:
+        async for event in stream_rows("SELECT * FROM execution_events ORDER BY occurred_at"):
+            write(event)
+
+    Notes:
+        - The connection is held (in a read-only transaction, which asyncpg
+          cursors require) until iteration finishes; close the generator
+          (aclose) when abandoning it early
+        - Recorded once in the query metrics, with the total row count
+    """
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
+
+    try:
+        async with timed_acquire(pool, pool_name) as conn:
+            async with conn.transaction(readonly=True):
+                with track_query(query) as timer:
+                    timer.rows = 0
+                    async for row in conn.cursor(query, *args, prefetch=prefetch):
+                        timer.rows += 1
+                        yield dict(row)
+
+    except Exception as e:
+        logger.error(f"Error in stream_rows: {e}", exc_info=True)
+        logger.error(f"Query: {query}")
+        logger.error(f"Args: {args}")
+        raise
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-async def execute_with_returning(query: str, *args) -> Optional[Dict[str, Any]]:
+async def execute_with_returning(query: str, *args, intent: str = INTENT_WRITE) -> Optional[Dict[str, Any]]:
     """
     Execute INSERT/UPDATE/DELETE with RETURNING clause.
 
     Args:
         query: SQL query with RETURNING clause
         *args: Query parameters
+        intent: Pool routing ("write" or "batch"; see module notes)
 
     Returns:
         Dict with returned column values, or None if no row returned
@@ -345,11 +539,14 @@ async def execute_with_returning(query: str, *args) -> Optional[Dict[str, Any]]:
         - Useful for getting auto-generated IDs or old values
         - Returns None if query affects no rows
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
     try:
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(query, *args)
+        async with timed_acquire(pool, pool_name) as conn:
+            with track_query(query) as timer:
+                row = await conn.fetchrow(query, *args)
+                timer.rows = 1 if row else 0
             return dict(row) if row else None
 
     except Exception as e:
@@ -359,13 +556,16 @@ async def execute_with_returning(query: str, *args) -> Optional[Dict[str, Any]]:
         raise
 
 
-async def execute_many_with_returning(query: str, args_list: List[tuple]) -> List[Dict[str, Any]]:
+async def execute_many_with_returning(
+    query: str, args_list: List[tuple], *, intent: str = INTENT_WRITE
+) -> List[Dict[str, Any]]:
     """
     Execute batch operation with RETURNING clause.
 
     Args:
         query: SQL query with RETURNING clause
         args_list: List of tuples, each containing parameters for one execution
+        intent: Pool routing ("write" or "batch"; see module notes)
 
     Returns:
         List of dicts with returned values
@@ -384,16 +584,19 @@ async def execute_many_with_returning(query: str, args_list: List[tuple]) -> Lis
         - All operations run in a single transaction
         - Useful for bulk inserts that need generated IDs
     """
-    pool = get_pool()
+    pool_name = pool_name_for_intent(intent)
+    pool = get_pool(pool_name)
 
     try:
-        async with pool.acquire() as conn:
+        async with timed_acquire(pool, pool_name) as conn:
             async with conn.transaction():
                 results = []
-                for args in args_list:
-                    row = await conn.fetchrow(query, *args)
-                    if row:
-                        results.append(dict(row))
+                with track_query(query) as timer:
+                    for args in args_list:
+                        row = await conn.fetchrow(query, *args)
+                        if row:
+                            results.append(dict(row))
+                    timer.rows = len(results)
                 return results
 
     except Exception as e:
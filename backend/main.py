@@ -1,17 +1,49 @@
 """FastAPI backend for LLM Council and Trading Dashboard."""
 
-from fastapi import FastAPI
+import os
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.routing import Match
 from backend.pipeline.stages.research import get_week_id
 from backend.config import get_cors_origins
-from backend.redis_client import get_redis_client, close_redis_client
-from backend.db.pool import init_pool, close_pool, check_pool_health
+from backend.redis_client import init_redis_pool, close_redis_pool, check_redis_health
+from backend.cache.invalidation import (
+    InvalidationEvent,
+    ALL_SOURCES,
+    SOURCE_RESEARCH_REPORTS,
+    SOURCE_PM_PITCHES,
+    SOURCE_PEER_REVIEWS,
+    SOURCE_CHAIRMAN_DECISIONS,
+    subscribe,
+    start_listener,
+    stop_listener,
+)
+from backend.cache.stats import start_stats_publisher, stop_stats_publisher
+from backend.db.pool import init_pools, close_pool, check_all_pools_health, POOL_PRIMARY
+from backend.db.metrics import db_scope
+from backend.db.partitions import ensure_partitions
+from backend.db.change_feed import start_change_feed, stop_change_feed
+from backend.db.event_writer import start_event_writer, stop_event_writer
 from backend.http_pool import init_http_clients, close_http_clients, check_http_clients_health
 
 
 class PipelineState:
     """In-memory state for the trading pipeline."""
 
+    # Fields derived from each source; dropped when another worker writes it
+    INVALIDATES = {
+        SOURCE_RESEARCH_REPORTS: ("research_packs",),
+        "ResearchStage": ("research_packs",),
+        SOURCE_PM_PITCHES: ("pm_pitches", "pm_pitches_raw", "pm_pitch_ids"),
+        "PMPitchStage": ("pm_pitches", "pm_pitches_raw", "pm_pitch_ids"),
+        SOURCE_PEER_REVIEWS: ("peer_reviews",),
+        "PeerReviewStage": ("peer_reviews",),
+        SOURCE_CHAIRMAN_DECISIONS: ("council_decision",),
+        "ChairmanStage": ("council_decision",),
+        "ExecutionStage": ("execution_results",),
+    }
+
     def __init__(self):
         self.current_week = get_week_id()
         self.research_status = "pending"
@@ -21,6 +53,7 @@ class PipelineState:
         self.research_packs = None
         self.pm_pitches = None
         self.pm_pitches_raw = None
+        self.pm_pitch_ids = None  # model -> pm_pitches.id from the last save
         self.peer_reviews = None
         self.council_decision = None
         self.execution_results = None
@@ -28,6 +61,14 @@ class PipelineState:
         self.executed_trades = []
         self.jobs = {}  # job_id -> status_dict
 
+    def invalidate(self, event: InvalidationEvent) -> None:
+        """Drop fields derived from a source another worker just wrote.
+
+        Readers fall back to the database when a field is None.
+        """
+        for name in self.INVALIDATES.get(event.source, ()):
+            setattr(self, name, None)
+
 
 # Global state
 pipeline_state = PipelineState()
@@ -43,6 +84,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def db_scope_middleware(request: Request, call_next):
+    """Attribute database usage to the matched route (see backend/db/metrics.py)."""
+    label = "<unmatched>"  # never the raw path: keeps scope cardinality bounded
+    for route in app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            label = getattr(route, "path", label)
+            break
+    with db_scope(f"{request.method} {label}"):
+        return await call_next(request)
+
 # Register API routers
 from backend.api.market import router as market_router
 from backend.api.research import router as research_router, graphs_router, data_package_router
@@ -50,7 +104,11 @@ from backend.api.pitches import router as pitches_router
 from backend.api.council import router as council_router
 from backend.api.trades import router as trades_router
 from backend.api.monitor import router as monitor_router
+from backend.api.cache import router as cache_router
+from backend.api.bundles import router as bundles_router
+from backend.api.db import router as db_router
 from backend.api.conversations import router as conversations_router
+from backend.api.events import router as events_router
 
 app.include_router(market_router)
 app.include_router(research_router)
@@ -60,34 +118,71 @@ app.include_router(pitches_router)
 app.include_router(council_router)
 app.include_router(trades_router)
 app.include_router(monitor_router)
+app.include_router(cache_router)
+app.include_router(bundles_router)
+app.include_router(db_router)
+app.include_router(events_router)
 app.include_router(conversations_router)
 
 
 @app.on_event("startup")
 async def startup_event():
-    print("Startup: Listing all registered routes:")
-    for route in app.routes:
-        print(f" - {route.path} [{getattr(route, 'methods', [])}]")
+    if os.getenv("LOG_ROUTES", "").lower() in ("1", "true", "yes"):
+        print("Startup: Listing all registered routes:")
+        for route in app.routes:
+            print(f" - {route.path} [{getattr(route, 'methods', [])}]")
 
-    # Initialize database connection pool
+    # Initialize database connection pools (primary + DB_POOLS read/batch);
+    # one connection each now, the rest warm up in the background
     try:
-        await init_pool()
-        print("✓ Database connection pool initialized")
+        pools = await init_pools(lazy=True)
+        print(f"✓ Database connection pools initialized: {', '.join(pools)}")
     except Exception as e:
         print(f"✗ Database pool initialization failed: {e}")
         print("  Application will continue but database operations may fail")
 
-    # Initialize Redis client
+    # Make sure this month's partitions exist (no-op before migrate_partitions.py)
     try:
-        redis_client = get_redis_client()
-        if redis_client.ping():
-            print("✓ Redis connected successfully")
-        else:
-            print("✗ Redis ping failed - caching will be disabled")
+        created = await ensure_partitions()
+        if created:
+            print(f"✓ Created partitions: {', '.join(created)}")
+    except Exception as e:
+        print(f"✗ Partition check failed: {e}")
+
+    # Write execution events behind a queue (replays any spilled events)
+    try:
+        await start_event_writer()
+        print("✓ Execution event writer started")
+    except Exception as e:
+        print(f"✗ Execution event writer failed: {e}")
+        print("  Application will continue; events are written inline")
+
+    # Initialize async Redis pool (request path never uses the sync client)
+    try:
+        await init_redis_pool()
+        print("✓ Redis connected successfully")
     except Exception as e:
         print(f"✗ Redis initialization failed: {e}")
         print("  Application will continue without caching")
 
+    # Subscribe to cross-worker invalidation events
+    try:
+        subscribe(ALL_SOURCES, pipeline_state.invalidate)
+        await start_listener()
+        start_stats_publisher()
+        print("✓ Cache invalidation listener started")
+    except Exception as e:
+        print(f"✗ Cache invalidation listener failed: {e}")
+        print("  Application will continue but other workers' writes may be served stale")
+
+    # Listen for database change notifications (cache invalidation + push)
+    try:
+        await start_change_feed()
+        print("✓ Database change feed listening")
+    except Exception as e:
+        print(f"✗ Database change feed failed: {e}")
+        print("  Application will continue; clients fall back to polling")
+
     # Initialize HTTP clients
     try:
         await init_http_clients()
@@ -102,12 +197,22 @@ async def shutdown_event():
     """Cleanup on application shutdown."""
     print("Shutting down...")
 
-    # Close database connection pool
+    # Stop the change feed before its handlers' dependencies go away
+    await stop_change_feed()
+
+    # Flush queued execution events while the pools are still open
+    await stop_event_writer()
+
+    # Close database connection pools
     await close_pool()
-    print("✓ Database connection pool closed")
+    print("✓ Database connection pools closed")
+
+    # Stop invalidation listener before closing Redis
+    await stop_listener()
+    await stop_stats_publisher()
 
-    # Close Redis client
-    close_redis_client()
+    # Close Redis pool
+    await close_redis_pool()
     print("✓ Redis connection closed")
 
     # Close HTTP clients
@@ -142,8 +247,8 @@ async def health_check():
 
     # Check Redis connectivity
     try:
-        redis_client = get_redis_client()
-        if redis_client.ping():
+        redis_health = await check_redis_health()
+        if redis_health["status"] == "healthy":
             status["redis"] = "connected"
         else:
             status["redis"] = "disconnected"
@@ -152,12 +257,14 @@ async def health_check():
         status["redis"] = f"error: {str(e)}"
         status["status"] = "degraded"
 
-    # Check PostgreSQL pool health
+    # Check PostgreSQL pool health (per named pool; "fallback" pools are
+    # served by primary and do not degrade the service)
     try:
-        pool_health = await check_pool_health()
-        status["database"] = pool_health
+        pools_health = await check_all_pools_health()
+        status["database"] = pools_health[POOL_PRIMARY]
+        status["database_pools"] = pools_health
 
-        if pool_health["status"] != "healthy":
+        if any(h["status"] not in ("healthy", "fallback") for h in pools_health.values()):
             status["status"] = "degraded"
     except Exception as e:
         status["database"] = {
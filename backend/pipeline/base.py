@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Awaitable, Callable, List
 
 from .context import PipelineContext
+from ..db.metrics import db_scope
 
 
 class Stage(ABC):
@@ -25,13 +26,28 @@ class Stage(ABC):
 class Pipeline:
     """Chain of stages with sequential async execution. Immutable - with_stage() returns new pipeline."""
 
-    def __init__(self, stages: List[Stage] | None = None):
+    def __init__(
+        self,
+        stages: List[Stage] | None = None,
+        on_stage_complete: Callable[[str], Awaitable[None]] | None = None,
+    ):
+        """
+        Args:
+            stages: Stages to run in order
+            on_stage_complete: Optional async hook called with stage.name after
+                each stage finishes (e.g. cache warming)
+        """
         self.stages = stages or []
+        self.on_stage_complete = on_stage_complete
 
     async def execute(self, context: PipelineContext) -> PipelineContext:
         current_context = context
         for stage in self.stages:
-            current_context = await stage.execute(current_context)
+            # Attribute the stage's database usage in backend/db/metrics.py
+            with db_scope(f"stage:{stage.name}"):
+                current_context = await stage.execute(current_context)
+            if self.on_stage_complete is not None:
+                await self.on_stage_complete(stage.name)
         return current_context
 
     def with_stage(self, stage: Stage) -> "Pipeline":
@@ -40,7 +56,7 @@ class Pipeline:
 
         Creates a new pipeline, leaves the original unchanged.
         """
-        return Pipeline(self.stages + [stage])
+        return Pipeline(self.stages + [stage], self.on_stage_complete)
 
     def __len__(self) -> int:
         return len(self.stages)
@@ -1,21 +1,31 @@
-"""Pipeline stages for LLM trading system."""
+"""Pipeline stages for LLM trading system.
 
-from .research import ResearchStage, get_week_id
-from .pm_pitch import PMPitchStage
-from .peer_review import PeerReviewStage
-from .chairman import ChairmanStage
-from .execution import ExecutionStage
-from .checkpoint import CheckpointStage, CheckpointAction, run_checkpoint, run_all_checkpoints
+Stages are imported on first attribute access, so importing one stage
+module (e.g. `stages.research` for get_week_id) does not load every other
+stage and the LLM/broker clients they depend on.
+"""
 
-__all__ = [
-    "ResearchStage",
-    "get_week_id",
-    "PMPitchStage",
-    "PeerReviewStage",
-    "ChairmanStage",
-    "ExecutionStage",
-    "CheckpointStage",
-    "CheckpointAction",
-    "run_checkpoint",
-    "run_all_checkpoints",
-]
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "ResearchStage": "research",
+    "get_week_id": "research",
+    "PMPitchStage": "pm_pitch",
+    "PeerReviewStage": "peer_review",
+    "ChairmanStage": "chairman",
+    "ExecutionStage": "execution",
+    "CheckpointStage": "checkpoint",
+    "CheckpointAction": "checkpoint",
+    "run_checkpoint": "checkpoint",
+    "run_all_checkpoints": "checkpoint",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,6 @@ import json
 import re
 from typing import Dict, Any, List
 from datetime import datetime
-import jsonschema
 from pathlib import Path
 
 from ...requesty_client import query_chairman, REQUESTY_MODELS
@@ -299,6 +298,9 @@ Return as valid JSON only, no markdown formatting."""
 
         json_str = json_match.group(0)
 
+        # Imported here: jsonschema is slow to import and only needed now
+        import jsonschema
+
         try:
             decision = json.loads(json_str)
 
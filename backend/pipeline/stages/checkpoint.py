@@ -480,12 +480,20 @@ async def run_checkpoint(
     Returns:
         Dict with checkpoint results
     """
-    from ..context import PipelineContext
-    from .research import MARKET_SNAPSHOT
-
-    # For standalone checkpoint, we need to load the frozen context
-    # This would typically come from database
-    context = PipelineContext()
+    from ..week_bundle import load_week_bundle, bundle_to_context
+
+    # Load the frozen week context (snapshot, decisions, executions) in one read
+    try:
+        bundle = await load_week_bundle(get_week_id())
+    except Exception as e:
+        print(f"  ⚠️  Failed to load week bundle: {e}")
+        bundle = None
+
+    if bundle:
+        print(f"  🧊 Loaded week bundle {bundle['week_id']} v{bundle['version']}")
+        context = bundle_to_context(bundle)
+    else:
+        context = PipelineContext()
 
     stage = CheckpointStage()
     result_context = await stage.execute(context)
@@ -9,6 +9,8 @@ from datetime import datetime
 
 from ...research import query_perplexity_research
 from ...db_helpers import execute_with_returning
+from ...cache.invalidation import publish_change, SOURCE_RESEARCH_REPORTS
+from ...cache.keys import research_week_key
 from ...storage.data_fetcher import MarketDataManager
 from ..graph_extractor import extract_graph
 from ..context import PipelineContext, ContextKey
@@ -343,6 +345,12 @@ JSON format:
             research_id = result["id"] if result else None
             print(f"  💾 Saved {provider} research to database (ID: {research_id})")
 
+            await publish_change(
+                SOURCE_RESEARCH_REPORTS,
+                week_id=week_id,
+                keys=(research_week_key(week_id),),
+            )
+
         except Exception as e:
             print(f"  ⚠️  Failed to save {provider} research to database: {e}")
 
@@ -0,0 +1,268 @@
+"""Frozen week bundle for checkpoints and dashboard pages.
+
+At weekly-pipeline completion the context every later reader needs is
+frozen into one immutable, versioned, gzip-compressed blob:
+
+    - market_snapshot: frozen MARKET_SNAPSHOT from the research stage
+    - digest: knowledge-graph digest of the week's research
+    - pm_pitches / peer_reviews / label_to_model
+    - chairman_decision
+    - execution_result
+
+The bundle is written to Postgres (week_bundles, append-only source of
+truth) and to Redis (bundle:week:<week_id>). Checkpoints and dashboard
+pages load it with a single Redis HGETALL; on a miss they do a single
+Postgres SELECT and backfill Redis.
+
+Usage:
+    from backend.pipeline.week_bundle import (
+        build_week_bundle, save_week_bundle, load_week_bundle, bundle_to_context,
+    )
+
+    # Weekly pipeline completion
+    bundle = build_week_bundle(results)
+    await save_week_bundle(bundle)
+
+    # Checkpoint start-up (one round-trip)
+    bundle = await load_week_bundle(week_id)
+    context = bundle_to_context(bundle)
+"""
+
+import base64
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .context import PipelineContext
+from ..cache.keys import week_bundle_key
+from ..cache.serializer import serialize, deserialize
+
+logger = logging.getLogger(__name__)
+
+# Bump when the bundle layout changes; readers reject unknown versions
+BUNDLE_SCHEMA_VERSION = 1
+
+# Redis copy lives past the following week's run; Postgres keeps every version
+BUNDLE_TTL = 14 * 24 * 3600
+
+# Pipeline results copied into the bundle
+BUNDLE_FIELDS = (
+    "execution_mode",
+    "market_snapshot",
+    "pm_pitches",
+    "peer_reviews",
+    "label_to_model",
+    "chairman_decision",
+    "execution_result",
+)
+
+
+class BundleError(Exception):
+    """Raised when a stored bundle cannot be decoded."""
+
+
+# ============================================================================
+# Build / Encode
+# ============================================================================
+
+
+def _build_digest(research_pack: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Digest the week's knowledge graph, if the research produced one."""
+    from .graph_digest import make_digest
+
+    if not research_pack:
+        return None
+    weekly_graph = (research_pack.get("structured_json") or {}).get("weekly_graph")
+    if not weekly_graph:
+        return None
+    try:
+        return make_digest(weekly_graph)
+    except Exception as e:
+        logger.warning(f"Failed to build graph digest for week bundle: {e}")
+        return None
+
+
+def build_week_bundle(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a week bundle from WeeklyTradingPipeline results.
+
+    Args:
+        results: Dict returned by WeeklyTradingPipeline._extract_results()
+
+    Returns:
+        Bundle dict (version is assigned when saved)
+    """
+    bundle = {
+        "schema_version": BUNDLE_SCHEMA_VERSION,
+        "week_id": results["week_id"],
+        "created_at": datetime.utcnow().isoformat(),
+        "digest": _build_digest(results.get("research_pack_a")),
+    }
+    for field in BUNDLE_FIELDS:
+        bundle[field] = results.get(field)
+    return bundle
+
+
+def encode_bundle(bundle: Dict[str, Any]) -> bytes:
+    """Serialize a bundle to gzip-compressed JSON."""
+    return serialize(bundle, format="json", compress=True, compression_threshold=0)
+
+
+def decode_bundle(payload: bytes, checksum: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Decode a stored bundle payload.
+
+    Args:
+        payload: gzip-compressed JSON
+        checksum: Expected SHA-256 hex digest (optional)
+
+    Returns:
+        Bundle dict
+
+    Raises:
+        BundleError: If the checksum does not match, the payload is corrupt,
+                     or the schema version is unknown
+    """
+    if checksum and hashlib.sha256(payload).hexdigest() != checksum:
+        raise BundleError("Week bundle checksum mismatch")
+    try:
+        bundle = deserialize(payload, format="json", compressed=True)
+    except ValueError as e:
+        raise BundleError(f"Corrupt week bundle: {e}") from e
+    if bundle.get("schema_version") != BUNDLE_SCHEMA_VERSION:
+        raise BundleError(
+            f"Unsupported week bundle schema version: {bundle.get('schema_version')}"
+        )
+    return bundle
+
+
+# ============================================================================
+# Save / Load
+# ============================================================================
+
+
+async def _cache_bundle(week_id: str, version: int, payload: bytes) -> bool:
+    """Store the encoded bundle in Redis as a {version, payload} hash. Never raises."""
+    from ..redis_client import get_redis_pool
+
+    key = week_bundle_key(week_id)
+    try:
+        redis = get_redis_pool()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "version": version,
+                    "payload": base64.b64encode(payload).decode("ascii"),
+                },
+            )
+            pipe.expire(key, BUNDLE_TTL)
+            await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Week bundle {week_id} not cached in Redis: {e}")
+        return False
+
+
+async def save_week_bundle(bundle: Dict[str, Any]) -> int:
+    """
+    Persist a bundle to Postgres and Redis.
+
+    Args:
+        bundle: Dict from build_week_bundle()
+
+    Returns:
+        Version number assigned by Postgres
+
+    Raises:
+        Exception: If the Postgres write fails (Redis failures are logged)
+    """
+    from ..db.bundle_db import save_week_bundle as db_save_week_bundle
+
+    week_id = bundle["week_id"]
+    payload = encode_bundle(bundle)
+    checksum = hashlib.sha256(payload).hexdigest()
+
+    version = await db_save_week_bundle(week_id, payload, checksum, BUNDLE_SCHEMA_VERSION)
+    await _cache_bundle(week_id, version, payload)
+    return version
+
+
+async def load_week_bundle(
+    week_id: Optional[str] = None,
+    version: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a week bundle in one round-trip.
+
+    Reads the latest version from Redis; on a miss (or when a specific
+    version is requested) reads Postgres and backfills Redis for the latest.
+
+    Args:
+        week_id: Week identifier (defaults to the current week)
+        version: Specific version, or None for the latest
+
+    Returns:
+        Bundle dict with its "version", or None if no bundle exists
+    """
+    from ..db.bundle_db import load_week_bundle as db_load_week_bundle
+    from ..redis_client import get_redis_pool
+    from .stages.research import get_week_id
+
+    week_id = week_id or get_week_id()
+
+    if version is None:
+        try:
+            cached = await get_redis_pool().hgetall(week_bundle_key(week_id))
+            if cached:
+                bundle = decode_bundle(base64.b64decode(cached["payload"]))
+                return {**bundle, "version": int(cached["version"])}
+        except Exception as e:
+            logger.warning(f"Week bundle {week_id} Redis read failed: {e}")
+
+    row = await db_load_week_bundle(week_id, version)
+    if row is None:
+        return None
+
+    payload = bytes(row["payload"])
+    bundle = decode_bundle(payload, row["checksum"])
+    if version is None:
+        await _cache_bundle(week_id, row["version"], payload)
+    return {**bundle, "version": row["version"]}
+
+
+def bundle_to_context(
+    bundle: Dict[str, Any],
+    context: Optional[PipelineContext] = None,
+) -> PipelineContext:
+    """
+    Seed a pipeline context with the frozen week state.
+
+    Args:
+        bundle: Dict from load_week_bundle()
+        context: Context to extend (defaults to an empty context)
+
+    Returns:
+        New PipelineContext with MARKET_SNAPSHOT, PM_PITCHES, PEER_REVIEWS,
+        LABEL_TO_MODEL, CHAIRMAN_DECISION and EXECUTION_RESULT set
+    """
+    from .stages.research import MARKET_SNAPSHOT
+    from .stages.pm_pitch import PM_PITCHES
+    from .stages.peer_review import PEER_REVIEWS, LABEL_TO_MODEL
+    from .stages.chairman import CHAIRMAN_DECISION
+    from .stages.execution import EXECUTION_RESULT
+
+    context = context or PipelineContext()
+    keys = {
+        "market_snapshot": MARKET_SNAPSHOT,
+        "pm_pitches": PM_PITCHES,
+        "peer_reviews": PEER_REVIEWS,
+        "label_to_model": LABEL_TO_MODEL,
+        "chairman_decision": CHAIRMAN_DECISION,
+        "execution_result": EXECUTION_RESULT,
+    }
+    for field, key in keys.items():
+        if bundle.get(field) is not None:
+            context = context.set(key, bundle[field])
+    return context
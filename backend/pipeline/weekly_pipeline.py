@@ -13,6 +13,8 @@ from .stages.peer_review import PeerReviewStage
 from .stages.chairman import ChairmanStage
 from .stages.execution import ExecutionStage
 from ..requesty_client import get_pm_model_keys
+from ..cache.invalidation import stage_completed
+from .week_bundle import build_week_bundle, save_week_bundle
 
 
 class WeeklyTradingPipeline:
@@ -63,7 +65,7 @@ class WeeklyTradingPipeline:
             )
 
         stages.append(ExecutionStage())
-        self.pipeline = Pipeline(stages)
+        self.pipeline = Pipeline(stages, on_stage_complete=stage_completed)
 
     async def run(self, user_query: str | None = None) -> Dict[str, Any]:
         """
@@ -93,6 +95,7 @@ class WeeklyTradingPipeline:
             result_context = await self.pipeline.execute(context)
 
             results = self._extract_results(result_context)
+            await self._freeze_week_bundle(results)
 
             print("\n" + "=" * 80)
             print("✅ WEEKLY PIPELINE COMPLETE")
@@ -149,6 +152,20 @@ class WeeklyTradingPipeline:
             "execution_result": context.get(EXECUTION_RESULT),
         }
 
+    async def _freeze_week_bundle(self, results: Dict[str, Any]) -> None:
+        """
+        Freeze the week's context into a versioned bundle for checkpoints.
+
+        Failures are reported but do not fail the pipeline; checkpoints
+        report a missing bundle instead.
+        """
+        try:
+            version = await save_week_bundle(build_week_bundle(results))
+            results["bundle_version"] = version
+            print(f"\n🧊 Froze week bundle {results['week_id']} v{version}")
+        except Exception as e:
+            print(f"\n⚠️  Failed to freeze week bundle: {e}")
+
     def _print_summary(self, results: Dict[str, Any]):
         """Print pipeline summary."""
         print("\n📊 PIPELINE SUMMARY:")
@@ -21,9 +21,16 @@ Usage (Async - Recommended):
     # In FastAPI shutdown event
     await close_redis_pool()
 
-Usage (Sync - Legacy):
+Usage (Sync - Scripts Only):
     redis_client = get_redis_client()
     redis_client.set("key", "value")
+
+Blocking Guard:
+    The sync client blocks the calling thread on network I/O. Inside a
+    running event loop that stalls every concurrent request in the worker,
+    so each sync operation checks for a running loop in the current thread,
+    logs a warning and records the call (see get_blocking_calls()). The test
+    suite fails any test that triggers it.
 """
 
 import os
@@ -31,6 +38,7 @@ import logging
 from typing import Optional, Any, Union
 from contextlib import contextmanager
 import time
+import asyncio
 
 import redis
 from redis import asyncio as aioredis
@@ -379,6 +387,39 @@ async def check_redis_health() -> dict:
 # SYNC REDIS CLIENT (Legacy - for backward compatibility)
 # ============================================================================
 
+# Blocking call guard: sync Redis operations attempted while an event loop
+# was running (they stall every coroutine on that loop)
+_blocking_calls: list[str] = []
+
+
+def in_event_loop() -> bool:
+    """Return True if the current thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def _check_blocking_call(operation: str) -> None:
+    """Record and warn about a sync Redis operation on the event loop thread."""
+    if in_event_loop():
+        _blocking_calls.append(operation)
+        logger.warning(
+            f"Blocking Redis call '{operation}' inside the event loop - "
+            "use get_redis_pool() in async code"
+        )
+
+
+def get_blocking_calls() -> list[str]:
+    """Get sync Redis operations that ran inside an event loop."""
+    return list(_blocking_calls)
+
+
+def reset_blocking_calls() -> None:
+    """Clear the recorded blocking calls (used by the test suite)."""
+    _blocking_calls.clear()
+
 
 class RedisClient:
     """
@@ -501,6 +542,8 @@ class RedisClient:
         Raises:
             RedisError: If operation fails after all retries
         """
+        _check_blocking_call(getattr(operation, "__name__", str(operation)))
+
         last_error = None
 
         for attempt in range(self.max_retries):
@@ -882,6 +925,8 @@ def get_redis_client() -> RedisClient:
 
     This function provides a singleton Redis client that is shared
     across the application. The client is initialized on first access.
+    It blocks on network I/O - use it from scripts and sync code only;
+    async code should use get_redis_pool().
 
     Returns:
         RedisClient instance
@@ -890,15 +935,11 @@ def get_redis_client() -> RedisClient:
         RuntimeError: If Redis client initialization fails
 
     Example:
-        # In FastAPI dependency
-        def get_redis():
-            return get_redis_client()
-
-        @app.get("/api/data")
-        async def get_data(redis = Depends(get_redis)):
-            cached = redis.get("data")
-            if cached:
-                return json.loads(cached)
+        # In a script
+        redis = get_redis_client()
+        cached = redis.get("data")
+        if cached:
+            data = json.loads(cached)
     """
     global _redis_client
 
@@ -2,11 +2,13 @@
 
 import os
 import asyncio
-from typing import List, Dict, Any, Optional
-from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletionMessageParam
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    # The OpenAI SDK takes ~0.5s to import; load it on the first query
+    from openai import AsyncOpenAI
+
 load_dotenv()
 
 # ============================================================================
@@ -69,8 +71,10 @@ PM_MODELS = ["chatgpt", "gemini", "groq", "claude", "deepseek"]
 # ============================================================================
 
 
-def get_requesty_client() -> AsyncOpenAI:
+def get_requesty_client() -> "AsyncOpenAI":
     """Get Requesty API client instance."""
+    from openai import AsyncOpenAI
+
     if not REQUESTY_API_KEY:
         raise ValueError("REQUESTY_API_KEY environment variable not set")
 
@@ -117,6 +121,7 @@ async def query_model(
         client = get_requesty_client()
 
         from typing import cast
+        from openai.types.chat import ChatCompletionMessageParam
 
         response = await client.chat.completions.create(
             model=model_id,
@@ -5,10 +5,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import uuid
 
-from backend.db.council_db import (
-    save_peer_reviews as db_save_peer_reviews,
-    save_chairman_decision as db_save_chairman_decision,
-)
+from backend.db.council_db import save_council_results as db_save_council_results
 from backend.pipeline.context import PipelineContext
 from backend.pipeline.stages.peer_review import PeerReviewStage, PEER_REVIEWS
 from backend.pipeline.stages.chairman import ChairmanStage, CHAIRMAN_DECISION
@@ -43,6 +40,7 @@ class CouncilService:
         pipeline_state: Any = None,
         week_id: Optional[str] = None,
         research_date: Optional[str] = None,
+        pitch_ids: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """
         Synthesize council decision through peer review and chairman stages.
@@ -65,6 +63,8 @@ class CouncilService:
             pipeline_state: Global pipeline state object for job tracking
             week_id: Week identifier for the council session (optional)
             research_date: ISO format research date (optional)
+            pitch_ids: Model -> pitch ID as returned by save_pitches
+                (optional; saves the peer reviews without the ID lookup)
 
         Returns:
             Dict containing:
@@ -171,23 +171,19 @@ class CouncilService:
                     # Extract label_to_model mapping from context
                     label_to_model = context.data.get("label_to_model", {})
 
-                    # Save peer reviews
-                    await db_save_peer_reviews(
+                    # Save peer reviews and chairman decision atomically
+                    await db_save_council_results(
                         week_id=week_id,
                         peer_reviews=peer_reviews,
+                        chairman_decision=chairman_decision,
                         research_date=research_date,
                         pm_pitches=pm_pitches_raw,
                         label_to_model=label_to_model,
+                        pitch_ids=pitch_ids,
                     )
-                    logger.info(f"Saved {len(peer_reviews)} peer reviews to database")
-
-                    # Save chairman decision
-                    await db_save_chairman_decision(
-                        week_id=week_id,
-                        chairman_decision=chairman_decision,
-                        research_date=research_date,
+                    logger.info(
+                        f"Saved {len(peer_reviews)} peer reviews and chairman decision to database"
                     )
-                    logger.info("Saved chairman decision to database")
 
                 except Exception as e:
                     logger.error(f"Error saving council data to database: {e}", exc_info=True)
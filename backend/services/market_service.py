@@ -71,8 +71,7 @@ class MarketService:
             Returns None if an error occurs.
 
         Database Tables:
-            - rolling_7day_log_returns: Contains 7-day rolling log returns by symbol/date
-            - correlation_matrix: Contains pairwise correlations by symbol/date
+            - latest_metrics: Latest 7-day returns and correlations (maintained on write)
         """
         try:
             metrics = await fetch_market_metrics()
@@ -97,7 +96,7 @@ class MarketService:
             Returns None if an error occurs.
 
         Database Tables:
-            - daily_bars: Contains OHLCV data by symbol/date
+            - latest_prices: Latest daily bar per symbol (maintained on write)
 
         Tracked Symbols:
             SPY, QQQ, IWM, TLT, HYG, UUP, GLD, USO, VIXY, SH
@@ -1,7 +1,7 @@
 """Pitch service for PM pitch business logic."""
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime
 import uuid
 
@@ -9,6 +9,8 @@ from backend.db.pitch_db import (
     save_pitches as db_save_pitches,
     load_pitches as db_load_pitches,
     find_pitch_by_id as db_find_pitch_by_id,
+    get_pitch_page as db_get_pitch_page,
+    stream_pitches as db_stream_pitches,
 )
 from backend.pipeline.context import PipelineContext
 from backend.pipeline.stages.pm_pitch import PMPitchStage, PM_PITCHES
@@ -187,9 +189,10 @@ class PitchService:
             formatted_pitches = _format_pitches_for_frontend(result_context)
 
             # Save pitches to database
+            pitch_ids = None
             if raw_pitches and week_id:
                 try:
-                    await db_save_pitches(
+                    pitch_ids = await db_save_pitches(
                         week_id=week_id,
                         pitches_raw=raw_pitches,
                         research_date=research_date
@@ -202,6 +205,7 @@ class PitchService:
             if pipeline_state:
                 pipeline_state.pm_pitches = formatted_pitches
                 pipeline_state.pm_pitches_raw = raw_pitches
+                pipeline_state.pm_pitch_ids = pitch_ids
                 pipeline_state.pm_status = "complete"
 
                 # Update job status
@@ -313,3 +317,33 @@ class PitchService:
         except Exception as e:
             logger.error(f"Error in get_pitch_by_id for {pitch_id}: {e}")
             return None
+
+    async def get_pitch_history(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        week_id: Optional[str] = None,
+        model: Optional[str] = None,
+        account: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get one keyset-paginated page of pitch history (newest first).
+
+        Returns:
+            Dict with "items" (pitch rows) and "next_cursor"
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        return await db_get_pitch_page(
+            limit=limit, cursor=cursor, week_id=week_id, model=model, account=account
+        )
+
+    def stream_pitches(
+        self,
+        week_id: Optional[str] = None,
+        model: Optional[str] = None,
+        account: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream pitch history for export (server-side cursor)."""
+        return db_stream_pitches(week_id=week_id, model=model, account=account)
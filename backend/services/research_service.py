@@ -1,7 +1,7 @@
 """Research service for research business logic."""
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
 import uuid
@@ -10,7 +10,12 @@ from backend.db.research_db import (
     get_latest_research as db_get_latest_research,
     get_research_by_id as db_get_research_by_id,
     get_research_history as db_get_research_history,
+    get_research_page as db_get_research_page,
+    stream_research_reports as db_stream_research_reports,
 )
+from backend.cache.decorator import cached
+from backend.cache.keys import graphs_latest_key, data_package_key
+from backend.cache.invalidation import stage_completed
 from backend.pipeline.context import PipelineContext
 from backend.pipeline.stages.research import ResearchStage
 from backend.utils.formatters import _format_research_for_frontend
@@ -91,7 +96,7 @@ class ResearchService:
             logger.error(f"Error reading research prompt: {e}")
             raise
 
-    async def get_latest_research(self) -> Dict[str, Any]:
+    async def get_latest_research(self) -> Optional[Dict[str, Any]]:
         """
         Get the latest complete research report from database.
 
@@ -108,7 +113,7 @@ class ResearchService:
                 - status: Report status
                 - error_message: Error message if any
                 - created_at: Creation timestamp (ISO format)
-            Returns empty dict if no research found or error occurs.
+            Returns empty dict if no research found, None if an error occurs.
 
         Database Tables:
             - research_reports: Contains research report data
@@ -117,7 +122,7 @@ class ResearchService:
             return await db_get_latest_research()
         except Exception as e:
             logger.error(f"Error in get_latest_research: {e}")
-            return {}
+            return None
 
     async def get_research_by_id(self, report_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -163,6 +168,36 @@ class ResearchService:
             logger.error(f"Error in get_research_history: {e}")
             return {"history": {}, "days": days, "error": str(e)}
 
+    async def get_research_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        provider: Optional[str] = None,
+        status: Optional[str] = None,
+        week_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get one keyset-paginated page of research reports (newest first).
+
+        Returns:
+            Dict with "items" (report metadata) and "next_cursor"
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        return await db_get_research_page(
+            limit=limit, cursor=cursor, provider=provider, status=status, week_id=week_id
+        )
+
+    def stream_research_reports(
+        self,
+        provider: Optional[str] = None,
+        status: Optional[str] = None,
+        week_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream full research reports for export (server-side cursor)."""
+        return db_stream_research_reports(provider=provider, status=status, week_id=week_id)
+
     async def generate_research(
         self,
         models: List[str],
@@ -238,6 +273,10 @@ class ResearchService:
 
             result_context = await stage.execute(context)
 
+            # New report is in the database - refresh dependent cache keys
+            # and tell other workers to drop their local copies
+            await stage_completed(stage.name)
+
             # Store results
             results = _format_research_for_frontend(result_context)
 
@@ -296,7 +335,8 @@ class ResearchService:
             logger.error(f"Error verifying research {research_id}: {e}")
             raise
 
-    async def get_latest_graphs(self) -> Dict[str, Any]:
+    @cached(key=graphs_latest_key(), ttl=3600, cache_none=False)
+    async def get_latest_graphs(self) -> Optional[Dict[str, Any]]:
         """
         Get the latest knowledge graphs from database.
 
@@ -306,13 +346,16 @@ class ResearchService:
             Dict containing:
                 - date: Creation timestamp of the research
                 - weekly_graph: Weekly knowledge graph from structured_json
-            Returns empty dict if no research or no graph available.
+            Returns empty dict if no research or no graph available, None if
+            the research could not be read (None is not cached).
 
         Database Tables:
             - research_reports: Contains research report data with structured_json
         """
         try:
             report = await self.get_latest_research()
+            if report is None:
+                return None
 
             if report and report.get("structured_json"):
                 return {
@@ -323,9 +366,10 @@ class ResearchService:
             return {}
         except Exception as e:
             logger.error(f"Error getting latest graphs: {e}")
-            return {}
+            return None
 
-    async def get_latest_data_package(self) -> Dict[str, Any]:
+    @cached(key=data_package_key(), ttl=3600, cache_none=False)
+    async def get_latest_data_package(self) -> Optional[Dict[str, Any]]:
         """
         Get the latest complete data package with research and market data.
 
@@ -338,6 +382,8 @@ class ResearchService:
                 - research: Latest complete research report
                 - market_metrics: Latest 7-day returns and correlation matrix
                 - current_prices: Latest OHLCV data for tracked symbols
+            Returns None if any part could not be read (None is not cached,
+            so a partial package is never served for the TTL).
         """
         try:
             # Import here to avoid circular dependencies
@@ -348,6 +394,9 @@ class ResearchService:
             research = await self.get_latest_research()
             metrics = await market_service.get_market_metrics()
             prices = await market_service.get_current_prices()
+            if research is None or metrics is None or prices is None:
+                logger.warning("Latest data package incomplete; not caching")
+                return None
 
             return {
                 "date": research.get("created_at") if research else None,
@@ -357,9 +406,4 @@ class ResearchService:
             }
         except Exception as e:
             logger.error(f"Error getting latest data package: {e}")
-            return {
-                "date": None,
-                "research": {},
-                "market_metrics": None,
-                "current_prices": None,
-            }
+            return None
@@ -5,27 +5,49 @@ Calculate and store market metrics using pandas.
 Calculations:
 1. Daily log returns: ln(close_t / close_t-1)
 2. 7-day log returns: ln(close_t / close_t-7)
-3. 30-day rolling correlation matrix of 7-day log returns
+3. 30-day rolling correlation matrix of 7-day log returns (vectorized over
+   all windows, backend/storage/rolling_correlation.py; stored as the upper
+   triangle, symbol_1 <= symbol_2)
+
+INCREMENTAL MODE (default):
+    Each symbol's high-water mark is the last date present in both
+    daily_log_returns and rolling_7day_log_returns; the correlation mark
+    is the last date in correlation_matrix. Only bars after a symbol's
+    mark are new, plus the LOOKBACK_BARS (7 + 30) bars before it that the
+    7-day returns and the 30-day correlation window of the first new date
+    need. Only metrics for dates after the marks are computed and
+    upserted, so a daily run costs O(new days), not O(history).
+    Symbols without metrics yet (and an empty correlation table) are
+    computed over their full history.
+
+    The daily bar update re-fetches the last REFETCH_DAYS days every run,
+    and Alpaca may revise those bars. So no mark is later than the day
+    before that window, and the metrics of re-fetched dates are recomputed
+    along with the new ones.
+
+    --backfill ignores the marks and recomputes every date (after bars
+    were re-fetched or corrected, or when the calculations change).
 
 ASYNC PATTERNS USED:
     This module demonstrates batch operations with asyncpg connection pool.
     See backend/db/ASYNC_PATTERNS.md for complete documentation.
 
     Key patterns:
-    - Batch inserts use conn.executemany() for performance
+    - Batch upserts use COPY via backend/db/bulk_loader.bulk_upsert()
     - Connection pool is acquired with 'async with pool.acquire()'
     - All database operations use 'await'
     - Parameter placeholders use $1, $2, $3 (not %s)
 
 Usage:
-    python calculate_metrics.py          # Calculate all metrics
-    python calculate_metrics.py --backfill  # Backfill historical metrics
+    python calculate_metrics.py          # Calculate metrics for new dates
+    python calculate_metrics.py --backfill  # Recompute all historical metrics
 """
 
 import os
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 import argparse
 import asyncio
 import numpy as np
@@ -35,7 +57,18 @@ from dotenv import load_dotenv
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.db.pool import get_pool, init_pool, close_pool
+from backend.db.pool import INTENT_BATCH, init_pool, close_pool
+from backend.db.bulk_loader import bulk_upsert
+from backend.db.columnar import columns_to_dataframe
+from backend.db_helpers import fetch_columns
+from backend.storage.rolling_correlation import rolling_correlation, upper_triangle
+from backend.redis_client import close_redis_pool
+from backend.cache.warming import (
+    warm_after_update,
+    TABLE_DAILY_LOG_RETURNS,
+    TABLE_ROLLING_7DAY_LOG_RETURNS,
+    TABLE_CORRELATION_MATRIX,
+)
 
 load_dotenv()
 
@@ -53,6 +86,20 @@ DB_USER = os.getenv("DATABASE_USER", "luis")
 # Rolling window for correlation
 CORRELATION_WINDOW = 30
 
+# Bars before a symbol's high-water mark needed to compute its next date:
+# 7 for the 7-day return, then CORRELATION_WINDOW 7-day returns for the
+# correlation window ending on it
+LOOKBACK_BARS = 7 + CORRELATION_WINDOW
+
+# Days of bars re-fetched and upserted by every daily update (keep in sync
+# with update_daily_bars in fetch_market_data.py and data_fetcher.py)
+REFETCH_DAYS = 5
+
+
+def refetch_floor(today: Optional[date] = None) -> date:
+    """Latest usable high-water mark: the day before the re-fetched window."""
+    return (today or date.today()) - timedelta(days=REFETCH_DAYS + 1)
+
 
 # ============================================================================
 # DATABASE MANAGER
@@ -62,7 +109,7 @@ class MetricsDB:
     """PostgreSQL database manager for metrics using async connection pool."""
 
     def __init__(self):
-        # No longer stores connection - uses pool from get_pool()
+        # No longer stores connection - uses the pool via db_helpers
         pass
 
     async def load_daily_bars(self) -> pd.DataFrame:
@@ -72,30 +119,102 @@ class MetricsDB:
         Returns:
             DataFrame with columns: symbol, date, open, high, low, close, volume
         """
+        # Prices are cast to float8 in SQL so asyncpg decodes them straight
+        # to floats (no Decimal per value), and rows are transposed to
+        # columns in one pass instead of building a dict per row
         query = """
-            SELECT symbol, date, open, high, low, close, volume
+            SELECT symbol, date,
+                   open::float8 AS open, high::float8 AS high,
+                   low::float8 AS low, close::float8 AS close, volume
             FROM daily_bars
             ORDER BY symbol, date
         """
-        # ASYNC PATTERN: Direct pool usage (advanced)
-        # - Use when you need fine-grained control over connection
-        # - get_pool() returns the global connection pool singleton
-        # - 'async with pool.acquire()' automatically gets/releases connection
-        # - Connection is returned to pool on exit (even on exception)
-        pool = get_pool()
-        async with pool.acquire() as conn:
-            # ASYNC PATTERN: Use await with conn.fetch()
-            # - conn.fetch() returns all rows as list of Record objects
-            # - Records are dict-like: access with row["column_name"]
-            rows = await conn.fetch(query)
-            # Convert to list of dicts for DataFrame
-            data = [dict(row) for row in rows]
-            df = pd.DataFrame(data)
-            # Ensure date column is datetime
-            if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-            print(f"📊 Loaded {len(df)} daily bars from database")
-            return df
+        # ASYNC PATTERN: Column-wise fetch on the batch pool
+        # - intent="batch" keeps long metric scans off the pool that serves
+        #   the API (falls back to primary if the batch pool isn't initialized)
+        # - fetch_columns returns {column: [values]} for pandas/NumPy
+        columns = await fetch_columns(query, intent=INTENT_BATCH)
+        df = columns_to_dataframe(columns)
+        # Ensure date column is datetime
+        if not df.empty:
+            df['date'] = pd.to_datetime(df['date'])
+        print(f"📊 Loaded {len(df)} daily bars from database")
+        return df
+
+    async def load_high_water_marks(
+        self, symbols: List[str]
+    ) -> Tuple[Dict[str, Optional[date]], Optional[date]]:
+        """
+        Load the last computed metric date of each symbol and of correlations.
+
+        A symbol's mark is the earlier of its last daily and 7-day log return
+        dates (None if either table has no rows for it). Each lookup is an
+        index probe on (symbol, date), not a scan.
+
+        Args:
+            symbols: Symbols to look up
+
+        Returns:
+            Tuple of (symbol -> mark or None, last correlation date or None)
+        """
+        query = """
+            SELECT m.symbol,
+                   (SELECT MAX(date) FROM daily_log_returns r
+                    WHERE r.symbol = m.symbol) AS daily_mark,
+                   (SELECT MAX(date) FROM rolling_7day_log_returns r
+                    WHERE r.symbol = m.symbol) AS weekly_mark,
+                   (SELECT MAX(date) FROM correlation_matrix) AS correlation_mark
+            FROM unnest($1::text[]) AS m(symbol)
+        """
+        columns = await fetch_columns(query, list(symbols), intent=INTENT_BATCH)
+        if not columns:
+            return {}, None
+        marks = {
+            symbol: min(daily, weekly) if daily and weekly else None
+            for symbol, daily, weekly in zip(
+                columns["symbol"], columns["daily_mark"], columns["weekly_mark"]
+            )
+        }
+        return marks, columns["correlation_mark"][0]
+
+    async def load_daily_bars_since(
+        self, marks: Dict[str, Optional[date]], lookback: int = LOOKBACK_BARS
+    ) -> pd.DataFrame:
+        """
+        Load the bars of each symbol after its mark, plus `lookback` bars
+        up to and including it (all bars when the mark is None).
+
+        Args:
+            marks: Dict mapping symbol -> high-water mark or None
+            lookback: Bars at or before the mark to include
+
+        Returns:
+            DataFrame with columns: symbol, date, close
+        """
+        query = """
+            SELECT b.symbol, b.date, b.close
+            FROM unnest($1::text[], $2::date[]) AS m(symbol, mark)
+            CROSS JOIN LATERAL (
+                (SELECT symbol, date, close::float8 AS close
+                 FROM daily_bars
+                 WHERE symbol = m.symbol AND (m.mark IS NULL OR date > m.mark))
+                UNION ALL
+                (SELECT symbol, date, close::float8 AS close
+                 FROM daily_bars
+                 WHERE symbol = m.symbol AND date <= m.mark
+                 ORDER BY date DESC
+                 LIMIT $3)
+            ) b
+            ORDER BY b.symbol, b.date
+        """
+        columns = await fetch_columns(
+            query, list(marks), list(marks.values()), lookback, intent=INTENT_BATCH
+        )
+        df = columns_to_dataframe(columns)
+        if not df.empty:
+            df['date'] = pd.to_datetime(df['date'])
+        print(f"📊 Loaded {len(df)} daily bars from database (incremental)")
+        return df
 
     async def upsert_daily_log_returns(self, df: pd.DataFrame):
         """
@@ -108,34 +227,18 @@ class MetricsDB:
             print("  ⚠️  No daily log returns to insert")
             return
 
-        # ASYNC PATTERN: Batch operations (efficient bulk insert)
-        # - Prepare list of tuples for executemany()
-        # - Each tuple contains parameters for one row ($1, $2, $3)
-        # - Much faster than calling execute() in a loop (single transaction)
-        # - For 100 rows: 1 round-trip vs 100 round-trips
-        data = [
-            (row['symbol'], row['date'], float(row['log_return']) if pd.notna(row['log_return']) else None)
-            for _, row in df.iterrows()
-        ]
-
-        pool = get_pool()
-        async with pool.acquire() as conn:
-            # ASYNC PATTERN: Use await with conn.executemany() for batch operations
-            # - executemany() runs all operations in a single transaction
-            # - All rows succeed or all fail (atomic)
-            # - 10-100x faster than individual execute() calls
-            # - Use $1, $2, $3 placeholders (not %s, %s, %s)
-            await conn.executemany(
-                """
-                INSERT INTO daily_log_returns (symbol, date, log_return)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (symbol, date) DO UPDATE SET
-                    log_return = EXCLUDED.log_return,
-                    created_at = NOW()
-                """,
-                data
-            )
-        print(f"  ✅ Upserted {len(df)} daily log returns")
+        # ASYNC PATTERN: COPY-based bulk upsert (see backend/db/bulk_loader.py)
+        # - Columns go to COPY as-is (no df.iterrows())
+        # - One staging COPY + one INSERT ... ON CONFLICT merge per call
+        # - All rows succeed or all fail (single transaction)
+        rows = await bulk_upsert(
+            "daily_log_returns",
+            df,
+            conflict_columns=["symbol", "date"],
+            touch_columns=["created_at"],
+            columns=["symbol", "date", "log_return"],
+        )
+        print(f"  ✅ Upserted {rows} daily log returns")
 
     async def upsert_7day_log_returns(self, df: pd.DataFrame):
         """
@@ -148,25 +251,14 @@ class MetricsDB:
             print("  ⚠️  No 7-day log returns to insert")
             return
 
-        # Prepare data for bulk insert
-        data = [
-            (row['symbol'], row['date'], float(row['log_return_7d']) if pd.notna(row['log_return_7d']) else None)
-            for _, row in df.iterrows()
-        ]
-
-        pool = get_pool()
-        async with pool.acquire() as conn:
-            await conn.executemany(
-                """
-                INSERT INTO rolling_7day_log_returns (symbol, date, log_return_7d)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (symbol, date) DO UPDATE SET
-                    log_return_7d = EXCLUDED.log_return_7d,
-                    created_at = NOW()
-                """,
-                data
-            )
-        print(f"  ✅ Upserted {len(df)} 7-day log returns")
+        rows = await bulk_upsert(
+            "rolling_7day_log_returns",
+            df,
+            conflict_columns=["symbol", "date"],
+            touch_columns=["created_at"],
+            columns=["symbol", "date", "log_return_7d"],
+        )
+        print(f"  ✅ Upserted {rows} 7-day log returns")
 
     async def upsert_correlation_matrix(self, df: pd.DataFrame):
         """
@@ -179,25 +271,14 @@ class MetricsDB:
             print("  ⚠️  No correlation data to insert")
             return
 
-        # Prepare data for bulk insert
-        data = [
-            (row['date'], row['symbol_1'], row['symbol_2'], float(row['correlation']) if pd.notna(row['correlation']) else None)
-            for _, row in df.iterrows()
-        ]
-
-        pool = get_pool()
-        async with pool.acquire() as conn:
-            await conn.executemany(
-                """
-                INSERT INTO correlation_matrix (date, symbol_1, symbol_2, correlation)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (date, symbol_1, symbol_2) DO UPDATE SET
-                    correlation = EXCLUDED.correlation,
-                    created_at = NOW()
-                """,
-                data
-            )
-        print(f"  ✅ Upserted {len(df)} correlation pairs")
+        rows = await bulk_upsert(
+            "correlation_matrix",
+            df,
+            conflict_columns=["date", "symbol_1", "symbol_2"],
+            touch_columns=["created_at"],
+            columns=["date", "symbol_1", "symbol_2", "correlation"],
+        )
+        print(f"  ✅ Upserted {rows} correlation pairs")
 
 
 # ============================================================================
@@ -262,63 +343,97 @@ class MetricsCalculator:
         print(f"  ✅ Calculated {len(result)} 7-day log returns")
         return result
 
-    def calculate_correlation_matrix(self, df: pd.DataFrame, window: int = 30) -> pd.DataFrame:
+    def calculate_correlation_matrix(
+        self, df: pd.DataFrame, window: int = 30, since: Optional[date] = None
+    ) -> pd.DataFrame:
         """
         Calculate 30-day rolling correlation matrix of 7-day log returns.
 
         Args:
             df: DataFrame with columns: symbol, date, log_return_7d
             window: Rolling window size (default: 30)
+            since: Only compute windows ending after this date (df must
+                   still hold the window - 1 dates before the first one)
 
         Returns:
-            DataFrame with columns: date, symbol_1, symbol_2, correlation
+            DataFrame with columns: date, symbol_1, symbol_2, correlation;
+            the upper triangle of each matrix (symbol_1 <= symbol_2)
         """
         print(f"\n📊 Calculating {window}-day rolling correlation matrix...")
 
-        # Pivot to wide format: dates as rows, symbols as columns
+        # Pivot to wide format: dates as rows, symbols as columns (sorted,
+        # so the upper triangle is symbol_1 <= symbol_2)
         pivot_df = df.pivot(index='date', columns='symbol', values='log_return_7d')
+        pivot_df = pivot_df.sort_index().sort_index(axis=1)
+
+        first = window - 1
+        if since is not None:
+            first = max(first, pivot_df.index.searchsorted(pd.Timestamp(since), side='right'))
+
+        # All windows ending at rows first..T-1 in one pass: (dates, N, N)
+        corr = rolling_correlation(pivot_df.to_numpy(dtype=float)[first - window + 1:], window)
+        dates = pivot_df.index[first:first + len(corr)]
+
+        # Only the upper triangle is stored; reads mirror it
+        i, j, pairs = upper_triangle(corr)
+        symbols = pivot_df.columns.to_numpy()
+        result = pd.DataFrame({
+            'date': np.repeat(dates, len(i)),
+            'symbol_1': np.tile(symbols[i], len(dates)),
+            'symbol_2': np.tile(symbols[j], len(dates)),
+            'correlation': pairs.ravel(),
+        })
+
+        print(f"  ✅ Calculated {len(result)} correlation pairs ({len(dates)} dates)")
+        return result
 
-        # Sort by date
-        pivot_df = pivot_df.sort_index()
-
-        # Calculate rolling correlation
-        correlation_records = []
-
-        for i in range(window - 1, len(pivot_df)):
-            # Get window of data
-            window_data = pivot_df.iloc[i - window + 1:i + 1]
-            current_date = pivot_df.index[i]
-
-            # Calculate correlation matrix for this window
-            corr_matrix = window_data.corr()
-
-            # Extract correlation pairs
-            for symbol_1 in corr_matrix.columns:
-                for symbol_2 in corr_matrix.columns:
-                    correlation_records.append({
-                        'date': current_date,
-                        'symbol_1': symbol_1,
-                        'symbol_2': symbol_2,
-                        'correlation': corr_matrix.loc[symbol_1, symbol_2]
-                    })
+    def select_new_rows(self, df: pd.DataFrame, marks: Dict[str, Optional[date]]) -> pd.DataFrame:
+        """
+        Keep rows dated after their symbol's high-water mark.
 
-        result = pd.DataFrame(correlation_records)
+        Args:
+            df: DataFrame with columns: symbol, date, ...
+            marks: Dict mapping symbol -> mark (None or missing keeps all rows)
 
-        print(f"  ✅ Calculated {len(result)} correlation pairs ({len(result) // (len(INSTRUMENTS) ** 2)} dates)")
-        return result
+        Returns:
+            The rows of df that are new
+        """
+        if df.empty or not marks:
+            return df
+        cutoffs = df['symbol'].map(
+            {symbol: pd.Timestamp(mark) for symbol, mark in marks.items() if mark is not None}
+        )
+        return df[cutoffs.isna() | (df['date'] > cutoffs)]
 
     async def run_all_calculations(self, backfill: bool = False):
         """
         Run all metric calculations and store in database.
 
         Args:
-            backfill: If True, recalculate all historical metrics
+            backfill: If True, recalculate all historical metrics instead of
+                      only the dates after each high-water mark
         """
         print("\n🚀 Starting metrics calculation...")
         print("=" * 60)
 
-        # Load daily bars
-        daily_bars = await self.db.load_daily_bars()
+        if backfill:
+            # Full recompute of every date
+            marks, correlation_mark = {}, None
+            daily_bars = await self.db.load_daily_bars()
+        else:
+            # Only dates after each high-water mark, plus their lookback.
+            # Bars load from the earlier of a symbol's mark and the
+            # correlation mark, so both have their windows
+            marks, correlation_mark = await self.db.load_high_water_marks(INSTRUMENTS)
+            # Re-fetched bars may have been revised: recompute their dates too
+            floor = refetch_floor()
+            marks = {symbol: min(mark, floor) if mark else None for symbol, mark in marks.items()}
+            correlation_mark = min(correlation_mark, floor) if correlation_mark else None
+            load_marks = {
+                symbol: min(mark, correlation_mark) if mark and correlation_mark else None
+                for symbol, mark in marks.items()
+            }
+            daily_bars = await self.db.load_daily_bars_since(load_marks, LOOKBACK_BARS)
 
         if daily_bars.empty:
             print("❌ No daily bars found in database. Run fetch_market_data.py first.")
@@ -326,18 +441,29 @@ class MetricsCalculator:
 
         # 1. Calculate daily log returns
         daily_log_returns = self.calculate_daily_log_returns(daily_bars)
-        await self.db.upsert_daily_log_returns(daily_log_returns)
+        await self.db.upsert_daily_log_returns(self.select_new_rows(daily_log_returns, marks))
 
         # 2. Calculate 7-day log returns
         log_returns_7d = self.calculate_7day_log_returns(daily_bars)
-        await self.db.upsert_7day_log_returns(log_returns_7d)
+        await self.db.upsert_7day_log_returns(self.select_new_rows(log_returns_7d, marks))
 
-        # 3. Calculate correlation matrix
-        correlation_matrix = self.calculate_correlation_matrix(log_returns_7d, window=CORRELATION_WINDOW)
+        # 3. Calculate correlation matrix (the lookback rows feed the windows)
+        correlation_matrix = self.calculate_correlation_matrix(
+            log_returns_7d, window=CORRELATION_WINDOW, since=correlation_mark
+        )
         await self.db.upsert_correlation_matrix(correlation_matrix)
 
         print("\n✅ All metrics calculated and stored successfully")
 
+        # 4. Warm dashboard caches that read these tables
+        warmed = await warm_after_update(
+            TABLE_DAILY_LOG_RETURNS,
+            TABLE_ROLLING_7DAY_LOG_RETURNS,
+            TABLE_CORRELATION_MATRIX,
+        )
+        if warmed:
+            print(f"🔥 Warmed {sum(warmed.values())}/{len(warmed)} cache keys")
+
 
 # ============================================================================
 # MAIN
@@ -353,7 +479,7 @@ async def main():
     parser.add_argument(
         "--backfill",
         action="store_true",
-        help="Recalculate all historical metrics (default: only new data)"
+        help="Recalculate all historical metrics (default: only dates after each high-water mark)"
     )
 
     args = parser.parse_args()
@@ -367,6 +493,7 @@ async def main():
     finally:
         # Close database connection pool
         await close_pool()
+        await close_redis_pool()
 
 
 if __name__ == "__main__":
@@ -19,6 +19,9 @@ ASYNC PATTERNS USED:
     - All database operations use 'await'
     - Parameter placeholders use $1, $2, $3 (not %s)
 
+The materialized leaderboard (mv_leaderboard) is refreshed CONCURRENTLY
+once the metrics are written, so dashboard reads stay index scans.
+
 Usage:
     python calculate_performance.py              # Calculate all-time metrics
     python calculate_performance.py --weeks 4    # Calculate 4-week metrics
@@ -39,7 +42,8 @@ from dotenv import load_dotenv
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.db.pool import get_pool, init_pool, close_pool
+from backend.db.pool import POOL_BATCH, get_pool, init_pool, close_pool
+from backend.db.performance_db import refresh_leaderboard
 
 load_dotenv()
 
@@ -96,10 +100,11 @@ class PerformanceDB:
 
         # ASYNC PATTERN: Direct pool usage (advanced)
         # - Use when you need fine-grained control over connection
-        # - get_pool() returns the global connection pool singleton
+        # - get_pool(POOL_BATCH) returns the batch pool (falls back to primary),
+        #   keeping long metric scans off the pool that serves the API
         # - 'async with pool.acquire()' automatically gets/releases connection
         # - Connection is returned to pool on exit (even on exception)
-        pool = get_pool()
+        pool = get_pool(POOL_BATCH)
         async with pool.acquire() as conn:
             # ASYNC PATTERN: Use await with conn.fetch()
             # - conn.fetch() returns all rows as list of Record objects
@@ -152,13 +157,16 @@ class PerformanceDB:
             for _, row in df.iterrows()
         ]
 
-        pool = get_pool()
+        pool = get_pool(POOL_BATCH)
         async with pool.acquire() as conn:
             # ASYNC PATTERN: Use await with conn.executemany() for batch operations
             # - executemany() runs all operations in a single transaction
             # - All rows succeed or all fail (atomic)
             # - 10-100x faster than individual execute() calls
             # - Use $1, $2, $3 placeholders (not %s, %s, %s)
+            # The conflict target is the expression of the unique index
+            # idx_account_performance_account_lookback, so all-time rows
+            # (weeks_lookback NULL) update in place instead of duplicating
             await conn.executemany(
                 """
                 INSERT INTO account_performance (
@@ -167,7 +175,7 @@ class PerformanceDB:
                     avg_conviction, max_conviction, calculated_at
                 )
                 VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                ON CONFLICT (account, weeks_lookback) DO UPDATE SET
+                ON CONFLICT (account, (COALESCE(weeks_lookback, 0))) DO UPDATE SET
                     total_return = EXCLUDED.total_return,
                     sharpe_ratio = EXCLUDED.sharpe_ratio,
                     max_drawdown = EXCLUDED.max_drawdown,
@@ -324,12 +332,14 @@ def calculate_account_metrics(weekly_df: pd.DataFrame, account: str) -> dict:
     }
 
 
-async def calculate_performance(weeks_lookback: int = None):
+async def calculate_performance(weeks_lookback: int = None, refresh_views: bool = True):
     """
     Calculate performance metrics for all accounts.
 
     Args:
         weeks_lookback: Number of weeks to look back (None = all time)
+        refresh_views: Refresh the materialized leaderboard afterwards
+                       (pass False when more periods follow, see main())
     """
     period_label = f"{weeks_lookback}w" if weeks_lookback else "all-time"
     print(f"\n{'='*60}")
@@ -374,9 +384,19 @@ async def calculate_performance(weeks_lookback: int = None):
     print(f"\n💾 Saving {period_label} metrics to database...")
     await db.upsert_account_performance(metrics_df)
 
+    if refresh_views:
+        await refresh_materialized_views()
+
     print(f"\n✅ {period_label.capitalize()} performance calculation complete!")
 
 
+async def refresh_materialized_views():
+    """Refresh the dashboard's materialized leaderboard (CONCURRENTLY)."""
+    print("🔄 Refreshing materialized leaderboard...")
+    refreshed_at = await refresh_leaderboard()
+    print(f"  ✅ mv_leaderboard refreshed at {refreshed_at}")
+
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
@@ -414,9 +434,10 @@ Examples:
     try:
         if args.all:
             # Calculate all time periods
-            await calculate_performance(None)  # All-time
-            await calculate_performance(4)     # 4 weeks
-            await calculate_performance(8)     # 8 weeks
+            await calculate_performance(None, refresh_views=False)  # All-time
+            await calculate_performance(4, refresh_views=False)     # 4 weeks
+            await calculate_performance(8, refresh_views=False)     # 8 weeks
+            await refresh_materialized_views()
         else:
             # Calculate single time period
             await calculate_performance(args.weeks)
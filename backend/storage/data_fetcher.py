@@ -10,6 +10,10 @@ Runs via cron job:
 - Daily: 17:00 ET (after market close) - fetch daily bars
 - Hourly: :00, :05 past checkpoint hours - fetch snapshots
 
+Bars for the whole universe are fetched with multi-symbol requests
+(backend/alpaca_integration/bars.py): chunked, paginated, run with bounded
+concurrency and throttled by the API key's shared rate limiter.
+
 Database: PostgreSQL (llm_trading)
 """
 
@@ -26,7 +30,17 @@ from dotenv import load_dotenv
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from multi_alpaca_client import MultiAlpacaManager
-from backend.db.pool import get_pool
+from backend.alpaca_integration.bars import (
+    BarFetcher,
+    RestBarsTransport,
+    daily_bar_columns,
+    get_rate_limiter,
+)
+from backend.db.pool import close_pool, get_pool, init_pool
+from backend.http_pool import close_http_clients, init_http_clients
+from backend.db.bulk_loader import bulk_upsert
+from backend.redis_client import close_redis_pool
+from backend.cache.warming import warm_after_update, TABLE_DAILY_BARS
 
 load_dotenv()
 
@@ -124,6 +138,53 @@ class MarketDataManager:
             print(f"  ❌ Error inserting snapshot for {symbol}: {e}")
             return False
 
+    async def insert_daily_bars(self, bars_by_symbol: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        Bulk upsert Alpaca REST bars (keys t, o, h, l, c, v) for many symbols.
+
+        Args:
+            bars_by_symbol: Dict mapping symbol -> bars (BarsResult.bars)
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        columns = daily_bar_columns(bars_by_symbol)
+        if not columns["symbol"]:
+            return 0
+        return await bulk_upsert(
+            "daily_bars",
+            columns,
+            conflict_columns=["symbol", "date"],
+            touch_columns=["created_at"],
+        )
+
+    async def insert_hourly_snapshots(self, snapshots: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Bulk upsert hourly snapshots.
+
+        Args:
+            snapshots: Dict mapping symbol -> {"timestamp", "price", "volume"}
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        if not snapshots:
+            return 0
+        timestamps = [datetime.fromisoformat(s["timestamp"]) for s in snapshots.values()]
+        return await bulk_upsert(
+            "hourly_snapshots",
+            {
+                "symbol": list(snapshots.keys()),
+                "timestamp": timestamps,
+                "date": [ts.date() for ts in timestamps],
+                "hour": [ts.hour for ts in timestamps],
+                "price": [float(s["price"]) for s in snapshots.values()],
+                "volume": [int(s.get("volume", 0)) for s in snapshots.values()],
+            },
+            conflict_columns=["symbol", "timestamp"],
+            touch_columns=["created_at"],
+        )
+
     async def log_fetch(self, fetch_type: str, symbol: str, success: bool, error: str = None):
         """Log a fetch attempt."""
         pool = get_pool()
@@ -141,46 +202,103 @@ class MarketDataManager:
         """Get 30 days of daily bars for a symbol."""
         pool = get_pool()
         async with pool.acquire() as conn:
+            # Prices are cast to float8 in SQL: asyncpg decodes them straight
+            # to floats instead of building a Decimal per value
             rows = await conn.fetch("""
-                SELECT date, open, high, low, close, volume
+                SELECT date,
+                       open::float8 AS open, high::float8 AS high,
+                       low::float8 AS low, close::float8 AS close, volume
                 FROM daily_bars
                 WHERE symbol = $1 AND date >= CURRENT_DATE - INTERVAL '30 days'
                 ORDER BY date DESC
             """, symbol)
-            result = []
-            for row in rows:
-                r = dict(row)
-                # Ensure numerics are floats
-                for key in ['open', 'high', 'low', 'close']:
-                    if r.get(key) is not None:
-                        r[key] = float(r[key])
-                if r.get('volume') is not None:
-                    r['volume'] = int(r['volume'])
-                result.append(r)
-            return result
+            return [dict(row) for row in rows]
 
     async def get_current_price(self, symbol: str) -> Optional[float]:
         """Get the most recent price for a symbol."""
         pool = get_pool()
         async with pool.acquire() as conn:
-            # Try hourly snapshot first
+            # latest_prices is maintained on write: hourly snapshot price
+            # first, daily close as fallback
             row = await conn.fetchrow("""
-                SELECT price FROM hourly_snapshots
+                SELECT COALESCE(price, close) AS price
+                FROM latest_prices
                 WHERE symbol = $1
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """, symbol)
-            if row:
-                return float(row["price"])
-
-            # Fall back to daily close
-            row = await conn.fetchrow("""
-                SELECT close as price FROM daily_bars
-                WHERE symbol = $1
-                ORDER BY date DESC
-                LIMIT 1
             """, symbol)
-            return float(row["price"]) if row else None
+            return float(row["price"]) if row and row["price"] is not None else None
+
+    async def get_universe_snapshot(
+        self,
+        symbols: List[str],
+        bar_days: int = 30,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get prices and recent bars for every symbol in one round-trip.
+
+        Replaces per-symbol get_30day_bars() + get_current_price() loops with
+        one set-based query (current prices from latest_prices, week open via
+        DISTINCT ON over daily_bars).
+
+        Args:
+            symbols: Symbols to include
+            bar_days: Days of daily bars to return (0 skips bars)
+
+        Returns:
+            Dict mapping symbol -> {
+                "current_price": latest hourly snapshot, else latest daily close,
+                "week_open": first close of the trading week (Thursday onwards),
+                "bars": daily bars, newest first (same shape as get_30day_bars)
+            }
+        """
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch("""
+                WITH week_open AS (
+                    SELECT DISTINCT ON (symbol) symbol, close
+                    FROM daily_bars
+                    WHERE symbol = ANY($1::text[])
+                        AND date >= date_trunc('week', CURRENT_DATE) + INTERVAL '3 days'
+                        AND date < date_trunc('week', CURRENT_DATE) + INTERVAL '10 days'
+                    ORDER BY symbol, date ASC
+                ),
+                recent AS (
+                    SELECT symbol, date, open, high, low, close, volume
+                    FROM daily_bars
+                    WHERE symbol = ANY($1::text[])
+                        AND $2::int > 0
+                        AND date >= CURRENT_DATE - $2::int
+                )
+                SELECT u.symbol,
+                       COALESCE(lp.price, lp.close)::float8 AS current_price,
+                       w.close::float8 AS week_open,
+                       r.date, r.open::float8 AS open, r.high::float8 AS high,
+                       r.low::float8 AS low, r.close::float8 AS close, r.volume
+                FROM unnest($1::text[]) AS u(symbol)
+                LEFT JOIN latest_prices lp ON lp.symbol = u.symbol
+                LEFT JOIN week_open w ON w.symbol = u.symbol
+                LEFT JOIN recent r ON r.symbol = u.symbol
+                ORDER BY u.symbol, r.date DESC
+            """, list(symbols), bar_days)
+
+        universe: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            entry = universe.get(row["symbol"])
+            if entry is None:
+                entry = universe[row["symbol"]] = {
+                    "current_price": float(row["current_price"]) if row["current_price"] is not None else None,
+                    "week_open": float(row["week_open"]) if row["week_open"] is not None else None,
+                    "bars": [],
+                }
+            if row["date"] is not None:
+                entry["bars"].append({
+                    "date": row["date"],
+                    "open": float(row["open"]) if row["open"] is not None else None,
+                    "high": float(row["high"]) if row["high"] is not None else None,
+                    "low": float(row["low"]) if row["low"] is not None else None,
+                    "close": float(row["close"]) if row["close"] is not None else None,
+                    "volume": int(row["volume"]) if row["volume"] is not None else None,
+                })
+        return universe
 
     async def get_checkpoint_snapshot(self, symbol: str, date: str, hour: int) -> Optional[Dict[str, Any]]:
         """Get a specific checkpoint snapshot for a symbol."""
@@ -201,124 +319,102 @@ class MarketDataManager:
 class MarketDataFetcher:
     """Fetch market data from Alpaca and store in PostgreSQL."""
 
+    # Accounts tried in order when a key is rejected (401)
+    ACCOUNTS = ["COUNCIL", "GEMINI", "CLAUDE", "CHATGPT"]
+
     def __init__(self):
         self.db = MarketDataManager()
         self.manager = MultiAlpacaManager()
         self.client = self.manager.get_client("COUNCIL")
+        self.bars = self.bar_fetcher("COUNCIL")
+
+    def bar_fetcher(self, account_name: str) -> BarFetcher:
+        """Multi-symbol bar fetcher using an account's key (and its rate limiter)."""
+        headers = self.manager.get_client(account_name).headers
+        return BarFetcher(
+            RestBarsTransport(headers),
+            get_rate_limiter(headers.get("APCA-API-KEY-ID")),
+        )
+
+    async def _log_results(self, fetch_type: str, symbols: List[str], errors: Dict[str, str]) -> None:
+        for symbol in symbols:
+            await self.db.log_fetch(fetch_type, symbol, symbol not in errors, errors.get(symbol))
 
     async def seed_initial_data(self, days: int = 30):
         """Seed database with initial historical data."""
-        from datetime import datetime, timedelta
-
         print(f"\n🌱 Seeding initial data: Last {days} days")
         print("=" * 60)
 
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days + 10)
 
+        bars: Dict[str, List[Dict[str, Any]]] = {}
+        errors: Dict[str, str] = {}
+        pending = list(INSTRUMENTS)
+        for account_name in self.ACCOUNTS:
+            if account_name != "COUNCIL":
+                print(f"  🔄 Trying {account_name} account for {len(pending)} symbols...")
+            result = await self.bar_fetcher(account_name).fetch(
+                pending, "1Day", start=start_date, end=end_date, adjustment="raw"
+            )
+            bars.update(result.bars)
+            errors.update(result.errors)
+            # Symbols whose key was rejected are retried with the next account
+            pending = [symbol for symbol, error in result.errors.items() if "401" in error]
+            if not pending or account_name == self.ACCOUNTS[-1]:
+                break
+            for symbol in pending:
+                del errors[symbol]
+
         for symbol in INSTRUMENTS:
-            print(f"\n📊 Fetching {symbol}...")
-
-            # Try multiple accounts if one fails with 401
-            accounts_to_try = ["COUNCIL", "GEMINI", "CLAUDE", "CHATGPT"]
-            success = False
-
-            for account_name in accounts_to_try:
-                try:
-                    # Switch to different account if needed
-                    if account_name != "COUNCIL":
-                        print(f"  🔄 Trying {account_name} account...")
-                        self.client = self.manager.get_client(account_name)
-
-                    bars = await self.client.get_bars(
-                        symbol=symbol,
-                        timeframe="1Day",
-                        limit=100,
-                        start=start_date.isoformat() + "Z",
-                        end=end_date.isoformat() + "Z",
-                        adjustment="raw"
-                    )
-
-                    if not bars:
-                        print(f"  ⚠️  No bars returned for {symbol}")
-                        break  # No point trying other accounts if no data exists
-
-                    inserted = 0
-                    for bar in bars:
-                        bar_data = {
-                            "date": bar["t"][:10],
-                            "open": float(bar["o"]),
-                            "high": float(bar["h"]),
-                            "low": float(bar["l"]),
-                            "close": float(bar["c"]),
-                            "volume": int(bar["v"])
-                        }
-                        if await self.db.insert_daily_bar(symbol, bar_data):
-                            inserted += 1
-
-                    print(f"  ✅ Inserted {inserted} bars for {symbol} (via {account_name})")
-                    await self.db.log_fetch("seed", symbol, True)
-                    success = True
-                    break  # Success, move to next symbol
-
-                except Exception as e:
-                    error_msg = str(e)
-                    if "401" in error_msg and account_name != accounts_to_try[-1]:
-                        # Try next account
-                        continue
-                    else:
-                        # Last account or different error
-                        print(f"  ❌ Error fetching {symbol}: {e}")
-                        await self.db.log_fetch("seed", symbol, False, str(e))
-                        break
+            if symbol in errors:
+                print(f"  ❌ Error fetching {symbol}: {errors[symbol]}")
+            elif not bars.get(symbol):
+                print(f"  ⚠️  No bars returned for {symbol}")
 
+        try:
+            inserted = await self.db.insert_daily_bars(bars)
+            print(f"\n  ✅ Inserted {inserted} bars for {sum(1 for b in bars.values() if b)} symbols")
+        except Exception as e:
+            print(f"  ❌ Error inserting bars: {e}")
+            errors.update({symbol: str(e) for symbol in bars})
+
+        await self._log_results("seed", INSTRUMENTS, errors)
         print("\n✅ Initial data seeding complete")
+        await warm_after_update(TABLE_DAILY_BARS)
+
+    async def update_daily_bars(self, days: int = 5):
+        """
+        Fetch and update daily bars for all instruments.
 
-    async def update_daily_bars(self):
-        """Fetch and update daily bars for all instruments."""
+        Fetches the last `days` days in one multi-symbol request per chunk so
+        a missed run is caught up; existing bars are upserted.
+        """
         print("\n📈 Updating daily bars")
         print("=" * 60)
 
-        for symbol in INSTRUMENTS:
-            print(f"\n📊 Updating {symbol}...")
-
-            try:
-                bars = await self.client.get_bars(
-                    symbol=symbol,
-                    timeframe="1Day",
-                    limit=1
-                )
-
-                if not bars:
-                    print(f"  ⚠️  No bars returned for {symbol}")
-                    continue
-
-                bar = bars[0]
-                bar_data = {
-                    "date": bar["t"][:10],
-                    "open": float(bar["o"]),
-                    "high": float(bar["h"]),
-                    "low": float(bar["l"]),
-                    "close": float(bar["c"]),
-                    "volume": int(bar["v"])
-                }
-
-                latest_date = await self.db.get_latest_date(symbol)
-                if latest_date == bar_data["date"]:
-                    print(f"  ✓ Already have data for {bar_data['date']}")
-                    continue
+        end_date = datetime.now()
+        result = await self.bars.fetch(
+            INSTRUMENTS, "1Day", start=end_date - timedelta(days=days), end=end_date
+        )
+        errors = dict(result.errors)
 
-                if await self.db.insert_daily_bar(symbol, bar_data):
-                    print(f"  ✅ Inserted bar for {bar_data['date']}")
-                    await self.db.log_fetch("daily_close", symbol, True)
-                else:
-                    await self.db.log_fetch("daily_close", symbol, False, "Insert failed")
+        for symbol in INSTRUMENTS:
+            if symbol in errors:
+                print(f"  ❌ Error updating {symbol}: {errors[symbol]}")
+            elif not result.bars.get(symbol):
+                print(f"  ⚠️  No bars returned for {symbol}")
 
-            except Exception as e:
-                print(f"  ❌ Error updating {symbol}: {e}")
-                await self.db.log_fetch("daily_close", symbol, False, str(e))
+        try:
+            inserted = await self.db.insert_daily_bars(result.bars)
+            print(f"  ✅ Upserted {inserted} bars ({result.requests} requests)")
+        except Exception as e:
+            print(f"  ❌ Error inserting bars: {e}")
+            errors.update({symbol: str(e) for symbol in result.bars})
 
+        await self._log_results("daily_close", INSTRUMENTS, errors)
         print("\n✅ Daily bars updated")
+        await warm_after_update(TABLE_DAILY_BARS)
 
     async def fetch_hourly_snapshots(self):
         """Fetch current price snapshots for all instruments."""
@@ -333,36 +429,35 @@ class MarketDataFetcher:
             print(f"  ⏭️  Skipping (not a checkpoint hour)")
             return
 
-        for symbol in INSTRUMENTS:
-            print(f"  📸 {symbol}...", end=" ")
-
-            try:
-                bars = await self.client.get_bars(
-                    symbol=symbol,
-                    timeframe="1Min",
-                    limit=1
-                )
-
-                if not bars:
-                    print("⚠️  No data")
-                    continue
+        # Latest minute bar of every symbol in one request per chunk
+        result = await self.bars.fetch_latest(INSTRUMENTS)
 
-                bar = bars[0]
-                snapshot = {
-                    "timestamp": timestamp,
-                    "price": float(bar["c"]),
-                    "volume": int(bar["v"])
-                }
-
-                if await self.db.insert_hourly_snapshot(symbol, snapshot):
-                    print("✅")
-                    await self.db.log_fetch("hourly_snapshot", symbol, True)
-                else:
-                    print("❌")
-                    await self.db.log_fetch("hourly_snapshot", symbol, False, "Insert failed")
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        for symbol in INSTRUMENTS:
+            bars = result.bars.get(symbol)
+            if symbol in result.errors:
+                print(f"  📸 {symbol}... ❌ {result.errors[symbol]}")
+                await self.db.log_fetch("hourly_snapshot", symbol, False, result.errors[symbol])
+                continue
+            if not bars:
+                print(f"  📸 {symbol}... ⚠️  No data")
+                continue
+            bar = bars[-1]
+            snapshots[symbol] = {
+                "timestamp": timestamp,
+                "price": float(bar["c"]),
+                "volume": int(bar["v"])
+            }
+            print(f"  📸 {symbol}... ✅")
 
-            except Exception as e:
-                print(f"❌ {e}")
+        # Write all snapshots in one bulk upsert
+        try:
+            await self.db.insert_hourly_snapshots(snapshots)
+            for symbol in snapshots:
+                await self.db.log_fetch("hourly_snapshot", symbol, True)
+        except Exception as e:
+            print(f"  ❌ Error inserting snapshots: {e}")
+            for symbol in snapshots:
                 await self.db.log_fetch("hourly_snapshot", symbol, False, str(e))
 
         print("\n✅ Hourly snapshots updated")
@@ -374,8 +469,11 @@ class MarketDataFetcher:
             "instruments": {}
         }
 
+        universe = await self.db.get_universe_snapshot(INSTRUMENTS, bar_days=30)
+
         for symbol in INSTRUMENTS:
-            bars = await self.db.get_30day_bars(symbol)
+            data = universe.get(symbol)
+            bars = data["bars"] if data else []
 
             if not bars:
                 print(f"  ⚠️  No data for {symbol}")
@@ -386,7 +484,7 @@ class MarketDataFetcher:
             sma_50 = sum(closes[:50]) / 50 if len(closes) >= 50 else None
             rsi_14 = self._calculate_rsi(closes, 14) if len(closes) >= 14 else None
 
-            current_price = await self.db.get_current_price(symbol)
+            current_price = data["current_price"]
             latest = bars[0]
             previous = bars[1] if len(bars) > 1 else latest
             change_pct = ((current_price - previous["close"]) / previous["close"]) * 100 if previous["close"] > 0 else 0.0
@@ -423,20 +521,12 @@ class MarketDataFetcher:
             "instruments": {}
         }
 
-        pool = get_pool()
-        for symbol in INSTRUMENTS:
-            current_price = await self.db.get_current_price(symbol)
+        universe = await self.db.get_universe_snapshot(INSTRUMENTS, bar_days=0)
 
-            # Get week open
-            async with pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT close FROM daily_bars
-                    WHERE symbol = $1 AND date >= date_trunc('week', CURRENT_DATE) + INTERVAL '3 days'
-                        AND date < date_trunc('week', CURRENT_DATE) + INTERVAL '10 days'
-                    ORDER BY date ASC
-                    LIMIT 1
-                """, symbol)
-                week_open = row["close"] if row else None
+        for symbol in INSTRUMENTS:
+            data = universe.get(symbol, {})
+            current_price = data.get("current_price")
+            week_open = data.get("week_open")
 
             if current_price and week_open:
                 change_pct = ((current_price - week_open) / week_open) * 100
@@ -488,14 +578,21 @@ async def main():
 
     args = parser.parse_args()
 
-    fetcher = MarketDataFetcher()
-
-    if args.command == "seed":
-        await fetcher.seed_initial_data(days=args.days)
-    elif args.command == "daily":
-        await fetcher.update_daily_bars()
-    elif args.command == "hourly":
-        await fetcher.fetch_hourly_snapshots()
+    await init_pool()
+    await init_http_clients()
+    try:
+        fetcher = MarketDataFetcher()
+
+        if args.command == "seed":
+            await fetcher.seed_initial_data(days=args.days)
+        elif args.command == "daily":
+            await fetcher.update_daily_bars()
+        elif args.command == "hourly":
+            await fetcher.fetch_hourly_snapshots()
+    finally:
+        await close_http_clients()
+        await close_redis_pool()  # Opened lazily by warm_after_update()
+        await close_pool()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,13 @@ Fetch market data using alpaca-py SDK and store in PostgreSQL.
 This script uses the modern alpaca-py library with StockHistoricalDataClient
 for reliable market data access. It's designed to run via cron for periodic updates.
 
+Bars for the whole universe are fetched with multi-symbol requests through
+the shared engine in backend/alpaca_integration/bars.py (chunked, bounded
+concurrency, per-key rate limiter), the same one data_fetcher.py uses.
+The synchronous SDK client runs in worker threads, so the event loop never
+blocks on HTTP: the universe is split into one chunk per worker and the
+chunks are fetched concurrently, then upserted in one column-wise load.
+
 Usage:
     python fetch_market_data.py seed --days 30    # Initial seed (30 days)
     python fetch_market_data.py daily             # Daily update (run after market close)
@@ -31,13 +38,21 @@ from dotenv import load_dotenv
 
 # Modern Alpaca SDK
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockBarsRequest
-from alpaca.data.timeframe import TimeFrame
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from backend.alpaca_integration.bars import (
+    CONCURRENCY,
+    BarFetcher,
+    SdkBarsTransport,
+    daily_bar_columns,
+    get_rate_limiter,
+)
 from backend.db.pool import get_pool, init_pool, close_pool
+from backend.db.bulk_loader import bulk_upsert
+from backend.redis_client import close_redis_pool
+from backend.cache.warming import warm_after_update, TABLE_DAILY_BARS
 
 load_dotenv()
 
@@ -99,6 +114,27 @@ class MarketDataDB:
             print(f"  ❌ Error inserting bar for {symbol}: {e}")
             return False
 
+    async def upsert_bars(self, bars_by_symbol: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        Bulk upsert bars of many symbols in one load.
+
+        Args:
+            bars_by_symbol: Dict mapping symbol -> bars in the REST shape
+                            (t, o, h, l, c, v), as returned by BarFetcher
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        columns = daily_bar_columns(bars_by_symbol)
+        if not columns["symbol"]:
+            return 0
+        return await bulk_upsert(
+            "daily_bars",
+            columns,
+            conflict_columns=["symbol", "date"],
+            touch_columns=["created_at"],
+        )
+
     async def log_fetch(self, fetch_type: str, symbol: str, success: bool, error: str = None):
         """Log a fetch attempt using async pool."""
         pool = get_pool()
@@ -124,8 +160,38 @@ class AlpacaMarketDataFetcher:
             raise ValueError("Alpaca API credentials not found in .env file")
         
         self.client = StockHistoricalDataClient(ALPACA_API_KEY, ALPACA_SECRET_KEY)
+        # One chunk per worker thread so the universe is fetched concurrently
+        self.bars = BarFetcher(
+            SdkBarsTransport(self.client),
+            get_rate_limiter(ALPACA_API_KEY),
+            chunk_size=-(-len(INSTRUMENTS) // CONCURRENCY),
+        )
         print(f"✅ Initialized Alpaca data client")
 
+    async def _fetch_and_store(self, fetch_type: str, start_date: datetime, end_date: datetime) -> None:
+        """Fetch daily bars for the universe and upsert them in one load."""
+        result = await self.bars.fetch(INSTRUMENTS, "1Day", start=start_date, end=end_date)
+        errors = dict(result.errors)
+
+        for symbol in INSTRUMENTS:
+            if symbol in errors:
+                print(f"  ❌ Error fetching {symbol}: {errors[symbol]}")
+            elif not result.bars.get(symbol):
+                print(f"  ⚠️  No bars returned for {symbol}")
+                errors[symbol] = "No data returned"
+            else:
+                print(f"  📊 {symbol}: {len(result.bars[symbol])} bars")
+
+        try:
+            inserted = await self.db.upsert_bars(result.bars)
+            print(f"  ✅ Upserted {inserted} bars ({result.requests} requests)")
+        except Exception as e:
+            print(f"  ❌ Error inserting bars: {e}")
+            errors.update({symbol: str(e) for symbol in result.bars})
+
+        for symbol in INSTRUMENTS:
+            await self.db.log_fetch(fetch_type, symbol, symbol not in errors, errors.get(symbol))
+
     async def seed_initial_data(self, days: int = 180):
         """
         Seed database with initial historical data.
@@ -139,52 +205,7 @@ class AlpacaMarketDataFetcher:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days + 10)  # Extra buffer for weekends
 
-        for symbol in INSTRUMENTS:
-            print(f"\n📊 Fetching {symbol}...")
-
-            try:
-                # Create request using modern SDK
-                request_params = StockBarsRequest(
-                    symbol_or_symbols=[symbol],
-                    timeframe=TimeFrame.Day,
-                    start=start_date,
-                    end=end_date
-                )
-
-                # Fetch bars
-                bars_response = self.client.get_stock_bars(request_params)
-
-                # Convert to DataFrame for easier processing
-                df = bars_response.df
-
-                if df.empty:
-                    print(f"  ⚠️  No bars returned for {symbol}")
-                    await self.db.log_fetch("seed", symbol, False, "No data returned")
-                    continue
-
-                # Insert each bar into database
-                # Note: DataFrame has MultiIndex (symbol, timestamp)
-                inserted = 0
-                for index, row in df.iterrows():
-                    # index is a tuple: (symbol, timestamp)
-                    symbol_from_index, timestamp = index
-                    bar_data = {
-                        "date": timestamp.strftime("%Y-%m-%d"),
-                        "open": float(row['open']),
-                        "high": float(row['high']),
-                        "low": float(row['low']),
-                        "close": float(row['close']),
-                        "volume": int(row['volume'])
-                    }
-                    if await self.db.insert_daily_bar(symbol, bar_data):
-                        inserted += 1
-
-                print(f"  ✅ Inserted {inserted} bars for {symbol}")
-                await self.db.log_fetch("seed", symbol, True)
-
-            except Exception as e:
-                print(f"  ❌ Error fetching {symbol}: {e}")
-                await self.db.log_fetch("seed", symbol, False, str(e))
+        await self._fetch_and_store("seed", start_date, end_date)
 
         print("\n✅ Initial data seeding complete")
 
@@ -199,45 +220,7 @@ class AlpacaMarketDataFetcher:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=5)
 
-        for symbol in INSTRUMENTS:
-            print(f"\n📊 Updating {symbol}...")
-
-            try:
-                request_params = StockBarsRequest(
-                    symbol_or_symbols=[symbol],
-                    timeframe=TimeFrame.Day,
-                    start=start_date,
-                    end=end_date
-                )
-
-                bars_response = self.client.get_stock_bars(request_params)
-                df = bars_response.df
-
-                if df.empty:
-                    print(f"  ⚠️  No new bars for {symbol}")
-                    continue
-
-                inserted = 0
-                for index, row in df.iterrows():
-                    # index is a tuple: (symbol, timestamp)
-                    symbol_from_index, timestamp = index
-                    bar_data = {
-                        "date": timestamp.strftime("%Y-%m-%d"),
-                        "open": float(row['open']),
-                        "high": float(row['high']),
-                        "low": float(row['low']),
-                        "close": float(row['close']),
-                        "volume": int(row['volume'])
-                    }
-                    if await self.db.insert_daily_bar(symbol, bar_data):
-                        inserted += 1
-
-                print(f"  ✅ Updated {inserted} bars for {symbol}")
-                await self.db.log_fetch("daily", symbol, True)
-
-            except Exception as e:
-                print(f"  ❌ Error updating {symbol}: {e}")
-                await self.db.log_fetch("daily", symbol, False, str(e))
+        await self._fetch_and_store("daily", start_date, end_date)
 
         print("\n✅ Daily update complete")
 
@@ -292,14 +275,31 @@ async def main():
             try:
                 from backend.storage.calculate_metrics import MetricsCalculator
                 calculator = MetricsCalculator()
-                await calculator.run_all_calculations()
+                # A seed re-fetches history (bars may be revised): recompute
+                # everything. Daily updates only compute the new dates.
+                await calculator.run_all_calculations(backfill=args.command == "seed")
             except Exception as e:
                 print(f"⚠️  Warning: Metrics calculation failed: {e}")
                 print("   You can run it manually with: python backend/storage/calculate_metrics.py")
 
+        # Warm price-derived dashboard caches (metrics keys are warmed above)
+        if args.command in ["seed", "daily"]:
+            await warm_after_update(TABLE_DAILY_BARS)
+
+        # Create upcoming monthly partitions and apply retention
+        if args.command == "daily":
+            try:
+                from backend.db.partitions import maintain_partitions
+                result = await maintain_partitions()
+                print(f"✅ Partitions: {len(result['created'])} created, {len(result['dropped'])} dropped")
+            except Exception as e:
+                print(f"⚠️  Warning: Partition maintenance failed: {e}")
+                print("   You can run it manually with: python backend/storage/migrate_partitions.py --maintain")
+
     finally:
         # Close database connection pool
         await close_pool()
+        await close_redis_pool()
 
 
 if __name__ == "__main__":
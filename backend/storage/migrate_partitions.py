@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Convert execution_events and hourly_snapshots to monthly range partitions.
+
+PostgreSQL cannot ALTER an existing table into a partitioned one, so each
+table is rebuilt in a single transaction:
+
+    1. Save and drop the views that select from the table (e.g.
+       v_account_history); a renamed table carries its views along and
+       could not be dropped
+    2. Rename the old table (and its indexes) out of the way
+    3. Create the partitioned parent (same columns as postgres_schema.sql)
+    4. Create one partition per month from the oldest row through
+       PARTITION_MONTHS_AHEAD months ahead, plus the DEFAULT partition
+    5. Copy rows with INSERT ... SELECT and drop the old table
+    6. Recreate indexes, triggers and the saved views
+
+Order: apply postgres_schema.sql first, then run this script. The schema
+creates the trigger functions the rebuilt tables need (and leaves the
+DEFAULT partitions out while the tables are unpartitioned); the script
+checks for them before changing anything.
+
+Tables that are already partitioned are skipped, so the script is safe to
+re-run. Writers are blocked for the duration of the copy (ACCESS EXCLUSIVE
+lock); run it outside market hours.
+
+Usage:
+    python migrate_partitions.py             # Convert both tables
+    python migrate_partitions.py --dry-run   # Show what would be done
+    python migrate_partitions.py --maintain  # Create upcoming partitions + apply retention
+    python migrate_partitions.py --list      # List partitions
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime
+from typing import List, Tuple
+import argparse
+import asyncio
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.db.pool import POOL_BATCH, get_pool, init_pool, close_pool
+from backend.db.partitions import (
+    PARTITION_MONTHS_AHEAD,
+    PARTITIONED_TABLES,
+    add_months,
+    create_month_partition,
+    is_partitioned,
+    list_partitions,
+    maintain_partitions,
+    month_start,
+)
+
+load_dotenv()
+
+# ============================================================================
+# PARTITIONED TABLE DEFINITIONS (keep in sync with postgres_schema.sql)
+# ============================================================================
+
+PARENT_DDL = {
+    "execution_events": """
+        CREATE TABLE execution_events (
+            id UUID NOT NULL DEFAULT uuid_generate_v4(),
+            week_id VARCHAR(10) NOT NULL,
+            event_type VARCHAR(50) NOT NULL,
+            account VARCHAR(20) NOT NULL,
+            event_data JSONB NOT NULL,
+            occurred_at TIMESTAMPTZ NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            PRIMARY KEY (id, occurred_at)
+        ) PARTITION BY RANGE (occurred_at)
+    """,
+    "hourly_snapshots": """
+        CREATE TABLE hourly_snapshots (
+            id INTEGER NOT NULL DEFAULT nextval('hourly_snapshots_id_seq'),
+            symbol VARCHAR(10) NOT NULL,
+            timestamp TIMESTAMPTZ NOT NULL,
+            date DATE NOT NULL,
+            hour INTEGER NOT NULL,
+            price DECIMAL(12,4),
+            volume BIGINT,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            PRIMARY KEY (id, timestamp),
+            UNIQUE(symbol, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+    """,
+}
+
+COLUMNS = {
+    "execution_events": "id, week_id, event_type, account, event_data, occurred_at, created_at",
+    "hourly_snapshots": "id, symbol, timestamp, date, hour, price, volume, created_at",
+}
+
+# Statements run after the copy (indexes, triggers, sequence ownership)
+POST_DDL = {
+    "execution_events": [
+        "CREATE INDEX idx_events_week ON execution_events(week_id)",
+        "CREATE INDEX idx_events_account ON execution_events(account)",
+        "CREATE INDEX idx_events_type ON execution_events(event_type)",
+        "CREATE INDEX idx_events_occurred ON execution_events(occurred_at DESC)",
+        "CREATE INDEX idx_events_occurred_id ON execution_events(occurred_at DESC, id DESC)",
+        "CREATE INDEX idx_events_account_occurred ON execution_events(account, occurred_at DESC)",
+        "CREATE INDEX idx_events_created_id ON execution_events(created_at, id)",
+        """
+        CREATE TRIGGER trg_execution_events_notify
+            AFTER INSERT OR UPDATE OR DELETE ON execution_events
+            FOR EACH ROW EXECUTE FUNCTION notify_table_change('execution_events')
+        """,
+    ],
+    "hourly_snapshots": [
+        "CREATE INDEX idx_hourly_snapshots_symbol_timestamp ON hourly_snapshots(symbol, timestamp DESC)",
+        "CREATE INDEX idx_hourly_snapshots_date ON hourly_snapshots(date DESC)",
+        "ALTER SEQUENCE hourly_snapshots_id_seq OWNED BY hourly_snapshots.id",
+        """
+        CREATE TRIGGER trg_hourly_snapshots_latest_insert
+            AFTER INSERT ON hourly_snapshots REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_price_from_snapshot()
+        """,
+        """
+        CREATE TRIGGER trg_hourly_snapshots_latest_update
+            AFTER UPDATE ON hourly_snapshots REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_price_from_snapshot()
+        """,
+    ],
+}
+
+
+# Trigger functions POST_DDL needs (created by postgres_schema.sql)
+REQUIRED_FUNCTIONS = {
+    "execution_events": ["notify_table_change()"],
+    "hourly_snapshots": ["sync_latest_price_from_snapshot()"],
+}
+
+
+# ============================================================================
+# MIGRATION
+# ============================================================================
+
+async def dependent_views(conn, table: str) -> List[Tuple[str, str]]:
+    """
+    Views that select from `table`, with their definitions.
+
+    Definitions must be read before the table is renamed: afterwards they
+    refer to the renamed table.
+
+    Returns:
+        List of (view name, SELECT definition)
+    """
+    rows = await conn.fetch("""
+        SELECT DISTINCT v.oid::regclass::text AS name, pg_get_viewdef(v.oid) AS definition
+        FROM pg_depend d
+        JOIN pg_rewrite r ON r.oid = d.objid
+        JOIN pg_class v ON v.oid = r.ev_class
+        WHERE d.classid = 'pg_rewrite'::regclass
+            AND d.refobjid = $1::regclass
+            AND v.oid <> $1::regclass
+            AND v.relkind = 'v'
+    """, table)
+    return [(row["name"], row["definition"]) for row in rows]
+
+
+async def migrate_table(conn, table: str, dry_run: bool = False) -> bool:
+    """
+    Rebuild `table` as a partitioned table (no-op if already partitioned).
+
+    Returns:
+        True if the table was converted
+
+    Raises:
+        RuntimeError: If postgres_schema.sql has not been applied yet
+    """
+    column = PARTITIONED_TABLES[table]
+    if await is_partitioned(conn, table):
+        print(f"✓ {table} is already partitioned")
+        return False
+
+    for function in REQUIRED_FUNCTIONS[table]:
+        if await conn.fetchval("SELECT to_regprocedure($1)", function) is None:
+            raise RuntimeError(
+                f"{table}: function {function} is missing; apply postgres_schema.sql before migrating"
+            )
+
+    oldest = await conn.fetchval(f'SELECT MIN("{column}") FROM {table}')
+    count = await conn.fetchval(f"SELECT COUNT(*) FROM {table}")
+    today = month_start(datetime.utcnow().date())
+    first = month_start(oldest.date()) if oldest else today
+    last = add_months(today, PARTITION_MONTHS_AHEAD)
+
+    print(f"→ {table}: {count} rows, partitions {first:%Y-%m} .. {last:%Y-%m} + default")
+    if dry_run:
+        return False
+
+    old = f"{table}_unpartitioned"
+    async with conn.transaction():
+        await conn.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        views = await dependent_views(conn, table)
+        for name, _definition in views:
+            await conn.execute(f"DROP VIEW {name}")
+        await conn.execute(f"ALTER TABLE {table} RENAME TO {old}")
+
+        # Free index/constraint names for the new parent
+        indexes = await conn.fetch(
+            """
+            SELECT c.relname AS indexname
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE i.indrelid = to_regclass($1)
+            """,
+            old,
+        )
+        for row in indexes:
+            await conn.execute(
+                f"ALTER INDEX {row['indexname']} RENAME TO {row['indexname']}_unpartitioned"
+            )
+        if table == "hourly_snapshots":
+            # Keep the SERIAL sequence alive when the old table is dropped
+            await conn.execute("ALTER SEQUENCE hourly_snapshots_id_seq OWNED BY NONE")
+
+        await conn.execute(PARENT_DDL[table])
+        month = first
+        while month <= last:
+            await create_month_partition(conn, table, month)
+            month = add_months(month, 1)
+        await conn.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        copied = await conn.execute(
+            f"INSERT INTO {table} ({COLUMNS[table]}) SELECT {COLUMNS[table]} FROM {old}"
+        )
+        await conn.execute(f"DROP TABLE {old}")
+        for statement in POST_DDL[table]:
+            await conn.execute(statement)
+        for name, definition in views:
+            await conn.execute(f"CREATE VIEW {name} AS {definition}")
+
+    print(f"✅ {table} partitioned ({copied})")
+    return True
+
+
+async def print_partitions(conn) -> None:
+    """Print partitions and row counts per table."""
+    for table in PARTITIONED_TABLES:
+        if not await is_partitioned(conn, table):
+            print(f"{table}: not partitioned")
+            continue
+        print(f"{table}:")
+        for name, _month in await list_partitions(conn, table):
+            rows = await conn.fetchval(f"SELECT COUNT(*) FROM {name}")
+            print(f"   {name:<40} {rows:>10} rows")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+async def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Partition execution_events and hourly_snapshots by month")
+    parser.add_argument("--dry-run", action="store_true", help="Show the plan without changing anything")
+    parser.add_argument("--maintain", action="store_true", help="Create upcoming partitions and apply retention")
+    parser.add_argument("--list", action="store_true", help="List partitions and row counts")
+    args = parser.parse_args()
+
+    await init_pool(POOL_BATCH)
+    try:
+        if args.maintain:
+            result = await maintain_partitions()
+            print(f"✅ Created {len(result['created'])} partitions, dropped {len(result['dropped'])}")
+            return
+
+        async with get_pool(POOL_BATCH).acquire() as conn:
+            if args.list:
+                await print_partitions(conn)
+                return
+            for table in PARTITIONED_TABLES:
+                await migrate_table(conn, table, dry_run=args.dry_run)
+    finally:
+        await close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
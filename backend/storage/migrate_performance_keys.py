@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Remove duplicate all-time rows from account_performance and key it by lookback.
+
+account_performance used UNIQUE(account, weeks_lookback). All-time metrics
+are stored with weeks_lookback NULL, and NULLs never conflict in a unique
+constraint, so every all-time run inserted another row per account. The
+duplicates also break mv_leaderboard: its unique index on
+(lookback_key, account) cannot be built, and REFRESH ... CONCURRENTLY
+needs it.
+
+In one transaction:
+
+    1. Delete duplicates per (account, COALESCE(weeks_lookback, 0)),
+       keeping the most recently calculated row
+    2. Refresh mv_leaderboard (plainly) so it holds the deduplicated rows
+    3. Apply performance_schema.sql: creates the unique index
+       idx_account_performance_account_lookback the upsert targets, and
+       the mv_leaderboard indexes
+    4. Drop the old UNIQUE(account, weeks_lookback) constraint
+
+Safe to re-run (nothing is deleted once the unique index exists). Run it
+before the next calculate_performance.py run on an existing database.
+
+Usage:
+    python migrate_performance_keys.py             # Migrate
+    python migrate_performance_keys.py --dry-run   # Count duplicates only
+"""
+
+import sys
+from pathlib import Path
+import argparse
+import asyncio
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.db.pool import POOL_BATCH, get_pool, init_pool, close_pool
+
+load_dotenv()
+
+SCHEMA = Path(__file__).parent / "performance_schema.sql"
+OLD_CONSTRAINT = "account_performance_account_weeks_lookback_key"
+
+# Rows with a more recent twin (same account and lookback key)
+DUPLICATES = """
+    FROM account_performance a
+    WHERE EXISTS (
+        SELECT 1 FROM account_performance b
+        WHERE b.account = a.account
+            AND COALESCE(b.weeks_lookback, 0) = COALESCE(a.weeks_lookback, 0)
+            AND (b.calculated_at, b.id) > (a.calculated_at, a.id)
+    )
+"""
+
+
+async def migrate(conn, dry_run: bool = False) -> int:
+    """
+    Deduplicate account_performance and apply the lookback-keyed schema.
+
+    Returns:
+        Number of duplicate rows (deleted unless dry_run)
+    """
+    duplicates = await conn.fetchval(f"SELECT COUNT(*) {DUPLICATES}")
+    print(f"→ account_performance: {duplicates} duplicate rows")
+    if dry_run:
+        return duplicates
+
+    async with conn.transaction():
+        await conn.execute("LOCK TABLE account_performance IN SHARE ROW EXCLUSIVE MODE")
+        await conn.execute(f"DELETE {DUPLICATES}")
+        if await conn.fetchval("SELECT to_regclass('mv_leaderboard')") is not None:
+            await conn.execute("REFRESH MATERIALIZED VIEW mv_leaderboard")
+        await conn.execute(SCHEMA.read_text())
+        await conn.execute(
+            f"ALTER TABLE account_performance DROP CONSTRAINT IF EXISTS {OLD_CONSTRAINT}"
+        )
+
+    print(f"✅ Removed {duplicates} duplicates; account_performance keyed by (account, lookback)")
+    return duplicates
+
+
+async def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Deduplicate account_performance all-time rows")
+    parser.add_argument("--dry-run", action="store_true", help="Count duplicates without changing anything")
+    args = parser.parse_args()
+
+    await init_pool(POOL_BATCH)
+    try:
+        async with get_pool(POOL_BATCH).acquire() as conn:
+            await migrate(conn, dry_run=args.dry_run)
+    finally:
+        await close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -38,12 +38,16 @@ CREATE TABLE IF NOT EXISTS account_performance (
     -- Timestamps
     calculated_at TIMESTAMPTZ NOT NULL,               -- When metrics were last calculated
     created_at TIMESTAMPTZ DEFAULT NOW(),
-    updated_at TIMESTAMPTZ DEFAULT NOW(),
-
-    -- Ensure one row per account per lookback period
-    UNIQUE(account, weeks_lookback)
+    updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Ensure one row per account per lookback period. An expression index rather
+-- than UNIQUE(account, weeks_lookback): NULLs are distinct in a unique
+-- constraint, so all-time rows (NULL) would never conflict and would pile up.
+-- The upsert in calculate_performance.py targets this same expression.
+-- Existing databases: run migrate_performance_keys.py (removes duplicates).
+CREATE UNIQUE INDEX IF NOT EXISTS idx_account_performance_account_lookback
+    ON account_performance(account, (COALESCE(weeks_lookback, 0)));
 CREATE INDEX IF NOT EXISTS idx_account_performance_account ON account_performance(account);
 CREATE INDEX IF NOT EXISTS idx_account_performance_total_return ON account_performance(total_return DESC);
 CREATE INDEX IF NOT EXISTS idx_account_performance_sharpe ON account_performance(sharpe_ratio DESC);
@@ -222,3 +226,49 @@ ORDER BY
         ELSE 2
     END,
     total_return DESC;
+
+-- ============================================================================
+-- MATERIALIZED LEADERBOARD
+-- ============================================================================
+
+-- All lookback periods ranked in one materialized view. Dashboard reads are
+-- index scans on (lookback_key, rank); refreshed CONCURRENTLY at the end of
+-- calculate_performance.py (readers never block). refreshed_at records when
+-- the snapshot was taken and is returned to the API as a freshness stamp.
+--   lookback_key = 0 for all-time (weeks_lookback IS NULL), else weeks_lookback
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_leaderboard AS
+SELECT
+    COALESCE(weeks_lookback, 0) AS lookback_key,
+    weeks_lookback,
+    ROW_NUMBER() OVER (
+        PARTITION BY weeks_lookback ORDER BY total_return DESC, account
+    ) AS rank,
+    CASE
+        WHEN account = 'COUNCIL' THEN 'Council'
+        WHEN account = 'BASELINE' THEN 'Baseline'
+        ELSE 'Individual PM'
+    END AS strategy_type,
+    CASE
+        WHEN account = 'COUNCIL' THEN 1
+        WHEN account = 'BASELINE' THEN 3
+        ELSE 2
+    END AS strategy_order,
+    account,
+    total_return,
+    sharpe_ratio,
+    max_drawdown,
+    volatility,
+    win_rate,
+    weeks_traded,
+    profitable_weeks,
+    calculated_at,
+    NOW() AS refreshed_at
+FROM account_performance;
+
+-- Required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_leaderboard_key_account
+    ON mv_leaderboard(lookback_key, account);
+CREATE INDEX IF NOT EXISTS idx_mv_leaderboard_key_rank
+    ON mv_leaderboard(lookback_key, rank);
+CREATE INDEX IF NOT EXISTS idx_mv_leaderboard_key_strategy
+    ON mv_leaderboard(lookback_key, strategy_order, total_return DESC);
@@ -29,8 +29,10 @@ CREATE INDEX IF NOT EXISTS idx_daily_bars_symbol_date ON daily_bars(symbol, date
 CREATE INDEX IF NOT EXISTS idx_daily_bars_date ON daily_bars(date DESC);
 
 -- Hourly snapshots at checkpoint times (for conviction updates)
+-- Partitioned by month on timestamp (see backend/db/partitions.py); keys
+-- include the partition column as PostgreSQL requires.
 CREATE TABLE IF NOT EXISTS hourly_snapshots (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     symbol VARCHAR(10) NOT NULL,
     timestamp TIMESTAMPTZ NOT NULL,
     date DATE NOT NULL,
@@ -38,8 +40,19 @@ CREATE TABLE IF NOT EXISTS hourly_snapshots (
     price DECIMAL(12,4),
     volume BIGINT,
     created_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (id, timestamp),
     UNIQUE(symbol, timestamp)
-);
+) PARTITION BY RANGE (timestamp);
+
+-- Catches rows outside the created months (ensure_partitions moves them out).
+-- Skipped while the table is still unpartitioned (an existing database
+-- before migrate_partitions.py), so this file can be re-applied first.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('hourly_snapshots')) THEN
+        CREATE TABLE IF NOT EXISTS hourly_snapshots_default PARTITION OF hourly_snapshots DEFAULT;
+    END IF;
+END $$;
 
 CREATE INDEX IF NOT EXISTS idx_hourly_snapshots_symbol_timestamp ON hourly_snapshots(symbol, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_hourly_snapshots_date ON hourly_snapshots(date DESC);
@@ -76,12 +89,90 @@ CREATE TABLE IF NOT EXISTS correlation_matrix (
     symbol_2 VARCHAR(10) NOT NULL,
     correlation DECIMAL(12,8),
     created_at TIMESTAMPTZ DEFAULT NOW(),
-    UNIQUE(date, symbol_1, symbol_2)
+    UNIQUE(date, symbol_1, symbol_2),
+    -- Upper triangle of each matrix only (see correlation_pairs)
+    CONSTRAINT correlation_matrix_upper_triangle CHECK (symbol_1 <= symbol_2)
 );
 
 CREATE INDEX IF NOT EXISTS idx_correlation_matrix_date ON correlation_matrix(date DESC);
 CREATE INDEX IF NOT EXISTS idx_correlation_matrix_symbols ON correlation_matrix(symbol_1, symbol_2, date DESC);
 
+-- Correlations are stored as the upper triangle of each matrix
+-- (symbol_1 <= symbol_2, calculate_metrics.py); this view mirrors the
+-- lower triangle for reads by either symbol order.
+CREATE OR REPLACE VIEW correlation_pairs AS
+SELECT date, symbol_1, symbol_2, correlation
+FROM correlation_matrix
+UNION ALL
+SELECT date, symbol_2 AS symbol_1, symbol_1 AS symbol_2, correlation
+FROM correlation_matrix
+WHERE symbol_1 < symbol_2;
+
+-- ============================================================================
+-- LATEST VALUES (maintained on write by triggers, see FUNCTIONS below)
+-- ============================================================================
+
+-- One row per symbol: latest daily bar and latest hourly snapshot price.
+-- Current-price reads are a primary-key lookup regardless of history size.
+CREATE TABLE IF NOT EXISTS latest_prices (
+    symbol VARCHAR(10) PRIMARY KEY,
+
+    -- Latest daily bar (from daily_bars)
+    date DATE,
+    open DECIMAL(12,4),
+    high DECIMAL(12,4),
+    low DECIMAL(12,4),
+    close DECIMAL(12,4),
+    volume BIGINT,
+
+    -- Latest intraday price (from hourly_snapshots)
+    price DECIMAL(12,4),
+    price_at TIMESTAMPTZ,
+
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Latest value of each metric series.
+--   metric = 'log_return_7d': symbol_1 = symbol, symbol_2 = ''
+--   metric = 'correlation':   symbol_1/symbol_2 = pair
+CREATE TABLE IF NOT EXISTS latest_metrics (
+    metric VARCHAR(32) NOT NULL,
+    symbol_1 VARCHAR(10) NOT NULL,
+    symbol_2 VARCHAR(10) NOT NULL DEFAULT '',
+    date DATE NOT NULL,
+    value DECIMAL(12,8),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (metric, symbol_1, symbol_2),
+    CONSTRAINT latest_metrics_upper_triangle CHECK (metric <> 'correlation' OR symbol_1 <= symbol_2)
+);
+
+CREATE INDEX IF NOT EXISTS idx_latest_metrics_metric_date ON latest_metrics(metric, date DESC);
+
+-- One-time cleanup for databases written before correlations were stored
+-- as the upper triangle: delete the lower-triangle rows, then enforce it
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'correlation_matrix'::regclass
+            AND conname = 'correlation_matrix_upper_triangle'
+    ) THEN
+        DELETE FROM correlation_matrix WHERE symbol_1 > symbol_2;
+        ALTER TABLE correlation_matrix
+            ADD CONSTRAINT correlation_matrix_upper_triangle CHECK (symbol_1 <= symbol_2);
+    END IF;
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'latest_metrics'::regclass
+            AND conname = 'latest_metrics_upper_triangle'
+    ) THEN
+        DELETE FROM latest_metrics WHERE metric = 'correlation' AND symbol_1 > symbol_2;
+        ALTER TABLE latest_metrics
+            ADD CONSTRAINT latest_metrics_upper_triangle
+            CHECK (metric <> 'correlation' OR symbol_1 <= symbol_2);
+    END IF;
+END $$;
+
 -- ============================================================================
 -- RESEARCH REPORTS (RAW STORAGE)
 -- ============================================================================
@@ -113,6 +204,7 @@ CREATE INDEX IF NOT EXISTS idx_research_week_provider ON research_reports(week_i
 CREATE INDEX IF NOT EXISTS idx_research_status ON research_reports(status);
 CREATE INDEX IF NOT EXISTS idx_research_status_created_at ON research_reports(status, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_research_created_at ON research_reports(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_research_created_id ON research_reports(created_at DESC, id DESC);
 
 -- JSONB indexes for querying structured fields
 CREATE INDEX IF NOT EXISTS idx_research_macro_regime ON research_reports USING GIN ((structured_json->'macro_regime'));
@@ -148,6 +240,7 @@ CREATE INDEX IF NOT EXISTS idx_pm_pitches_week ON pm_pitches(week_id);
 CREATE INDEX IF NOT EXISTS idx_pm_pitches_account ON pm_pitches(account);
 CREATE INDEX IF NOT EXISTS idx_pm_pitches_instrument ON pm_pitches(instrument);
 CREATE INDEX IF NOT EXISTS idx_pm_pitches_research_date ON pm_pitches(research_date);
+CREATE INDEX IF NOT EXISTS idx_pm_pitches_created_id ON pm_pitches(created_at DESC, id DESC);
 
 -- ============================================================================
 -- PEER REVIEWS (RAW STORAGE)
@@ -198,12 +291,69 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_chairman_decisions_week_research
     ON chairman_decisions(week_id, research_date);
 CREATE INDEX IF NOT EXISTS idx_chairman_decisions_research_date ON chairman_decisions(research_date);
 
+-- ============================================================================
+-- JSONB PAYLOADS: migration and generated filter columns
+-- ============================================================================
+-- Older databases stored pitch/review/decision payloads as TEXT. Convert them
+-- in place; the application registers JSONB codecs on every connection and
+-- passes dicts directly (backend/db/codecs.py).
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name
+        FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND (table_name, column_name) IN (
+              ('pm_pitches', 'pitch_data'),
+              ('peer_reviews', 'review_data'),
+              ('chairman_decisions', 'decision_data')
+          )
+          AND data_type IN ('text', 'character varying', 'json')
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN %I TYPE JSONB USING %I::jsonb',
+            col.table_name, col.column_name, col.column_name
+        );
+    END LOOP;
+END $$;
+
+-- Hot filter fields, kept in sync with the payload by PostgreSQL
+ALTER TABLE pm_pitches
+    ADD COLUMN IF NOT EXISTS horizon TEXT
+        GENERATED ALWAYS AS (pitch_data->>'horizon') STORED,
+    ADD COLUMN IF NOT EXISTS risk_profile TEXT
+        GENERATED ALWAYS AS (pitch_data->>'risk_profile') STORED,
+    ADD COLUMN IF NOT EXISTS entry_policy JSONB
+        GENERATED ALWAYS AS (pitch_data->'entry_policy') STORED,
+    ADD COLUMN IF NOT EXISTS exit_policy JSONB
+        GENERATED ALWAYS AS (pitch_data->'exit_policy') STORED;
+
+ALTER TABLE chairman_decisions
+    ADD COLUMN IF NOT EXISTS selected_instrument TEXT
+        GENERATED ALWAYS AS (decision_data->'selected_trade'->>'instrument') STORED,
+    ADD COLUMN IF NOT EXISTS selected_direction TEXT
+        GENERATED ALWAYS AS (decision_data->'selected_trade'->>'direction') STORED;
+
+CREATE INDEX IF NOT EXISTS idx_chairman_decisions_selected
+    ON chairman_decisions(selected_instrument, selected_direction);
+
+-- Containment queries on payload contents (pitch_data @> '{"horizon": "1W"}')
+CREATE INDEX IF NOT EXISTS idx_pm_pitches_data ON pm_pitches USING GIN (pitch_data jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_peer_reviews_data ON peer_reviews USING GIN (review_data jsonb_path_ops);
+
 -- ============================================================================
 -- EXECUTION EVENTS (Event Sourcing)
 -- ============================================================================
 
+-- Partitioned by month on occurred_at (see backend/db/partitions.py). Existing
+-- unpartitioned tables are converted by backend/storage/migrate_partitions.py:
+-- apply this file first (it creates the trigger functions the migration
+-- needs), then run the migration.
 CREATE TABLE IF NOT EXISTS execution_events (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     week_id VARCHAR(10) NOT NULL,
 
     -- Event metadata
@@ -215,13 +365,65 @@ CREATE TABLE IF NOT EXISTS execution_events (
 
     -- Timestamp
     occurred_at TIMESTAMPTZ NOT NULL,
-    created_at TIMESTAMPTZ DEFAULT NOW()
-);
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+
+    PRIMARY KEY (id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+-- Skipped while the table is still unpartitioned (see hourly_snapshots)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('execution_events')) THEN
+        CREATE TABLE IF NOT EXISTS execution_events_default PARTITION OF execution_events DEFAULT;
+    END IF;
+END $$;
 
 CREATE INDEX IF NOT EXISTS idx_events_week ON execution_events(week_id);
 CREATE INDEX IF NOT EXISTS idx_events_account ON execution_events(account);
 CREATE INDEX IF NOT EXISTS idx_events_type ON execution_events(event_type);
 CREATE INDEX IF NOT EXISTS idx_events_occurred ON execution_events(occurred_at DESC);
+CREATE INDEX IF NOT EXISTS idx_events_occurred_id ON execution_events(occurred_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_events_account_occurred ON execution_events(account, occurred_at DESC);
+-- Stream order for projections (backend/db/projections.py)
+CREATE INDEX IF NOT EXISTS idx_events_created_id ON execution_events(created_at, id);
+
+-- Snapshots of projection state over execution_events (newest few are kept)
+CREATE TABLE IF NOT EXISTS projection_snapshots (
+    id BIGSERIAL PRIMARY KEY,
+
+    -- Stream position of the last applied event
+    position_at TIMESTAMPTZ NOT NULL,
+    position_id UUID NOT NULL,
+    events_applied BIGINT NOT NULL,
+
+    -- {projection: {"version": n, "state": {...}}}
+    state JSONB NOT NULL,
+
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- ============================================================================
+-- WEEK BUNDLES (frozen weekly context for checkpoints and dashboard)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS week_bundles (
+    id SERIAL PRIMARY KEY,
+    week_id VARCHAR(10) NOT NULL,
+
+    -- Re-running the weekly pipeline appends a new version (never updated)
+    version INTEGER NOT NULL,
+    schema_version INTEGER NOT NULL,
+
+    -- gzip-compressed JSON bundle
+    payload BYTEA NOT NULL,
+    payload_size INTEGER NOT NULL,
+    checksum VARCHAR(64) NOT NULL,
+
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE(week_id, version)
+);
+
+CREATE INDEX IF NOT EXISTS idx_week_bundles_week_version ON week_bundles(week_id, version DESC);
 
 -- ============================================================================
 -- FETCH LOG (for monitoring data collection)
@@ -349,3 +551,213 @@ BEGIN
         created_at = NOW();
 END;
 $$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- LATEST-VALUE TRIGGERS
+-- ============================================================================
+-- Keep latest_prices / latest_metrics current inside the writing transaction.
+-- Older rows (backfills) never overwrite a newer latest value.
+--
+-- Statement-level: each INSERT/UPDATE statement (including a COPY-based
+-- bulk_upsert of thousands of rows) runs one INSERT ... SELECT over its
+-- transition table, taking the newest row per key, instead of one upsert
+-- per written row. Transition tables allow only one event per trigger,
+-- hence separate INSERT and UPDATE triggers (an upsert fires both).
+
+CREATE OR REPLACE FUNCTION sync_latest_price_from_daily_bar()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO latest_prices AS lp (symbol, date, open, high, low, close, volume, updated_at)
+    SELECT DISTINCT ON (symbol) symbol, date, open, high, low, close, volume, NOW()
+    FROM new_rows
+    ORDER BY symbol, date DESC
+    ON CONFLICT (symbol) DO UPDATE SET
+        date = EXCLUDED.date,
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume,
+        updated_at = NOW()
+    WHERE lp.date IS NULL OR EXCLUDED.date >= lp.date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_latest_price_from_snapshot()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO latest_prices AS lp (symbol, price, price_at, updated_at)
+    SELECT DISTINCT ON (symbol) symbol, price, timestamp, NOW()
+    FROM new_rows
+    ORDER BY symbol, timestamp DESC
+    ON CONFLICT (symbol) DO UPDATE SET
+        price = EXCLUDED.price,
+        price_at = EXCLUDED.price_at,
+        updated_at = NOW()
+    WHERE lp.price_at IS NULL OR EXCLUDED.price_at >= lp.price_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_latest_metric_7d()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO latest_metrics AS lm (metric, symbol_1, symbol_2, date, value, updated_at)
+    SELECT DISTINCT ON (symbol) 'log_return_7d', symbol, '', date, log_return_7d, NOW()
+    FROM new_rows
+    ORDER BY symbol, date DESC
+    ON CONFLICT (metric, symbol_1, symbol_2) DO UPDATE SET
+        date = EXCLUDED.date,
+        value = EXCLUDED.value,
+        updated_at = NOW()
+    WHERE EXCLUDED.date >= lm.date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_latest_metric_correlation()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO latest_metrics AS lm (metric, symbol_1, symbol_2, date, value, updated_at)
+    SELECT DISTINCT ON (symbol_1, symbol_2) 'correlation', symbol_1, symbol_2, date, correlation, NOW()
+    FROM new_rows
+    ORDER BY symbol_1, symbol_2, date DESC
+    ON CONFLICT (metric, symbol_1, symbol_2) DO UPDATE SET
+        date = EXCLUDED.date,
+        value = EXCLUDED.value,
+        updated_at = NOW()
+    WHERE EXCLUDED.date >= lm.date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Row-level triggers of earlier schema versions
+DROP TRIGGER IF EXISTS trg_daily_bars_latest ON daily_bars;
+DROP TRIGGER IF EXISTS trg_hourly_snapshots_latest ON hourly_snapshots;
+DROP TRIGGER IF EXISTS trg_rolling_7day_latest ON rolling_7day_log_returns;
+DROP TRIGGER IF EXISTS trg_correlation_matrix_latest ON correlation_matrix;
+
+DROP TRIGGER IF EXISTS trg_daily_bars_latest_insert ON daily_bars;
+CREATE TRIGGER trg_daily_bars_latest_insert
+    AFTER INSERT ON daily_bars REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_price_from_daily_bar();
+DROP TRIGGER IF EXISTS trg_daily_bars_latest_update ON daily_bars;
+CREATE TRIGGER trg_daily_bars_latest_update
+    AFTER UPDATE ON daily_bars REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_price_from_daily_bar();
+
+DROP TRIGGER IF EXISTS trg_hourly_snapshots_latest_insert ON hourly_snapshots;
+CREATE TRIGGER trg_hourly_snapshots_latest_insert
+    AFTER INSERT ON hourly_snapshots REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_price_from_snapshot();
+DROP TRIGGER IF EXISTS trg_hourly_snapshots_latest_update ON hourly_snapshots;
+CREATE TRIGGER trg_hourly_snapshots_latest_update
+    AFTER UPDATE ON hourly_snapshots REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_price_from_snapshot();
+
+DROP TRIGGER IF EXISTS trg_rolling_7day_latest_insert ON rolling_7day_log_returns;
+CREATE TRIGGER trg_rolling_7day_latest_insert
+    AFTER INSERT ON rolling_7day_log_returns REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_metric_7d();
+DROP TRIGGER IF EXISTS trg_rolling_7day_latest_update ON rolling_7day_log_returns;
+CREATE TRIGGER trg_rolling_7day_latest_update
+    AFTER UPDATE ON rolling_7day_log_returns REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_metric_7d();
+
+DROP TRIGGER IF EXISTS trg_correlation_matrix_latest_insert ON correlation_matrix;
+CREATE TRIGGER trg_correlation_matrix_latest_insert
+    AFTER INSERT ON correlation_matrix REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_metric_correlation();
+DROP TRIGGER IF EXISTS trg_correlation_matrix_latest_update ON correlation_matrix;
+CREATE TRIGGER trg_correlation_matrix_latest_update
+    AFTER UPDATE ON correlation_matrix REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_latest_metric_correlation();
+
+-- One-time backfill for databases created before the latest-value tables
+INSERT INTO latest_prices (symbol, date, open, high, low, close, volume)
+SELECT DISTINCT ON (symbol) symbol, date, open, high, low, close, volume
+FROM daily_bars
+ORDER BY symbol, date DESC
+ON CONFLICT (symbol) DO NOTHING;
+
+-- Also creates the row of a symbol that has snapshots but no daily bars
+INSERT INTO latest_prices AS lp (symbol, price, price_at)
+SELECT DISTINCT ON (symbol) symbol, price, timestamp
+FROM hourly_snapshots
+ORDER BY symbol, timestamp DESC
+ON CONFLICT (symbol) DO UPDATE SET
+    price = EXCLUDED.price,
+    price_at = EXCLUDED.price_at
+WHERE lp.price_at IS NULL;
+
+INSERT INTO latest_metrics (metric, symbol_1, symbol_2, date, value)
+SELECT DISTINCT ON (symbol) 'log_return_7d', symbol, '', date, log_return_7d
+FROM rolling_7day_log_returns
+ORDER BY symbol, date DESC
+ON CONFLICT (metric, symbol_1, symbol_2) DO NOTHING;
+
+INSERT INTO latest_metrics (metric, symbol_1, symbol_2, date, value)
+SELECT DISTINCT ON (symbol_1, symbol_2) 'correlation', symbol_1, symbol_2, date, correlation
+FROM correlation_matrix
+ORDER BY symbol_1, symbol_2, date DESC
+ON CONFLICT (metric, symbol_1, symbol_2) DO NOTHING;
+
+-- ============================================================================
+-- CHANGE FEED (LISTEN/NOTIFY)
+-- ============================================================================
+-- Every committed write to the pipeline tables is announced on the
+-- 'table_changes' channel; the API listens (backend/db/change_feed.py) to
+-- invalidate caches and push updates to clients. TG_ARGV[0] carries the
+-- logical table name, so partitions report as their parent table.
+-- Identical payloads within one transaction are delivered once.
+
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS TRIGGER AS $$
+DECLARE
+    row_data JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := to_jsonb(OLD);
+    ELSE
+        row_data := to_jsonb(NEW);
+    END IF;
+
+    PERFORM pg_notify(
+        'table_changes',
+        jsonb_build_object(
+            'table', TG_ARGV[0],
+            'op', TG_OP,
+            'week_id', row_data->>'week_id',
+            'research_date', row_data->>'research_date',
+            'account', row_data->>'account',
+            'app', current_setting('application_name', true)
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_research_reports_notify ON research_reports;
+CREATE TRIGGER trg_research_reports_notify
+    AFTER INSERT OR UPDATE OR DELETE ON research_reports
+    FOR EACH ROW EXECUTE FUNCTION notify_table_change('research_reports');
+
+DROP TRIGGER IF EXISTS trg_pm_pitches_notify ON pm_pitches;
+CREATE TRIGGER trg_pm_pitches_notify
+    AFTER INSERT OR UPDATE OR DELETE ON pm_pitches
+    FOR EACH ROW EXECUTE FUNCTION notify_table_change('pm_pitches');
+
+DROP TRIGGER IF EXISTS trg_peer_reviews_notify ON peer_reviews;
+CREATE TRIGGER trg_peer_reviews_notify
+    AFTER INSERT OR UPDATE OR DELETE ON peer_reviews
+    FOR EACH ROW EXECUTE FUNCTION notify_table_change('peer_reviews');
+
+DROP TRIGGER IF EXISTS trg_chairman_decisions_notify ON chairman_decisions;
+CREATE TRIGGER trg_chairman_decisions_notify
+    AFTER INSERT OR UPDATE OR DELETE ON chairman_decisions
+    FOR EACH ROW EXECUTE FUNCTION notify_table_change('chairman_decisions');
+
+DROP TRIGGER IF EXISTS trg_execution_events_notify ON execution_events;
+CREATE TRIGGER trg_execution_events_notify
+    AFTER INSERT OR UPDATE OR DELETE ON execution_events
+    FOR EACH ROW EXECUTE FUNCTION notify_table_change('execution_events');
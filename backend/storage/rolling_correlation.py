@@ -0,0 +1,124 @@
+"""
+Vectorized rolling correlation matrices.
+
+calculate_metrics.py needs the correlation matrix of N series (7-day log
+returns per symbol) over every W-row window. Instead of calling
+DataFrame.corr() once per window and walking N x N pairs in Python,
+rolling_correlation() computes all windows at once:
+
+    - sliding_window_view() exposes the windows as a (K, N, W) view of
+      the input without copying (K = T - W + 1 windows)
+    - Each window is centered on its own means, and one batched matrix
+      product gives every covariance matrix: C = Xc @ Xc^T, (K, N, N)
+    - Correlations are C / (sd_i * sd_j) from C's diagonal
+
+Windows with missing values use pairwise-complete observations, like
+DataFrame.corr(): for each pair only the rows where both series have a
+value count. Pair counts, sums and sums of squares are batched matrix
+products of the zero-filled values and the validity mask.
+
+Windows are processed in blocks of BLOCK_CELLS / N^2 so intermediates
+stay bounded for large N; the result itself is (K, N, N).
+
+Usage:
+    corr = rolling_correlation(values, window=30)   # values: (T, N)
+    corr[k]        # N x N matrix of the window ending at row k + window - 1
+    i, j, pairs = upper_triangle(corr)              # (K, P) pairs, i <= j
+
+Storage:
+    A correlation matrix is symmetric, so only the upper triangle
+    (including the diagonal) is stored: N(N+1)/2 rows per date instead
+    of N^2, with symbol_1 <= symbol_2 (a CHECK constraint). Reads
+    mirror it back (the correlation_pairs view, market.latest_correlations).
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Cells (windows x N x N) per block of intermediates (8 bytes each)
+BLOCK_CELLS = 1 << 22
+
+
+def rolling_correlation(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Correlation matrix of every `window`-row window of `values`.
+
+    Args:
+        values: (T, N) array, one column per series; NaN marks a missing value
+        window: Rows per window
+
+    Returns:
+        (T - window + 1, N, N) float array; entry k is the matrix of rows
+        k .. k + window - 1. Pairs with fewer than 2 shared values or zero
+        variance are NaN. Empty (0, N, N) when T < window.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 2:
+        raise ValueError(f"values must be 2-D (T, N), got shape {values.shape}")
+    if window < 2:
+        raise ValueError(f"window must be at least 2, got {window}")
+
+    T, N = values.shape
+    K = T - window + 1
+    if K <= 0 or N == 0:
+        return np.empty((max(K, 0), N, N))
+
+    windows = sliding_window_view(values, window, axis=0)  # (K, N, W) view
+    correlate = _correlate_pairwise if np.isnan(values).any() else _correlate_complete
+    result = np.empty((K, N, N))
+    block = max(1, BLOCK_CELLS // (N * N))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for start in range(0, K, block):
+            result[start:start + block] = correlate(windows[start:start + block])
+    return np.clip(result, -1.0, 1.0, out=result)
+
+
+def _correlate_complete(windows: np.ndarray) -> np.ndarray:
+    """Correlations of (k, N, W) windows without missing values."""
+    centered = windows - windows.mean(axis=2, keepdims=True)
+    cov = centered @ centered.transpose(0, 2, 1)
+    sd = np.sqrt(np.diagonal(cov, axis1=1, axis2=2))
+    return cov / (sd[:, :, None] * sd[:, None, :])
+
+
+def _correlate_pairwise(windows: np.ndarray) -> np.ndarray:
+    """Correlations of (k, N, W) windows over pairwise-complete rows."""
+    valid = ~np.isnan(windows)
+    mask = valid.astype(float)
+    # Center each series on its own valid mean first (does not change the
+    # correlation, keeps the sums small)
+    counts = mask.sum(axis=2, keepdims=True)
+    x = np.where(valid, windows, 0.0)
+    x = np.where(valid, x - x.sum(axis=2, keepdims=True) / np.maximum(counts, 1.0), 0.0)
+
+    mask_t = mask.transpose(0, 2, 1)
+    n = mask @ mask_t                   # rows where both i and j are valid
+    sx = x @ mask_t                     # sum of x_i over those rows
+    sxx = (x * x) @ mask_t              # sum of x_i^2 over those rows
+    sxy = x @ x.transpose(0, 2, 1)      # sum of x_i * x_j
+
+    sy = sx.transpose(0, 2, 1)
+    syy = sxx.transpose(0, 2, 1)
+    cov = sxy - sx * sy / n
+    var_x = sxx - sx * sx / n
+    var_y = syy - sy * sy / n
+    corr = cov / np.sqrt(var_x * var_y)
+    corr[n < 2] = np.nan
+    return corr
+
+
+def upper_triangle(corr: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Upper triangle (with diagonal) of a stack of symmetric matrices.
+
+    Args:
+        corr: (K, N, N) array from rolling_correlation()
+
+    Returns:
+        Tuple of (i, j, pairs): row and column indices (i <= j) of the
+        P = N(N+1)/2 pairs, and the (K, P) values
+    """
+    i, j = np.triu_indices(corr.shape[-1])
+    return i, j, corr[:, i, j]
@@ -0,0 +1,92 @@
+"""Streaming NDJSON/CSV export responses.
+
+Export endpoints pass an async row iterator (usually db_helpers.stream_rows,
+backed by a server-side cursor) to export_response(). Rows are serialized
+and flushed in chunks as they arrive, so an export never holds the full
+result set in memory on either side of the connection.
+"""
+
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, List
+
+from fastapi.responses import StreamingResponse
+
+from backend.db.codecs import json_dumps
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Rows serialized per chunk sent to the client
+CHUNK_ROWS = 200
+
+
+async def ndjson_chunks(rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """One JSON document per line."""
+    buffer: List[str] = []
+    async for row in rows:
+        buffer.append(json_dumps(row))
+        if len(buffer) >= CHUNK_ROWS:
+            yield ("\n".join(buffer) + "\n").encode()
+            buffer = []
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode()
+
+
+def _csv_value(value: Any) -> Any:
+    """Flatten nested values (JSONB payloads) to JSON text for a CSV cell."""
+    if isinstance(value, (dict, list)):
+        return json_dumps(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+async def csv_chunks(rows: AsyncIterator[Dict[str, Any]], columns: List[str]) -> AsyncIterator[bytes]:
+    """CSV with a header row; JSON columns are embedded as JSON text."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    count = 0
+    async for row in rows:
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+        count += 1
+        if count % CHUNK_ROWS == 0:
+            yield out.getvalue().encode()
+            out.seek(0)
+            out.truncate()
+    if out.tell():
+        yield out.getvalue().encode()
+
+
+def export_response(
+    rows: AsyncIterator[Dict[str, Any]],
+    fmt: str,
+    columns: List[str],
+    filename: str,
+) -> StreamingResponse:
+    """
+    Stream rows as an NDJSON or CSV download.
+
+    Args:
+        rows: Async row iterator
+        fmt: "ndjson" or "csv"
+        columns: CSV column order (NDJSON writes whole rows)
+        filename: Download name without extension
+
+    Raises:
+        ValueError: If fmt is not a supported format
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt!r} (expected one of {EXPORT_FORMATS})")
+
+    body = ndjson_chunks(rows) if fmt == "ndjson" else csv_chunks(rows, columns)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
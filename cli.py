@@ -9,19 +9,42 @@ from typing import Optional
 import click
 from dotenv import load_dotenv
 
-from backend.pipeline import Pipeline, PipelineContext
-from backend.pipeline.weekly_pipeline import (
-    WeeklyTradingPipeline,
-    run_weekly_pipeline,
-    run_research_only,
-    run_pm_pitches_only,
-)
-from backend.pipeline.context import USER_QUERY
-from backend.pipeline.stages.checkpoint import run_checkpoint, run_all_checkpoints
+# Pipeline, database and SDK modules are imported inside each command so
+# that light commands (status, cache-stats) start fast; `status` must not
+# load pandas, the Alpaca SDK or the LLM clients.
 
 load_dotenv()
 
 
+async def _open_pools() -> None:
+    """Open the DB and Redis pools for commands that read/write the week bundle."""
+    from functools import partial
+
+    from backend.db.event_writer import start_event_writer
+    from backend.db.pool import init_pool
+    from backend.redis_client import init_redis_pool
+
+    for name, init in (
+        ("Database", partial(init_pool, lazy=True)),
+        ("Redis", init_redis_pool),
+        ("Event writer", start_event_writer),
+    ):
+        try:
+            await init()
+        except Exception as e:
+            click.echo(f"⚠️  {name} unavailable: {e}")
+
+
+async def _close_pools() -> None:
+    from backend.db.event_writer import stop_event_writer
+    from backend.db.pool import close_pool
+    from backend.redis_client import close_redis_pool
+
+    await stop_event_writer()
+    await close_pool()
+    await close_redis_pool()
+
+
 @click.group()
 def cli():
     """LLM Trading - Pipeline-first trading system using council decisions."""
@@ -54,6 +77,7 @@ def council(query: str):
 )
 def run_weekly(query: str = "", mode: str = "full", search_provider: str | None = None):
     """Run full weekly pipeline (research -> PM pitches -> peer review -> chairman -> execute)."""
+    from backend.pipeline.weekly_pipeline import WeeklyTradingPipeline
 
     async def run():
         click.echo(f"Running full weekly pipeline (mode: {mode})...")
@@ -75,7 +99,11 @@ def run_weekly(query: str = "", mode: str = "full", search_provider: str | None
         pipeline = WeeklyTradingPipeline(
             search_provider=search_provider, execution_mode=mode
         )
-        result = await pipeline.run(query)
+        await _open_pools()
+        try:
+            result = await pipeline.run(query)
+        finally:
+            await _close_pools()
 
         if result.get("success"):
             click.echo("\n✅ Weekly pipeline complete!")
@@ -90,6 +118,7 @@ def run_weekly(query: str = "", mode: str = "full", search_provider: str | None
 @click.option("--time", type=str, help='Checkpoint time (e.g., "09:00")')
 def checkpoint(time: Optional[str]):
     """Run conviction checkpoint (STAY/EXIT/FLIP/REDUCE)."""
+    from backend.pipeline.stages.checkpoint import run_checkpoint
 
     async def run():
         if time:
@@ -102,7 +131,11 @@ def checkpoint(time: Optional[str]):
             click.echo("=" * 60)
 
             # Run checkpoint
-            result = await run_checkpoint(time)
+            await _open_pools()
+            try:
+                result = await run_checkpoint(time)
+            finally:
+                await _close_pools()
 
             if result.get("success"):
                 click.echo("\n✅ Checkpoint complete!")
@@ -130,6 +163,7 @@ def checkpoint(time: Optional[str]):
 )
 def run_checkpoints(all_checkpoints: bool):
     """Run all daily checkpoints (09:00, 12:00, 14:00, 15:50 ET)."""
+    from backend.pipeline.stages.checkpoint import run_all_checkpoints
 
     async def run():
         if all_checkpoints:
@@ -138,7 +172,11 @@ def run_checkpoints(all_checkpoints: bool):
             click.echo("=" * 60)
 
             # Run all checkpoints
-            result = await run_all_checkpoints()
+            await _open_pools()
+            try:
+                result = await run_all_checkpoints()
+            finally:
+                await _close_pools()
 
             if result.get("success"):
                 click.echo("\n✅ All checkpoints complete!")
@@ -171,6 +209,120 @@ def postmortem(week: Optional[str]):
         click.echo("Please specify a week with --week (e.g., --week 2026-01-01)")
 
 
+@cli.command("warm-cache")
+@click.option(
+    "--source",
+    "sources",
+    multiple=True,
+    help="Only warm keys derived from this table/stage (repeatable, default: all)",
+)
+def warm_cache(sources: tuple):
+    """Recompute and store dashboard cache keys (run after data jobs)."""
+    from backend.db.pool import init_pool, close_pool
+    from backend.redis_client import close_redis_pool
+    from backend.cache.warming import warm_cache as run_warm_cache
+
+    async def run():
+        await init_pool()
+        try:
+            return await run_warm_cache(list(sources) if sources else None)
+        finally:
+            await close_pool()
+            await close_redis_pool()
+
+    results = asyncio.run(run())
+
+    if not results:
+        click.echo("No cache keys warmed (check database/Redis connectivity)")
+        return
+
+    for key, ok in results.items():
+        click.echo(f"  {'✓' if ok else '✗'} {key}")
+    click.echo(f"\nWarmed {sum(results.values())}/{len(results)} cache keys")
+
+
+@cli.command()
+@click.option("--rebuild", is_flag=True, help="Ignore snapshots and replay every event")
+def projections(rebuild: bool):
+    """Update projections over execution_events (positions, weekly P&L, conviction)."""
+    import time
+
+    from backend.db.pool import init_pool, close_pool
+    from backend.db.projections import ProjectionEngine
+
+    async def run():
+        await init_pool()
+        try:
+            engine = ProjectionEngine()
+            start = time.perf_counter()
+            applied = await engine.run(rebuild=rebuild)
+            return engine, applied, time.perf_counter() - start
+        finally:
+            await close_pool()
+
+    engine, applied, elapsed = asyncio.run(run())
+
+    click.echo(f"Applied {applied} events in {elapsed:.2f}s ({engine.events_applied} total)")
+    for account, lots in sorted(engine["positions"].positions.items()):
+        held = ", ".join(f"{symbol} {lot['qty']:g}" for symbol, lot in sorted(lots.items()))
+        click.echo(f"  {account:<10} {held or 'flat'}")
+
+
+@cli.command("cache-stats")
+@click.option("--family", type=str, help="Only show this key family (e.g. market:metrics)")
+@click.option("--json", "as_json", is_flag=True, help="Print raw JSON")
+def cache_stats(family: Optional[str], as_json: bool):
+    """Show cache hit/miss, latency and size stats per key family."""
+    import json
+
+    from backend.redis_client import init_redis_pool, close_redis_pool
+    from backend.cache.stats import collect_cluster_stats
+
+    async def run():
+        try:
+            await init_redis_pool()
+        except Exception as e:
+            click.echo(f"✗ Redis unavailable: {e}")
+            return None
+        try:
+            return await collect_cluster_stats(include_local=False)
+        finally:
+            await close_redis_pool()
+
+    stats = asyncio.run(run())
+    if stats is None:
+        return
+
+    families = stats["families"]
+    if family:
+        families = {k: v for k, v in families.items() if k == family}
+
+    if as_json:
+        click.echo(json.dumps({**stats, "families": families}, indent=2))
+        return
+
+    if not families:
+        click.echo("No cache stats recorded (is the API running?)")
+        return
+
+    click.echo(f"Cache stats ({stats['workers']} worker(s))")
+    click.echo(
+        f"{'family':<22} {'hits':>8} {'misses':>8} {'errors':>7} {'hit%':>6} "
+        f"{'deser p95':>10} {'ser p95':>8} {'size p95':>10} {'ratio':>6}"
+    )
+    for name, data in families.items():
+        hit_rate = data["hit_rate"]
+        ratio = data["compression_ratio"]["mean"]
+        click.echo(
+            f"{name:<22} {data['hits']:>8} {data['misses']:>8} {data['errors']:>7} "
+            f"{(f'{hit_rate * 100:.1f}' if hit_rate is not None else '-'):>6} "
+            f"{str(data['deserialize_ms']['p95'] or '-'):>10} "
+            f"{str(data['serialize_ms']['p95'] or '-'):>8} "
+            f"{str(data['payload_bytes']['p95'] or '-'):>10} "
+            f"{(f'{ratio:.1f}x' if ratio else '-'):>6}"
+        )
+
+
 @cli.command()
 def status():
     """Show system status and configuration."""
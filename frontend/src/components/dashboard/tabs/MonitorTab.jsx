@@ -5,6 +5,7 @@ import { Button } from "../ui/Button";
 import { Play, History, RefreshCw, TrendingUp, Wallet, Clock } from 'lucide-react';
 import { tradingApi } from '../../../api/trading';
 import { cn } from "../../../lib/utils";
+import { useChangeFeed } from '../../../hooks/useChangeFeed';
 import PerformanceChart from './PerformanceChart';
 
 export default function MonitorTab() {
@@ -56,14 +57,21 @@ export default function MonitorTab() {
     setLastRefreshTime(new Date());
   }, []);
 
-  // Auto-refresh every 30 seconds
+  // Refresh when execution events land (pushed by the API)
+  const { connected: liveUpdates } = useChangeFeed(['execution_events'], () => {
+    handleRefresh();
+  });
+
+  // Fall back to auto-refresh every 30 seconds while push is unavailable
   useEffect(() => {
+    if (liveUpdates) return undefined;
+
     const interval = setInterval(() => {
       handleRefresh();
     }, 30000); // 30 seconds
 
     return () => clearInterval(interval);
-  }, []);
+  }, [liveUpdates]);
 
   // Format last refresh time
   const formatLastRefresh = () => {
@@ -86,7 +94,7 @@ export default function MonitorTab() {
                   Live positions and account health.
                   <span className="ml-2 text-xs">
                     <Badge variant="outline" className="ml-2">
-                      Auto-refresh: ON
+                      {liveUpdates ? 'Live updates: ON' : 'Auto-refresh: ON'}
                     </Badge>
                     {lastRefreshTime && (
                       <span className="ml-2 text-muted-foreground">
@@ -0,0 +1,52 @@
+import { useState, useEffect, useRef } from 'react';
+
+/**
+ * Custom hook for database change events pushed by the API
+ * (GET /api/events/stream, Server-Sent Events).
+ *
+ * Calls onChange whenever a row of one of the given tables is written, so a
+ * view can refetch on demand instead of polling. EventSource reconnects on
+ * its own after network errors; `connected` is false meanwhile so callers
+ * can fall back to polling.
+ *
+ * @param {string[]} tables - Tables to watch (e.g. ['execution_events'])
+ * @param {Function} onChange - Callback receiving the change event
+ *   ({ table, op, week_id, research_date, account, at })
+ * @returns {Object} - { connected }
+ */
+export function useChangeFeed(tables, onChange) {
+  const [connected, setConnected] = useState(false);
+  const onChangeRef = useRef(onChange);
+  const tablesKey = tables.join(',');
+
+  // Always call the latest callback without reopening the stream
+  useEffect(() => {
+    onChangeRef.current = onChange;
+  }, [onChange]);
+
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') return undefined;
+
+    const source = new EventSource(`/api/events/stream?tables=${encodeURIComponent(tablesKey)}`);
+
+    source.onopen = () => setConnected(true);
+    source.onerror = () => setConnected(false);
+    source.onmessage = (e) => {
+      try {
+        const event = JSON.parse(e.data);
+        if (event.type === 'change' && onChangeRef.current) {
+          onChangeRef.current(event);
+        }
+      } catch (err) {
+        console.error('Invalid change event:', err);
+      }
+    };
+
+    return () => {
+      source.close();
+      setConnected(false);
+    };
+  }, [tablesKey]);
+
+  return { connected };
+}
@@ -39,6 +39,10 @@ def pytest_configure(config):
         "markers",
         "slow: mark test as slow (may take several seconds)"
     )
+    config.addinivalue_line(
+        "markers",
+        "allow_blocking_redis: allow sync Redis calls inside the event loop"
+    )
 
 
 # ==================== Async Test Support ====================
@@ -74,6 +78,24 @@ def isolate_environment(monkeypatch):
     os.environ.update(original_env)
 
 
+@pytest.fixture(scope="function", autouse=True)
+def no_blocking_redis(request):
+    """Fail any test that runs a sync Redis operation inside the event loop.
+
+    The sync RedisClient blocks the worker thread; in async code it stalls
+    every concurrent request. Tests that exercise the guard itself can opt
+    out with @pytest.mark.allow_blocking_redis.
+    """
+    from backend.redis_client import get_blocking_calls, reset_blocking_calls
+
+    reset_blocking_calls()
+    yield
+    calls = get_blocking_calls()
+    reset_blocking_calls()
+    if calls and not request.node.get_closest_marker("allow_blocking_redis"):
+        pytest.fail(f"Blocking sync Redis call(s) inside the event loop: {calls}")
+
+
 @pytest.fixture
 def mock_env_vars(monkeypatch) -> Dict[str, str]:
     """Provide mock environment variables for testing.
@@ -178,6 +200,30 @@ async def init_http_pool():
 
 # ==================== Async Mock Fixtures ====================
 
+@pytest.fixture
+def mock_transaction():
+    """Provide a factory for patchable db_helpers.transaction stand-ins.
+
+    Returns:
+        Function mock_transaction(conn=None) returning a mock transaction()
+        whose context yields conn (an AsyncMock when omitted); its
+        call_count is the number of transactions opened
+
+    Example:
+        with patch.object(pitch_db, "transaction", mock_transaction(conn)):
+            ...
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    def factory(conn=None):
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=AsyncMock() if conn is None else conn)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return MagicMock(return_value=ctx)
+
+    return factory
+
+
 @pytest.fixture
 def mock_query_model():
     """Provide a mock query_model function for testing.
@@ -0,0 +1,324 @@
+"""Unit tests for multi-symbol bar fetching (backend/alpaca_integration/bars.py).
+
+This module tests:
+- Symbols are chunked into multi-symbol requests and pages are followed
+- Chunks run with bounded concurrency; a failed chunk only fails its symbols
+- The per-key rate limiter throttles, follows headers and pauses on 429
+- The REST transport sends symbols and page tokens
+- The SDK transport runs blocking calls in worker threads, concurrently
+- Bars convert column-wise into daily_bars loads
+- Both daily_bars writers refresh created_at on conflict
+- data_fetcher refreshes the universe with one fetch and one bulk upsert
+- data_fetcher main() closes every pool it opened, including Redis
+"""
+
+import asyncio
+import datetime
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.alpaca_integration import bars as bars_module
+from backend.alpaca_integration.bars import (
+    BarFetcher,
+    RateLimitedError,
+    RateLimiter,
+    RestBarsTransport,
+    SdkBarsTransport,
+    daily_bar_columns,
+    get_rate_limiter,
+)
+
+
+def bar(day, close=100.0):
+    return {"t": f"2024-01-{day:02d}T05:00:00Z", "o": close, "h": close, "l": close, "c": close, "v": 1000}
+
+
+class FakeTransport:
+    """Serves two pages for chunks containing "SPY", one page otherwise."""
+
+    def __init__(self, delay=0.0, fail=()):
+        self.calls = []
+        self.delay = delay
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_page(self, symbols, params, page_token=None, limiter=None):
+        self.calls.append((tuple(symbols), page_token))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.fail & set(symbols):
+            raise RuntimeError("401 Unauthorized")
+        if "SPY" in symbols and page_token is None:
+            return {"SPY": [bar(2)]}, "page-2"
+        page = {symbol: [bar(3)] for symbol in symbols}
+        return page, None
+
+    async def fetch_latest(self, symbols, params, limiter=None):
+        self.calls.append((tuple(symbols), None))
+        return {symbol: bar(4) for symbol in symbols}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fetch_chunks_symbols_and_follows_pages():
+    transport = FakeTransport()
+    fetcher = BarFetcher(transport, RateLimiter(60000), chunk_size=2)
+
+    result = await fetcher.fetch(["SPY", "QQQ", "IWM", "TLT", "GLD"], "1Day")
+
+    chunks = {symbols for symbols, _ in transport.calls}
+    assert chunks == {("SPY", "QQQ"), ("IWM", "TLT"), ("GLD",)}
+    assert ("SPY", "QQQ") in [c for c, token in transport.calls if token == "page-2"]
+    assert result.requests == 4
+    assert [b["t"][:10] for b in result.bars["SPY"]] == ["2024-01-02", "2024-01-03"]
+    assert len(result.bars["GLD"]) == 1
+    assert result.errors == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrency_is_bounded_and_failures_are_per_chunk():
+    transport = FakeTransport(delay=0.01, fail={"TLT"})
+    fetcher = BarFetcher(transport, RateLimiter(60000), chunk_size=1, concurrency=2)
+    symbols = ["QQQ", "IWM", "TLT", "GLD", "USO", "SH"]
+
+    result = await fetcher.fetch(symbols)
+
+    assert transport.max_in_flight == 2
+    assert set(result.errors) == {"TLT"}
+    assert "TLT" not in result.bars
+    assert all(result.bars[s] for s in symbols if s != "TLT")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fetch_latest_returns_one_bar_per_symbol():
+    transport = FakeTransport()
+    result = await BarFetcher(transport, RateLimiter(60000)).fetch_latest(["SPY", "QQQ"])
+
+    assert len(transport.calls) == 1
+    assert result.bars == {"SPY": [bar(4)], "QQQ": [bar(4)]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rate_limiter_throttles_to_budget():
+    limiter = RateLimiter(rate_per_minute=6000, burst=1)  # 100/s
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.035
+    assert limiter.requests == 5
+    assert limiter.throttled >= 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_429_pauses_the_key_and_retries():
+    transport = FakeTransport()
+    calls = {"n": 0}
+    fetch_page = transport.fetch_page
+
+    async def flaky(symbols, params, page_token=None, limiter=None):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RateLimitedError(retry_after=0.02)
+        return await fetch_page(symbols, params, page_token, limiter)
+
+    transport.fetch_page = flaky
+    limiter = RateLimiter(60000)
+    start = time.monotonic()
+
+    result = await BarFetcher(transport, limiter).fetch(["QQQ"])
+
+    assert time.monotonic() - start >= 0.015
+    assert result.errors == {}
+    assert result.bars["QQQ"] == [bar(3)]
+
+
+@pytest.mark.unit
+def test_limiter_follows_rate_limit_headers():
+    limiter = RateLimiter(200)
+    limiter.observe({"X-RateLimit-Remaining": "3"})
+    assert limiter.tokens == 3
+
+    limiter.observe({"X-RateLimit-Remaining": "0", "Retry-After": "30"})
+    assert limiter.tokens == 0
+    assert limiter.paused_until - time.monotonic() > 25
+
+    assert get_rate_limiter("key-a") is get_rate_limiter("key-a")
+    assert get_rate_limiter("key-a") is not get_rate_limiter("key-b")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rest_transport_sends_symbols_and_page_token():
+    response = MagicMock(status_code=200, headers={"X-RateLimit-Remaining": "150"})
+    response.json.return_value = {"bars": {"SPY": [bar(2)]}, "next_page_token": None}
+    client = MagicMock()
+    client.get = AsyncMock(return_value=response)
+    limiter = RateLimiter(200)
+
+    with patch.object(bars_module, "get_alpaca_client", return_value=client):
+        page, token = await RestBarsTransport({"APCA-API-KEY-ID": "k"}).fetch_page(
+            ["SPY", "QQQ"], {"timeframe": "1Day"}, "abc", limiter
+        )
+
+    url = client.get.await_args.args[0]
+    params = client.get.await_args.kwargs["params"]
+    assert url.endswith("/v2/stocks/bars")
+    assert params == {"timeframe": "1Day", "symbols": "SPY,QQQ", "page_token": "abc"}
+    assert page == {"SPY": [bar(2)]}
+    assert token is None
+
+
+class BlockingClient:
+    """StockHistoricalDataClient stand-in whose calls block like requests does."""
+
+    def __init__(self, delay=0.05, error=None):
+        self.delay = delay
+        self.error = error
+        self.threads = set()
+
+    def get_stock_bars(self, request):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        timestamp = datetime.datetime(2024, 1, 2, 5, tzinfo=datetime.timezone.utc)
+        return SimpleNamespace(data={
+            symbol: [SimpleNamespace(
+                timestamp=timestamp, open=1.0, high=2.0, low=0.5, close=1.5,
+                volume=100.0, trade_count=3.0, vwap=1.2,
+            )]
+            for symbol in request.symbol_or_symbols
+        })
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sdk_transport_runs_chunks_concurrently_off_the_loop():
+    import alpaca.data.requests  # noqa: F401 (keep the SDK import out of the timing)
+
+    client = BlockingClient(delay=0.1)
+    fetcher = BarFetcher(SdkBarsTransport(client), RateLimiter(60000), chunk_size=1, concurrency=4)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    start = time.monotonic()
+    result = await fetcher.fetch(["SPY", "QQQ", "IWM", "TLT"], "1Day", start=datetime.datetime(2024, 1, 1))
+    elapsed = time.monotonic() - start
+    task.cancel()
+
+    assert elapsed < 0.3  # 4 x 0.1s calls overlapped, not serial
+    assert ticks >= 5  # the loop kept running while the SDK blocked
+    assert threading.get_ident() not in client.threads
+    assert result.bars["SPY"] == [{
+        "t": "2024-01-02T05:00:00+00:00", "o": 1.0, "h": 2.0, "l": 0.5,
+        "c": 1.5, "v": 100.0, "n": 3.0, "vw": 1.2,
+    }]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sdk_transport_maps_429_to_rate_limited():
+    from alpaca.common.exceptions import APIError
+
+    http_error = SimpleNamespace(response=SimpleNamespace(status_code=429, headers={"Retry-After": "2"}))
+    client = BlockingClient(delay=0, error=APIError('{"message": "too many requests"}', http_error))
+
+    with pytest.raises(RateLimitedError) as excinfo:
+        await SdkBarsTransport(client).fetch_page(["SPY"], {"timeframe": "1Day"})
+
+    assert excinfo.value.retry_after == 2.0
+
+
+@pytest.mark.unit
+def test_daily_bar_columns():
+    columns = daily_bar_columns({"SPY": [bar(2, 470.0), bar(3, 471.5)], "QQQ": [bar(2, 400.0)], "TLT": []})
+
+    assert columns["symbol"] == ["SPY", "SPY", "QQQ"]
+    assert columns["date"] == [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3), datetime.date(2024, 1, 2)]
+    assert columns["close"].tolist() == [470.0, 471.5, 400.0]
+    assert columns["volume"].dtype.name == "int64"
+    assert daily_bar_columns({})["symbol"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_daily_bar_writers_touch_created_at():
+    """Re-fetched bars count as fresh for both daily_bars writers."""
+    from backend.storage import data_fetcher, fetch_market_data
+
+    bars_by_symbol = {"SPY": [bar(2, 470.0)]}
+    writers = [
+        (data_fetcher, data_fetcher.MarketDataManager().insert_daily_bars),
+        (fetch_market_data, fetch_market_data.MarketDataDB().upsert_bars),
+    ]
+    for module, write in writers:
+        with patch.object(module, "bulk_upsert", AsyncMock(return_value=1)) as upsert:
+            assert await write(bars_by_symbol) == 1
+        assert upsert.await_args.kwargs == {
+            "conflict_columns": ["symbol", "date"],
+            "touch_columns": ["created_at"],
+        }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_data_fetcher_updates_universe_in_one_load():
+    from backend.storage import data_fetcher
+    from backend.storage.data_fetcher import INSTRUMENTS, MarketDataFetcher
+
+    fetcher = MarketDataFetcher.__new__(MarketDataFetcher)
+    transport = FakeTransport()
+    fetcher.bars = BarFetcher(transport, RateLimiter(60000))
+    fetcher.db = MagicMock()
+    fetcher.db.insert_daily_bars = AsyncMock(return_value=len(INSTRUMENTS) + 1)
+    fetcher.db.log_fetch = AsyncMock()
+
+    with patch.object(data_fetcher, "warm_after_update", AsyncMock()):
+        await fetcher.update_daily_bars()
+
+    assert len({symbols for symbols, _ in transport.calls}) == 1
+    fetcher.db.insert_daily_bars.assert_awaited_once()
+    loaded = fetcher.db.insert_daily_bars.await_args.args[0]
+    assert set(loaded) == set(INSTRUMENTS)
+    assert fetcher.db.log_fetch.await_count == len(INSTRUMENTS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_data_fetcher_main_closes_redis_pool():
+    from backend.storage import data_fetcher
+
+    fetcher = MagicMock(update_daily_bars=AsyncMock(side_effect=RuntimeError("boom")))
+    closers = {name: AsyncMock() for name in ("close_http_clients", "close_redis_pool", "close_pool")}
+
+    with patch.object(data_fetcher, "init_pool", AsyncMock()), \
+         patch.object(data_fetcher, "init_http_clients", AsyncMock()), \
+         patch.object(data_fetcher, "MarketDataFetcher", return_value=fetcher), \
+         patch.multiple(data_fetcher, **closers), \
+         patch("sys.argv", ["data_fetcher.py", "daily"]):
+        with pytest.raises(RuntimeError):
+            await data_fetcher.main()
+
+    for closer in closers.values():
+        closer.assert_awaited_once()
@@ -0,0 +1,152 @@
+"""Unit tests for the COPY-based bulk loader (backend/db/bulk_loader.py).
+
+This module tests:
+- Column-wise conversion (NaN/NaT -> None, NumPy scalars -> native, broadcast)
+- Staging table, COPY and merge statement sequence in one transaction
+- Merge SQL (update columns, touched columns, duplicate keys)
+- Identifier validation and empty input
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.db.bulk_loader import bulk_upsert, columns_to_records
+
+
+class MockAcquireContext:
+    """Mock async context manager for pool.acquire() / conn.transaction()."""
+    def __init__(self, value):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+@pytest.fixture
+def mock_conn():
+    """Patch get_pool() with a pool whose connection records statements."""
+    conn = MagicMock()
+    conn.execute = AsyncMock(side_effect=["SELECT 0", "INSERT 0 3"])
+    conn.copy_records_to_table = AsyncMock(return_value="COPY 3")
+    conn.transaction = MagicMock(return_value=MockAcquireContext(None))
+
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=MockAcquireContext(conn))
+    with patch("backend.db.bulk_loader.get_pool", return_value=pool):
+        yield conn
+
+
+# ==================== Column Conversion ====================
+
+
+@pytest.mark.unit
+def test_columns_to_records_converts_missing_and_numpy_values():
+    """NaN/NaT become None and NumPy scalars become native Python types."""
+    df = pd.DataFrame({
+        "symbol": ["SPY", "QQQ", "IWM"],
+        "date": pd.to_datetime(["2024-01-02", "2024-01-03", None]),
+        "log_return": [0.01, np.nan, -0.02],
+        "volume": np.array([100, 200, 300], dtype="int64"),
+    })
+
+    records = columns_to_records(df, ["symbol", "date", "log_return", "volume"])
+
+    assert records[0] == ("SPY", datetime.datetime(2024, 1, 2), 0.01, 100)
+    assert records[1][2] is None
+    assert records[2][1] is None
+    assert type(records[0][3]) is int
+
+
+@pytest.mark.unit
+def test_columns_to_records_broadcasts_scalars():
+    """A scalar column (e.g. one symbol) is repeated for every row."""
+    records = columns_to_records(
+        {"symbol": "SPY", "close": np.array([1.5, 2.5])}, ["symbol", "close"]
+    )
+    assert records == [("SPY", 1.5), ("SPY", 2.5)]
+
+
+@pytest.mark.unit
+def test_columns_to_records_rejects_ragged_columns():
+    """Columns of different lengths raise ValueError."""
+    with pytest.raises(ValueError):
+        columns_to_records({"a": [1, 2], "b": [1]}, ["a", "b"])
+
+
+# ==================== Bulk Upsert ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_upsert_stages_copies_and_merges(mock_conn):
+    """Rows are COPYed into a temp table and merged with one INSERT."""
+    df = pd.DataFrame({
+        "symbol": ["SPY", "SPY", "QQQ"],
+        "date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-02"]),
+        "log_return": [0.01, 0.02, np.nan],
+    })
+
+    rows = await bulk_upsert(
+        "daily_log_returns", df,
+        conflict_columns=["symbol", "date"],
+        touch_columns=["created_at"],
+    )
+
+    assert rows == 3
+    create_sql = mock_conn.execute.await_args_list[0].args[0]
+    assert "CREATE TEMP TABLE _stage_daily_log_returns ON COMMIT DROP" in create_sql
+    assert "FROM daily_log_returns WITH NO DATA" in create_sql
+
+    copy_call = mock_conn.copy_records_to_table.await_args
+    assert copy_call.args == ("_stage_daily_log_returns",)
+    assert copy_call.kwargs["columns"] == ["symbol", "date", "log_return"]
+    assert copy_call.kwargs["records"][2][2] is None
+
+    merge_sql = mock_conn.execute.await_args_list[1].args[0]
+    assert "SELECT DISTINCT ON (symbol, date)" in merge_sql
+    assert "ON CONFLICT (symbol, date) DO UPDATE SET" in merge_sql
+    assert "log_return = EXCLUDED.log_return" in merge_sql
+    assert "created_at = NOW()" in merge_sql
+    mock_conn.transaction.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_upsert_without_update_columns_does_nothing_on_conflict(mock_conn):
+    """With nothing to update, conflicting rows are skipped."""
+    await bulk_upsert(
+        "daily_bars", {"symbol": ["SPY"], "date": [datetime.date(2024, 1, 2)]},
+        conflict_columns=["symbol", "date"],
+    )
+
+    merge_sql = mock_conn.execute.await_args_list[1].args[0]
+    assert merge_sql.endswith("ON CONFLICT (symbol, date) DO NOTHING")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_upsert_empty_input_skips_database(mock_conn):
+    """No rows means no database round-trips."""
+    rows = await bulk_upsert(
+        "daily_bars", {"symbol": [], "date": []}, conflict_columns=["symbol", "date"]
+    )
+    assert rows == 0
+    mock_conn.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_upsert_rejects_invalid_identifiers(mock_conn):
+    """Table and column names are validated before building SQL."""
+    with pytest.raises(ValueError):
+        await bulk_upsert("daily_bars; DROP TABLE x", {"symbol": ["SPY"]}, ["symbol"])
+    with pytest.raises(ValueError):
+        await bulk_upsert("daily_bars", {"symbol": ["SPY"]}, ["date"])
+    mock_conn.execute.assert_not_called()
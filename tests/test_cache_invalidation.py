@@ -0,0 +1,248 @@
+"""Unit tests for cross-worker cache invalidation (backend/cache/invalidation.py).
+
+This module tests:
+- Event serialization round trip
+- publish_change deleting shared keys and publishing to the channel
+- Listener ignoring its own events and dispatching others
+- Local handler dispatch (sync, async, wildcard, failing handlers)
+- Writers publishing change events
+- PipelineState dropping fields on invalidation
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import redis_client
+from backend.cache import invalidation
+from backend.cache.invalidation import (
+    InvalidationEvent,
+    InvalidationListener,
+    INVALIDATION_CHANNEL,
+    SOURCE_PM_PITCHES,
+    SOURCE_CHAIRMAN_DECISIONS,
+    WORKER_ID,
+)
+
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    """Reset the Redis pool and registered handlers around each test."""
+    saved = {k: list(v) for k, v in invalidation._handlers.items()}
+    invalidation._handlers.clear()
+    yield
+    invalidation._handlers.clear()
+    invalidation._handlers.update(saved)
+    redis_client._redis_pool = None
+    redis_client._redis_config = None
+
+
+@pytest.fixture
+def mock_redis_pool():
+    """Install a mock async Redis pool as the global pool."""
+    mock_pool = AsyncMock()
+    mock_pool.publish = AsyncMock(return_value=2)
+    mock_pool.delete = AsyncMock(return_value=1)
+    redis_client._redis_pool = mock_pool
+    return mock_pool
+
+
+def _remote_event(source, **kwargs):
+    """Build an event that appears to come from another worker."""
+    return InvalidationEvent(source=source, origin="other-host:1:abc", **kwargs)
+
+
+# ==================== Events ====================
+
+
+@pytest.mark.unit
+def test_event_round_trip():
+    """Events survive JSON serialization."""
+    event = InvalidationEvent(
+        source=SOURCE_PM_PITCHES,
+        week_id="2024-01-10",
+        research_date="2024-01-10T08:00:00",
+        keys=("pitches:week:2024-01-10",),
+    )
+
+    assert InvalidationEvent.from_json(event.to_json()) == event
+
+
+@pytest.mark.unit
+def test_event_from_invalid_payload_raises_value_error():
+    """Malformed payloads raise ValueError."""
+    with pytest.raises(ValueError):
+        InvalidationEvent.from_json("not json")
+    with pytest.raises(ValueError):
+        InvalidationEvent.from_json(json.dumps({"week_id": "x"}))
+
+
+# ==================== Publishing ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_publish_change_deletes_keys_then_publishes(mock_redis_pool):
+    """Shared keys are deleted and the event is published on the channel."""
+    ok = await invalidation.publish_change(
+        SOURCE_PM_PITCHES, week_id="2024-01-10", keys=("pitches:latest",)
+    )
+
+    assert ok is True
+    mock_redis_pool.delete.assert_awaited_once_with("pitches:latest")
+    channel, payload = mock_redis_pool.publish.call_args.args
+    assert channel == INVALIDATION_CHANNEL
+    event = InvalidationEvent.from_json(payload)
+    assert event.source == SOURCE_PM_PITCHES
+    assert event.week_id == "2024-01-10"
+    assert event.origin == WORKER_ID
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_publish_change_without_pool_is_noop():
+    """Without the async Redis pool, publishing is skipped."""
+    assert await invalidation.publish_change(SOURCE_PM_PITCHES) is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_publish_change_never_raises(mock_redis_pool):
+    """Redis errors are reported as False."""
+    mock_redis_pool.publish.side_effect = ConnectionError("down")
+
+    assert await invalidation.publish_change(SOURCE_PM_PITCHES) is False
+
+
+# ==================== Dispatch ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_dispatch_runs_source_and_wildcard_handlers():
+    """Sync, async and wildcard handlers all receive the event."""
+    sync_handler = MagicMock()
+    async_handler = AsyncMock()
+    wildcard = MagicMock()
+    other = MagicMock()
+    invalidation.subscribe(SOURCE_PM_PITCHES, sync_handler)
+    invalidation.subscribe(SOURCE_PM_PITCHES, async_handler)
+    invalidation.subscribe(invalidation.ALL_SOURCES, wildcard)
+    invalidation.subscribe(SOURCE_CHAIRMAN_DECISIONS, other)
+
+    event = _remote_event(SOURCE_PM_PITCHES)
+    assert await invalidation.dispatch(event) == 3
+
+    sync_handler.assert_called_once_with(event)
+    async_handler.assert_awaited_once_with(event)
+    wildcard.assert_called_once_with(event)
+    other.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_dispatch_continues_after_failing_handler():
+    """A failing handler does not stop the others."""
+    after = MagicMock()
+    invalidation.subscribe(SOURCE_PM_PITCHES, MagicMock(side_effect=Exception("boom")))
+    invalidation.subscribe(SOURCE_PM_PITCHES, after)
+
+    assert await invalidation.dispatch(_remote_event(SOURCE_PM_PITCHES)) == 1
+    after.assert_called_once()
+
+
+# ==================== Listener ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_listener_ignores_own_events():
+    """Events published by this worker are not dispatched locally."""
+    handler = MagicMock()
+    invalidation.subscribe(SOURCE_PM_PITCHES, handler)
+    listener = InvalidationListener()
+
+    own = InvalidationEvent(source=SOURCE_PM_PITCHES).to_json()
+    assert await listener.handle_message(own) is False
+
+    remote = _remote_event(SOURCE_PM_PITCHES).to_json().encode("utf-8")
+    assert await listener.handle_message(remote) is True
+
+    handler.assert_called_once()
+    assert listener.received == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_listener_ignores_invalid_payload():
+    """Malformed messages are dropped without raising."""
+    assert await InvalidationListener().handle_message("{bad") is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_listener_start_requires_redis_pool():
+    """Starting without the async Redis pool raises RuntimeError."""
+    with pytest.raises(RuntimeError):
+        await InvalidationListener().start()
+
+
+# ==================== Writers ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_save_chairman_decision_publishes_change(mock_transaction):
+    """Writers announce the change after a successful save."""
+    from backend.db import council_db
+
+    with patch.object(council_db, "transaction", mock_transaction()), \
+         patch.object(council_db, "publish_change", AsyncMock()) as publish:
+        await council_db.save_chairman_decision("2024-01-10", {"a": 1}, "2024-01-10")
+
+    publish.assert_awaited_once_with(
+        SOURCE_CHAIRMAN_DECISIONS, week_id="2024-01-10", research_date="2024-01-10"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_save_pitches_publishes_pitch_keys(mock_transaction):
+    """save_pitches invalidates the shared pitch keys for the week."""
+    from backend.db import pitch_db
+
+    with patch.object(pitch_db, "transaction", mock_transaction()), \
+         patch.object(pitch_db, "publish_change", AsyncMock()) as publish:
+        await pitch_db.save_pitches("2024-01-10", [{"model": "gpt", "conviction": 1}])
+
+    args, kwargs = publish.call_args
+    assert args == (SOURCE_PM_PITCHES,)
+    assert "pitches:week:2024-01-10" in kwargs["keys"]
+    assert "pitches:latest" in kwargs["keys"]
+
+
+# ==================== PipelineState ====================
+
+
+@pytest.mark.unit
+def test_pipeline_state_drops_fields_for_source():
+    """PipelineState.invalidate clears only fields derived from the source."""
+    from backend.main import PipelineState
+
+    state = PipelineState()
+    state.pm_pitches = [{"model": "gpt"}]
+    state.pm_pitches_raw = [{"model": "gpt"}]
+    state.pm_pitch_ids = {"gpt": "pitch-id"}
+    state.council_decision = {"selected": "gpt"}
+
+    state.invalidate(_remote_event(SOURCE_PM_PITCHES))
+    assert state.pm_pitches is None
+    assert state.pm_pitches_raw is None
+    assert state.pm_pitch_ids is None
+    assert state.council_decision == {"selected": "gpt"}
+
+    state.invalidate(_remote_event("ChairmanStage"))
+    assert state.council_decision is None
@@ -0,0 +1,258 @@
+"""Unit tests for cache observability (backend/cache/stats.py).
+
+This module tests:
+- Key family grouping via parse_key
+- Histogram bucketing, percentiles and merging
+- Decorator recording hits, misses, errors, sizes and compression ratio
+- Merging per-worker snapshots
+- Cluster collection reads snapshots without publishing one
+- /api/cache/stats endpoint
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from backend import redis_client
+from backend.cache.decorator import cached
+from backend.cache.stats import (
+    CacheStats,
+    Histogram,
+    STATS_KEY_PREFIX,
+    cache_stats,
+    collect_cluster_stats,
+    family_for_key,
+    merge_snapshots,
+)
+
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    """Reset global stats and the async Redis pool around each test."""
+    cache_stats.reset()
+    yield
+    cache_stats.reset()
+    redis_client._redis_pool = None
+    redis_client._redis_config = None
+
+
+@pytest.fixture
+def mock_redis_pool():
+    """Install a mock async Redis pool as the global pool."""
+    mock_pool = AsyncMock()
+    mock_pool.get = AsyncMock(return_value=None)
+    mock_pool.setex = AsyncMock(return_value=True)
+    redis_client._redis_pool = mock_pool
+    return mock_pool
+
+
+def _family(name):
+    return cache_stats.snapshot()["families"][name]
+
+
+# ==================== Families ====================
+
+
+@pytest.mark.unit
+def test_family_for_key_groups_by_category_and_subcategory():
+    """Keys with different identifiers share a family."""
+    assert family_for_key("research:report:abc") == "research:report"
+    assert family_for_key("market:prices:symbol:SPY:latest") == "market:prices"
+    assert family_for_key("pitches:latest") == "pitches:latest"
+    assert family_for_key("nocolon") == "unknown"
+
+
+# ==================== Histogram ====================
+
+
+@pytest.mark.unit
+def test_histogram_buckets_and_percentiles():
+    """Values land in the first bucket whose bound is >= value."""
+    hist = Histogram((1.0, 10.0))
+    for value in (0.5, 1.0, 5.0, 50.0):
+        hist.observe(value)
+
+    data = hist.to_dict()
+    assert data["counts"] == [2, 1, 1]
+    assert data["count"] == 4
+    assert data["max"] == 50.0
+    assert data["p50"] == 1.0
+    assert data["p95"] == 50.0
+
+
+@pytest.mark.unit
+def test_merge_snapshots_adds_counts():
+    """Worker snapshots merge into one view."""
+    a, b = CacheStats(), CacheStats()
+    a.record_hit("market:metrics:latest", 0.2, 100)
+    b.record_hit("market:metrics:latest", 0.3, 200)
+    b.record_miss("market:metrics:latest")
+
+    merged = merge_snapshots([a.snapshot(), b.snapshot()])
+
+    family = merged["families"]["market:metrics"]
+    assert merged["workers"] == 2
+    assert family["hits"] == 2
+    assert family["misses"] == 1
+    assert family["hit_rate"] == round(2 / 3, 4)
+    assert family["payload_bytes"]["count"] == 2
+
+
+# ==================== Decorator Recording ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_decorator_records_miss_set_and_hit(mock_redis_pool):
+    """A miss, the following SET and a hit are all recorded."""
+    @cached(key="market:metrics:latest", ttl=60)
+    async def load():
+        return {"v": 1}
+
+    await load()
+    mock_redis_pool.get.return_value = json.dumps({"v": 1})
+    await load()
+
+    family = _family("market:metrics")
+    assert family["misses"] == 1
+    assert family["sets"] == 1
+    assert family["hits"] == 1
+    assert family["deserialize_ms"]["count"] == 1
+    assert family["serialize_ms"]["count"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_decorator_records_compression_ratio(mock_redis_pool):
+    """Compressed payloads record uncompressed/compressed ratio."""
+    @cached(key="data_package:latest", ttl=60, compress=True, compression_threshold=10)
+    async def load():
+        return {"bars": ["x" * 100] * 50}
+
+    await load()
+
+    ratio = _family("data_package:latest")["compression_ratio"]
+    assert ratio["count"] == 1
+    assert ratio["mean"] > 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_decorator_records_errors(mock_redis_pool):
+    """Redis and deserialization failures count as errors."""
+    mock_redis_pool.get.side_effect = ConnectionError("down")
+
+    @cached(key="research:latest", ttl=60)
+    async def load():
+        return {"v": 1}
+
+    assert await load() == {"v": 1}
+
+    family = _family("research:latest")
+    # GET failed, then the function ran (miss) and the SET succeeded
+    assert family["errors"] == 1
+    assert family["misses"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_decorator_failed_set_is_an_error_not_a_set(mock_redis_pool):
+    """A SET that fails or times out records an error and no payload."""
+    mock_redis_pool.setex.side_effect = TimeoutError("timed out")
+
+    @cached(key="market:metrics:latest", ttl=60)
+    async def load():
+        return {"v": 1}
+
+    assert await load() == {"v": 1}
+
+    family = _family("market:metrics")
+    assert family["sets"] == 0
+    assert family["errors"] == 1
+    assert family["payload_bytes"]["count"] == 0
+
+
+# ==================== Cluster Stats ====================
+
+
+def _scan(keys):
+    async def scan_iter(match=None):
+        for key in keys:
+            yield key
+    return scan_iter
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_collect_cluster_stats_only_reads(mock_redis_pool):
+    """Snapshots are read, never written; this worker's comes from memory."""
+    from backend.cache.invalidation import WORKER_ID
+
+    other = {"families": {"market:metrics": {"hits": 5, "misses": 1}}}
+    stale_own = {"families": {"market:metrics": {"hits": 100}}}
+    mock_redis_pool.scan_iter = _scan([STATS_KEY_PREFIX + "other", STATS_KEY_PREFIX + WORKER_ID])
+    mock_redis_pool.get.side_effect = lambda key: json.dumps(other if key.endswith("other") else stale_own)
+    cache_stats.record_hit("market:metrics:latest", deserialize_ms=0.1, payload_bytes=10)
+
+    result = await collect_cluster_stats()
+
+    mock_redis_pool.setex.assert_not_called()
+    assert result["scope"] == "cluster"
+    assert result["workers"] == 2
+    assert result["families"]["market:metrics"]["hits"] == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_collect_cluster_stats_without_local_can_be_empty(mock_redis_pool):
+    """The CLI does not count itself: no published workers means no stats."""
+    mock_redis_pool.scan_iter = _scan([])
+
+    result = await collect_cluster_stats(include_local=False)
+
+    mock_redis_pool.setex.assert_not_called()
+    assert result == {"scope": "cluster", "workers": 0, "families": {}}
+
+
+# ==================== Endpoint ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_stats_endpoint_local_scope():
+    """scope=local returns this worker's stats."""
+    from backend.api.cache import get_cache_stats
+
+    cache_stats.record_miss("graphs:latest")
+
+    result = await get_cache_stats(scope="local")
+
+    assert result["scope"] == "local"
+    assert result["families"]["graphs:latest"]["misses"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_stats_endpoint_falls_back_without_redis():
+    """Without Redis, cluster scope falls back to local stats."""
+    from backend.api.cache import get_cache_stats
+
+    result = await get_cache_stats(scope="cluster")
+
+    assert result["scope"] == "local"
+    assert result["workers"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_stats_endpoint_rejects_bad_scope():
+    """Unknown scopes are rejected with 400."""
+    from fastapi import HTTPException
+    from backend.api.cache import get_cache_stats
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_cache_stats(scope="everything")
+    assert exc_info.value.status_code == 400
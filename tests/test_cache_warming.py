@@ -0,0 +1,269 @@
+"""Unit tests for proactive cache warming (backend/cache/warming.py).
+
+This module tests:
+- Dependency map between cache keys and source tables/stages
+- Target selection by source
+- Warming order (base keys before composite keys)
+- Skipping when the database or Redis pool is unavailable
+- @cached refresh() used by warmers
+- Failed research reads are not cached and surface as errors
+- Pipeline on_stage_complete hook
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import redis_client
+from backend.cache import warming
+from backend.cache.decorator import cached
+from backend.cache.keys import (
+    market_metrics_key,
+    market_prices_key,
+    research_latest_key,
+    graphs_latest_key,
+    data_package_key,
+)
+
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_pool():
+    """Reset the global async Redis pool around each test."""
+    yield
+    redis_client._redis_pool = None
+    redis_client._redis_config = None
+
+
+@pytest.fixture
+def mock_redis_pool():
+    """Install a mock async Redis pool as the global pool."""
+    mock_pool = AsyncMock()
+    mock_pool.get = AsyncMock(return_value=None)
+    mock_pool.set = AsyncMock(return_value=True)
+    mock_pool.setex = AsyncMock(return_value=True)
+    redis_client._redis_pool = mock_pool
+    return mock_pool
+
+
+def _target(key, sources, composite=False, result=None, calls=None):
+    """Build a WarmTarget whose refresh records call order."""
+    async def refresh():
+        if calls is not None:
+            calls.append(key)
+        return {"key": key} if result is None else result
+
+    return warming.WarmTarget(key, refresh, frozenset(sources), composite)
+
+
+# ==================== Dependency Map ====================
+
+
+@pytest.mark.unit
+def test_key_dependencies_cover_dashboard_keys():
+    """Every dashboard key is registered with its source tables."""
+    deps = warming.get_key_dependencies()
+
+    assert deps[market_metrics_key()] == warming.METRICS_SOURCES
+    assert deps[market_prices_key()] == {warming.TABLE_DAILY_BARS}
+    assert warming.STAGE_RESEARCH in deps[research_latest_key()]
+    assert warming.STAGE_RESEARCH in deps[graphs_latest_key()]
+    # Data package aggregates every source
+    assert warming.TABLE_DAILY_BARS in deps[data_package_key()]
+    assert warming.TABLE_CORRELATION_MATRIX in deps[data_package_key()]
+    assert warming.TABLE_RESEARCH_REPORTS in deps[data_package_key()]
+
+
+@pytest.mark.unit
+def test_targets_for_sources_filters_by_source():
+    """Only keys derived from the changed sources are selected."""
+    keys = [t.key for t in warming.targets_for_sources([warming.TABLE_DAILY_BARS])]
+
+    assert keys == [market_prices_key(), data_package_key()]
+
+
+@pytest.mark.unit
+def test_targets_for_sources_none_selects_all():
+    """No sources means every registered target."""
+    assert len(warming.targets_for_sources()) == len(warming.WARM_TARGETS)
+
+
+@pytest.mark.unit
+def test_targets_for_unknown_source_is_empty():
+    """A source nothing depends on selects no targets."""
+    assert warming.targets_for_sources(["fetch_log"]) == []
+
+
+# ==================== Warming ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_warm_cache_runs_composites_after_base_keys():
+    """Composite keys are refreshed after all base keys."""
+    calls = []
+    targets = [
+        _target("data_package:latest", ["t"], composite=True, calls=calls),
+        _target("market:metrics:latest", ["t"], calls=calls),
+        _target("market:prices:latest", ["t"], calls=calls),
+    ]
+
+    with patch.object(warming, "WARM_TARGETS", targets), \
+         patch.object(warming, "_ensure_pools", AsyncMock(return_value=True)):
+        results = await warming.warm_cache(["t"])
+
+    assert calls[-1] == "data_package:latest"
+    assert results == {
+        "market:metrics:latest": True,
+        "market:prices:latest": True,
+        "data_package:latest": True,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_warm_cache_reports_failures():
+    """A failing or empty refresh is reported as False without raising."""
+    async def failing():
+        raise RuntimeError("db down")
+
+    targets = [
+        warming.WarmTarget("a:b", failing, frozenset({"t"})),
+        _target("c:d", ["t"]),
+    ]
+
+    with patch.object(warming, "WARM_TARGETS", targets), \
+         patch.object(warming, "_ensure_pools", AsyncMock(return_value=True)):
+        results = await warming.warm_cache()
+
+    assert results == {"a:b": False, "c:d": True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_warm_cache_skipped_without_db_pool():
+    """Warming is skipped when the database pool is not initialized."""
+    refresh = AsyncMock()
+    targets = [warming.WarmTarget("a:b", refresh, frozenset({"t"}))]
+
+    with patch.object(warming, "WARM_TARGETS", targets), \
+         patch("backend.db.pool.get_pool", side_effect=RuntimeError("no pool")):
+        results = await warming.warm_cache()
+
+    assert results == {}
+    refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_warm_after_update_never_raises():
+    """The producer hook swallows unexpected errors."""
+    with patch.object(warming, "warm_cache", AsyncMock(side_effect=Exception("boom"))):
+        assert await warming.warm_after_update("daily_bars") == {}
+
+
+# ==================== Decorator refresh() ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cached_refresh_bypasses_cache_and_stores(mock_redis_pool):
+    """refresh() always calls the function and overwrites the cached value."""
+    mock_redis_pool.get.return_value = json.dumps({"v": "stale"})
+
+    @cached(key="test:refresh", ttl=60)
+    async def load():
+        return {"v": "fresh"}
+
+    result = await load.refresh()
+
+    assert result == {"v": "fresh"}
+    mock_redis_pool.get.assert_not_called()
+    mock_redis_pool.setex.assert_called_once_with(
+        "test:refresh", 60, json.dumps({"v": "fresh"}, separators=(",", ":"))
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cached_cache_none_false_skips_none(mock_redis_pool):
+    """cache_none=False keeps error results (None) out of the cache."""
+    @cached(key="test:none", ttl=60, cache_none=False)
+    async def load():
+        return None
+
+    assert await load() is None
+    assert await load.refresh() is None
+    mock_redis_pool.setex.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_research_keys_not_cached_when_read_fails(mock_redis_pool):
+    """A failed research read fails the warm instead of caching {} for an hour."""
+    from backend.db import research_db
+    from backend.services.market_service import MarketService
+
+    keys = {research_latest_key(), graphs_latest_key(), data_package_key()}
+    targets = [t for t in warming.WARM_TARGETS if t.key in keys]
+
+    with patch.object(research_db, "fetch_one", AsyncMock(side_effect=RuntimeError("db down"))), \
+         patch.object(MarketService, "get_market_metrics", AsyncMock(return_value={"symbols": []})), \
+         patch.object(MarketService, "get_current_prices", AsyncMock(return_value={"prices": []})):
+        outcomes = [await warming._warm_target(t) for t in targets]
+
+    assert len(targets) == 3
+    assert outcomes == [False, False, False]
+    mock_redis_pool.setex.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_research_endpoints_fail_on_failed_read():
+    """Endpoints answer 500 when the service returns None."""
+    from fastapi import HTTPException
+    from backend.api import research
+
+    with patch.object(research.research_service, "get_latest_graphs", AsyncMock(return_value=None)), \
+         patch.object(research.research_service, "get_latest_data_package", AsyncMock(return_value=None)):
+        for endpoint in (research.get_latest_graphs, research.get_latest_data_package):
+            with pytest.raises(HTTPException) as excinfo:
+                await endpoint()
+            assert excinfo.value.status_code == 500
+
+
+@pytest.mark.unit
+def test_cached_cache_key_helper():
+    """cache_key() returns the key a call would use."""
+    @cached(key_builder=lambda week_id: f"pitches:week:{week_id}")
+    async def load(week_id):
+        return week_id
+
+    assert load.cache_key("2024-01-10") == "pitches:week:2024-01-10"
+
+
+# ==================== Pipeline Hook ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pipeline_calls_on_stage_complete():
+    """Pipeline invokes the hook with each stage name in order."""
+    from backend.pipeline.base import Pipeline
+    from backend.pipeline.context import PipelineContext
+
+    def make_stage(name):
+        stage = MagicMock()
+        stage.name = name
+        stage.execute = AsyncMock(side_effect=lambda ctx: ctx)
+        return stage
+
+    hook = AsyncMock()
+    pipeline = Pipeline([make_stage("A"), make_stage("B")], on_stage_complete=hook)
+    await pipeline.execute(PipelineContext())
+
+    assert [c.args[0] for c in hook.call_args_list] == ["A", "B"]
+    # with_stage keeps the hook
+    assert pipeline.with_stage(make_stage("C")).on_stage_complete is hook
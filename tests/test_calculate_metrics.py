@@ -0,0 +1,165 @@
+"""Unit tests for incremental metrics (backend/storage/calculate_metrics.py).
+
+This module tests:
+- Incremental runs compute exactly the backfill's values for new dates
+- Only rows after each symbol's high-water mark are upserted
+- Bars revised inside the re-fetch window get their metrics recomputed
+- High-water marks need both return tables
+- --backfill loads everything and ignores marks
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.storage import calculate_metrics
+from backend.storage.calculate_metrics import LOOKBACK_BARS, REFETCH_DAYS, MetricsCalculator, refetch_floor
+
+SYMBOLS = ["SPY", "QQQ", "TLT"]
+
+
+def make_bars(days=90, seed=7):
+    """Random-walk closes for SYMBOLS on business days."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=days)
+    frames = []
+    for symbol in SYMBOLS:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, days)))
+        frames.append(pd.DataFrame({"symbol": symbol, "date": dates, "close": close}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def bars_since(bars, marks, lookback):
+    """What MetricsDB.load_daily_bars_since selects, in pandas."""
+    parts = []
+    for symbol, mark in marks.items():
+        rows = bars[bars["symbol"] == symbol].sort_values("date")
+        if mark is None:
+            parts.append(rows)
+            continue
+        mark = pd.Timestamp(mark)
+        parts.append(pd.concat([rows[rows["date"] <= mark].tail(lookback), rows[rows["date"] > mark]]))
+    return pd.concat(parts, ignore_index=True)
+
+
+async def run(bars, backfill, marks=None, correlation_mark=None):
+    """Run the calculator against in-memory bars; return what it upserted."""
+    calculator = MetricsCalculator()
+    db = calculator.db
+    db.load_daily_bars = AsyncMock(return_value=bars)
+    db.load_high_water_marks = AsyncMock(return_value=(marks or {}, correlation_mark))
+    db.load_daily_bars_since = AsyncMock(side_effect=lambda m, lookback: bars_since(bars, m, lookback))
+    db.upsert_daily_log_returns = AsyncMock()
+    db.upsert_7day_log_returns = AsyncMock()
+    db.upsert_correlation_matrix = AsyncMock()
+
+    with patch.object(calculate_metrics, "warm_after_update", AsyncMock(return_value={})):
+        await calculator.run_all_calculations(backfill=backfill)
+
+    return db, (
+        db.upsert_daily_log_returns.await_args.args[0],
+        db.upsert_7day_log_returns.await_args.args[0],
+        db.upsert_correlation_matrix.await_args.args[0],
+    )
+
+
+def after(df, mark):
+    return df[df["date"] > pd.Timestamp(mark)].reset_index(drop=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_incremental_matches_backfill_for_new_dates():
+    bars = make_bars()
+    dates = sorted(bars["date"].unique())
+    mark = dates[70].date()
+
+    _, (full_daily, full_7d, full_corr) = await run(bars, backfill=True)
+    db, (daily, weekly, corr) = await run(
+        bars, backfill=False, marks={s: mark for s in SYMBOLS}, correlation_mark=mark
+    )
+
+    # Loaded only the new bars plus the lookback, not the history
+    load_marks, lookback = db.load_daily_bars_since.await_args.args
+    assert lookback == LOOKBACK_BARS
+    assert len(bars_since(bars, load_marks, lookback)) == len(SYMBOLS) * (len(dates) - 71 + LOOKBACK_BARS)
+
+    pd.testing.assert_frame_equal(daily.reset_index(drop=True), after(full_daily, mark))
+    pd.testing.assert_frame_equal(weekly.reset_index(drop=True), after(full_7d, mark))
+    pd.testing.assert_frame_equal(corr.reset_index(drop=True), after(full_corr, mark))
+    assert corr["date"].nunique() == len(dates) - 71
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_incremental_uses_each_symbols_mark():
+    bars = make_bars()
+    dates = sorted(bars["date"].unique())
+    marks = {"SPY": dates[80].date(), "QQQ": dates[60].date(), "TLT": None}
+
+    _, (full_daily, _, full_corr) = await run(bars, backfill=True)
+    _, (daily, _, corr) = await run(bars, backfill=False, marks=marks, correlation_mark=dates[75].date())
+
+    counts = daily.groupby("symbol").size()
+    assert counts["SPY"] == len(dates) - 81
+    assert counts["QQQ"] == len(dates) - 61
+    assert counts["TLT"] == len(dates) - 1  # no mark: full history
+    pd.testing.assert_frame_equal(corr.reset_index(drop=True), after(full_corr, dates[75].date()))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_incremental_recomputes_revised_bars():
+    bars = make_bars()
+    dates = sorted(bars["date"].unique())
+    last = dates[-1].date()
+    # Everything was computed, then the daily update re-fetched a revised bar
+    revised = bars.copy()
+    revised.loc[(revised["symbol"] == "SPY") & (revised["date"] == dates[-3]), "close"] *= 1.02
+    floor = refetch_floor(last)
+
+    _, (full_daily, full_7d, full_corr) = await run(revised, backfill=True)
+    with patch.object(calculate_metrics, "refetch_floor", return_value=floor):
+        _, (daily, weekly, corr) = await run(
+            revised, backfill=False, marks={s: last for s in SYMBOLS}, correlation_mark=last
+        )
+
+    assert dates[-3] in set(daily["date"])
+    pd.testing.assert_frame_equal(daily.reset_index(drop=True), after(full_daily, floor))
+    pd.testing.assert_frame_equal(weekly.reset_index(drop=True), after(full_7d, floor))
+    pd.testing.assert_frame_equal(corr.reset_index(drop=True), after(full_corr, floor))
+    assert floor == last - datetime.timedelta(days=REFETCH_DAYS + 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_backfill_ignores_marks():
+    bars = make_bars(days=50)
+    db, (daily, _, corr) = await run(bars, backfill=True, marks={"SPY": datetime.date(2030, 1, 1)})
+
+    db.load_high_water_marks.assert_not_awaited()
+    db.load_daily_bars_since.assert_not_awaited()
+    assert len(daily) == len(SYMBOLS) * 49
+    assert corr["date"].nunique() == 50 - 7 - 29
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_high_water_marks_need_both_return_tables():
+    d1, d2 = datetime.date(2024, 3, 1), datetime.date(2024, 3, 4)
+    columns = {
+        "symbol": ["SPY", "QQQ", "TLT"],
+        "daily_mark": [d2, d2, None],
+        "weekly_mark": [d1, None, None],
+        "correlation_mark": [d1, d1, d1],
+    }
+
+    with patch.object(calculate_metrics, "fetch_columns", AsyncMock(return_value=columns)) as fetch:
+        marks, correlation_mark = await calculate_metrics.MetricsDB().load_high_water_marks(SYMBOLS)
+
+    assert fetch.await_args.args[1] == SYMBOLS
+    assert marks == {"SPY": d1, "QQQ": None, "TLT": None}
+    assert correlation_mark == d1
@@ -0,0 +1,121 @@
+"""Unit tests for the LISTEN/NOTIFY change feed (backend/db/change_feed.py).
+
+This module tests:
+- Parsing trigger payloads into invalidation events and push messages
+- Fan-out to cache invalidation (skipped for this process's own writes)
+- Bounded per-client push queues
+- The SSE stream filters by table
+- The schema defines a notify trigger for every feed table
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.cache.keys import pitches_latest_key, pitches_week_key
+from backend.db import change_feed
+from backend.db.pool import APPLICATION_NAME
+
+SCHEMA = Path(__file__).parent.parent / "backend" / "storage" / "postgres_schema.sql"
+
+
+def payload(table="pm_pitches", app="cron:backfill", **fields):
+    data = {"table": table, "op": "INSERT", "week_id": "2024-01-10",
+            "research_date": None, "account": None, "app": app}
+    data.update(fields)
+    return json.dumps(data)
+
+
+@pytest.mark.unit
+def test_parse_notification_builds_event_and_message():
+    event, message = change_feed.parse_notification(payload())
+
+    assert event.source == "pm_pitches"
+    assert event.origin == "postgres:cron:backfill"
+    assert set(event.keys) == {pitches_latest_key(), pitches_week_key("2024-01-10")}
+    assert message["table"] == "pm_pitches"
+    assert message["op"] == "INSERT"
+
+    with pytest.raises(ValueError):
+        change_feed.parse_notification("not json")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_external_write_invalidates_and_pushes():
+    broadcaster = change_feed.ChangeBroadcaster()
+    queue = broadcaster.subscribe()
+    listener = change_feed.ChangeFeedListener(config=MagicMock(), broadcaster=broadcaster)
+
+    with patch.object(change_feed, "dispatch", AsyncMock()) as dispatch, \
+         patch.object(change_feed, "_delete_shared_keys", AsyncMock()) as delete_keys:
+        assert await listener.handle_notification(payload()) is True
+
+    dispatch.assert_awaited_once()
+    assert dispatch.await_args.args[0].source == "pm_pitches"
+    delete_keys.assert_awaited_once()
+    assert queue.get_nowait()["week_id"] == "2024-01-10"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_own_write_is_pushed_but_not_reinvalidated():
+    """The writing worker already called publish_change()."""
+    broadcaster = change_feed.ChangeBroadcaster()
+    queue = broadcaster.subscribe()
+    listener = change_feed.ChangeFeedListener(config=MagicMock(), broadcaster=broadcaster)
+
+    with patch.object(change_feed, "dispatch", AsyncMock()) as dispatch, \
+         patch.object(change_feed, "_delete_shared_keys", AsyncMock()) as delete_keys:
+        await listener.handle_notification(payload(app=APPLICATION_NAME))
+
+    dispatch.assert_not_called()
+    delete_keys.assert_not_called()
+    assert queue.qsize() == 1
+
+
+@pytest.mark.unit
+def test_broadcaster_drops_oldest_for_slow_clients():
+    broadcaster = change_feed.ChangeBroadcaster(max_queue=2)
+    queue = broadcaster.subscribe()
+
+    for i in range(3):
+        broadcaster.publish({"table": "execution_events", "n": i})
+
+    assert [queue.get_nowait()["n"] for _ in range(2)] == [1, 2]
+    assert broadcaster.dropped == 1
+    broadcaster.unsubscribe(queue)
+    assert broadcaster.clients == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sse_stream_filters_tables():
+    from backend.api import events
+
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(side_effect=[False, False, True])
+    stream = events.change_events(request, {"execution_events"}, heartbeat=0.01)
+
+    first = await stream.__anext__()
+    assert json.loads(first[len("data: "):])["type"] == "connected"
+
+    change_feed.broadcaster.publish({"table": "pm_pitches"})
+    change_feed.broadcaster.publish({"table": "execution_events", "op": "INSERT"})
+    frames = [frame async for frame in stream]
+
+    assert len(frames) == 1
+    assert json.loads(frames[0][len("data: "):]) == {"type": "change", "table": "execution_events", "op": "INSERT"}
+    assert change_feed.broadcaster.clients == 0
+
+
+@pytest.mark.unit
+def test_schema_defines_notify_triggers():
+    schema = SCHEMA.read_text()
+    assert "CREATE OR REPLACE FUNCTION notify_table_change()" in schema
+    assert f"'{change_feed.CHANGE_CHANNEL}'" in schema
+    for table in change_feed.FEED_TABLES:
+        assert f"FOR EACH ROW EXECUTE FUNCTION notify_table_change('{table}');" in schema
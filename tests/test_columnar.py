@@ -0,0 +1,94 @@
+"""Unit tests for column-wise reads (backend/db/columnar.py).
+
+This module tests:
+- Rows transpose into {column: [values]} in select-list order
+- Float arrays map None to NaN
+- DataFrames are built from columns
+- fetch_columns routes by intent and returns columns (backend/db_helpers.py)
+"""
+
+import datetime
+import math
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import db_helpers
+from backend.db import columnar
+
+
+class Record(tuple):
+    """Tuple with keys(), iterating values like asyncpg.Record."""
+
+    def __new__(cls, **fields):
+        record = super().__new__(cls, fields.values())
+        record._keys = list(fields)
+        return record
+
+    def keys(self):
+        return self._keys
+
+
+ROWS = [
+    Record(symbol="SPY", date=datetime.date(2024, 1, 2), close=470.5),
+    Record(symbol="SPY", date=datetime.date(2024, 1, 3), close=None),
+    Record(symbol="SPY", date=datetime.date(2024, 1, 4), close=468.0),
+]
+
+
+@pytest.mark.unit
+def test_rows_to_columns_transposes_in_order():
+    cols = columnar.rows_to_columns(ROWS, ["symbol", "date", "close"])
+
+    assert list(cols) == ["symbol", "date", "close"]
+    assert cols["close"] == [470.5, None, 468.0]
+    assert columnar.rows_to_columns([], ["symbol", "close"]) == {"symbol": [], "close": []}
+
+
+@pytest.mark.unit
+def test_columns_to_arrays_maps_none_to_nan():
+    cols = columnar.rows_to_columns(ROWS, ["symbol", "date", "close"])
+
+    arrays = columnar.columns_to_arrays(cols, float_columns=["close"])
+
+    assert arrays["close"].dtype.name == "float64"
+    assert arrays["close"][0] == 470.5
+    assert math.isnan(arrays["close"][1])
+    assert list(arrays["symbol"]) == ["SPY"] * 3
+    assert columnar.to_float_array([1, 2.5]).tolist() == [1.0, 2.5]
+
+
+@pytest.mark.unit
+def test_columns_to_dataframe():
+    cols = columnar.rows_to_columns(ROWS, ["symbol", "date", "close"])
+
+    df = columnar.columns_to_dataframe(cols)
+
+    assert list(df.columns) == ["symbol", "date", "close"]
+    assert len(df) == 3
+    assert df["close"].isna().sum() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fetch_columns_uses_intent_pool():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=ROWS)
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+
+    with patch.object(db_helpers, "get_pool", MagicMock()) as get_pool, \
+         patch.object(db_helpers, "timed_acquire", MagicMock(return_value=acquire)):
+        cols = await db_helpers.fetch_columns("SELECT 1", "SPY", intent="batch")
+        get_pool.assert_called_once_with("batch")
+
+        conn.fetch = AsyncMock(return_value=[])
+        assert await db_helpers.fetch_columns("SELECT 1") == {}
+
+    assert conn.fetch.await_args.args == ("SELECT 1",)
+    assert cols == {
+        "symbol": ["SPY"] * 3,
+        "date": [row[1] for row in ROWS],
+        "close": [470.5, None, 468.0],
+    }
@@ -0,0 +1,132 @@
+"""Unit tests for batched pitch and council writes (pitch_db, council_db).
+
+This module tests:
+- save_pitches: one transaction, set-based DELETE, one INSERT ... RETURNING
+- save_peer_reviews: one pitch-ID lookup and one executemany for all reviews
+- save_council_results: reviews and chairman decision in one transaction
+- The council endpoint passes the saved pitch IDs on to the council save
+"""
+
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.db import council_db, pitch_db
+
+
+@pytest.fixture
+def conn():
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value="DELETE 0")
+    conn.executemany = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[])
+    return conn
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_save_pitches_is_two_statements_in_one_transaction(conn, mock_transaction):
+    """All pitches are replaced with one DELETE and one INSERT returning IDs."""
+    ids = {"gpt": uuid.uuid4(), "claude": uuid.uuid4()}
+    conn.fetch.return_value = [{"model": m, "id": i} for m, i in ids.items()]
+    pitches = [
+        {"model": "gpt", "conviction": 1, "selected_instrument": "SPY", "direction": "LONG"},
+        {"model": "claude", "conviction": -1, "instrument": "TLT", "direction": "SHORT"},
+        {"model": "gpt", "conviction": 2, "selected_instrument": "QQQ", "direction": "LONG"},
+    ]
+    transaction = mock_transaction(conn)
+
+    with patch.object(pitch_db, "transaction", transaction), \
+         patch.object(pitch_db, "publish_change", AsyncMock()):
+        result = await pitch_db.save_pitches("2024-01-10", pitches, "2024-01-10T09:00:00")
+
+    assert transaction.call_count == 1
+    assert conn.execute.await_count == 1
+    delete_args = conn.execute.await_args.args
+    assert "model = ANY" in delete_args[0]
+    assert delete_args[2] == ["gpt", "claude"]
+
+    assert conn.fetch.await_count == 1
+    insert_args = conn.fetch.await_args.args
+    assert "RETURNING id, model" in insert_args[0]
+    assert insert_args[2] == ["gpt", "claude"]
+    assert insert_args[5] == ["QQQ", "TLT"]  # last pitch per model wins
+    assert insert_args[7] == [2.0, -1.0]
+    assert result == {m: str(i) for m, i in ids.items()}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_save_peer_reviews_batches_lookup_and_inserts(conn, mock_transaction):
+    """Pitch IDs are resolved in one query and reviews inserted in one executemany."""
+    pitch_id = uuid.uuid4()
+    conn.fetch.return_value = [{"model": "claude", "id": pitch_id}]
+    reviews = [
+        {"reviewer_model": "gpt", "pitch_label": "Pitch A", "scores": {"clarity": 8}},
+        {"reviewer_model": "gpt", "pitch_label": "Pitch B", "scores": {"clarity": 6}},
+        {"reviewer_model": "claude", "pitch_label": "Pitch Z"},
+    ]
+
+    with patch.object(council_db, "transaction", mock_transaction(conn)), \
+         patch.object(council_db, "publish_change", AsyncMock()):
+        await council_db.save_peer_reviews(
+            "2024-01-10",
+            reviews,
+            "2024-01-10",
+            pm_pitches=[{"model": "gpt"}, {"model": "claude"}],
+            label_to_model={"Pitch A": "gpt", "Pitch B": "claude"},
+            pitch_ids={"gpt": "known-id"},
+        )
+
+    # Only models without a known ID are looked up
+    assert conn.fetch.await_count == 1
+    assert conn.fetch.await_args.args[1] == ["claude"]
+
+    conn.executemany.assert_awaited_once()
+    records = conn.executemany.await_args.args[1]
+    assert [r[1] for r in records] == ["known-id", pitch_id]
+    assert records[0][4] == reviews[0]  # dict for the JSONB codec
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_save_council_results_is_atomic(conn, mock_transaction):
+    """Reviews and decision share one transaction; both changes are published."""
+    transaction = mock_transaction(conn)
+    decision = {"selected_trade": {"instrument": "SPY"}}
+
+    with patch.object(council_db, "transaction", transaction), \
+         patch.object(council_db, "publish_change", AsyncMock()) as publish:
+        await council_db.save_council_results(
+            "2024-01-10", [], decision, "2024-01-10",
+            pm_pitches=[], label_to_model={},
+        )
+
+    assert transaction.call_count == 1
+    statements = [call.args[0] for call in conn.execute.await_args_list]
+    assert any("DELETE FROM peer_reviews" in q for q in statements)
+    assert any("INSERT INTO chairman_decisions" in q for q in statements)
+    conn.executemany.assert_not_called()
+    assert publish.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_council_uses_pitch_ids_from_pipeline_state():
+    """IDs returned by save_pitches reach the council save (no ID lookup)."""
+    from fastapi import BackgroundTasks
+    from backend.api import council
+    from backend.main import PipelineState
+
+    state = PipelineState()
+    state.pm_pitches_raw = [{"model": "gpt"}]
+    state.pm_pitch_ids = {"gpt": "known-id"}
+    tasks = BackgroundTasks()
+
+    with patch.object(council, "get_pipeline_state", return_value=state), \
+         patch.object(council.council_service, "synthesize_council", AsyncMock()) as synthesize:
+        await council.synthesize_council(tasks, council.SynthesizeCouncilRequest())
+        await tasks()
+
+    assert synthesize.await_args.kwargs["pitch_ids"] == {"gpt": "known-id"}
@@ -0,0 +1,161 @@
+"""Unit tests for connection type codecs (backend/db/codecs.py).
+
+This module tests:
+- JSON encoding of Decimal/datetime/UUID values
+- Codec registration for json and jsonb on connection init
+- The pool passes the init hook to asyncpg
+- Numeric -> float decoding for analytic pools (read pool only by default)
+- Writers pass dicts (not json.dumps strings) to JSONB columns
+"""
+
+import datetime
+import json
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.db import codecs, pool
+
+SCHEMA = Path(__file__).parent.parent / "backend" / "storage" / "postgres_schema.sql"
+
+
+@pytest.mark.unit
+def test_json_dumps_handles_database_types():
+    """Values read from other columns can be embedded in JSONB payloads."""
+    encoded = codecs.json_dumps({
+        "price": Decimal("475.25"),
+        "at": datetime.datetime(2024, 1, 10, 9, 30),
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "legs": [1, None],
+    })
+
+    assert json.loads(encoded) == {
+        "price": 475.25,
+        "at": "2024-01-10T09:30:00",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "legs": [1, None],
+    }
+    assert codecs.json_loads(encoded)["legs"] == [1, None]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_init_connection_registers_json_and_jsonb():
+    """Both json types decode to Python objects."""
+    conn = MagicMock()
+    conn.set_type_codec = AsyncMock()
+
+    await codecs.init_connection(conn)
+
+    registered = {call.args[0]: call.kwargs for call in conn.set_type_codec.await_args_list}
+    assert set(registered) >= {"json", "jsonb"}
+    assert registered["jsonb"]["decoder"] is codecs.json_loads
+    assert registered["jsonb"]["format"] == "text"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pool_uses_init_hook(monkeypatch):
+    """Every pool connection gets the codecs."""
+    conn = AsyncMock()
+    conn.fetchval = AsyncMock(return_value="PostgreSQL 16.0, compiled")
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+    mock_pool = MagicMock()
+    mock_pool.acquire = MagicMock(return_value=acquire_ctx)
+    mock_pool.close = AsyncMock()
+
+    with patch("backend.db.pool.asyncpg.create_pool", AsyncMock(return_value=mock_pool)) as create:
+        await pool.init_pool()
+    try:
+        assert create.call_args.kwargs["init"].keywords["init"] is codecs.init_connection
+    finally:
+        await pool.close_pool()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_init_analytic_connection_decodes_numeric_as_float():
+    """Analytic pools decode numeric to float and still get the JSON codecs."""
+    conn = MagicMock()
+    conn.set_type_codec = AsyncMock()
+
+    await codecs.init_analytic_connection(conn)
+
+    registered = {call.args[0]: call.kwargs for call in conn.set_type_codec.await_args_list}
+    assert set(registered) >= {"json", "jsonb", "numeric"}
+    numeric = registered["numeric"]
+    assert numeric["schema"] == "pg_catalog"
+    assert numeric["decoder"]("475.25") == 475.25
+    assert numeric["encoder"](Decimal("1.50")) == "1.50"
+    assert numeric["encoder"](0.25) == "0.25"
+
+
+@pytest.mark.unit
+def test_numeric_as_float_defaults_per_pool(monkeypatch):
+    """Only the read pool decodes numeric as float unless configured."""
+    for name in ("DB_NUMERIC_AS_FLOAT", "DB_READ_NUMERIC_AS_FLOAT", "DB_BATCH_NUMERIC_AS_FLOAT"):
+        monkeypatch.delenv(name, raising=False)
+
+    assert pool.DatabaseConfig(pool.POOL_READ).numeric_as_float is True
+    assert pool.DatabaseConfig(pool.POOL_PRIMARY).numeric_as_float is False
+    # Batch loads use binary COPY, which the text-format codec would break
+    assert pool.DatabaseConfig(pool.POOL_BATCH).numeric_as_float is False
+
+    monkeypatch.setenv("DB_READ_NUMERIC_AS_FLOAT", "false")
+    assert pool.DatabaseConfig(pool.POOL_READ).numeric_as_float is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pool_uses_analytic_hook_when_enabled(monkeypatch):
+    """DB_NUMERIC_AS_FLOAT switches the pool to the analytic init hook."""
+    monkeypatch.setenv("DB_NUMERIC_AS_FLOAT", "true")
+    conn = AsyncMock()
+    conn.fetchval = AsyncMock(return_value="PostgreSQL 16.0, compiled")
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+    mock_pool = MagicMock()
+    mock_pool.acquire = MagicMock(return_value=acquire_ctx)
+    mock_pool.close = AsyncMock()
+
+    with patch("backend.db.pool.asyncpg.create_pool", AsyncMock(return_value=mock_pool)) as create:
+        await pool.init_pool()
+    try:
+        assert create.call_args.kwargs["init"].keywords["init"] is codecs.init_analytic_connection
+    finally:
+        await pool.close_pool()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_writers_pass_payloads_to_jsonb_columns(mock_transaction):
+    """Payloads are not double-encoded; generated columns cover filter fields."""
+    from backend.db import council_db, pitch_db
+
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[])
+
+    pitch = {"model": "gpt", "conviction": 1, "entry_policy": {"mode": "limit"}}
+    decision = {"selected_trade": {"instrument": "SPY", "direction": "LONG"}}
+    with patch.object(pitch_db, "transaction", mock_transaction(conn)), \
+         patch.object(pitch_db, "publish_change", AsyncMock()), \
+         patch.object(council_db, "transaction", mock_transaction(conn)), \
+         patch.object(council_db, "publish_change", AsyncMock()):
+        await pitch_db.save_pitches("2024-01-10", [pitch])
+        await council_db.save_chairman_decision("2024-01-10", decision, "2024-01-10")
+
+    # Pitches travel as one JSON text array cast to JSONB in SQL
+    assert json.loads(conn.fetch.await_args.args[4][0]) == pitch
+    # Single values go through the pool's JSONB codec as dicts
+    assert conn.execute.await_args_list[-1].args[2] is decision
+
+    schema = SCHEMA.read_text()
+    assert "ALTER COLUMN %I TYPE JSONB" in schema
+    assert "GENERATED ALWAYS AS (pitch_data->'entry_policy') STORED" in schema
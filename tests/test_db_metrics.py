@@ -0,0 +1,151 @@
+"""Unit tests for database instrumentation (backend/db/metrics.py).
+
+This module tests:
+- Statement normalization
+- Query latency, rows and errors recorded by db_helpers
+- Pool acquire wait and in-use tracking per scope
+- Slow-query log
+- Metrics exposed by check_pool_health and GET /api/db/metrics
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import db_helpers
+from backend.db import metrics, pool
+from backend.db.metrics import db_scope, db_stats, normalize_statement
+
+
+class MockAcquireContext:
+    """Mock async context manager for pool.acquire()."""
+    def __init__(self, mock_conn):
+        self.mock_conn = mock_conn
+
+    async def __aenter__(self):
+        return self.mock_conn
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    """Start every test with empty stats."""
+    db_stats.reset()
+    yield
+    db_stats.reset()
+
+
+@pytest.fixture
+def mock_conn():
+    """Install a mock pool for db_helpers."""
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
+    conn.fetchrow = AsyncMock(return_value={"id": 1})
+    conn.execute = AsyncMock(return_value="UPDATE 3")
+    mock_pool = MagicMock()
+    mock_pool.acquire = MagicMock(side_effect=lambda: MockAcquireContext(conn))
+    with patch("backend.db_helpers.get_pool", return_value=mock_pool):
+        yield conn
+
+
+# ==================== Normalization ====================
+
+
+@pytest.mark.unit
+def test_normalize_statement_collapses_whitespace_and_literals():
+    """Literals and whitespace do not split statement stats."""
+    assert normalize_statement(
+        "SELECT *\n   FROM t\n  WHERE a = 'x' AND b = 42 AND c = $1"
+    ) == "SELECT * FROM t WHERE a = ? AND b = ? AND c = $1"
+
+
+# ==================== Helpers ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_helpers_record_latency_rows_and_scope(mock_conn):
+    """fetch_all and execute record calls, rows and the active scope."""
+    with db_scope("GET /api/test"):
+        await db_helpers.fetch_all("SELECT id FROM t WHERE x = $1", 1)
+        await db_helpers.execute("UPDATE t SET y = 1")
+
+    snapshot = db_stats.snapshot()
+    fetch_stats = snapshot["statements"]["SELECT id FROM t WHERE x = $1"]
+    assert fetch_stats["calls"] == 1
+    assert fetch_stats["rows"] == 2
+    assert snapshot["statements"]["UPDATE t SET y = ?"]["rows"] == 3
+
+    scope = snapshot["scopes"]["GET /api/test"]
+    assert scope["acquires"] == 2
+    assert scope["queries"] == 2
+    assert scope["in_use"] == 0
+    assert scope["max_in_use"] == 1
+    assert snapshot["summary"]["in_use"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_helpers_record_errors(mock_conn):
+    """Failed queries are counted and the error is re-raised."""
+    mock_conn.fetchrow.side_effect = Exception("boom")
+
+    with pytest.raises(Exception, match="boom"):
+        await db_helpers.fetch_one("SELECT 1")
+
+    stats = db_stats.snapshot()["statements"]["SELECT ?"]
+    assert stats["errors"] == 1
+    assert db_stats.summary()["in_use"] == 0
+
+
+@pytest.mark.unit
+def test_slow_queries_are_logged(caplog):
+    """Queries above the threshold land in the slow-query buffer."""
+    db_stats.record_query("SELECT pg_sleep(1)", metrics.SLOW_QUERY_MS + 1, rows=1, scope="stage:research")
+    db_stats.record_query("SELECT 1", 0.5)
+
+    slow = db_stats.snapshot()["slow_queries"]
+    assert len(slow) == 1
+    assert slow[0]["scope"] == "stage:research"
+    assert "Slow query" in caplog.text
+
+
+# ==================== Exposure ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_check_pool_health_includes_metrics():
+    """check_pool_health reports acquire/query counters."""
+    conn = AsyncMock()
+    conn.fetchval = AsyncMock(return_value=1)
+    mock_pool = MagicMock()
+    mock_pool.acquire = MagicMock(return_value=MockAcquireContext(conn))
+    mock_pool.get_size.return_value = 10
+    mock_pool.get_idle_size.return_value = 8
+
+    db_stats.record_acquire(1.0, "stage:research")
+    with patch.object(pool, "_pool", mock_pool):
+        health = await pool.check_pool_health()
+
+    assert health["status"] == "healthy"
+    assert health["metrics"]["acquires"] == 1
+    assert health["metrics"]["in_use"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_db_metrics_endpoint_returns_scopes():
+    """GET /api/db/metrics returns per-scope pool usage."""
+    from backend.api.db import get_db_metrics
+
+    db_stats.record_acquire(2.0, "GET /api/market/metrics")
+    db_stats.record_query("SELECT 1", 1.0, rows=1, scope="GET /api/market/metrics")
+
+    with patch("backend.api.db.check_pool_health", AsyncMock(return_value={"status": "healthy"})):
+        response = await get_db_metrics(top=10)
+
+    assert response["pool"]["status"] == "healthy"
+    assert response["scopes"]["GET /api/market/metrics"]["acquires"] == 1
+    assert "SELECT ?" in response["statements"]
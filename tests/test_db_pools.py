@@ -0,0 +1,148 @@
+"""Unit tests for named connection pools (backend/db/pool.py).
+
+This module tests:
+- Per-pool configuration (DB_READ_*, DB_BATCH_*, DATABASE_READ_URL)
+- init_pools() with a failing secondary pool falling back to primary
+- Intent routing in db_helpers (read -> read pool, write -> primary)
+- Per-pool health reporting
+- Lazy init opens one connection and warms up in the background
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import db_helpers
+from backend.db import pool
+from backend.db.metrics import db_stats
+
+
+class MockAcquireContext:
+    """Mock async context manager for pool.acquire()."""
+    def __init__(self, mock_conn):
+        self.mock_conn = mock_conn
+
+    async def __aenter__(self):
+        return self.mock_conn
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+def make_pool(fetch_result=None):
+    """Create a mock pool whose connection returns fetch_result."""
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=fetch_result or [])
+    conn.fetchval = AsyncMock(return_value="PostgreSQL 16.0, compiled")
+    conn.execute = AsyncMock(return_value="UPDATE 1")
+    mock_pool = MagicMock()
+    mock_pool.acquire = MagicMock(side_effect=lambda: MockAcquireContext(conn))
+    mock_pool.close = AsyncMock()
+    mock_pool.get_size.return_value = 2
+    mock_pool.get_idle_size.return_value = 2
+    mock_pool.conn = conn
+    return mock_pool
+
+
+@pytest.fixture(autouse=True)
+async def cleanup_pools():
+    """Reset pool globals and stats around each test."""
+    db_stats.reset()
+    yield
+    await pool.close_pool()
+    pool._pool = None
+    pool._config = None
+    pool._named_pools.clear()
+    pool._named_configs.clear()
+    db_stats.reset()
+
+
+@pytest.mark.unit
+def test_named_pool_config_uses_prefix_and_replica_url(monkeypatch):
+    """Read/batch pools have their own sizes; read may target a replica."""
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@primary:5432/db")
+    monkeypatch.setenv("DATABASE_READ_URL", "postgresql://u:p@replica:5432/db")
+    monkeypatch.setenv("DB_READ_MAX_POOL_SIZE", "8")
+    monkeypatch.delenv("DB_BATCH_COMMAND_TIMEOUT", raising=False)
+
+    read = pool.DatabaseConfig(pool.POOL_READ)
+    batch = pool.DatabaseConfig(pool.POOL_BATCH)
+
+    assert read.get_dsn() == "postgresql://u:p@replica:5432/db"
+    assert read.max_pool_size == 8
+    assert batch.get_dsn() == "postgresql://u:p@primary:5432/db"
+    assert batch.command_timeout == 600.0
+    with pytest.raises(ValueError, match="Unknown pool"):
+        pool.DatabaseConfig("reporting")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_init_pools_falls_back_when_secondary_fails(monkeypatch):
+    """A failing read pool is skipped and get_pool('read') returns primary."""
+    primary, batch = make_pool(), make_pool()
+    created = iter([primary, Exception("replica down"), batch])
+
+    async def create_pool_mock(**kwargs):
+        result = next(created)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with patch("backend.db.pool.asyncpg.create_pool", side_effect=create_pool_mock):
+        pools = await pool.init_pools(["primary", "read", "batch"])
+
+    assert set(pools) == {"primary", "batch"}
+    assert pool.get_pool(pool.POOL_READ) is primary
+    assert pool.get_pool(pool.POOL_BATCH) is batch
+
+    health = await pool.check_all_pools_health()
+    assert health["read"] == {"status": "fallback", "routes_to": "primary"}
+    assert health["batch"]["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_helpers_route_by_intent():
+    """Reads use the read pool; writes and intent='write' reads use primary."""
+    primary, read = make_pool([{"id": 1}]), make_pool([{"id": 2}])
+    pool._pool = primary
+    pool._named_pools[pool.POOL_READ] = read
+
+    assert await db_helpers.fetch_all("SELECT id FROM t") == [{"id": 2}]
+    assert await db_helpers.fetch_all("SELECT id FROM t", intent="write") == [{"id": 1}]
+    await db_helpers.execute("UPDATE t SET x = 1")
+
+    primary.conn.execute.assert_awaited_once()
+    read.conn.execute.assert_not_called()
+    pools = db_stats.snapshot()["pools"]
+    assert pools["read"]["acquires"] == 1
+    assert pools["primary"]["acquires"] == 2
+
+    with pytest.raises(ValueError, match="Unknown query intent"):
+        await db_helpers.fetch_all("SELECT 1", intent="replica")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_lazy_init_warms_pool_in_background(monkeypatch):
+    """lazy=True creates the pool with one connection, then fills min_size."""
+    monkeypatch.setenv("DB_MIN_POOL_SIZE", "4")
+    primary = make_pool()
+    primary.get_size.return_value = 1
+    primary.release = AsyncMock()
+    acquired = []
+
+    async def acquire_new():
+        acquired.append(MagicMock())
+        return acquired[-1]
+
+    with patch("backend.db.pool.asyncpg.create_pool", AsyncMock(return_value=primary)) as create:
+        await pool.init_pools([pool.POOL_PRIMARY], lazy=True)
+        assert create.call_args.kwargs["min_size"] == 1
+
+        # Warm-up acquires the missing connections concurrently, then releases them
+        primary.acquire = MagicMock(side_effect=acquire_new)
+        await pool._warmup_tasks[pool.POOL_PRIMARY]
+
+    assert len(acquired) == 3
+    assert primary.release.await_count == 3
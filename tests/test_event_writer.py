@@ -0,0 +1,107 @@
+"""Unit tests for the write-behind execution event writer (backend/db/event_writer.py).
+
+This module tests:
+- log_execution_event() queues and returns without a database call
+- Queued events are written in one batched INSERT
+- stop() drains the queue
+- Failed batches and queue overflow spill to disk and are replayed
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.db import event_writer
+from backend.db.event_writer import ExecutionEventWriter, make_event
+
+
+def event(n=0):
+    return make_event("2024-01-10", "order_placed", "CHATGPT", {"n": n}, datetime(2024, 1, 10, 14, 30))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_log_execution_event_queues_when_writer_running(tmp_path):
+    from backend.db import execution_db
+
+    writer = ExecutionEventWriter(flush_interval=60, spill_path=str(tmp_path / "spill.ndjson"))
+    with patch.object(event_writer, "write_events", AsyncMock()), \
+         patch.object(execution_db, "get_event_writer", return_value=writer), \
+         patch.object(execution_db, "fetch_val", AsyncMock()) as fetch_val:
+        event_id = await execution_db.log_execution_event(
+            week_id="2024-01-10", event_type="order_placed", account="CHATGPT", event_data={"symbol": "SPY"}
+        )
+
+    fetch_val.assert_not_called()
+    assert writer.stats()["queued"] == 1
+    assert writer._queue.get_nowait()["id"] == event_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_events_are_written_in_one_batch(tmp_path):
+    writer = ExecutionEventWriter(batch_size=100, flush_interval=0.01, spill_path=str(tmp_path / "spill.ndjson"))
+
+    with patch.object(event_writer, "write_events", AsyncMock()) as write_events:
+        await writer.start()
+        ids = [writer.enqueue(event(i)) for i in range(5)]
+        await asyncio.sleep(0.05)
+        await writer.stop()
+
+    write_events.assert_awaited_once()
+    assert [e["id"] for e in write_events.await_args.args[0]] == ids
+    assert writer.written == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_stop_drains_queue(tmp_path):
+    writer = ExecutionEventWriter(batch_size=2, flush_interval=60, spill_path=str(tmp_path / "spill.ndjson"))
+    for i in range(5):
+        writer.enqueue(event(i))
+
+    with patch.object(event_writer, "write_events", AsyncMock()) as write_events:
+        await writer.stop()
+
+    assert write_events.await_count == 3
+    assert writer.written == 5
+    assert writer.stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_failed_batch_spills_and_replays(tmp_path):
+    spill = tmp_path / "spill.ndjson"
+    writer = ExecutionEventWriter(flush_interval=60, spill_path=str(spill))
+    queued = [event(i) for i in range(3)]
+    for e in queued:
+        writer.enqueue(e)
+
+    with patch.object(event_writer, "write_events", AsyncMock(side_effect=ConnectionError("db down"))):
+        await writer.stop()
+
+    assert writer.spilled == 3
+    assert len(spill.read_text().splitlines()) == 3
+
+    with patch.object(event_writer, "write_events", AsyncMock()) as write_events:
+        assert await writer.replay() == 3
+
+    replayed = write_events.await_args.args[0]
+    assert [e["id"] for e in replayed] == [e["id"] for e in queued]
+    assert replayed[0]["occurred_at"] == datetime(2024, 1, 10, 14, 30)
+    assert not writer.stats()["spill_pending"]
+
+
+@pytest.mark.unit
+def test_full_queue_spills_instead_of_blocking(tmp_path):
+    spill = tmp_path / "spill.ndjson"
+    writer = ExecutionEventWriter(max_queue=2, spill_path=str(spill))
+
+    for i in range(3):
+        writer.enqueue(event(i))
+
+    assert writer.stats()["queued"] == 2
+    assert writer.spilled == 1
+    assert spill.exists()
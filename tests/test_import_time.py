@@ -0,0 +1,65 @@
+"""Import-time budget tests (python -X importtime).
+
+This module tests:
+- `import backend.main` does not load the LLM SDKs, jsonschema, pandas
+  or the Alpaca SDK (they are imported on first use)
+- `cli.py status` does not load pandas or any pipeline/database module
+- Cold import of the API app stays within its time budget
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# Cumulative import time allowed for `import backend.main` (seconds). The
+# app itself imports in ~0.7s; the budget leaves room for slow CI machines
+# but fails if an eager SDK import (~0.5s for openai alone) comes back.
+API_IMPORT_BUDGET = 2.5
+
+# Loaded lazily, never at import time of the API app
+HEAVY_MODULES = ("openai", "jsonschema", "pandas", "numpy", "alpaca", "yaml")
+
+
+def import_times(*args: str) -> Dict[str, float]:
+    """Run python -X importtime and return cumulative seconds per top-level module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@pytest.mark.slow
+@pytest.mark.unit
+def test_api_app_import_is_lazy_and_within_budget():
+    times = import_times("-c", "import backend.main")
+
+    loaded = [m for m in HEAVY_MODULES if m in times]
+    assert loaded == []
+    assert times["backend.main"] < API_IMPORT_BUDGET
+
+
+@pytest.mark.slow
+@pytest.mark.unit
+def test_cli_status_does_not_import_pandas_or_pipeline():
+    times = import_times("cli.py", "status")
+
+    assert "pandas" not in times
+    assert "numpy" not in times
+    assert not [m for m in times if m.startswith(("backend.pipeline", "backend.db", "openai"))]
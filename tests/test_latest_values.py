@@ -0,0 +1,97 @@
+"""Unit tests for latest-value reads (latest_prices / latest_metrics).
+
+This module tests:
+- fetch_current_prices reads one row per symbol from latest_prices
+- fetch_market_metrics reads latest_metrics and derives the as-of date
+- The schema keeps both tables current with statement-level triggers on the
+  history tables, and backfills them
+"""
+
+import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.db import market_db
+from backend.db.statements import get_statement
+
+SCHEMA = Path(__file__).parent.parent / "backend" / "storage" / "postgres_schema.sql"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fetch_current_prices_reads_latest_prices():
+    """Current prices come from latest_prices, not a MAX(date) scan."""
+    rows = [{
+        "symbol": "SPY",
+        "date": datetime.date(2024, 1, 10),
+        "open": Decimal("470.0"),
+        "high": Decimal("476.0"),
+        "low": Decimal("469.0"),
+        "close": Decimal("475.2"),
+        "volume": 1000,
+    }]
+    with patch("backend.db.market_db.fetch_prepared", AsyncMock(return_value=rows)) as mock_fetch:
+        result = await market_db.fetch_current_prices()
+
+    query = get_statement(mock_fetch.await_args.args[0]).sql
+    assert "FROM latest_prices" in query
+    assert "MAX(date)" not in query
+    assert result == {
+        "prices": [{
+            "symbol": "SPY", "date": "2024-01-10", "open": 470.0, "high": 476.0,
+            "low": 469.0, "close": 475.2, "volume": 1000,
+        }],
+        "asof_date": "2024-01-10",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fetch_market_metrics_reads_latest_metrics():
+    """Returns and correlations come from latest_metrics in two queries."""
+    date = datetime.date(2024, 1, 10)
+    returns_rows = [
+        {"symbol": "SPY", "log_return_7d": Decimal("0.02"), "date": date},
+        {"symbol": "TLT", "log_return_7d": Decimal("-0.01"), "date": date},
+    ]
+    corr_rows = [
+        {"symbol_1": "SPY", "symbol_2": "SPY", "correlation": Decimal("1.0")},
+        {"symbol_1": "SPY", "symbol_2": "TLT", "correlation": Decimal("-0.4")},
+    ]
+    mock_fetch = AsyncMock(side_effect=[returns_rows, corr_rows])
+    with patch("backend.db.market_db.fetch_prepared", mock_fetch):
+        result = await market_db.fetch_market_metrics()
+
+    assert mock_fetch.await_count == 2
+    assert all(
+        "FROM latest_metrics" in get_statement(call.args[0]).sql
+        for call in mock_fetch.await_args_list
+    )
+    assert result["date"] == "2024-01-10"
+    assert [r["symbol"] for r in result["returns_7d"]] == ["SPY", "TLT"]
+    assert result["correlation_matrix"]["SPY"]["TLT"] == -0.4
+    assert result["symbols"] == ["SPY"]
+
+
+@pytest.mark.unit
+def test_schema_maintains_latest_tables_on_write():
+    """Every history table feeding a latest-value table has statement triggers."""
+    schema = SCHEMA.read_text()
+    for table in ("daily_bars", "hourly_snapshots", "rolling_7day_log_returns", "correlation_matrix"):
+        for event in ("INSERT", "UPDATE"):
+            assert f"AFTER {event} ON {table} REFERENCING NEW TABLE AS new_rows\n    FOR EACH STATEMENT" in schema
+    assert "FOR EACH ROW EXECUTE FUNCTION sync_latest" not in schema
+    assert "CREATE TABLE IF NOT EXISTS latest_prices" in schema
+    assert "CREATE TABLE IF NOT EXISTS latest_metrics" in schema
+
+
+@pytest.mark.unit
+def test_schema_backfills_snapshot_only_symbols():
+    """The snapshot backfill upserts, so symbols without daily bars get a row."""
+    schema = SCHEMA.read_text()
+    backfill = schema[schema.index("INSERT INTO latest_prices AS lp (symbol, price, price_at)"):]
+    assert backfill.index("ON CONFLICT (symbol) DO UPDATE") < backfill.index(";")
+    assert "UPDATE latest_prices lp SET" not in schema
@@ -0,0 +1,109 @@
+"""Unit tests for the materialized leaderboard (performance_db, performance_schema.sql).
+
+This module tests:
+- get_leaderboard / get_council_vs_individuals read mv_leaderboard by lookback key
+- refresh_leaderboard refreshes CONCURRENTLY once populated
+- The schema defines the unique index CONCURRENTLY requires
+- The monitor API returns the freshness timestamp
+"""
+
+import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.db import performance_db
+from backend.db.statements import get_statement
+
+SCHEMA = Path(__file__).parent.parent / "backend" / "storage" / "performance_schema.sql"
+REFRESHED_AT = datetime.datetime(2024, 1, 12, 18, 0, tzinfo=datetime.timezone.utc)
+
+
+def row(account, total_return, strategy_type="Individual PM", rank=1):
+    return {
+        "rank": rank,
+        "strategy_type": strategy_type,
+        "account": account,
+        "total_return": Decimal(str(total_return)),
+        "sharpe_ratio": Decimal("1.1"),
+        "max_drawdown": Decimal("-0.01"),
+        "win_rate": Decimal("0.5"),
+        "weeks_traded": 4,
+        "profitable_weeks": 2,
+        "refreshed_at": REFRESHED_AT,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("weeks_filter, key", [(None, 0), (4, 4), (12, 12)])
+async def test_get_leaderboard_reads_materialized_view(weeks_filter, key):
+    """Every lookback period is one keyed read of mv_leaderboard."""
+    mock_fetch = AsyncMock(return_value=[row("COUNCIL", 0.03)])
+    with patch.object(performance_db, "fetch_prepared", mock_fetch):
+        rows = await performance_db.get_leaderboard(weeks_filter)
+
+    name, arg = mock_fetch.await_args.args
+    query = get_statement(name).sql
+    assert "FROM mv_leaderboard" in query
+    assert "WHERE lookback_key = $1" in query
+    assert arg == key
+    assert rows[0]["refreshed_at"] == REFRESHED_AT
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_council_vs_individuals_includes_freshness():
+    """Council comparison comes from the same view with its refresh time."""
+    rows = [
+        row("COUNCIL", 0.03, "Council"),
+        row("GPT", 0.05),
+        row("GEMINI", 0.01),
+        row("BASELINE", 0.02, "Baseline"),
+    ]
+    with patch.object(performance_db, "fetch_prepared", AsyncMock(return_value=rows)) as mock_fetch:
+        result = await performance_db.get_council_vs_individuals(4)
+
+    assert mock_fetch.await_args.args[1] == 4
+    assert "ORDER BY strategy_order, total_return DESC" in get_statement(mock_fetch.await_args.args[0]).sql
+    assert result["refreshed_at"] == REFRESHED_AT
+    assert result["council_vs_best_individual"]["best_individual_account"] == "GPT"
+    assert result["council_vs_best_individual"]["council_wins"] is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("populated, statement", [
+    (True, "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_leaderboard"),
+    (False, "REFRESH MATERIALIZED VIEW mv_leaderboard"),
+])
+async def test_refresh_leaderboard(populated, statement):
+    """Refreshes concurrently unless the view was never populated."""
+    with patch.object(performance_db, "fetch_val", AsyncMock(side_effect=[populated, REFRESHED_AT])), \
+         patch.object(performance_db, "execute", AsyncMock()) as mock_execute:
+        refreshed_at = await performance_db.refresh_leaderboard()
+
+    mock_execute.assert_awaited_once_with(statement, intent="batch")
+    assert refreshed_at == REFRESHED_AT
+
+
+@pytest.mark.unit
+def test_schema_supports_concurrent_refresh():
+    """CONCURRENTLY needs a plain unique index covering every row."""
+    schema = SCHEMA.read_text()
+    assert "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_leaderboard" in schema
+    assert "CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_leaderboard_key_account\n    ON mv_leaderboard(lookback_key, account);" in schema
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_leaderboard_endpoint_returns_refreshed_at():
+    """The monitor API exposes the freshness stamp as ISO 8601."""
+    from backend.api.monitor import get_leaderboard
+
+    with patch("backend.db.performance_db.get_leaderboard", AsyncMock(return_value=[row("COUNCIL", 0.03)])):
+        result = await get_leaderboard(weeks=None)
+
+    assert result[0]["refreshed_at"] == REFRESHED_AT.isoformat()
@@ -0,0 +1,119 @@
+"""Unit tests for set-based market snapshots (backend/storage/data_fetcher.py).
+
+This module tests:
+- get_universe_snapshot groups one result set into per-symbol prices and bars
+- Research and conviction snapshots use a single query for the whole universe
+"""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.storage.data_fetcher import INSTRUMENTS, MarketDataFetcher, MarketDataManager
+
+
+class MockAcquireContext:
+    """Mock async context manager for pool.acquire()."""
+    def __init__(self, mock_conn):
+        self.mock_conn = mock_conn
+
+    async def __aenter__(self):
+        return self.mock_conn
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+def _bar_rows(symbol, current_price, week_open, closes):
+    """Rows shaped like the universe query (newest bar first)."""
+    start = datetime.date(2024, 1, 31)
+    if not closes:
+        return [{
+            "symbol": symbol, "current_price": current_price, "week_open": week_open,
+            "date": None, "open": None, "high": None, "low": None, "close": None, "volume": None,
+        }]
+    return [
+        {
+            "symbol": symbol,
+            "current_price": current_price,
+            "week_open": week_open,
+            "date": start - datetime.timedelta(days=i),
+            "open": Decimal(str(close)),
+            "high": Decimal(str(close)),
+            "low": Decimal(str(close)),
+            "close": Decimal(str(close)),
+            "volume": 1000,
+        }
+        for i, close in enumerate(closes)
+    ]
+
+
+@pytest.fixture
+def mock_conn():
+    """Patch get_pool() with a pool whose connection returns universe rows."""
+    conn = MagicMock()
+    rows = _bar_rows("SPY", Decimal("101.00"), Decimal("98.00"), [100.0, 99.0, 98.0])
+    rows += _bar_rows("QQQ", None, None, [])
+    conn.fetch = AsyncMock(return_value=rows)
+
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=MockAcquireContext(conn))
+    with patch("backend.storage.data_fetcher.get_pool", return_value=pool):
+        yield conn
+
+
+@pytest.fixture
+def fetcher():
+    """MarketDataFetcher without Alpaca clients."""
+    instance = MarketDataFetcher.__new__(MarketDataFetcher)
+    instance.db = MarketDataManager()
+    return instance
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_universe_snapshot_groups_rows_by_symbol(mock_conn):
+    """One query returns prices and newest-first float bars per symbol."""
+    universe = await MarketDataManager().get_universe_snapshot(["SPY", "QQQ"])
+
+    mock_conn.fetch.assert_awaited_once()
+    assert mock_conn.fetch.await_args.args[1:] == (["SPY", "QQQ"], 30)
+
+    spy = universe["SPY"]
+    assert spy["current_price"] == 101.0
+    assert spy["week_open"] == 98.0
+    assert [bar["close"] for bar in spy["bars"]] == [100.0, 99.0, 98.0]
+    assert isinstance(spy["bars"][0]["close"], float)
+
+    assert universe["QQQ"] == {"current_price": None, "week_open": None, "bars": []}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_research_snapshot_uses_one_query(mock_conn, fetcher):
+    """The research snapshot covers every instrument with a single round-trip."""
+    snapshot = await fetcher.get_market_snapshot_for_research()
+
+    mock_conn.fetch.assert_awaited_once()
+    assert mock_conn.fetch.await_args.args[1] == INSTRUMENTS
+    assert list(snapshot["instruments"]) == ["SPY"]
+    spy = snapshot["instruments"]["SPY"]
+    assert spy["current"]["price"] == 101.0
+    assert spy["current"]["change_pct"] == round((101.0 - 99.0) / 99.0 * 100, 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_conviction_snapshot_uses_one_query_without_bars(mock_conn, fetcher):
+    """The checkpoint snapshot skips bars and reads week open from the same query."""
+    snapshot = await fetcher.get_checkpoint_snapshot_for_conviction()
+
+    mock_conn.fetch.assert_awaited_once()
+    assert mock_conn.fetch.await_args.args[2] == 0
+    assert snapshot["instruments"]["SPY"] == {
+        "price": 101.0,
+        "change_since_week_open_pct": round((101.0 - 98.0) / 98.0 * 100, 2),
+    }
+    assert snapshot["instruments"]["QQQ"]["price"] is None
@@ -0,0 +1,167 @@
+"""Tests for converting tables to partitions (backend/storage/migrate_partitions.py).
+
+This module tests:
+- Views over the table are dropped before the rename and recreated after
+- The migration refuses to start before postgres_schema.sql is applied
+- Integration: an existing unpartitioned database takes postgres_schema.sql,
+  then migrate_table converts both tables with v_account_history intact
+
+REQUIREMENTS (integration test only):
+    A running PostgreSQL database configured as for tests/test_async_db.py
+    (DATABASE_URL or DATABASE_NAME/USER/...). Everything is created in a
+    scratch schema that is dropped afterwards; the test skips if the
+    database is unavailable.
+"""
+
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.db.partitions import is_partitioned
+from backend.db.pool import close_pool, get_pool, init_pool
+from backend.storage import migrate_partitions
+from backend.storage.migrate_partitions import migrate_table
+
+SCHEMA = Path(__file__).parent.parent / "backend" / "storage" / "postgres_schema.sql"
+SCRATCH = "test_migrate_partitions"
+
+# The tables as created by postgres_schema.sql before partitioning
+LEGACY_DDL = """
+    CREATE TABLE execution_events (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        week_id VARCHAR(10) NOT NULL,
+        event_type VARCHAR(50) NOT NULL,
+        account VARCHAR(20) NOT NULL,
+        event_data JSONB NOT NULL,
+        occurred_at TIMESTAMPTZ NOT NULL,
+        created_at TIMESTAMPTZ DEFAULT NOW()
+    );
+    CREATE TABLE hourly_snapshots (
+        id SERIAL PRIMARY KEY,
+        symbol VARCHAR(10) NOT NULL,
+        timestamp TIMESTAMPTZ NOT NULL,
+        date DATE NOT NULL,
+        hour INTEGER NOT NULL,
+        price DECIMAL(12,4),
+        volume BIGINT,
+        created_at TIMESTAMPTZ DEFAULT NOW(),
+        UNIQUE(symbol, timestamp)
+    );
+"""
+
+
+def make_conn(views=(), functions_exist=True):
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value="INSERT 0 3")
+    conn.fetch = AsyncMock(side_effect=lambda sql, *args: (
+        [{"name": n, "definition": d} for n, d in views] if "pg_get_viewdef" in sql else []
+    ))
+
+    async def fetchval(sql, *args):
+        if "pg_partitioned_table" in sql:
+            return False
+        if "to_regprocedure" in sql:
+            return "fn" if functions_exist else None
+        if "to_regclass" in sql:
+            return False
+        return None  # MIN(), COUNT()
+
+    conn.fetchval = AsyncMock(side_effect=fetchval)
+    tx = MagicMock()
+    tx.__aenter__ = AsyncMock(return_value=None)
+    tx.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock(return_value=tx)
+    return conn
+
+
+def executed(conn):
+    return [" ".join(call.args[0].split()) for call in conn.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_views_are_dropped_before_rename_and_recreated():
+    definition = " SELECT week_id, account FROM execution_events;"
+    conn = make_conn(views=[("v_account_history", definition)])
+
+    assert await migrate_table(conn, "execution_events") is True
+
+    statements = executed(conn)
+    drop_view = statements.index("DROP VIEW v_account_history")
+    rename = statements.index("ALTER TABLE execution_events RENAME TO execution_events_unpartitioned")
+    drop_table = statements.index("DROP TABLE execution_events_unpartitioned")
+    create_view = statements.index("CREATE VIEW v_account_history AS SELECT week_id, account FROM execution_events;")
+    assert drop_view < rename < drop_table < create_view
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_refuses_to_migrate_before_schema_is_applied():
+    conn = make_conn(functions_exist=False)
+
+    with pytest.raises(RuntimeError, match="apply postgres_schema.sql"):
+        await migrate_table(conn, "hourly_snapshots")
+
+    conn.transaction.assert_not_called()
+    assert set(migrate_partitions.REQUIRED_FUNCTIONS) == set(migrate_partitions.PARENT_DDL)
+
+
+@pytest_asyncio.fixture
+async def scratch_conn():
+    """Connection whose search_path is an empty scratch schema."""
+    try:
+        await init_pool()
+    except Exception as e:
+        pytest.skip(f"Could not connect to test database: {e}")
+    try:
+        async with get_pool().acquire() as conn:
+            await conn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+            await conn.execute(f"CREATE SCHEMA {SCRATCH}")
+            await conn.execute(f"SET search_path TO {SCRATCH}, public")
+            try:
+                yield conn
+            finally:
+                await conn.execute("RESET search_path")
+                await conn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+    finally:
+        await close_pool()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_migrate_existing_database_with_real_schema(scratch_conn):
+    conn = scratch_conn
+    await conn.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
+    await conn.execute(LEGACY_DDL)
+    await conn.execute("""
+        INSERT INTO execution_events (week_id, event_type, account, event_data, occurred_at)
+        VALUES ('2024-01-03', 'order_submitted', 'COUNCIL', '{}', '2024-01-04T15:00:00Z'),
+               ('2024-02-07', 'order_filled', 'COUNCIL', '{}', '2024-02-08T15:00:00Z');
+        INSERT INTO hourly_snapshots (symbol, timestamp, date, hour, price, volume)
+        VALUES ('SPY', '2024-01-04T14:00:00Z', '2024-01-04', 9, 470.5, 1000);
+    """)
+
+    # The schema applies to the unpartitioned tables (views, functions, triggers)
+    await conn.execute(SCHEMA.read_text())
+    assert await conn.fetchval("SELECT COUNT(*) FROM v_account_history") == 2
+
+    for table in ("execution_events", "hourly_snapshots"):
+        assert await migrate_table(conn, table) is True
+        assert await is_partitioned(conn, table)
+
+    assert await conn.fetchval("SELECT COUNT(*) FROM execution_events") == 2
+    assert await conn.fetchval("SELECT COUNT(*) FROM v_account_history") == 2
+    assert await conn.fetchval("SELECT COUNT(*) FROM hourly_snapshots") == 1
+
+    # Re-applying the schema and re-running the migration are no-ops
+    await conn.execute(SCHEMA.read_text())
+    assert await migrate_table(conn, "execution_events") is False
+
+    # Triggers and the SERIAL default survived the rebuild
+    await conn.execute("""
+        INSERT INTO hourly_snapshots (symbol, timestamp, date, hour, price, volume)
+        VALUES ('SPY', now(), current_date, 12, 480.0, 2000)
+    """)
+    assert await conn.fetchval("SELECT price FROM latest_prices WHERE symbol = 'SPY'") == 480
@@ -0,0 +1,136 @@
+"""Tests for keying account_performance by lookback (migrate_performance_keys.py).
+
+This module tests:
+- The upsert's conflict target is the schema's unique index expression
+- Integration: a database with duplicate all-time rows is deduplicated,
+  repeated all-time upserts update in place, and mv_leaderboard refreshes
+  CONCURRENTLY
+
+REQUIREMENTS (integration test only):
+    A running PostgreSQL database configured as for tests/test_async_db.py
+    (DATABASE_URL or DATABASE_NAME/USER/...). Everything is created in a
+    scratch schema that is dropped afterwards; the test skips if the
+    database is unavailable.
+"""
+
+import inspect
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock, patch
+
+from backend.db.pool import close_pool, get_pool, init_pool
+from backend.storage import calculate_performance
+from backend.storage.calculate_performance import PerformanceDB
+from backend.storage.migrate_performance_keys import migrate
+
+SCHEMA = Path(__file__).parent.parent / "backend" / "storage" / "performance_schema.sql"
+SCRATCH = "test_migrate_performance_keys"
+LOOKBACK_KEY = "(account, (COALESCE(weeks_lookback, 0)))"
+
+# account_performance as created before the lookback-keyed index
+LEGACY_DDL = """
+    CREATE TABLE account_performance (
+        id SERIAL PRIMARY KEY,
+        account VARCHAR(20) NOT NULL,
+        weeks_lookback INTEGER,
+        total_return DECIMAL(12,6) NOT NULL DEFAULT 0.0,
+        sharpe_ratio DECIMAL(12,6),
+        max_drawdown DECIMAL(12,6),
+        volatility DECIMAL(12,6),
+        weeks_traded INTEGER NOT NULL DEFAULT 0,
+        profitable_weeks INTEGER NOT NULL DEFAULT 0,
+        win_rate DECIMAL(5,4),
+        avg_conviction DECIMAL(4,2),
+        max_conviction DECIMAL(4,2),
+        calculated_at TIMESTAMPTZ NOT NULL,
+        created_at TIMESTAMPTZ DEFAULT NOW(),
+        updated_at TIMESTAMPTZ DEFAULT NOW(),
+        UNIQUE(account, weeks_lookback)
+    );
+"""
+
+
+def metrics(total_return, weeks_lookback=None):
+    return pd.DataFrame([{
+        "account": "COUNCIL", "weeks_lookback": weeks_lookback, "total_return": total_return,
+        "sharpe_ratio": 1.0, "max_drawdown": -0.01, "volatility": 0.02, "weeks_traded": 4,
+        "profitable_weeks": 2, "win_rate": 0.5, "avg_conviction": 1.0, "max_conviction": 2.0,
+    }])
+
+
+@pytest.mark.unit
+def test_upsert_targets_unique_index_expression():
+    schema = SCHEMA.read_text()
+    upsert = inspect.getsource(PerformanceDB.upsert_account_performance)
+
+    assert f"ON account_performance{LOOKBACK_KEY};" in schema
+    assert f"ON CONFLICT {LOOKBACK_KEY} DO UPDATE" in upsert
+
+
+@pytest_asyncio.fixture
+async def scratch_conn():
+    """Connection whose search_path is an empty scratch schema."""
+    try:
+        await init_pool()
+    except Exception as e:
+        pytest.skip(f"Could not connect to test database: {e}")
+    try:
+        async with get_pool().acquire() as conn:
+            await conn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+            await conn.execute(f"CREATE SCHEMA {SCRATCH}")
+            await conn.execute(f"SET search_path TO {SCRATCH}, public")
+            try:
+                yield conn
+            finally:
+                await conn.execute("RESET search_path")
+                await conn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH} CASCADE")
+    finally:
+        await close_pool()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_migrate_removes_duplicates_and_upserts_in_place(scratch_conn):
+    conn = scratch_conn
+    await conn.execute(LEGACY_DDL)
+    await conn.execute("""
+        INSERT INTO account_performance (account, weeks_lookback, total_return, calculated_at)
+        VALUES ('COUNCIL', NULL, 0.01, '2024-01-05'),
+               ('COUNCIL', NULL, 0.03, '2024-01-12'),
+               ('COUNCIL', NULL, 0.02, '2024-01-08'),
+               ('COUNCIL', 4, 0.02, '2024-01-12'),
+               ('BASELINE', NULL, 0.01, '2024-01-12');
+    """)
+    # mv_leaderboard as the schema creates it (its unique index fails to build)
+    schema = SCHEMA.read_text()
+    start = schema.index("CREATE MATERIALIZED VIEW")
+    await conn.execute(schema[start:schema.index(";", start)])
+
+    assert await migrate(conn) == 2
+    rows = await conn.fetch("SELECT account, weeks_lookback, total_return FROM account_performance ORDER BY id")
+    assert [tuple(r) for r in rows] == [
+        ("COUNCIL", None, Decimal("0.03")), ("COUNCIL", 4, Decimal("0.02")), ("BASELINE", None, Decimal("0.01")),
+    ]
+    assert await conn.fetchval("SELECT COUNT(*) FROM mv_leaderboard WHERE lookback_key = 0") == 2
+    assert await migrate(conn) == 0
+
+    # Repeated all-time runs now update the one row
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock(acquire=acquire)
+    db = PerformanceDB()
+    with patch.object(calculate_performance, "get_pool", return_value=pool):
+        await db.upsert_account_performance(metrics(0.05))
+        await db.upsert_account_performance(metrics(0.06))
+
+    assert await conn.fetchval(
+        "SELECT array_agg(total_return) FROM account_performance WHERE account = 'COUNCIL' AND weeks_lookback IS NULL"
+    ) == [Decimal("0.06")]
+    await conn.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_leaderboard")
@@ -0,0 +1,141 @@
+"""Guards against blocking sync Redis use on the async request path.
+
+This module tests:
+- Static lint: no async function in the request path calls the sync client
+- Static lint: no sync function in the request path is @cached
+- Runtime guard: sync RedisClient operations inside the loop are recorded
+- Sync @cached functions bypass Redis inside the event loop
+"""
+
+import ast
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend import redis_client
+from backend.cache.decorator import cached
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modules that run inside the FastAPI event loop
+REQUEST_PATH = [
+    "backend/main.py",
+    "backend/api",
+    "backend/services",
+    "backend/db",
+    "backend/cache",
+    "backend/pipeline",
+]
+
+SYNC_CLIENT_NAMES = {"get_redis_client", "RedisClient"}
+
+
+def _request_path_files():
+    for entry in REQUEST_PATH:
+        path = PROJECT_ROOT / entry
+        if path.is_file():
+            yield path
+        else:
+            yield from sorted(path.rglob("*.py"))
+
+
+def _called_name(node: ast.Call) -> str:
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return ""
+
+
+def _is_cached_decorator(node: ast.expr) -> bool:
+    target = node.func if isinstance(node, ast.Call) else node
+    return (isinstance(target, ast.Name) and target.id == "cached") or (
+        isinstance(target, ast.Attribute) and target.attr == "cached"
+    )
+
+
+# ==================== Static Lint ====================
+
+
+@pytest.mark.unit
+def test_no_sync_redis_client_in_async_functions():
+    """Async functions on the request path never touch the sync client."""
+    violations = []
+    for path in _request_path_files():
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for func in ast.walk(tree):
+            if not isinstance(func, ast.AsyncFunctionDef):
+                continue
+            for node in ast.walk(func):
+                if isinstance(node, ast.Call) and _called_name(node) in SYNC_CLIENT_NAMES:
+                    rel = path.relative_to(PROJECT_ROOT)
+                    violations.append(f"{rel}:{node.lineno} in {func.name}()")
+
+    assert not violations, (
+        "Sync Redis client used in async code (use get_redis_pool()):\n"
+        + "\n".join(violations)
+    )
+
+
+@pytest.mark.unit
+def test_no_sync_cached_functions_on_request_path():
+    """@cached on the request path decorates async functions only."""
+    violations = []
+    for path in _request_path_files():
+        if path.name == "decorator.py":
+            continue  # docstring examples only
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for func in ast.walk(tree):
+            if isinstance(func, ast.FunctionDef) and any(
+                _is_cached_decorator(d) for d in func.decorator_list
+            ):
+                rel = path.relative_to(PROJECT_ROOT)
+                violations.append(f"{rel}:{func.lineno} {func.name}()")
+
+    assert not violations, (
+        "Sync @cached functions block the event loop on Redis I/O:\n"
+        + "\n".join(violations)
+    )
+
+
+# ==================== Runtime Guard ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.allow_blocking_redis
+async def test_sync_client_call_in_event_loop_is_recorded():
+    """A sync client operation inside the loop is recorded as blocking."""
+    client = redis_client.RedisClient.__new__(redis_client.RedisClient)
+    client.max_retries = 1
+    operation = MagicMock(return_value="v", __name__="get")
+
+    assert client._retry_operation(operation, "key") == "v"
+    assert redis_client.get_blocking_calls() == ["get"]
+
+
+@pytest.mark.unit
+def test_sync_client_call_outside_event_loop_is_allowed():
+    """Scripts (no running loop) may use the sync client freely."""
+    client = redis_client.RedisClient.__new__(redis_client.RedisClient)
+    client.max_retries = 1
+
+    client._retry_operation(MagicMock(return_value=True, __name__="ping"))
+
+    assert redis_client.get_blocking_calls() == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sync_cached_function_bypasses_redis_in_event_loop():
+    """A sync @cached function called from async code skips the sync client."""
+    @cached(key="test:sync:inloop", ttl=60)
+    def load():
+        return {"v": 1}
+
+    with patch("backend.cache.decorator.get_redis_client") as mock_get_client:
+        assert load() == {"v": 1}
+
+    mock_get_client.assert_not_called()
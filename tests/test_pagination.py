@@ -0,0 +1,178 @@
+"""Unit tests for keyset pagination and streaming exports.
+
+This module tests:
+- Cursor encoding and the seek predicate (backend/db/pagination.py)
+- History page queries for execution events, research reports and pitches
+- stream_rows reads through a server-side cursor (backend/db_helpers.py)
+- NDJSON/CSV serialization (backend/utils/exports.py)
+- Invalid cursors map to HTTP 400
+"""
+
+import csv
+import datetime
+import io
+import json
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import db_helpers
+from backend.db import execution_db, pagination, pitch_db, research_db
+from backend.utils import exports
+
+T0 = datetime.datetime(2024, 1, 10, 9, 30, tzinfo=datetime.timezone.utc)
+
+
+def event(i):
+    return {
+        "id": uuid.UUID(int=i),
+        "week_id": "2024-01-10",
+        "event_type": "order_filled",
+        "account": "COUNCIL",
+        "event_data": {"qty": i, "symbol": "SPY"},
+        "occurred_at": T0 - datetime.timedelta(minutes=i),
+        "created_at": T0,
+    }
+
+
+async def aiter_rows(rows):
+    for row in rows:
+        yield row
+
+
+@pytest.mark.unit
+def test_cursor_round_trip_and_validation():
+    token = pagination.encode_cursor(T0, uuid.UUID(int=7))
+
+    assert pagination.decode_cursor(token) == (T0, str(uuid.UUID(int=7)))
+    with pytest.raises(ValueError):
+        pagination.decode_cursor("not-a-cursor")
+
+
+@pytest.mark.unit
+def test_keyset_condition_and_page_size():
+    assert pagination.keyset_condition("occurred_at", "id", None, 3) == (None, [])
+
+    condition, params = pagination.keyset_condition(
+        "occurred_at", "id", pagination.encode_cursor(T0, "abc"), 3
+    )
+    assert condition == "(occurred_at, id) < ($3, $4::uuid)"
+    assert params == [T0, "abc"]
+
+    assert pagination.clamp_limit(None) == pagination.DEFAULT_PAGE_SIZE
+    assert pagination.clamp_limit(10_000) == pagination.MAX_PAGE_SIZE
+
+
+@pytest.mark.unit
+def test_build_page_uses_extra_row_as_has_more_flag():
+    rows = [event(i) for i in range(3)]
+
+    page = pagination.build_page(rows, 2, sort_key="occurred_at")
+    assert page["items"] == rows[:2]
+    assert pagination.decode_cursor(page["next_cursor"]) == (rows[1]["occurred_at"], str(rows[1]["id"]))
+
+    last = pagination.build_page(rows, 3, sort_key="occurred_at")
+    assert last["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_execution_page_seeks_past_cursor():
+    """Filters come first, then the seek predicate, then LIMIT page + 1."""
+    cursor = pagination.encode_cursor(T0, uuid.UUID(int=1))
+    mock_fetch = AsyncMock(return_value=[event(2), event(3)])
+
+    with patch.object(execution_db, "fetch_all", mock_fetch):
+        page = await execution_db.get_execution_page(limit=1, cursor=cursor, account="COUNCIL")
+
+    query, *params = mock_fetch.await_args.args
+    assert "account = $1" in query
+    assert "(occurred_at, id) < ($2, $3::uuid)" in query
+    assert "ORDER BY occurred_at DESC, id DESC" in query
+    assert "LIMIT $4" in query
+    assert params == ["COUNCIL", T0, str(uuid.UUID(int=1)), 2]
+    assert page["items"] == [event(2)]
+    assert page["next_cursor"] is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("module, function, table", [
+    (research_db, "get_research_page", "research_reports"),
+    (pitch_db, "get_pitch_page", "pm_pitches"),
+])
+async def test_history_pages_are_keyset_ordered(module, function, table):
+    mock_fetch = AsyncMock(return_value=[])
+    with patch.object(module, "fetch_all", mock_fetch):
+        page = await getattr(module, function)(limit=10)
+
+    query, *params = mock_fetch.await_args.args
+    assert f"FROM {table}" in query
+    assert "ORDER BY created_at DESC, id DESC" in query
+    assert "OFFSET" not in query
+    assert params == [11]
+    assert page == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_stream_rows_uses_server_side_cursor():
+    """Rows come from conn.cursor() inside a read-only transaction."""
+    conn = MagicMock()
+    conn.cursor = MagicMock(return_value=aiter_rows([{"id": 1}, {"id": 2}]))
+    tx = MagicMock()
+    tx.__aenter__ = AsyncMock(return_value=None)
+    tx.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock(return_value=tx)
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+
+    with patch.object(db_helpers, "get_pool", MagicMock()), \
+         patch.object(db_helpers, "timed_acquire", MagicMock(return_value=acquire)):
+        rows = [row async for row in db_helpers.stream_rows("SELECT id FROM t WHERE x = $1", 5, prefetch=100)]
+
+    assert rows == [{"id": 1}, {"id": 2}]
+    conn.transaction.assert_called_once_with(readonly=True)
+    conn.cursor.assert_called_once_with("SELECT id FROM t WHERE x = $1", 5, prefetch=100)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ndjson_and_csv_serialization(monkeypatch):
+    monkeypatch.setattr(exports, "CHUNK_ROWS", 2)
+    rows = [event(i) for i in range(3)]
+
+    ndjson = b"".join([chunk async for chunk in exports.ndjson_chunks(aiter_rows(rows))]).decode()
+    lines = [json.loads(line) for line in ndjson.splitlines()]
+    assert len(lines) == 3
+    assert lines[0]["event_data"] == {"qty": 0, "symbol": "SPY"}
+    assert lines[0]["occurred_at"] == T0.isoformat()
+
+    chunks = [chunk async for chunk in exports.csv_chunks(aiter_rows(rows), execution_db.EVENT_COLUMNS)]
+    assert len(chunks) == 2  # flushed every CHUNK_ROWS rows
+    parsed = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert list(parsed[0]) == execution_db.EVENT_COLUMNS
+    assert json.loads(parsed[2]["event_data"]) == {"qty": 2, "symbol": "SPY"}
+
+
+@pytest.mark.unit
+def test_export_response_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        exports.export_response(aiter_rows([]), "xlsx", [], "x")
+
+    response = exports.export_response(aiter_rows([]), "csv", ["id"], "execution_events")
+    assert response.media_type == "text/csv"
+    assert 'filename="execution_events.csv"' in response.headers["content-disposition"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_invalid_cursor_is_bad_request():
+    from backend.api.monitor import get_execution_events
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_execution_events(cursor="garbage")
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,170 @@
+"""Unit tests for monthly partitions (backend/db/partitions.py).
+
+This module tests:
+- Partition naming and month arithmetic
+- create_month_partition, including rows stranded in the DEFAULT partition
+- apply_retention archives to csv.gz and drops expired months only
+- The schema declares both tables partitioned with a DEFAULT partition
+"""
+
+import gzip
+from datetime import date
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.db import partitions
+
+SCHEMA = Path(__file__).parent.parent / "backend" / "storage" / "postgres_schema.sql"
+
+
+def make_conn():
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value="INSERT 0 0")
+    conn.fetch = AsyncMock(return_value=[])
+    conn.fetchval = AsyncMock()
+    tx = MagicMock()
+    tx.__aenter__ = AsyncMock(return_value=None)
+    tx.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock(return_value=tx)
+    return conn
+
+
+def patch_pool(conn):
+    """Patch the batch pool acquire used by ensure_partitions/apply_retention."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=conn)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return (
+        patch.object(partitions, "get_pool", MagicMock()),
+        patch.object(partitions, "timed_acquire", MagicMock(return_value=ctx)),
+    )
+
+
+@pytest.mark.unit
+def test_naming_and_month_arithmetic():
+    """Names sort chronologically and round-trip to their month."""
+    assert partitions.partition_name("execution_events", date(2024, 1, 15)) == "execution_events_y2024m01"
+    assert partitions.parse_partition_month("execution_events", "execution_events_y2024m01") == date(2024, 1, 1)
+    assert partitions.parse_partition_month("execution_events", "execution_events_default") is None
+    assert partitions.add_months(date(2024, 11, 30), 2) == date(2025, 1, 1)
+    assert partitions.add_months(date(2024, 1, 1), -1) == date(2023, 12, 1)
+    with pytest.raises(ValueError):
+        partitions._check_table("daily_bars")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_create_month_partition_plain():
+    """A month with no stranded rows is a single CREATE ... PARTITION OF."""
+    conn = make_conn()
+    conn.fetchval.side_effect = [False, True, False]  # exists, has default, stranded
+
+    created = await partitions.create_month_partition(conn, "hourly_snapshots", date(2024, 2, 1))
+
+    assert created is True
+    conn.execute.assert_awaited_once_with(
+        "CREATE TABLE hourly_snapshots_y2024m02 PARTITION OF hourly_snapshots "
+        "FOR VALUES FROM ('2024-02-01') TO ('2024-03-01')"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_create_month_partition_moves_default_rows():
+    """Rows already in DEFAULT for the month are moved, then the table is attached."""
+    conn = make_conn()
+    conn.fetchval.side_effect = [False, True, True]
+
+    await partitions.create_month_partition(conn, "execution_events", date(2024, 3, 1))
+
+    statements = [call.args[0] for call in conn.execute.await_args_list]
+    assert statements[0].startswith("CREATE TABLE execution_events_y2024m03 (LIKE execution_events")
+    assert "DELETE FROM execution_events_default" in statements[1]
+    assert conn.execute.await_args_list[1].args[1:] == (date(2024, 3, 1), date(2024, 4, 1))
+    assert statements[2].startswith("ALTER TABLE execution_events ATTACH PARTITION execution_events_y2024m03")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_create_month_partition_existing_is_noop():
+    conn = make_conn()
+    conn.fetchval.return_value = True
+
+    assert await partitions.create_month_partition(conn, "execution_events", date(2024, 3, 1)) is False
+    conn.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_apply_retention_archives_and_drops_expired(tmp_path, monkeypatch):
+    """Only whole months before the cutoff are archived and dropped."""
+    monkeypatch.setenv("EXECUTION_EVENTS_RETENTION_MONTHS", "3")
+    conn = make_conn()
+    conn.fetchval.return_value = True  # is_partitioned
+    conn.fetch.return_value = [
+        {"relname": "execution_events_default"},
+        {"relname": "execution_events_y2024m01"},
+        {"relname": "execution_events_y2024m02"},
+        {"relname": "execution_events_y2024m03"},
+    ]
+
+    async def copy_from_table(name, output, format, header):
+        await output(b"id,occurred_at\n")
+        await output(f"1,{name}\n".encode())
+
+    conn.copy_from_table = AsyncMock(side_effect=copy_from_table)
+
+    get_pool, timed_acquire = patch_pool(conn)
+    with get_pool, timed_acquire:
+        dropped = await partitions.apply_retention(
+            tables=["execution_events"], archive_dir=str(tmp_path), today=date(2024, 5, 20),
+        )
+
+    # Cutoff is 2024-02: January is dropped, February onward is kept
+    assert dropped == {"execution_events": ["execution_events_y2024m01"]}
+    statements = [call.args[0] for call in conn.execute.await_args_list]
+    assert statements == [
+        "ALTER TABLE execution_events DETACH PARTITION execution_events_y2024m01",
+        "DROP TABLE execution_events_y2024m01",
+    ]
+    archive = tmp_path / "execution_events_y2024m01.csv.gz"
+    with gzip.open(archive, "rt") as f:
+        assert f.read() == "id,occurred_at\n1,execution_events_y2024m01\n"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_apply_retention_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("EXECUTION_EVENTS_RETENTION_MONTHS", raising=False)
+    monkeypatch.delenv("HOURLY_SNAPSHOTS_RETENTION_MONTHS", raising=False)
+    conn = make_conn()
+
+    get_pool, timed_acquire = patch_pool(conn)
+    with get_pool, timed_acquire:
+        assert await partitions.apply_retention() == {}
+    conn.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ensure_partitions_skips_unpartitioned_tables():
+    """Before the migration runs, maintenance is a no-op."""
+    conn = make_conn()
+    conn.fetchval.return_value = False
+
+    get_pool, timed_acquire = patch_pool(conn)
+    with get_pool, timed_acquire:
+        assert await partitions.ensure_partitions() == []
+    conn.execute.assert_not_called()
+
+
+@pytest.mark.unit
+def test_schema_declares_partitioned_tables():
+    schema = SCHEMA.read_text()
+    assert ") PARTITION BY RANGE (occurred_at);" in schema
+    assert ") PARTITION BY RANGE (timestamp);" in schema
+    assert "PRIMARY KEY (id, occurred_at)" in schema
+    assert "CREATE TABLE IF NOT EXISTS execution_events_default PARTITION OF execution_events DEFAULT;" in schema
+    assert "CREATE TABLE IF NOT EXISTS hourly_snapshots_default PARTITION OF hourly_snapshots DEFAULT;" in schema
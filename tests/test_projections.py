@@ -0,0 +1,193 @@
+"""Unit tests for execution event projections (backend/db/projections.py).
+
+This module tests:
+- Positions, weekly P&L and conviction timeline folds
+- Batched catch-up from the stream position with periodic snapshots
+- Resuming from a snapshot gives the same state as a full replay
+- Snapshots from an older projection version are ignored
+- Replaying a season of events is fast
+"""
+
+import bisect
+import copy
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import patch
+
+from backend.db import projections
+from backend.db.projections import (
+    ConvictionTimelineProjection,
+    PositionsProjection,
+    ProjectionEngine,
+    WeeklyPnLProjection,
+)
+
+T0 = datetime(2025, 1, 15, 14, 30)
+
+
+def order(n, account="CHATGPT", symbol="SPY", side="buy", qty=10, price=100.0, week_id="2025-01-15", **data):
+    at = T0 + timedelta(seconds=n)
+    return {
+        "id": str(uuid.UUID(int=n + 1)),
+        "week_id": week_id,
+        "event_type": "order_placed",
+        "account": account,
+        "event_data": {"symbol": symbol, "side": side, "qty": qty, "limit_price": price, **data},
+        "occurred_at": at,
+        "created_at": at,
+    }
+
+
+class FakeEventStore:
+    """In-memory stand-in for execution_events and projection_snapshots."""
+
+    def __init__(self, events):
+        self.set_events(events)
+        self.snapshots = []
+        self.reads = 0
+
+    def set_events(self, events):
+        self.events = events
+        self.keys = [(e["created_at"], e["id"]) for e in events]
+
+    async def fetch_all(self, query, settle, *position, intent=None):
+        self.reads += 1
+        limit = int(query.split("LIMIT")[1])
+        start = 0
+        if position:
+            start = bisect.bisect_right(self.keys, tuple(position))
+        return self.events[start:start + limit]
+
+    async def fetch_one(self, query, intent=None):
+        return self.snapshots[-1] if self.snapshots else None
+
+    async def execute(self, query, *args, intent=None):
+        if "INSERT INTO projection_snapshots" in query:
+            position_at, position_id, events_applied, state = args
+            self.snapshots.append({
+                "position_at": position_at,
+                "position_id": position_id,
+                "events_applied": events_applied,
+                "state": copy.deepcopy(state),
+            })
+
+    def patch(self):
+        return patch.multiple(
+            projections, fetch_all=self.fetch_all, fetch_one=self.fetch_one, execute=self.execute
+        )
+
+
+@pytest.mark.unit
+def test_positions_and_realized_pnl():
+    positions = PositionsProjection()
+    weekly = WeeklyPnLProjection()
+    events = [
+        order(0, qty=10, price=100.0),
+        order(1, qty=10, price=110.0),
+        order(2, side="sell", qty=15, price=120.0),
+        order(3, account="GEMINI", symbol="TLT", side="sell", qty=5, price=90.0),
+    ]
+    for e in events:
+        positions.apply(e)
+        weekly.apply(e)
+
+    assert positions.positions["CHATGPT"]["SPY"]["qty"] == 5
+    assert positions.positions["CHATGPT"]["SPY"]["cost"] == pytest.approx(525.0)
+    assert positions.positions["GEMINI"]["TLT"]["qty"] == -5
+
+    pnl = weekly.pnl({"SPY": 130.0, "TLT": 80.0})["2025-01-15"]
+    # 15 sold at 120 against an average cost of 105
+    assert pnl["CHATGPT"]["realized_pnl"] == pytest.approx(225.0)
+    assert pnl["CHATGPT"]["unrealized_pnl"] == pytest.approx(5 * 130.0 - 525.0)
+    assert pnl["GEMINI"]["unrealized_pnl"] == pytest.approx(50.0)
+    assert pnl["CHATGPT"]["orders"] == 3
+
+
+@pytest.mark.unit
+def test_conviction_timeline_ignores_events_without_conviction():
+    timeline = ConvictionTimelineProjection()
+    timeline.apply(order(0, direction="LONG", conviction=1.5))
+    timeline.apply(order(1))
+
+    assert timeline.timeline["CHATGPT"] == [{
+        "at": T0.isoformat(),
+        "week_id": "2025-01-15",
+        "symbol": "SPY",
+        "direction": "LONG",
+        "conviction": 1.5,
+    }]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_catch_up_reads_batches_and_snapshots():
+    store = FakeEventStore([order(n, side="buy" if n % 2 else "sell") for n in range(25)])
+    engine = ProjectionEngine(batch_size=10, snapshot_every=10)
+
+    with store.patch():
+        assert await engine.run() == 25
+        # Nothing new: one empty read, no snapshot
+        assert await engine.run() == 0
+
+    assert store.reads == 4
+    assert [s["events_applied"] for s in store.snapshots] == [10, 20, 25]
+    assert engine.position == (store.events[-1]["created_at"], store.events[-1]["id"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_resume_from_snapshot_matches_full_replay():
+    events = [order(n, symbol=("SPY", "TLT")[n % 2], side=("buy", "sell")[n % 3 == 0],
+                    price=100.0 + n, conviction=n % 3) for n in range(40)]
+    store = FakeEventStore(events[:30])
+
+    with store.patch():
+        await ProjectionEngine(batch_size=8).run()
+        store.set_events(events)
+        resumed = ProjectionEngine(batch_size=8)
+        assert await resumed.run() == 10
+
+        full = ProjectionEngine(batch_size=8)
+        assert await full.run(rebuild=True) == 40
+
+    for name in full.projections:
+        assert resumed[name].state() == full[name].state()
+    assert resumed.events_applied == 40
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_snapshot_with_old_version_is_ignored():
+    store = FakeEventStore([order(n) for n in range(5)])
+
+    with store.patch():
+        await ProjectionEngine().run()
+        store.snapshots[-1]["state"]["positions"]["version"] = 0
+        engine = ProjectionEngine()
+        assert await engine.run() == 5
+
+    assert engine["positions"].positions["CHATGPT"]["SPY"]["qty"] == 50
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_season_replay_is_fast():
+    """A season of events (~100k) replays in well under the target of seconds."""
+    accounts = ["CHATGPT", "GEMINI", "CLAUDE", "GROQ", "DEEPSEEK", "COUNCIL"]
+    symbols = ["SPY", "QQQ", "TLT", "GLD", "USO", "IWM"]
+    events = [
+        order(n, account=accounts[n % 6], symbol=symbols[n % 5], side=("buy", "sell")[n % 2],
+              qty=1 + n % 7, price=100.0 + n % 13, week_id=f"2025-{1 + n // 10000:02d}-01",
+              conviction=n % 5 - 2, direction="LONG")
+        for n in range(100_000)
+    ]
+    store = FakeEventStore(events)
+    engine = ProjectionEngine(batch_size=5000, snapshot_every=50_000)
+
+    start = time.perf_counter()
+    with store.patch():
+        assert await engine.run(rebuild=True) == 100_000
+    assert time.perf_counter() - start < 5.0
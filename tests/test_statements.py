@@ -0,0 +1,170 @@
+"""Unit tests for the prepared statement registry (backend/db/statements.py).
+
+This module tests:
+- Registration rejects name clashes and unknown result shapes
+- The pool init hook registers codecs, then prepares every statement
+- pgbouncer mode prepares nothing and runs the SQL directly
+- Statements are prepared lazily and re-prepared after invalidation
+- fetch_prepared shapes results and records latency per statement name
+- Hot dashboard reads are registered with typed parameters
+"""
+
+import asyncpg
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import db_helpers
+from backend.db import pool, statements
+from backend.db import market_db, performance_db, pitch_db  # noqa: F401 (register statements)
+from backend.db.metrics import db_stats
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """An empty registry for the test."""
+    monkeypatch.setattr(statements, "STATEMENTS", {})
+    return statements.STATEMENTS
+
+
+def make_conn(prepared=None):
+    """Connection whose prepare() returns a statement yielding `rows`."""
+    conn = MagicMock()
+    conn.prepared = {} if prepared is None else prepared
+    stmt = MagicMock()
+    stmt.fetch = AsyncMock(return_value=[{"n": 1}, {"n": 2}])
+    stmt.fetchval = AsyncMock(return_value=7)
+    conn.prepare = AsyncMock(return_value=stmt)
+    conn.fetch = AsyncMock(return_value=[{"n": 3}])
+    return conn, stmt
+
+
+@pytest.mark.unit
+def test_register_statement_rejects_clashes(registry):
+    statements.register_statement("test.one", "SELECT 1")
+    statements.register_statement("test.one", "SELECT 1")
+
+    with pytest.raises(ValueError):
+        statements.register_statement("test.one", "SELECT 2")
+    with pytest.raises(ValueError):
+        statements.register_statement("test.two", "SELECT 2", returns="many")
+    with pytest.raises(KeyError):
+        statements.get_statement("test.missing")
+    assert list(registry) == ["test.one"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_init_hook_registers_codecs_then_prepares(registry):
+    statements.register_statement("test.one", "SELECT 1")
+    statements.register_statement("test.missing_table", "SELECT * FROM not_migrated")
+    conn, stmt = make_conn()
+    calls = []
+    codec_init = AsyncMock(side_effect=lambda c: calls.append("codecs"))
+
+    async def prepare(sql):
+        calls.append(sql)
+        if "not_migrated" in sql:
+            raise asyncpg.UndefinedTableError("relation does not exist")
+        return stmt
+
+    conn.prepare = AsyncMock(side_effect=prepare)
+
+    await statements.prepare_connection(conn, init=codec_init)
+
+    assert calls[0] == "codecs"
+    assert conn.prepared == {"test.one": stmt}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pgbouncer_mode_prepares_nothing(registry):
+    statement = statements.register_statement("test.one", "SELECT 1")
+    conn, _ = make_conn()
+
+    await statements.prepare_connection(conn, pgbouncer=True)
+    rows = await statements.run_statement(conn, statement, ())
+
+    conn.prepare.assert_not_awaited()
+    assert conn.prepared is None
+    assert rows == [{"n": 3}]
+    conn.fetch.assert_awaited_once_with("SELECT 1")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_run_statement_prepares_lazily_and_after_invalidation(registry):
+    statement = statements.register_statement("test.val", "SELECT $1::int", returns="value")
+    conn, stmt = make_conn()
+
+    assert await statements.run_statement(conn, statement, (7,)) == 7
+    assert await statements.run_statement(conn, statement, (7,)) == 7
+    assert conn.prepare.await_count == 1
+
+    stmt.fetchval = AsyncMock(side_effect=[asyncpg.InvalidCachedStatementError("plan changed"), 8])
+    assert await statements.run_statement(conn, statement, (8,)) == 8
+    assert conn.prepare.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_fetch_prepared_records_latency_by_name(registry):
+    statements.register_statement("test.rows", "SELECT n FROM t WHERE id = $1::int")
+    conn, stmt = make_conn()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    db_stats.reset()
+
+    with patch.object(db_helpers, "get_pool", MagicMock()) as get_pool, \
+         patch.object(db_helpers, "timed_acquire", MagicMock(return_value=acquire)):
+        rows = await db_helpers.fetch_prepared("test.rows", 1)
+        get_pool.assert_called_once_with("read")
+
+    assert rows == [{"n": 1}, {"n": 2}]
+    stmt.fetch.assert_awaited_once_with(1)
+    stats = db_stats.snapshot()["statements"]["prepared:test.rows"]
+    assert stats["calls"] == 1
+    assert stats["rows"] == 2
+    db_stats.reset()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pool_uses_statement_connections(monkeypatch):
+    """pgbouncer mode turns off asyncpg's implicit statement cache."""
+    monkeypatch.setenv("DB_PGBOUNCER", "true")
+    conn = AsyncMock()
+    conn.fetchval = AsyncMock(return_value="PostgreSQL 16.0, compiled")
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+    mock_pool = MagicMock()
+    mock_pool.acquire = MagicMock(return_value=acquire_ctx)
+    mock_pool.close = AsyncMock()
+
+    with patch("backend.db.pool.asyncpg.create_pool", AsyncMock(return_value=mock_pool)) as create:
+        await pool.init_pool()
+    try:
+        kwargs = create.call_args.kwargs
+        assert kwargs["connection_class"] is statements.StatementConnection
+        assert kwargs["statement_cache_size"] == 0
+        assert kwargs["init"].keywords["pgbouncer"] is True
+    finally:
+        await pool.close_pool()
+
+
+@pytest.mark.unit
+def test_hot_reads_are_registered():
+    registered = statements.STATEMENTS
+    for name in (
+        "market.latest_returns",
+        "market.latest_correlations",
+        "market.current_prices",
+        "pitches.by_week",
+        "pitches.by_research_date",
+        "leaderboard.by_lookback",
+        "leaderboard.council_vs_individuals",
+    ):
+        assert name in registered
+    assert "$1::int" in registered["leaderboard.by_lookback"].sql
+    assert registered["pitches.latest_week"].returns == statements.RETURNS_VALUE
@@ -0,0 +1,199 @@
+"""Unit tests for the frozen week bundle (backend/pipeline/week_bundle.py).
+
+This module tests:
+- Building a bundle from weekly pipeline results
+- Encode/decode round trip, checksum and schema version checks
+- Save to Postgres + Redis
+- Load from Redis (single read) and Postgres fallback with backfill
+- Seeding a checkpoint context from a bundle
+"""
+
+import base64
+import hashlib
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend import redis_client
+from backend.pipeline import week_bundle
+from backend.pipeline.week_bundle import (
+    BUNDLE_SCHEMA_VERSION,
+    BundleError,
+    build_week_bundle,
+    bundle_to_context,
+    decode_bundle,
+    encode_bundle,
+)
+
+
+WEEK_ID = "2024-01-10"
+
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_pool():
+    """Reset the global async Redis pool around each test."""
+    yield
+    redis_client._redis_pool = None
+    redis_client._redis_config = None
+
+
+@pytest.fixture
+def mock_redis_pool():
+    """Install a mock async Redis pool with a working pipeline()."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[2, True])
+    pipe_ctx = MagicMock()
+    pipe_ctx.__aenter__ = AsyncMock(return_value=pipe)
+    pipe_ctx.__aexit__ = AsyncMock(return_value=False)
+
+    mock_pool = AsyncMock()
+    mock_pool.hgetall = AsyncMock(return_value={})
+    mock_pool.pipeline = MagicMock(return_value=pipe_ctx)
+    mock_pool.pipe = pipe
+    redis_client._redis_pool = mock_pool
+    return mock_pool
+
+
+@pytest.fixture
+def pipeline_results():
+    """Results dict shaped like WeeklyTradingPipeline._extract_results()."""
+    return {
+        "week_id": WEEK_ID,
+        "execution_mode": "full",
+        "research_pack_a": {"structured_json": {}},
+        "market_snapshot": {"SPY": {"close": 475.2}},
+        "pm_pitches": [{"model": "gpt", "instrument": "SPY", "direction": "LONG"}],
+        "peer_reviews": [],
+        "label_to_model": {"Pitch A": "gpt"},
+        "chairman_decision": {"selected_trade": {"instrument": "SPY"}},
+        "execution_result": {"executed": True, "trades": []},
+    }
+
+
+# ==================== Build / Encode ====================
+
+
+@pytest.mark.unit
+def test_build_week_bundle_copies_frozen_fields(pipeline_results):
+    """The bundle carries snapshot, decisions and executions."""
+    bundle = build_week_bundle(pipeline_results)
+
+    assert bundle["schema_version"] == BUNDLE_SCHEMA_VERSION
+    assert bundle["week_id"] == WEEK_ID
+    assert bundle["market_snapshot"] == {"SPY": {"close": 475.2}}
+    assert bundle["chairman_decision"]["selected_trade"]["instrument"] == "SPY"
+    assert bundle["digest"] is None  # no weekly_graph in research
+    assert "research_pack_a" not in bundle
+
+
+@pytest.mark.unit
+def test_encode_decode_round_trip(pipeline_results):
+    """Bundles are gzip-compressed and decode to the same dict."""
+    bundle = build_week_bundle(pipeline_results)
+    payload = encode_bundle(bundle)
+
+    assert payload[:2] == b"\x1f\x8b"
+    assert decode_bundle(payload, hashlib.sha256(payload).hexdigest()) == bundle
+
+
+@pytest.mark.unit
+def test_decode_rejects_bad_checksum_and_schema(pipeline_results):
+    """Checksum mismatches and unknown schema versions raise BundleError."""
+    payload = encode_bundle(build_week_bundle(pipeline_results))
+    with pytest.raises(BundleError):
+        decode_bundle(payload, "0" * 64)
+
+    future = encode_bundle({**build_week_bundle(pipeline_results), "schema_version": 99})
+    with pytest.raises(BundleError):
+        decode_bundle(future)
+
+
+# ==================== Save / Load ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_save_week_bundle_writes_postgres_and_redis(mock_redis_pool, pipeline_results):
+    """Postgres assigns the version; Redis stores {version, payload}."""
+    bundle = build_week_bundle(pipeline_results)
+
+    with patch("backend.db.bundle_db.save_week_bundle", AsyncMock(return_value=3)) as db_save:
+        version = await week_bundle.save_week_bundle(bundle)
+
+    assert version == 3
+    week_id, payload, checksum, schema_version = db_save.call_args.args
+    assert week_id == WEEK_ID
+    assert checksum == hashlib.sha256(payload).hexdigest()
+    assert schema_version == BUNDLE_SCHEMA_VERSION
+
+    mapping = mock_redis_pool.pipe.hset.call_args.kwargs["mapping"]
+    assert mapping["version"] == 3
+    assert base64.b64decode(mapping["payload"]) == payload
+    mock_redis_pool.pipe.expire.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_load_week_bundle_from_redis_single_read(mock_redis_pool, pipeline_results):
+    """A Redis hit returns the bundle without touching Postgres."""
+    bundle = build_week_bundle(pipeline_results)
+    mock_redis_pool.hgetall.return_value = {
+        "version": "2",
+        "payload": base64.b64encode(encode_bundle(bundle)).decode("ascii"),
+    }
+
+    with patch("backend.db.bundle_db.load_week_bundle", AsyncMock()) as db_load:
+        loaded = await week_bundle.load_week_bundle(WEEK_ID)
+
+    assert loaded == {**bundle, "version": 2}
+    mock_redis_pool.hgetall.assert_awaited_once_with(f"bundle:week:{WEEK_ID}")
+    db_load.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_load_week_bundle_falls_back_to_postgres(mock_redis_pool, pipeline_results):
+    """A Redis miss reads Postgres and backfills Redis."""
+    bundle = build_week_bundle(pipeline_results)
+    payload = encode_bundle(bundle)
+    row = {
+        "week_id": WEEK_ID,
+        "version": 1,
+        "schema_version": BUNDLE_SCHEMA_VERSION,
+        "payload": payload,
+        "checksum": hashlib.sha256(payload).hexdigest(),
+    }
+
+    with patch("backend.db.bundle_db.load_week_bundle", AsyncMock(return_value=row)):
+        loaded = await week_bundle.load_week_bundle(WEEK_ID)
+
+    assert loaded["version"] == 1
+    assert loaded["pm_pitches"] == bundle["pm_pitches"]
+    mock_redis_pool.pipe.hset.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_load_week_bundle_missing_returns_none(mock_redis_pool):
+    """No bundle for the week returns None."""
+    with patch("backend.db.bundle_db.load_week_bundle", AsyncMock(return_value=None)):
+        assert await week_bundle.load_week_bundle(WEEK_ID) is None
+
+
+# ==================== Checkpoint Context ====================
+
+
+@pytest.mark.unit
+def test_bundle_to_context_seeds_checkpoint_keys(pipeline_results):
+    """The checkpoint reads MARKET_SNAPSHOT and EXECUTION_RESULT from the bundle."""
+    from backend.pipeline.stages.research import MARKET_SNAPSHOT
+    from backend.pipeline.stages.execution import EXECUTION_RESULT
+    from backend.pipeline.stages.chairman import CHAIRMAN_DECISION
+
+    context = bundle_to_context(build_week_bundle(pipeline_results))
+
+    assert context.get(MARKET_SNAPSHOT) == {"SPY": {"close": 475.2}}
+    assert context.get(EXECUTION_RESULT) == {"executed": True, "trades": []}
+    assert context.get(CHAIRMAN_DECISION)["selected_trade"]["instrument"] == "SPY"